@@ -0,0 +1,78 @@
+import argparse
+import base64
+import time
+from typing import Callable
+
+import cv2
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from inference.core.entities.requests.inference import ObjectDetectionInferenceRequest
+from inference.core.interfaces.http.binary_uploads import BinaryUploadsRoute
+from inference.core.utils.image_utils import load_image
+
+
+def measure(fn: Callable[[], None], runs: int) -> float:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares handling of base64 JSON, multipart and octet-stream "
+        "image uploads - from request parsing to decoded image"
+    )
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    app = FastAPI()
+    app.router.route_class = BinaryUploadsRoute
+
+    @app.post("/infer/object_detection")
+    def infer(inference_request: ObjectDetectionInferenceRequest):
+        return {"shape": list(load_image(inference_request.image)[0].shape)}
+
+    client = TestClient(app)
+    rng = np.random.default_rng(42)
+    image = rng.integers(0, 256, size=(args.height, args.width, 3), dtype=np.uint8)
+    image = cv2.GaussianBlur(image, (15, 15), 0)
+    image_bytes = cv2.imencode(".jpg", image)[1].tobytes()
+    json_payload = {
+        "model_id": "some/1",
+        "image": {"type": "base64", "value": base64.b64encode(image_bytes).decode()},
+    }
+    json_time = measure(
+        lambda: client.post("/infer/object_detection", json=json_payload),
+        runs=args.runs,
+    )
+    multipart_time = measure(
+        lambda: client.post(
+            "/infer/object_detection",
+            data={"model_id": "some/1"},
+            files={"image": ("image.jpg", image_bytes, "image/jpeg")},
+        ),
+        runs=args.runs,
+    )
+    octet_stream_time = measure(
+        lambda: client.post(
+            "/infer/object_detection?model_id=some/1",
+            content=image_bytes,
+            headers={"Content-Type": "application/octet-stream"},
+        ),
+        runs=args.runs,
+    )
+    print(
+        f"{args.width}x{args.height} JPEG ({len(image_bytes) / 1024 ** 2:.1f}MB) - "
+        f"base64 JSON: {json_time:.2f}ms, multipart: {multipart_time:.2f}ms, "
+        f"octet-stream: {octet_stream_time:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
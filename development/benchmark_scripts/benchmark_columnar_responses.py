@@ -0,0 +1,71 @@
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+
+from inference.core.interfaces.http.msgpack_utils import msgpack_response
+from inference.core.interfaces.http.orjson_utils import orjson_response
+from inference.core.models.instance_segmentation_base import (
+    InstanceSegmentationBaseOnnxRoboflowInferenceModel,
+)
+
+
+def measure(fn: Callable[[], None], runs: int) -> float:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares building and encoding of regular and columnar "
+        "instance segmentation responses"
+    )
+    parser.add_argument("--detections", type=int, default=300)
+    parser.add_argument("--polygon_points", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    model = InstanceSegmentationBaseOnnxRoboflowInferenceModel.__new__(
+        InstanceSegmentationBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = [f"class_{i}" for i in range(80)]
+    rng = np.random.default_rng(42)
+    predictions = [
+        np.concatenate(
+            [
+                rng.uniform(0, 600, size=(args.detections, 4)),
+                rng.uniform(0, 1, size=(args.detections, 2)),
+                rng.integers(0, 80, size=(args.detections, 1)),
+            ],
+            axis=1,
+        )
+    ]
+    masks = [
+        [
+            [tuple(p) for p in rng.uniform(0, 600, size=(args.polygon_points, 2))]
+            for _ in range(args.detections)
+        ]
+    ]
+    img_dims = [(640, 640)]
+    regular_time = measure(
+        lambda: orjson_response(model.make_response(predictions, masks, img_dims)),
+        runs=args.runs,
+    )
+    columnar_time = measure(
+        lambda: msgpack_response(
+            model.make_response(predictions, masks, img_dims, columnar_predictions=True)
+        ),
+        runs=args.runs,
+    )
+    print(
+        f"{args.detections} instances - regular JSON: {regular_time:.2f}ms, "
+        f"columnar msgpack: {columnar_time:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
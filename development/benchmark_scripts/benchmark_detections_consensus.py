@@ -0,0 +1,119 @@
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+import supervision as sv
+
+from inference.core.workflows.core_steps.fusion.detections_consensus.v1 import (
+    AggregationMode,
+    enumerate_detections,
+    find_consensus_detections,
+    get_consensus_for_single_detection,
+)
+
+CONSENSUS_PARAMETERS = {
+    "iou_threshold": 0.3,
+    "class_aware": True,
+    "required_votes": 2,
+    "confidence": 0.0,
+    "detections_merge_confidence_aggregation": AggregationMode.AVERAGE,
+    "detections_merge_coordinates_aggregation": AggregationMode.AVERAGE,
+}
+
+
+def generate_detections_from_sources(
+    sources: int, detections: int
+) -> List[sv.Detections]:
+    rng = np.random.default_rng(42)
+    top_left = rng.uniform(0, 1000, size=(detections, 2))
+    wh = rng.uniform(10, 80, size=(detections, 2))
+    base_xyxy = np.concatenate([top_left, top_left + wh], axis=1)
+    class_id = rng.integers(0, 5, size=detections)
+    results = []
+    for source_id in range(sources):
+        results.append(
+            sv.Detections(
+                xyxy=base_xyxy + rng.normal(0, 3, size=base_xyxy.shape),
+                confidence=rng.uniform(0.3, 1.0, size=detections),
+                class_id=class_id,
+                data={
+                    "detection_id": np.array(
+                        [f"{source_id}_{i}" for i in range(detections)]
+                    ),
+                    "class_name": np.array([f"class_{c}" for c in class_id]),
+                    "parent_id": np.array(["p"] * detections),
+                    "parent_coordinates": np.array([[0, 0]] * detections),
+                    "parent_dimensions": np.array([[1080, 1080]] * detections),
+                    "root_parent_id": np.array(["p"] * detections),
+                    "root_parent_coordinates": np.array([[0, 0]] * detections),
+                    "root_parent_dimensions": np.array([[1080, 1080]] * detections),
+                    "image_dimensions": np.array([[1080, 1080]] * detections),
+                },
+            )
+        )
+    return results
+
+
+def detection_by_detection_consensus(
+    detections_from_sources: List[sv.Detections],
+) -> List[sv.Detections]:
+    detections_already_considered = set()
+    consensus_detections = []
+    for source_id, detection in enumerate_detections(
+        detections_from_sources=detections_from_sources
+    ):
+        update, detections_already_considered = get_consensus_for_single_detection(
+            detection=detection,
+            source_id=source_id,
+            detections_from_sources=detections_from_sources,
+            detections_already_considered=detections_already_considered,
+            **CONSENSUS_PARAMETERS,
+        )
+        consensus_detections += update
+    return consensus_detections
+
+
+def measure(fn: Callable[[], None], runs: int) -> float:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares detection-by-detection consensus matching with "
+        "matching based on IoU matrices"
+    )
+    parser.add_argument("--sources", type=int, nargs="+", default=[2, 3, 5])
+    parser.add_argument("--detections", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    for sources in args.sources:
+        for detections in args.detections:
+            detections_from_sources = generate_detections_from_sources(
+                sources=sources, detections=detections
+            )
+            legacy_time = measure(
+                lambda: detection_by_detection_consensus(detections_from_sources),
+                runs=args.runs,
+            )
+            current_time = measure(
+                lambda: find_consensus_detections(
+                    detections_from_sources=detections_from_sources,
+                    **CONSENSUS_PARAMETERS,
+                ),
+                runs=args.runs,
+            )
+            print(
+                f"sources: {sources}, detections per source: {detections} - "
+                f"detection-by-detection: {legacy_time:.1f}ms, "
+                f"IoU matrices: {current_time:.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    StatementGroup,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
+    build_eval_function,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.detection.vectorized import (
+    build_detections_mask_function,
+)
+from inference.core.workflows.core_steps.common.query_language.operations.detections.base import (
+    filter_detections,
+)
+
+FILTER_DEFINITION = {
+    "type": "StatementGroup",
+    "operator": "and",
+    "statements": [
+        {
+            "type": "BinaryStatement",
+            "left_operand": {
+                "type": "DynamicOperand",
+                "operations": [
+                    {
+                        "type": "ExtractDetectionProperty",
+                        "property_name": "class_name",
+                    }
+                ],
+            },
+            "comparator": {"type": "in (Sequence)"},
+            "right_operand": {
+                "type": "DynamicOperand",
+                "operand_name": "classes",
+            },
+        },
+        {
+            "type": "BinaryStatement",
+            "left_operand": {
+                "type": "DynamicOperand",
+                "operations": [
+                    {
+                        "type": "ExtractDetectionProperty",
+                        "property_name": "confidence",
+                    }
+                ],
+            },
+            "comparator": {"type": "(Number) >="},
+            "right_operand": {"type": "StaticOperand", "value": 0.5},
+        },
+        {
+            "type": "BinaryStatement",
+            "left_operand": {
+                "type": "DynamicOperand",
+                "operations": [
+                    {
+                        "type": "ExtractDetectionProperty",
+                        "property_name": "size",
+                    }
+                ],
+            },
+            "comparator": {"type": "(Number) >"},
+            "right_operand": {"type": "StaticOperand", "value": 1000},
+        },
+    ],
+}
+
+
+def generate_detections(size: int) -> sv.Detections:
+    rng = np.random.default_rng(42)
+    top_left = rng.uniform(0, 1000, size=(size, 2))
+    wh = rng.uniform(5, 100, size=(size, 2))
+    class_id = rng.integers(0, 10, size=size)
+    return sv.Detections(
+        xyxy=np.concatenate([top_left, top_left + wh], axis=1).astype(np.float32),
+        confidence=rng.uniform(0, 1, size=size).astype(np.float32),
+        class_id=class_id,
+        data={"class_name": np.array([f"class_{c}" for c in class_id])},
+    )
+
+
+def measure(fn: Callable[[], None], runs: int) -> float:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares vectorized and row-by-row evaluation of DetectionsFilter"
+    )
+    parser.add_argument("--detections", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    detections = generate_detections(size=args.detections)
+    global_parameters = {"classes": ["class_1", "class_3", "class_5"]}
+    definition = StatementGroup.model_validate(FILTER_DEFINITION)
+    filtering_fun = build_eval_function(definition=definition)
+    mask_fun = build_detections_mask_function(definition=definition)
+    row_by_row_time = measure(
+        lambda: filter_detections(
+            detections=detections,
+            filtering_fun=filtering_fun,
+            global_parameters=global_parameters,
+        ),
+        runs=args.runs,
+    )
+    vectorized_time = measure(
+        lambda: filter_detections(
+            detections=detections,
+            filtering_fun=filtering_fun,
+            global_parameters=global_parameters,
+            mask_fun=mask_fun,
+        ),
+        runs=args.runs,
+    )
+    print(
+        f"{args.detections} detections - row-by-row: {row_by_row_time:.2f}ms, "
+        f"vectorized: {vectorized_time:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
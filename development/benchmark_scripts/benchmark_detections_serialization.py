@@ -0,0 +1,72 @@
+import argparse
+import time
+from typing import Callable
+
+import cv2
+import numpy as np
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.serializers import (
+    serialise_sv_detections,
+    serialise_sv_detections_compact,
+)
+
+
+def generate_detections(size: int, resolution: int) -> sv.Detections:
+    rng = np.random.default_rng(42)
+    centers = rng.integers(50, resolution - 50, size=(size, 2))
+    radii = rng.integers(5, 50, size=size)
+    masks = np.zeros((size, resolution, resolution), dtype=np.uint8)
+    for mask, (x, y), radius in zip(masks, centers, radii):
+        cv2.circle(mask, (int(x), int(y)), int(radius), 1, -1)
+    xyxy = np.concatenate(
+        [centers - radii[:, None], centers + radii[:, None]], axis=1
+    ).astype(np.float32)
+    class_id = rng.integers(0, 10, size=size)
+    return sv.Detections(
+        xyxy=xyxy,
+        mask=masks.astype(bool),
+        confidence=rng.uniform(0, 1, size=size).astype(np.float32),
+        class_id=class_id,
+        data={
+            "class_name": np.array([f"class_{c}" for c in class_id]),
+            "detection_id": np.array([f"id_{i}" for i in range(size)]),
+            "parent_id": np.array(["image"] * size),
+            "image_dimensions": np.array([[resolution, resolution]] * size),
+        },
+    )
+
+
+def measure(fn: Callable[[], None], runs: int) -> float:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measures serialisation of detections in default and compact format"
+    )
+    parser.add_argument("--detections", type=int, default=50)
+    parser.add_argument("--resolution", type=int, default=640)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    detections = generate_detections(size=args.detections, resolution=args.resolution)
+    default_time = measure(
+        lambda: serialise_sv_detections(detections=detections), runs=args.runs
+    )
+    compact_time = measure(
+        lambda: serialise_sv_detections_compact(detections=detections),
+        runs=args.runs,
+    )
+    print(
+        f"{args.detections} detections with masks - default: {default_time:.2f}ms, "
+        f"compact: {compact_time:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+from inference.core.cache.memory import MemoryCache
+
+
+class LegacySortedSets:
+    """Sorted sets emulation previously used by MemoryCache - dict[score -> value]
+    with full sort on every range query."""
+
+    def __init__(self) -> None:
+        self.cache = dict()
+
+    def zadd(self, key: str, value: Any, score: float, expire: float = None):
+        if not key in self.cache:
+            self.cache[key] = dict()
+        self.cache[key][score] = value
+
+    def zrangebyscore(self, key: str, min: float = -1, max: float = float("inf")):
+        if not key in self.cache:
+            return []
+        keys = sorted([k for k in self.cache[key].keys() if min <= k <= max])
+        return [self.cache[key][k] for k in keys]
+
+
+def measure(fn: Callable[[], None], runs: int) -> float:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares legacy sorted sets emulation with MemoryCache"
+    )
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--window", type=float, default=0.01)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    scores = np.sort(np.random.default_rng(42).uniform(0, 1, size=args.members))
+    for name, cache_class in [("legacy", LegacySortedSets), ("current", MemoryCache)]:
+
+        def insert() -> None:
+            cache = cache_class()
+            for i, score in enumerate(scores):
+                cache.zadd("metrics", value=i, score=float(score), expire=60)
+
+        cache = cache_class()
+        for i, score in enumerate(scores):
+            cache.zadd("metrics", value=i, score=float(score), expire=60)
+
+        def query() -> None:
+            for start in np.linspace(0, 1 - args.window, args.queries):
+                cache.zrangebyscore("metrics", min=start, max=start + args.window)
+
+        insert_time = measure(insert, runs=args.runs)
+        query_time = measure(query, runs=args.runs)
+        print(
+            f"{name}: {args.members} inserts: {insert_time:.2f}ms, "
+            f"{args.queries} range queries: {query_time:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
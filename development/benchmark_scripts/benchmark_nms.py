@@ -0,0 +1,61 @@
+import argparse
+import time
+
+import numpy as np
+
+from inference.core.nms import batched_non_max_suppression, w_np_non_max_suppression
+
+
+def generate_predictions(
+    batch_size: int, candidates: int, num_classes: int
+) -> np.ndarray:
+    generator = np.random.default_rng(42)
+    centers = generator.uniform(0, 640, size=(batch_size, candidates, 2))
+    sizes = generator.uniform(10, 120, size=(batch_size, candidates, 2))
+    class_confidences = (
+        generator.uniform(0, 0.6, size=(batch_size, candidates, num_classes)) ** 3
+    )
+    max_confidence = class_confidences.max(axis=2, keepdims=True)
+    return np.concatenate(
+        [centers, sizes, max_confidence, class_confidences], axis=2
+    ).astype(np.float32)
+
+
+def measure(nms, predictions: np.ndarray, runs: int, **kwargs) -> float:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _ = nms(predictions.copy(), **kwargs)
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares legacy and vectorized NMS implementations"
+    )
+    parser.add_argument("--batch_size", type=int, default=1)
+    parser.add_argument("--candidates", type=int, default=8400)
+    parser.add_argument("--num_classes", type=int, default=80)
+    parser.add_argument("--confidence", type=float, default=0.01)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    predictions = generate_predictions(
+        batch_size=args.batch_size,
+        candidates=args.candidates,
+        num_classes=args.num_classes,
+    )
+    for class_agnostic in (False, True):
+        kwargs = {"conf_thresh": args.confidence, "class_agnostic": class_agnostic}
+        legacy = measure(w_np_non_max_suppression, predictions, args.runs, **kwargs)
+        vectorized = measure(
+            batched_non_max_suppression, predictions, args.runs, **kwargs
+        )
+        print(
+            f"class_agnostic={class_agnostic}: legacy={legacy:.2f}ms "
+            f"vectorized={vectorized:.2f}ms speedup={legacy / vectorized:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
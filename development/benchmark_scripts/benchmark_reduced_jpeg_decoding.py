@@ -0,0 +1,61 @@
+import argparse
+import time
+from typing import Callable
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from inference.core.entities.requests.inference import InferenceRequestImage
+from inference.core.models import roboflow
+from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+
+
+def measure(fn: Callable[[], None], runs: int) -> float:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return float(np.median(durations)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares model input preparation for JPEG decoded at full and "
+        "reduced resolution"
+    )
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--input-size", type=int, default=640)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.preproc = {}
+    model.resize_method = "Fit (black edges) in"
+    model.img_size_h = args.input_size
+    model.img_size_w = args.input_size
+    rng = np.random.default_rng(42)
+    image = rng.integers(0, 256, size=(args.height, args.width, 3), dtype=np.uint8)
+    image = cv2.GaussianBlur(image, (15, 15), 0)
+    image_bytes = cv2.imencode(".jpg", image)[1].tobytes()
+    request_image = InferenceRequestImage(type="bytes", value=image_bytes)
+    results = {}
+    for reduced_decoding_enabled in (False, True):
+        with mock.patch.object(
+            roboflow,
+            "ENABLE_REDUCED_RESOLUTION_JPEG_DECODING",
+            reduced_decoding_enabled,
+        ):
+            results[reduced_decoding_enabled] = measure(
+                lambda: model.preproc_image(request_image), runs=args.runs
+            )
+    print(
+        f"{args.width}x{args.height} JPEG into {args.input_size}x{args.input_size} "
+        f"input - full resolution decoding: {results[False]:.2f}ms, "
+        f"reduced resolution decoding: {results[True]:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,13 @@ from functools import partial
 
 from inference.core.cache import cache
 from inference.core.env import (
+    INFERENCE_EXECUTION_MODE,
     MAX_ACTIVE_MODELS,
+    MODEL_BACKGROUND_LOADING_ENABLED,
+    MICRO_BATCHING_ENABLED,
+    MICRO_BATCHING_MAX_BATCH_SIZE,
+    INFERENCE_EXECUTOR_WORKERS,
+    INFERENCE_EXECUTOR_MAX_CONCURRENCY_PER_MODEL,
     ACTIVE_LEARNING_ENABLED,
     LAMBDA,
     ENABLE_STREAM_API,
@@ -16,7 +22,15 @@ from inference.core.managers.active_learning import (
     BackgroundTaskActiveLearningManager,
 )
 from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.background_loading import (
+    WithBackgroundModelLoading,
+)
+from inference.core.managers.decorators.executor import (
+    THREAD_POOL_EXECUTION_MODE,
+    WithInferenceExecutor,
+)
 from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+from inference.core.managers.decorators.micro_batching import WithMicroBatching
 from inference.core.registries.roboflow import (
     RoboflowModelRegistry,
 )
@@ -44,7 +58,30 @@ if ACTIVE_LEARNING_ENABLED:
 else:
     model_manager = ModelManager(model_registry=model_registry)
 
+if MICRO_BATCHING_ENABLED:
+    model_manager = WithMicroBatching(model_manager)
+
+if INFERENCE_EXECUTION_MODE == THREAD_POOL_EXECUTION_MODE:
+    executor_limits = {}
+    if MICRO_BATCHING_ENABLED:
+        # requests wait for their micro-batch inside executor threads - the executor
+        # must let through enough concurrent requests to a model for batches to fill
+        executor_limits = {
+            "max_workers": max(
+                INFERENCE_EXECUTOR_WORKERS, MICRO_BATCHING_MAX_BATCH_SIZE
+            ),
+            "max_concurrency_per_model": max(
+                INFERENCE_EXECUTOR_MAX_CONCURRENCY_PER_MODEL,
+                MICRO_BATCHING_MAX_BATCH_SIZE,
+            ),
+        }
+    model_manager = WithInferenceExecutor(model_manager, **executor_limits)
+
 model_manager = WithFixedSizeCache(model_manager, max_size=MAX_ACTIVE_MODELS)
+
+if MODEL_BACKGROUND_LOADING_ENABLED:
+    model_manager = WithBackgroundModelLoading(model_manager)
+
 model_manager.init_pingback()
 interface = HttpInterface(
     model_manager,
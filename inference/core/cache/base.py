@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 from inference.core import logger
 
@@ -50,6 +50,16 @@ class BaseCache:
         """
         raise NotImplementedError()
 
+    def zadd_many(self, entries: List[Tuple[str, Any, float, Optional[float]]]):
+        """
+        Adds multiple members to sorted sets - backends may do it in a single round trip.
+
+        Args:
+            entries (List[Tuple[str, Any, float, Optional[float]]]): (key, value, score, expire) tuples.
+        """
+        for key, value, score, expire in entries:
+            self.zadd(key, value=value, score=score, expire=expire)
+
     def zrangebyscore(
         self,
         key: str,
@@ -0,0 +1,268 @@
+import base64
+import hashlib
+import os
+import re
+import time
+from contextlib import contextmanager
+from typing import IO, Dict, Generator, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from inference.core.env import (
+    MODEL_ARTEFACTS_DOWNLOAD_RETRIES,
+    MODEL_ARTEFACTS_LOCK_TIMEOUT,
+)
+from inference.core.exceptions import ModelArtefactError
+from inference.core.logger import logger
+from inference.core.utils.file_system import ensure_parent_dir_exists
+from inference.core.utils.requests import api_key_safe_raise_for_status
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+PARTIAL_DOWNLOAD_SUFFIX = ".part"
+LOCK_SUFFIX = ".lock"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = (10, 60)
+LOCK_POLLING_INTERVAL = 0.1
+RETRY_BACKOFF = 0.5
+MAX_RETRY_BACKOFF = 5.0
+CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+GOOG_HASH_MD5_PATTERN = re.compile(r"md5=([A-Za-z0-9+/=]+)")
+
+
+class IncompleteDownloadError(Exception):
+    pass
+
+
+@contextmanager
+def file_lock(
+    path: str, timeout: float = MODEL_ARTEFACTS_LOCK_TIMEOUT
+) -> Generator[None, None, None]:
+    """Exclusive lock on file at `path`, held across processes (and threads).
+
+    Args:
+        path (str): Path to the lock file - created if missing and never removed, as
+            removal would let another process lock a different file under the same path.
+        timeout (float): Time (in seconds) to wait for the lock.
+
+    Raises:
+        TimeoutError: If the lock is not acquired within timeout.
+    """
+    ensure_parent_dir_exists(path=path)
+    with open(path, "a+b") as lock_file:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(lock_file=lock_file):
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Could not acquire lock {path} within {timeout} seconds"
+                )
+            time.sleep(LOCK_POLLING_INTERVAL)
+        try:
+            yield None
+        finally:
+            _unlock(lock_file=lock_file)
+
+
+def _try_lock(lock_file: IO[bytes]) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(lock_file: IO[bytes]) -> None:
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def download_file(
+    url: str,
+    target_path: str,
+    headers: Optional[Dict[str, str]] = None,
+    expected_sha256: Optional[str] = None,
+    max_retries: int = MODEL_ARTEFACTS_DOWNLOAD_RETRIES,
+    retry_backoff: float = RETRY_BACKOFF,
+) -> None:
+    """Downloads file, such that `target_path` only ever holds complete, verified file.
+
+    Content is streamed into `<target_path>.part`, which is renamed into `target_path`
+    once the size announced by server and checksum (given explicitly or announced by
+    server as `x-goog-hash` / `Content-MD5`) are verified. Interrupted transfers are
+    resumed with HTTP range requests - also when partial file is left by an earlier
+    process. Processes sharing the directory download the file once - others wait
+    for the lock and find the file in place.
+
+    Args:
+        url (str): URL of the file.
+        target_path (str): Destination path.
+        headers (Optional[Dict[str, str]]): Extra headers of requests.
+        expected_sha256 (Optional[str]): Expected SHA-256 of the file content.
+        max_retries (int): Number of times interrupted download is resumed.
+        retry_backoff (float): Base delay (in seconds) between retries.
+
+    Raises:
+        requests.exceptions.HTTPError: If server responds with error status.
+        ConnectionError: If connection could not be established (or kept) despite
+            retries.
+        ModelArtefactError: If file could not be downloaded in full or its content does
+            not match checksum.
+    """
+    with file_lock(path=f"{target_path}{LOCK_SUFFIX}"):
+        if os.path.isfile(target_path):
+            logger.debug(f"File {target_path} already downloaded.")
+            return None
+        partial_path = f"{target_path}{PARTIAL_DOWNLOAD_SUFFIX}"
+        response_headers = None
+        for attempt in range(max_retries + 1):
+            try:
+                response_headers = _download_into_partial_file(
+                    url=url, partial_path=partial_path, headers=headers
+                )
+                break
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+                IncompleteDownloadError,
+            ) as error:
+                if attempt == max_retries:
+                    _raise_download_error(
+                        target_path=target_path, attempts=attempt + 1, error=error
+                    )
+                logger.warning(
+                    f"Download of {os.path.basename(target_path)} interrupted "
+                    f"(attempt {attempt + 1}), resuming. Cause: {error}"
+                )
+                time.sleep(min(retry_backoff * 2**attempt, MAX_RETRY_BACKOFF))
+        _verify_checksum(
+            path=partial_path,
+            expected_sha256=expected_sha256,
+            expected_md5=_get_announced_md5(headers=response_headers),
+        )
+        os.replace(partial_path, target_path)
+
+
+def _raise_download_error(target_path: str, attempts: int, error: Exception) -> None:
+    message = (
+        f"Could not download {os.path.basename(target_path)} after {attempts} "
+        f"attempts. Cause: {error}"
+    )
+    if isinstance(error, IncompleteDownloadError):
+        raise ModelArtefactError(message) from error
+    # network errors surface as built-in `ConnectionError` - callers map it as any
+    # other connection failure (see `wrap_roboflow_api_errors(...)`)
+    raise ConnectionError(message) from error
+
+
+def _download_into_partial_file(
+    url: str, partial_path: str, headers: Optional[Dict[str, str]]
+) -> CaseInsensitiveDict:
+    downloaded_bytes = (
+        os.path.getsize(partial_path) if os.path.isfile(partial_path) else 0
+    )
+    request_headers = dict(headers or {})
+    if downloaded_bytes > 0:
+        request_headers["Range"] = f"bytes={downloaded_bytes}-"
+    with requests.get(
+        url, headers=request_headers, stream=True, timeout=DOWNLOAD_TIMEOUT
+    ) as response:
+        if response.status_code == 416:
+            # partial file is not a prefix of the file served now
+            os.remove(partial_path)
+            raise IncompleteDownloadError("Partial download could not be resumed")
+        api_key_safe_raise_for_status(response=response)
+        range_start, total_size = _parse_content_range(response=response)
+        if response.status_code != 206 or range_start != downloaded_bytes:
+            # server sent whole file
+            downloaded_bytes, mode = 0, "wb"
+            total_size = _get_content_length(response=response)
+        else:
+            mode = "ab"
+        ensure_parent_dir_exists(path=partial_path)
+        # keep bytes received before connection drop - size is verified below
+        response.raw.enforce_content_length = False
+        with open(partial_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+        size = os.path.getsize(partial_path)
+        if total_size is not None and size != total_size:
+            raise IncompleteDownloadError(f"Received {size} bytes out of {total_size}")
+        if response.status_code == 206:
+            # checksum headers of partial response may describe the range only
+            return CaseInsensitiveDict(
+                {
+                    k: v
+                    for k, v in response.headers.items()
+                    if k.lower() == "x-goog-hash"
+                }
+            )
+        return response.headers
+
+
+def _parse_content_range(response: requests.Response) -> tuple:
+    match = CONTENT_RANGE_PATTERN.fullmatch(
+        response.headers.get("Content-Range", "").strip()
+    )
+    if match is None:
+        return None, None
+    total_size = int(match.group(3)) if match.group(3) != "*" else None
+    return int(match.group(1)), total_size
+
+
+def _get_content_length(response: requests.Response) -> Optional[int]:
+    if response.headers.get("Content-Encoding"):
+        # length of encoded content, not the one written into file
+        return None
+    content_length = response.headers.get("Content-Length")
+    return int(content_length) if content_length is not None else None
+
+
+def _get_announced_md5(headers: Optional[CaseInsensitiveDict]) -> Optional[str]:
+    if not headers:
+        return None
+    goog_hash = GOOG_HASH_MD5_PATTERN.search(headers.get("x-goog-hash", ""))
+    encoded_md5 = goog_hash.group(1) if goog_hash else headers.get("Content-MD5")
+    if not encoded_md5:
+        return None
+    try:
+        return base64.b64decode(encoded_md5).hex()
+    except ValueError:
+        return None
+
+
+def _verify_checksum(
+    path: str, expected_sha256: Optional[str], expected_md5: Optional[str]
+) -> None:
+    if expected_sha256 is None and expected_md5 is None:
+        return None
+    sha256, md5 = hashlib.sha256(), hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            if expected_sha256 is not None:
+                sha256.update(chunk)
+            if expected_md5 is not None:
+                md5.update(chunk)
+    mismatches = []
+    if expected_sha256 is not None and sha256.hexdigest() != expected_sha256.lower():
+        mismatches.append("SHA-256")
+    if expected_md5 is not None and md5.hexdigest() != expected_md5:
+        mismatches.append("MD5")
+    if mismatches:
+        os.remove(path)
+        raise ModelArtefactError(
+            f"Downloaded {os.path.basename(path)} does not match {' and '.join(mismatches)} "
+            f"checksum - partial file removed"
+        )
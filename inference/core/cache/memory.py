@@ -1,20 +1,32 @@
+import heapq
+import itertools
 import threading
 import time
-from threading import Lock
-from typing import Any, Optional
+from threading import Lock, RLock
+from typing import Any, List, Optional, Tuple
+
+from sortedcontainers import SortedList
 
 from inference.core.cache.base import BaseCache
 from inference.core.env import MEMORY_CACHE_EXPIRE_INTERVAL
 
+# members of sorted sets are stored as (score, sequence number, value) tuples - sequence
+# number is unique, so members with equal scores are kept and values are never compared
+SortedSetMember = Tuple[float, int, Any]
+
 
 class MemoryCache(BaseCache):
     """
     MemoryCache is an in-memory cache that implements the BaseCache interface.
 
+    Sorted sets are kept in `SortedList` containers, so that inserts and range queries are O(log n).
+    Expiration times of keys and sorted set members are kept in a heap, which is drained by
+    a background thread - only expired entries are visited.
+
     Attributes:
         cache (dict): A dictionary to store the cache values.
         expires (dict): A dictionary to store the expiration times of the cache values.
-        zexpires (dict): A dictionary to store the expiration times of the sorted set values.
+        _expiration_heap (list): A heap of (expiration time, sequence number, key, sorted set member) entries.
         _expire_thread (threading.Thread): A thread that runs the _expire method.
     """
 
@@ -24,7 +36,11 @@ class MemoryCache(BaseCache):
         """
         self.cache = dict()
         self.expires = dict()
-        self.zexpires = dict()
+        self._expiration_heap: List[
+            Tuple[float, int, str, Optional[SortedSetMember]]
+        ] = []
+        self._sequence = itertools.count()
+        self._lock = RLock()
 
         self._expire_thread = threading.Thread(target=self._expire)
         self._expire_thread.daemon = True
@@ -32,28 +48,25 @@ class MemoryCache(BaseCache):
 
     def _expire(self):
         """
-        Removes the expired keys from the cache and zexpires dictionaries.
+        Removes the expired keys and sorted set members from the cache.
 
         This method runs in an infinite loop and sleeps for MEMORY_CACHE_EXPIRE_INTERVAL seconds between each iteration.
         """
         while True:
-            now = time.time()
-            keys_to_delete = []
-            for k, v in self.expires.copy().items():
-                if v < now:
-                    keys_to_delete.append(k)
-            for k in keys_to_delete:
-                del self.cache[k]
-                del self.expires[k]
-            keys_to_delete = []
-            for k, v in self.zexpires.copy().items():
-                if v < now:
-                    keys_to_delete.append(k)
-            for k in keys_to_delete:
-                del self.cache[k[0]][k[1]]
-                del self.zexpires[k]
-            while time.time() - now < MEMORY_CACHE_EXPIRE_INTERVAL:
-                time.sleep(0.1)
+            self._remove_expired_entries(now=time.time())
+            time.sleep(MEMORY_CACHE_EXPIRE_INTERVAL)
+
+    def _remove_expired_entries(self, now: float) -> None:
+        with self._lock:
+            while self._expiration_heap and self._expiration_heap[0][0] < now:
+                expire_at, _, key, member = heapq.heappop(self._expiration_heap)
+                if member is not None:
+                    sorted_set = self.cache.get(key)
+                    if isinstance(sorted_set, SortedList):
+                        sorted_set.discard(member)
+                elif self.expires.get(key) == expire_at:
+                    # entries of keys that were set again are outdated and skipped
+                    self._delete(key)
 
     def get(self, key: str):
         """
@@ -65,12 +78,12 @@ class MemoryCache(BaseCache):
         Returns:
             str: The value associated with the key, or None if the key does not exist or is expired.
         """
-        if key in self.expires:
-            if self.expires[key] < time.time():
-                del self.cache[key]
-                del self.expires[key]
-                return None
-        return self.cache.get(key)
+        with self._lock:
+            if key in self.expires:
+                if self.expires[key] < time.time():
+                    self._delete(key)
+                    return None
+            return self.cache.get(key)
 
     def set(self, key: str, value: str, expire: float = None):
         """
@@ -81,9 +94,14 @@ class MemoryCache(BaseCache):
             value (str): The value to store.
             expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
         """
-        self.cache[key] = value
-        if expire:
-            self.expires[key] = expire + time.time()
+        with self._lock:
+            self.cache[key] = value
+            if expire:
+                expire_at = expire + time.time()
+                self.expires[key] = expire_at
+                self._schedule_expiration(expire_at=expire_at, key=key)
+            else:
+                self.expires.pop(key, None)
 
     def zadd(self, key: str, value: Any, score: float, expire: float = None):
         """
@@ -95,11 +113,28 @@ class MemoryCache(BaseCache):
             score (float): The score associated with the value.
             expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
         """
-        if not key in self.cache:
-            self.cache[key] = dict()
-        self.cache[key][score] = value
-        if expire:
-            self.zexpires[(key, score)] = expire + time.time()
+        with self._lock:
+            sorted_set = self.cache.get(key)
+            if not isinstance(sorted_set, SortedList):
+                sorted_set = SortedList()
+                self.cache[key] = sorted_set
+            member = (score, next(self._sequence), value)
+            sorted_set.add(member)
+            if expire:
+                self._schedule_expiration(
+                    expire_at=expire + time.time(), key=key, member=member
+                )
+
+    def zadd_many(self, entries: List[Tuple[str, Any, float, Optional[float]]]):
+        """
+        Adds multiple members to sorted sets while holding the lock once.
+
+        Args:
+            entries (List[Tuple[str, Any, float, Optional[float]]]): (key, value, score, expire) tuples.
+        """
+        with self._lock:
+            for key, value, score, expire in entries:
+                self.zadd(key, value=value, score=score, expire=expire)
 
     def zrangebyscore(
         self,
@@ -120,13 +155,14 @@ class MemoryCache(BaseCache):
         Returns:
             list: A list of values (or value-score pairs if withscores is True) in the specified score range.
         """
-        if not key in self.cache:
-            return []
-        keys = sorted([k for k in self.cache[key].keys() if min <= k <= max])
-        if withscores:
-            return [(self.cache[key][k], k) for k in keys]
-        else:
-            return [self.cache[key][k] for k in keys]
+        with self._lock:
+            sorted_set = self.cache.get(key)
+            if not isinstance(sorted_set, SortedList):
+                return []
+            members = sorted_set.irange(*_score_range_bounds(min=min, max=max))
+            if withscores:
+                return [(value, score) for score, _, value in members]
+            return [value for _, _, value in members]
 
     def zremrangebyscore(
         self,
@@ -145,11 +181,17 @@ class MemoryCache(BaseCache):
         Returns:
             int: The number of members removed from the sorted set.
         """
-        res = self.zrangebyscore(key, min=min, max=max, withscores=True)
-        keys_to_delete = [k[1] for k in res]
-        for k in keys_to_delete:
-            del self.cache[key][k]
-        return len(keys_to_delete)
+        with self._lock:
+            sorted_set = self.cache.get(key)
+            if not isinstance(sorted_set, SortedList):
+                return 0
+            lower_bound, upper_bound = _score_range_bounds(min=min, max=max)
+            start = sorted_set.bisect_left(lower_bound)
+            end = sorted_set.bisect_right(upper_bound)
+            if end <= start:
+                return 0
+            del sorted_set[start:end]
+            return end - start
 
     def acquire_lock(self, key: str, expire=None) -> Any:
         lock: Optional[Lock] = self.get(key)
@@ -170,3 +212,21 @@ class MemoryCache(BaseCache):
 
     def get_numpy(self, key: str):
         return self.get(key)
+
+    def _schedule_expiration(
+        self, expire_at: float, key: str, member: Optional[SortedSetMember] = None
+    ) -> None:
+        heapq.heappush(
+            self._expiration_heap, (expire_at, next(self._sequence), key, member)
+        )
+
+    def _delete(self, key: str) -> None:
+        self.cache.pop(key, None)
+        self.expires.pop(key, None)
+
+
+def _score_range_bounds(
+    min: float, max: float
+) -> Tuple[Tuple[float], Tuple[float, float]]:
+    # (score, ) sorts before and (score, inf) after every member with the given score
+    return (min,), (max, float("inf"))
@@ -6,7 +6,7 @@ import threading
 import time
 from contextlib import asynccontextmanager
 from copy import copy
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 import redis
 
@@ -121,6 +121,22 @@ class RedisCache(BaseCache):
         if expire:
             self.zexpires[(key, score)] = expire + time.time()
 
+    def zadd_many(self, entries: List[Tuple[str, Any, float, Optional[float]]]):
+        """
+        Adds multiple members to sorted sets using a single pipeline.
+
+        Args:
+            entries (List[Tuple[str, Any, float, Optional[float]]]): (key, value, score, expire) tuples.
+        """
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value, score, _ in entries:
+            pipeline.zadd(key, {json.dumps(value): score})
+        pipeline.execute()
+        now = time.time()
+        for key, _, score, expire in entries:
+            if expire:
+                self.zexpires[(key, score)] = expire + now
+
     def zrangebyscore(
         self,
         key: str,
@@ -1,7 +1,8 @@
 from typing import Any, ClassVar, List, Optional, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+import pybase64
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 from inference.core.entities.common import ApiKey, ModelID, ModelType
 
@@ -55,9 +56,16 @@ class InferenceRequestImage(BaseModel):
     value: Optional[Any] = Field(
         None,
         examples=["http://www.example-image-url.com"],
-        description="Image data corresponding to the image type, if type = 'url' then value is a string containing the url of an image, else if type = 'base64' then value is a string containing base64 encoded image data, else if type = 'numpy' then value is binary numpy data serialized using pickle.dumps(); array should 3 dimensions, channels last, with values in the range [0,255].",
+        description="Image data corresponding to the image type, if type = 'url' then value is a string containing the url of an image, else if type = 'base64' then value is a string containing base64 encoded image data, else if type = 'numpy' then value is binary numpy data serialized using pickle.dumps(); array should 3 dimensions, channels last, with values in the range [0,255]. Type 'bytes' is reserved for raw image bytes uploaded as multipart/form-data or application/octet-stream body.",
     )
 
+    @field_serializer("value", when_used="json")
+    def serialize_value(self, value: Any) -> Any:
+        # raw bytes of uploaded images are not valid JSON strings
+        if self.type == "bytes" and isinstance(value, (bytes, bytearray)):
+            return pybase64.b64encode(value).decode("ascii")
+        return value
+
 
 class CVInferenceRequest(InferenceRequest):
     """Computer Vision inference request.
@@ -103,6 +111,7 @@ class ObjectDetectionInferenceRequest(CVInferenceRequest):
         visualization_labels (Optional[bool]): If true, labels will be rendered on prediction visualizations.
         visualization_stroke_width (Optional[int]): The stroke width used when visualizing predictions.
         visualize_predictions (Optional[bool]): If true, the predictions will be drawn on the original image and returned as a base64 string.
+        columnar_predictions (Optional[bool]): If true, predictions are returned as parallel arrays (one per attribute) instead of list of objects.
     """
 
     class_agnostic_nms: Optional[bool] = Field(
@@ -164,6 +173,13 @@ class ObjectDetectionInferenceRequest(CVInferenceRequest):
         examples=["my_dataset"],
         description="Parameter to be used when Active Learning data registration should happen against different dataset than the one pointed by model_id",
     )
+    columnar_predictions: Optional[bool] = Field(
+        default=False,
+        examples=[False],
+        description="If true, predictions are returned as parallel arrays (one per attribute) instead of list of objects - "
+        "which is much cheaper to build and serialise for dense scenes. Implied when response is requested "
+        "with `Accept: application/msgpack` header",
+    )
 
 
 class KeypointsDetectionInferenceRequest(ObjectDetectionInferenceRequest):
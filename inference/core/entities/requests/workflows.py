@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -28,6 +28,11 @@ class WorkflowInferenceRequest(BaseModel):
     workflow_id: Optional[str] = Field(
         default=None, description="Optional identifier of workflow"
     )
+    detections_serialization_format: Literal["default", "compact"] = Field(
+        default="default",
+        description="Format of detections in the response. `default` serialises each detection into "
+        "separate dictionary, `compact` serialises detections into parallel arrays - one list per field.",
+    )
 
 
 class PredefinedWorkflowInferenceRequest(WorkflowInferenceRequest):
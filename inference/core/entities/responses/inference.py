@@ -2,6 +2,7 @@ import base64
 from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_serializer
 
 
@@ -167,6 +168,7 @@ class InferenceResponse(BaseModel):
         inference_id (Optional[str]): Unique identifier of inference
         frame_id (Optional[int]): The frame id of the image used in inference if the input was a video.
         time (Optional[float]): The time in seconds it took to produce the predictions including image preprocessing.
+        queue_time (Optional[float]): The time in seconds the request waited for execution before predictions started.
     """
 
     model_config = ConfigDict(protected_namespaces=())
@@ -181,6 +183,10 @@ class InferenceResponse(BaseModel):
         default=None,
         description="The time in seconds it took to produce the predictions including image preprocessing",
     )
+    queue_time: Optional[float] = Field(
+        default=None,
+        description="The time in seconds the request waited for execution before predictions started",
+    )
 
 
 class CvInferenceResponse(InferenceResponse):
@@ -252,6 +258,108 @@ class InstanceSegmentationInferenceResponse(
     predictions: List[InstanceSegmentationPrediction]
 
 
+class ColumnarDetectionsPredictions(BaseModel):
+    """Object detection or instance segmentation predictions stored as parallel arrays -
+    i-th element of each column describes i-th detection.
+
+    Attributes:
+        xyxy (np.ndarray): Array of shape (N, 4) with bounding boxes coordinates.
+        confidence (np.ndarray): Array of shape (N, ) with detections confidence.
+        class_id (np.ndarray): Array of shape (N, ) with class ids.
+        class_name (List[str]): Class names of detections.
+        detection_id (List[str]): Unique identifiers of detections.
+        points (Optional[np.ndarray]): Array of shape (M, 2) with points of all instance polygons.
+        points_offsets (Optional[np.ndarray]): Array of shape (N + 1, ) - polygon of i-th detection
+            is `points[points_offsets[i]:points_offsets[i + 1]]`.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    xyxy: np.ndarray = Field(description="Bounding boxes coordinates (N, 4)")
+    confidence: np.ndarray = Field(description="Detections confidence (N, )")
+    class_id: np.ndarray = Field(description="Class ids of detections (N, )")
+    class_name: List[str] = Field(description="Class names of detections")
+    detection_id: List[str] = Field(description="Unique identifiers of detections")
+    points: Optional[np.ndarray] = Field(
+        default=None,
+        description="Points of all instance polygons, concatenated (M, 2)",
+    )
+    points_offsets: Optional[np.ndarray] = Field(
+        default=None,
+        description="Offsets of consecutive polygons within `points` (N + 1, )",
+    )
+
+    @field_serializer(
+        "xyxy",
+        "confidence",
+        "class_id",
+        "points",
+        "points_offsets",
+        when_used="json",
+    )
+    def serialize_column(self, column: Optional[np.ndarray]) -> Optional[list]:
+        if column is None:
+            return None
+        return column.tolist()
+
+    def __len__(self) -> int:
+        return len(self.class_name)
+
+    def to_predictions(
+        self,
+    ) -> Union[List[ObjectDetectionPrediction], List[InstanceSegmentationPrediction]]:
+        predictions = []
+        for i, (x_min, y_min, x_max, y_max) in enumerate(self.xyxy.tolist()):
+            prediction = {
+                "x": x_min + (x_max - x_min) / 2,
+                "y": y_min + (y_max - y_min) / 2,
+                "width": x_max - x_min,
+                "height": y_max - y_min,
+                "confidence": self.confidence[i].item(),
+                "class": self.class_name[i],
+                "class_id": self.class_id[i].item(),
+                "detection_id": self.detection_id[i],
+            }
+            if self.points is None:
+                predictions.append(ObjectDetectionPrediction(**prediction))
+                continue
+            polygon = self.points[self.points_offsets[i] : self.points_offsets[i + 1]]
+            prediction["points"] = [Point(x=x, y=y) for x, y in polygon.tolist()]
+            predictions.append(InstanceSegmentationPrediction(**prediction))
+        return predictions
+
+
+class ColumnarDetectionsInferenceResponse(
+    CvInferenceResponse, WithVisualizationResponse
+):
+    """Object detection or instance segmentation inference response with predictions
+    stored column-wise - built without instantiating objects for each prediction.
+
+    Attributes:
+        predictions (inference.core.entities.responses.inference.ColumnarDetectionsPredictions): Columns of predictions.
+    """
+
+    predictions: ColumnarDetectionsPredictions
+
+    def to_detections_response(
+        self,
+    ) -> Union[ObjectDetectionInferenceResponse, InstanceSegmentationInferenceResponse]:
+        response_class = (
+            ObjectDetectionInferenceResponse
+            if self.predictions.points is None
+            else InstanceSegmentationInferenceResponse
+        )
+        return response_class(
+            predictions=self.predictions.to_predictions(),
+            image=self.image,
+            inference_id=self.inference_id,
+            frame_id=self.frame_id,
+            time=self.time,
+            queue_time=self.queue_time,
+            visualization=self.visualization,
+        )
+
+
 class ClassificationInferenceResponse(CvInferenceResponse, WithVisualizationResponse):
     """Classification inference response.
 
@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -40,6 +40,11 @@ class ModelDescriptionEntity(BaseModel):
         None,
         description="Image input width accepted by the model (if registered).",
     )
+    session_settings: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Effective settings of ONNX Runtime session of the model (if "
+        "model runs with ONNX Runtime).",
+    )
 
     @classmethod
     def from_model_description(
@@ -51,6 +56,7 @@ class ModelDescriptionEntity(BaseModel):
             batch_size=model_description.batch_size,
             input_height=model_description.input_height,
             input_width=model_description.input_width,
+            session_settings=model_description.session_settings,
         )
 
 
@@ -164,6 +164,12 @@ DISABLE_PREPROC_GRAYSCALE = str2bool(os.getenv("DISABLE_PREPROC_GRAYSCALE", Fals
 # Flag to disable static crop preprocessing, default is False
 DISABLE_PREPROC_STATIC_CROP = str2bool(os.getenv("DISABLE_PREPROC_STATIC_CROP", False))
 
+# Flag to enable decoding JPEG inputs at 1/2, 1/4 or 1/8 of resolution, when model input
+# size allows that, default is True
+ENABLE_REDUCED_RESOLUTION_JPEG_DECODING = str2bool(
+    os.getenv("ENABLE_REDUCED_RESOLUTION_JPEG_DECODING", "True")
+)
+
 # Flag to disable version check, default is False
 DISABLE_VERSION_CHECK = str2bool(os.getenv("DISABLE_VERSION_CHECK", False))
 
@@ -223,6 +229,14 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
 # Maximum number of active models, default is 8
 MAX_ACTIVE_MODELS = int(os.getenv("MAX_ACTIVE_MODELS", 8))
 
+# Memory budget (in MB) for models loaded at the same time, default is None (only MAX_ACTIVE_MODELS applies)
+MODEL_CACHE_MEMORY_BUDGET_MB = os.getenv("MODEL_CACHE_MEMORY_BUDGET_MB")
+if MODEL_CACHE_MEMORY_BUDGET_MB is not None:
+    MODEL_CACHE_MEMORY_BUDGET_MB = int(MODEL_CACHE_MEMORY_BUDGET_MB)
+
+# Policy used to evict models from cache ("lru" or "gdsf"), default is "lru"
+MODEL_CACHE_EVICTION_POLICY = os.getenv("MODEL_CACHE_EVICTION_POLICY", "lru").lower()
+
 # Maximum batch size, default is infinite
 MAX_BATCH_SIZE = os.getenv("MAX_BATCH_SIZE", None)
 if MAX_BATCH_SIZE is not None:
@@ -230,6 +244,49 @@ if MAX_BATCH_SIZE is not None:
 else:
     MAX_BATCH_SIZE = float("inf")
 
+# Micro-batching of concurrent requests to the same model, default is False
+MICRO_BATCHING_ENABLED = str2bool(os.getenv("MICRO_BATCHING_ENABLED", False))
+
+# Maximum number of requests merged into single micro-batch, default is 8
+MICRO_BATCHING_MAX_BATCH_SIZE = int(os.getenv("MICRO_BATCHING_MAX_BATCH_SIZE", 8))
+
+# Maximum time (in seconds) the first request of micro-batch waits for others, default is 0.005
+MICRO_BATCHING_MAX_WAIT_TIME = float(os.getenv("MICRO_BATCHING_MAX_WAIT_TIME", 0.005))
+
+# Where model inference for HTTP requests runs - "event_loop" or "thread_pool", default is "event_loop"
+INFERENCE_EXECUTION_MODE = os.getenv("INFERENCE_EXECUTION_MODE", "event_loop")
+
+# Number of threads running model inference in "thread_pool" execution mode, default is 4
+INFERENCE_EXECUTOR_WORKERS = int(os.getenv("INFERENCE_EXECUTOR_WORKERS", 4))
+
+# Number of requests that may wait for a free inference thread, default is 64
+INFERENCE_EXECUTOR_MAX_QUEUE_SIZE = int(
+    os.getenv("INFERENCE_EXECUTOR_MAX_QUEUE_SIZE", 64)
+)
+
+# Number of requests to a single model executed concurrently, default is 2
+INFERENCE_EXECUTOR_MAX_CONCURRENCY_PER_MODEL = int(
+    os.getenv("INFERENCE_EXECUTOR_MAX_CONCURRENCY_PER_MODEL", 2)
+)
+
+# Number of requests that may wait for a single model, default is 32
+INFERENCE_EXECUTOR_MAX_QUEUE_SIZE_PER_MODEL = int(
+    os.getenv("INFERENCE_EXECUTOR_MAX_QUEUE_SIZE_PER_MODEL", 32)
+)
+
+# Flag to enable loading models in background worker threads, default is False
+MODEL_BACKGROUND_LOADING_ENABLED = str2bool(
+    os.getenv("MODEL_BACKGROUND_LOADING_ENABLED", False)
+)
+
+# Number of threads loading models in background, default is 2
+MODEL_LOADING_WORKERS = int(os.getenv("MODEL_LOADING_WORKERS", 2))
+
+# Max time (in seconds) a request waits for model being loaded, default is None (wait until loaded)
+MODEL_LOADING_WAIT_TIMEOUT = os.getenv("MODEL_LOADING_WAIT_TIMEOUT")
+if MODEL_LOADING_WAIT_TIMEOUT is not None:
+    MODEL_LOADING_WAIT_TIMEOUT = float(MODEL_LOADING_WAIT_TIMEOUT)
+
 # Maximum number of candidates, default is 3000
 MAX_CANDIDATES_ENV = "MAX_CANDIDATES"
 DEFAULT_MAX_CANDIDATES = 3000
@@ -251,6 +308,22 @@ if LAMBDA:
 # Interval for metrics aggregation, default is 60
 METRICS_INTERVAL = int(os.getenv("METRICS_INTERVAL", 60))
 
+# Max number of inference metrics events waiting to be recorded, default is 1024
+METRICS_RECORDER_QUEUE_SIZE = int(os.getenv("METRICS_RECORDER_QUEUE_SIZE", 1024))
+
+# Max number of inference metrics events recorded in a single batch, default is 64
+METRICS_RECORDER_BATCH_SIZE = int(os.getenv("METRICS_RECORDER_BATCH_SIZE", 64))
+
+# Max time (in seconds) to wait for a batch of inference metrics events, default is 0.05
+METRICS_RECORDER_FLUSH_INTERVAL = float(
+    os.getenv("METRICS_RECORDER_FLUSH_INTERVAL", 0.05)
+)
+
+# Fill ratio of metrics queue above which events are sampled, default is 0.5
+METRICS_RECORDER_SAMPLING_THRESHOLD = float(
+    os.getenv("METRICS_RECORDER_SAMPLING_THRESHOLD", 0.5)
+)
+
 # URL for posting metrics to Roboflow API, default is "{API_BASE_URL}/inference-stats"
 METRICS_URL = os.getenv("METRICS_URL", f"{API_BASE_URL}/inference-stats")
 
@@ -277,6 +350,72 @@ ONNXRUNTIME_EXECUTION_PROVIDERS = os.getenv(
     "[CUDAExecutionProvider,OpenVINOExecutionProvider,CoreMLExecutionProvider,CPUExecutionProvider]",
 )
 
+# Number of threads ONNX Runtime uses within a single operator, default is None (ONNX Runtime decides)
+ONNXRUNTIME_INTRA_OP_NUM_THREADS = os.getenv("ONNXRUNTIME_INTRA_OP_NUM_THREADS")
+if ONNXRUNTIME_INTRA_OP_NUM_THREADS is not None:
+    ONNXRUNTIME_INTRA_OP_NUM_THREADS = int(ONNXRUNTIME_INTRA_OP_NUM_THREADS)
+
+# Number of threads ONNX Runtime uses to run independent operators in parallel, default is None
+# (ONNX Runtime decides) - only used with parallel execution mode
+ONNXRUNTIME_INTER_OP_NUM_THREADS = os.getenv("ONNXRUNTIME_INTER_OP_NUM_THREADS")
+if ONNXRUNTIME_INTER_OP_NUM_THREADS is not None:
+    ONNXRUNTIME_INTER_OP_NUM_THREADS = int(ONNXRUNTIME_INTER_OP_NUM_THREADS)
+
+# Execution mode of ONNX Runtime sessions ("sequential" or "parallel"), default is "sequential"
+ONNXRUNTIME_EXECUTION_MODE = os.getenv(
+    "ONNXRUNTIME_EXECUTION_MODE", "sequential"
+).lower()
+
+# Total number of intra-op threads for all models loaded at the same time - split evenly
+# between MAX_ACTIVE_MODELS sessions, unless threads are set for the model explicitly,
+# default is None (no budget)
+ONNXRUNTIME_THREADS_BUDGET = os.getenv("ONNXRUNTIME_THREADS_BUDGET")
+if ONNXRUNTIME_THREADS_BUDGET is not None:
+    ONNXRUNTIME_THREADS_BUDGET = int(ONNXRUNTIME_THREADS_BUDGET)
+
+# Flag to let idle threads of ONNX Runtime sessions spin waiting for work - lowers latency,
+# but burns CPU when many models are loaded, default is True
+ONNXRUNTIME_ALLOW_SPINNING = str2bool(os.getenv("ONNXRUNTIME_ALLOW_SPINNING", "True"))
+
+# Flag to enable memory arena of ONNX Runtime sessions on CPU, default is True
+ONNXRUNTIME_ENABLE_CPU_MEM_ARENA = str2bool(
+    os.getenv("ONNXRUNTIME_ENABLE_CPU_MEM_ARENA", "True")
+)
+
+# Flag to make all ONNX Runtime sessions use single, process-wide CPU memory arena instead of
+# arena per session, default is False
+ONNXRUNTIME_SHARED_CPU_MEM_ARENA = str2bool(
+    os.getenv("ONNXRUNTIME_SHARED_CPU_MEM_ARENA", "False")
+)
+
+# Flag to save graphs optimised by ONNX Runtime in model cache and load them on subsequent
+# starts, default is True
+ONNXRUNTIME_PERSIST_OPTIMIZED_MODELS = str2bool(
+    os.getenv("ONNXRUNTIME_PERSIST_OPTIMIZED_MODELS", "True")
+)
+
+# Session settings for specific models - JSON object mapping model id (or dataset id) into
+# settings overrides, e.g. {"coco/3": {"intra_op_num_threads": 2}}, default is None
+ONNXRUNTIME_SESSION_PROFILES = os.getenv("ONNXRUNTIME_SESSION_PROFILES")
+
+# Flag to run ONNX sessions of models with outputs (and inputs) bound to preallocated, pooled
+# buffers (ONNX Runtime IOBinding), default is True
+ENABLE_ONNX_IO_BINDING = str2bool(os.getenv("ENABLE_ONNX_IO_BINDING", "True"))
+
+# Maximum number of free buffers kept by the model for each shape of input / output, default is 4
+ONNX_IO_BINDING_MAX_BUFFERS_PER_SHAPE = int(
+    os.getenv("ONNX_IO_BINDING_MAX_BUFFERS_PER_SHAPE", 4)
+)
+
+# Maximum number of input / output shapes (effectively - batch sizes) the model keeps free
+# buffers for, default is 8
+ONNX_IO_BINDING_MAX_SHAPES = int(os.getenv("ONNX_IO_BINDING_MAX_SHAPES", 8))
+
+# Number of threads decoding images, shared by all models, default is None (derived from CPU count)
+IMAGE_LOADER_POOL_SIZE = os.getenv("IMAGE_LOADER_POOL_SIZE")
+if IMAGE_LOADER_POOL_SIZE is not None:
+    IMAGE_LOADER_POOL_SIZE = int(IMAGE_LOADER_POOL_SIZE)
+
 # Port, default is 9001
 PORT = int(os.getenv("PORT", 9001))
 
@@ -368,6 +507,14 @@ PREDICTIONS_QUEUE_SIZE = int(
     os.getenv("INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE", 512)
 )
 RESTART_ATTEMPT_DELAY = int(os.getenv("INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY", 1))
+# Flag to run preprocessing, inference and postprocessing of InferencePipeline in separate stages, default is False
+INFERENCE_PIPELINE_PIPELINED_EXECUTION = str2bool(
+    os.getenv("INFERENCE_PIPELINE_PIPELINED_EXECUTION", "False")
+)
+# Size of buffers between stages of pipelined InferencePipeline, default is 2
+INFERENCE_PIPELINE_STAGES_QUEUE_SIZE = int(
+    os.getenv("INFERENCE_PIPELINE_STAGES_QUEUE_SIZE", 2)
+)
 DEFAULT_BUFFER_SIZE = int(os.getenv("VIDEO_SOURCE_BUFFER_SIZE", "64"))
 DEFAULT_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE = float(
     os.getenv("VIDEO_SOURCE_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE", "0.1")
@@ -381,6 +528,16 @@ DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES = int(
 DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW = int(
     os.getenv("VIDEO_SOURCE_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW", "16")
 )
+# Decoding mode of VideoSource (FULL, SKIP_DECODE or KEY_FRAMES_ONLY), default is FULL
+VIDEO_SOURCE_DECODING_MODE = os.getenv("VIDEO_SOURCE_DECODING_MODE", "FULL")
+# Flag to decode frames of VideoSource into shared memory ring buffer, default is False
+VIDEO_SOURCE_SHARED_MEMORY_BUFFER = str2bool(
+    os.getenv("VIDEO_SOURCE_SHARED_MEMORY_BUFFER", "False")
+)
+# Number of slots of VideoSource shared memory ring buffer (regardless of buffer size), default is 16
+VIDEO_SOURCE_SHARED_MEMORY_SLOTS = int(
+    os.getenv("VIDEO_SOURCE_SHARED_MEMORY_SLOTS", "16")
+)
 
 ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING = str2bool(
     os.getenv("ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING", "False")
@@ -416,6 +573,19 @@ DISABLE_WORKFLOW_ENDPOINTS = str2bool(os.getenv("DISABLE_WORKFLOW_ENDPOINTS", Fa
 WORKFLOWS_STEP_EXECUTION_MODE = os.getenv("WORKFLOWS_STEP_EXECUTION_MODE", "local")
 WORKFLOWS_REMOTE_API_TARGET = os.getenv("WORKFLOWS_REMOTE_API_TARGET", "hosted")
 WORKFLOWS_MAX_CONCURRENT_STEPS = int(os.getenv("WORKFLOWS_MAX_CONCURRENT_STEPS", "8"))
+
+# Number of threads of the executor shared by all Execution Engines to run workflow steps
+WORKFLOWS_STEPS_EXECUTOR_WORKERS = int(
+    os.getenv("WORKFLOWS_STEPS_EXECUTOR_WORKERS", "32")
+)
+
+# Order of steps execution: "waves" (level by level) or "dependencies" (each step starts once its own dependencies finish)
+WORKFLOWS_STEPS_SCHEDULING_MODE = os.getenv("WORKFLOWS_STEPS_SCHEDULING_MODE", "waves")
+
+# Number of initialised Execution Engines reused by HTTP server across requests, 0 disables the cache
+WORKFLOWS_EXECUTION_ENGINES_CACHE_SIZE = int(
+    os.getenv("WORKFLOWS_EXECUTION_ENGINES_CACHE_SIZE", "64")
+)
 WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_BATCH_SIZE = int(
     os.getenv("WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_BATCH_SIZE", "1")
 )
@@ -426,8 +596,30 @@ ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS = str2bool(
     os.getenv("ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS", True)
 )
 
+# Number of model artefacts downloaded concurrently, default is 4
+MODEL_ARTEFACTS_DOWNLOAD_WORKERS = int(os.getenv("MODEL_ARTEFACTS_DOWNLOAD_WORKERS", 4))
+
+# Number of times interrupted download of model artefact is resumed, default is 3
+MODEL_ARTEFACTS_DOWNLOAD_RETRIES = int(os.getenv("MODEL_ARTEFACTS_DOWNLOAD_RETRIES", 3))
+
+# Time (in seconds) to wait for other process downloading the same model artefacts, default is 900
+MODEL_ARTEFACTS_LOCK_TIMEOUT = float(os.getenv("MODEL_ARTEFACTS_LOCK_TIMEOUT", 900))
+
 MODEL_VALIDATION_DISABLED = str2bool(os.getenv("MODEL_VALIDATION_DISABLED", "False"))
 
+# Flag to save result of model validation in model cache - such that test inference and probing
+# of model output shape run once per version of model weights, default is True
+MODEL_VALIDATION_CACHE_ENABLED = str2bool(
+    os.getenv("MODEL_VALIDATION_CACHE_ENABLED", "True")
+)
+
+# Warmup inference run when model validation is skipped thanks to cached result ("async" - in
+# background, once model is loaded, "sync" - before model is ready, "disabled"), default is "async"
+MODEL_WARMUP_MODE = os.getenv("MODEL_WARMUP_MODE", "async").lower()
+
+# NMS implementation used by object detection models - "vectorized" or "legacy"
+NMS_IMPLEMENTATION = os.getenv("NMS_IMPLEMENTATION", "vectorized")
+
 INFERENCE_WARNINGS_DISABLED = str2bool(
     os.getenv("INFERENCE_WARNINGS_DISABLED", "False")
 )
@@ -444,6 +636,27 @@ DEDICATED_DEPLOYMENT_WORKSPACE_URL = os.environ.get(
 
 ENABLE_STREAM_API = str2bool(os.getenv("ENABLE_STREAM_API", "False"))
 STREAM_API_PRELOADED_PROCESSES = int(os.getenv("STREAM_API_PRELOADED_PROCESSES", "0"))
+# Flag to serve models of stream API pipelines from one process per model (instead
+# of loading model copy in each pipeline process), default is False
+STREAM_API_SHARED_MODEL_SERVERS = str2bool(
+    os.getenv("STREAM_API_SHARED_MODEL_SERVERS", "False")
+)
+# Maximum number of images batched by shared model server across pipelines, default is 8
+STREAM_API_MODEL_SERVER_MAX_BATCH_SIZE = int(
+    os.getenv("STREAM_API_MODEL_SERVER_MAX_BATCH_SIZE", "8")
+)
+# Time (in seconds) shared model server waits to fill the batch, default is 0.005
+STREAM_API_MODEL_SERVER_BATCH_COLLECTION_TIMEOUT = float(
+    os.getenv("STREAM_API_MODEL_SERVER_BATCH_COLLECTION_TIMEOUT", "0.005")
+)
+# Time (in seconds) after which shared model server without clients exits, default is 300
+STREAM_API_MODEL_SERVER_IDLE_TIMEOUT = float(
+    os.getenv("STREAM_API_MODEL_SERVER_IDLE_TIMEOUT", "300")
+)
+# Time (in seconds) to wait for shared model server to load the model, default is 600
+STREAM_API_MODEL_SERVER_STARTUP_TIMEOUT = float(
+    os.getenv("STREAM_API_MODEL_SERVER_STARTUP_TIMEOUT", "600")
+)
 
 RUNS_ON_JETSON = str2bool(os.getenv("RUNS_ON_JETSON", "False"))
 
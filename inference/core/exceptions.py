@@ -190,3 +190,21 @@ class ActiveLearningConfigurationError(ActiveLearningError):
 
 class CannotInitialiseModelError(Exception):
     pass
+
+
+class ModelInferenceQueueFullError(Exception):
+    """Raised when too many requests are waiting for inference on a single model."""
+
+    pass
+
+
+class InferenceExecutorQueueFullError(Exception):
+    """Raised when the inference executor cannot accept more requests."""
+
+    pass
+
+
+class ModelLoadingInProgressError(Exception):
+    """Raised when the model is still being loaded in background after the waiting timeout."""
+
+    pass
@@ -6,6 +6,11 @@ from typing import Callable, Dict, Optional, Tuple, Union
 
 import numpy as np
 
+from inference.core.interfaces.camera.frames_ring_buffer import (
+    FrameSlotReference,
+    release_frame_slot,
+)
+
 FrameTimestamp = datetime
 FrameID = int
 
@@ -58,6 +63,8 @@ class VideoFrame:
         fps (Optional[float]): declared FPS of source (if possible to be acquired)
         measured_fps (Optional[float]): measured FPS of live stream
         comes_from_video_file (Optional[bool]): flag to determine if frame comes from video file
+        slot_reference (Optional[FrameSlotReference]): reference of shared memory slot holding the image
+            (if frame was decoded into `SharedMemoryFramesRingBuffer`) - `image` is a view into the slot then
     """
 
     image: np.ndarray
@@ -68,6 +75,15 @@ class VideoFrame:
     measured_fps: Optional[float] = None
     source_id: Optional[int] = None
     comes_from_video_file: Optional[bool] = None
+    slot_reference: Optional[FrameSlotReference] = None
+
+    def release(self) -> None:
+        """Returns shared memory slot holding the image to the ring buffer. Frame (and
+        arrays created from its image without copying) must not be used afterwards.
+        Slots are also released once image is garbage collected, but explicit release
+        lets the source reuse the slot as soon as possible."""
+        if self.slot_reference is not None:
+            release_frame_slot(reference=self.slot_reference)
 
 
 @dataclass(frozen=True)
@@ -87,6 +103,21 @@ class VideoFrameProducer:
     def retrieve(self) -> Tuple[bool, np.ndarray]:
         raise NotImplementedError
 
+    def retrieve_into(self, image: np.ndarray) -> Tuple[bool, np.ndarray]:
+        """Decodes grabbed frame into `image` if producer is capable to do so -
+        returned array holds the frame and may be a different one than `image`."""
+        return self.retrieve()
+
+    def get_position(self) -> Optional[int]:
+        """Number of frames the producer moved past (0-based index of the next frame),
+        `None` if producer cannot tell."""
+        return None
+
+    def seek(self, position: int) -> bool:
+        """Moves the producer, so that next grabbed frame is the one with given
+        0-based index. Returns `False` if seeking is not supported."""
+        return False
+
     def release(self):
         raise NotImplementedError
 
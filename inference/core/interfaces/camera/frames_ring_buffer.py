@@ -0,0 +1,249 @@
+import ctypes
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from threading import Condition, Lock
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from inference.core.interfaces.camera.exceptions import StaleFrameSlotError
+from inference.core.utils.shared_memory import (
+    attach_shared_memory,
+    close_detached_shared_memories,
+    create_shared_memory,
+    shared_memory_array,
+    try_close_shared_memory,
+    unlink_shared_memory,
+)
+
+SLOT_ALIGNMENT = 64
+GENERATIONS_DTYPE = np.dtype(np.int64)
+
+
+@dataclass(frozen=True)
+class FrameSlotReference:
+    """Points to the slot of `SharedMemoryFramesRingBuffer` holding the frame.
+
+    Attributes:
+        buffer_name (str): Name of shared memory segment of the ring buffer
+        slot (int): Index of the slot
+        offset (int): Offset of the slot within the segment (in bytes)
+        generation (int): Counter of slot leases - allows to detect that slot
+            was already released and filled with another frame
+        frame_shape (Tuple[int, ...]): Shape of frame stored in the slot
+        dtype (str): Type of frame elements (`np.dtype(...).str`)
+    """
+
+    buffer_name: str
+    slot: int
+    offset: int
+    generation: int
+    frame_shape: Tuple[int, ...]
+    dtype: str
+
+
+class SharedMemoryFramesRingBuffer:
+    """Fixed number of frame slots allocated once in a shared memory segment.
+
+    Producer leases free slot with `acquire(...)` and decodes frame directly into
+    returned array - no allocation per frame is needed. Slot returns to the pool
+    once `release(...)` is called with its reference or once the leased array (and
+    all views created from it) is garbage collected - whatever happens first.
+    Consumer releasing the slot explicitly must not use the frame afterwards.
+
+    Segment starts with the generation of each slot (0 for slots that are free),
+    so that other processes may attach to the slot by its reference (see
+    `attach_frame_slot(...)`) and verify that the frame was not overwritten.
+    """
+
+    def __init__(self, frame_shape: Tuple[int, ...], slots: int, dtype: str = "|u1"):
+        if slots < 1:
+            raise ValueError("Ring buffer must have at least one slot")
+        self._frame_shape = tuple(frame_shape)
+        self._dtype = np.dtype(dtype)
+        self._slots = slots
+        self._frame_size = int(np.prod(self._frame_shape)) * self._dtype.itemsize
+        self._slot_size = _get_slot_size(frame_shape=self._frame_shape, dtype=dtype)
+        self._header_size = _get_header_size(slots=slots)
+        self._memory = create_shared_memory(
+            size=get_ring_buffer_size(frame_shape=frame_shape, slots=slots, dtype=dtype)
+        )
+        self._generations = np.ndarray(
+            (slots,), dtype=GENERATIONS_DTYPE, buffer=self._memory.buf
+        )
+        self._generations[:] = 0
+        self._generation = 0
+        self._free_slots: Deque[int] = deque(range(slots))
+        self._condition = Condition()
+        self._closed = False
+        _RING_BUFFERS_BY_NAME[self.name] = self
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def frame_shape(self) -> Tuple[int, ...]:
+        return self._frame_shape
+
+    @property
+    def slots(self) -> int:
+        return self._slots
+
+    def free_slots(self) -> int:
+        with self._condition:
+            return len(self._free_slots)
+
+    def acquire(
+        self, timeout: Optional[float] = 0.0
+    ) -> Optional[Tuple[np.ndarray, FrameSlotReference]]:
+        """Leases free slot, waiting up to `timeout` seconds (forever if `None`)
+        for one to be released.
+
+        Returns:
+            Optional[Tuple[np.ndarray, FrameSlotReference]]: Array backed by the slot
+                and reference of the slot, `None` if no slot could be leased.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._free_slots or self._closed, timeout=timeout
+            )
+            if self._closed or not self._free_slots:
+                return None
+            slot = self._free_slots.popleft()
+            self._generation += 1
+            generation = self._generation
+            self._generations[slot] = generation
+            offset = self._header_size + slot * self._slot_size
+            # each lease gets its own buffer object - numpy keeps it alive as long as
+            # any array created from the slot, which lets us release the slot on GC
+            slot_memory = (ctypes.c_uint8 * self._frame_size).from_buffer(
+                self._memory.buf, offset
+            )
+        image = np.frombuffer(slot_memory, dtype=self._dtype).reshape(self._frame_shape)
+        reference = FrameSlotReference(
+            buffer_name=self.name,
+            slot=slot,
+            offset=offset,
+            generation=generation,
+            frame_shape=self._frame_shape,
+            dtype=self._dtype.str,
+        )
+        weakref.finalize(slot_memory, self._release_slot, slot, generation)
+        return image, reference
+
+    def release(self, reference: FrameSlotReference) -> None:
+        if reference.buffer_name != self.name:
+            raise ValueError(
+                f"Frame slot belongs to different ring buffer: {reference.buffer_name}"
+            )
+        self._release_slot(slot=reference.slot, generation=reference.generation)
+
+    def close(self) -> None:
+        """Unlinks the segment. Frames that are still leased stay valid until
+        released - memory is unmapped with the last of them."""
+        with self._condition:
+            if self._closed:
+                return None
+            self._closed = True
+            self._condition.notify_all()
+        unlink_shared_memory(memory=self._memory)
+        self._generations = None
+        if not try_close_shared_memory(memory=self._memory):
+            _DETACHED_MEMORIES.append(self._memory)
+        _close_detached_memories()
+
+    def _release_slot(self, slot: int, generation: int) -> None:
+        with self._condition:
+            if self._closed or self._generations[slot] != generation:
+                # slot already released (explicitly or by GC)
+                return None
+            self._generations[slot] = 0
+            self._free_slots.append(slot)
+            self._condition.notify()
+
+
+def release_frame_slot(reference: FrameSlotReference) -> None:
+    ring_buffer = _RING_BUFFERS_BY_NAME.get(reference.buffer_name)
+    if ring_buffer is None:
+        # ring buffer already closed or owned by another process
+        return None
+    ring_buffer.release(reference=reference)
+
+
+def attach_frame_slot(reference: FrameSlotReference) -> np.ndarray:
+    """Gives read-only access to the frame from ring buffer owned by another
+    process. Slot is not leased by the caller - it is verified that the frame was
+    not released yet, but owner of the frame must keep it until caller is done.
+
+    Raises:
+        StaleFrameSlotError: when the slot was already released by its owner.
+    """
+    with _ATTACHED_MEMORIES_LOCK:
+        memory = _ATTACHED_MEMORIES.get(reference.buffer_name)
+        if memory is None:
+            memory = attach_shared_memory(name=reference.buffer_name)
+            _ATTACHED_MEMORIES[reference.buffer_name] = memory
+    generation = np.ndarray(
+        (1,),
+        dtype=GENERATIONS_DTYPE,
+        buffer=memory.buf,
+        offset=reference.slot * GENERATIONS_DTYPE.itemsize,
+    )[0]
+    if generation != reference.generation:
+        raise StaleFrameSlotError(
+            f"Slot {reference.slot} of {reference.buffer_name} was already released"
+        )
+    image = shared_memory_array(
+        memory=memory,
+        shape=reference.frame_shape,
+        dtype=reference.dtype,
+        offset=reference.offset,
+    )
+    image.flags.writeable = False
+    return image
+
+
+def detach_frames_ring_buffers() -> None:
+    """Unmaps segments attached with `attach_frame_slot(...)`."""
+    with _ATTACHED_MEMORIES_LOCK:
+        memories = list(_ATTACHED_MEMORIES.values())
+        _ATTACHED_MEMORIES.clear()
+    _DETACHED_MEMORIES.extend(memories)
+    _close_detached_memories()
+
+
+def get_ring_buffer_size(
+    frame_shape: Tuple[int, ...], slots: int, dtype: str = "|u1"
+) -> int:
+    """Size (in bytes) of shared memory segment of the ring buffer."""
+    return _get_header_size(slots=slots) + slots * _get_slot_size(
+        frame_shape=frame_shape, dtype=dtype
+    )
+
+
+def _get_header_size(slots: int) -> int:
+    return _align(slots * GENERATIONS_DTYPE.itemsize)
+
+
+def _get_slot_size(frame_shape: Tuple[int, ...], dtype: str) -> int:
+    return _align(int(np.prod(frame_shape)) * np.dtype(dtype).itemsize)
+
+
+def _align(size: int) -> int:
+    return (size + SLOT_ALIGNMENT - 1) // SLOT_ALIGNMENT * SLOT_ALIGNMENT
+
+
+def _close_detached_memories() -> None:
+    # segments with frames still referenced are unmapped on subsequent calls
+    _DETACHED_MEMORIES[:] = close_detached_shared_memories(memories=_DETACHED_MEMORIES)
+
+
+_RING_BUFFERS_BY_NAME: (
+    "weakref.WeakValueDictionary[str, SharedMemoryFramesRingBuffer]"
+) = weakref.WeakValueDictionary()
+_ATTACHED_MEMORIES: Dict[str, SharedMemory] = {}
+_ATTACHED_MEMORIES_LOCK = Lock()
+_DETACHED_MEMORIES: List[SharedMemory] = []
@@ -7,6 +7,7 @@ from queue import Empty, Queue
 from threading import Event, Lock, Thread
 from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, Union
 
+import av
 import cv2
 import supervision as sv
 from numpy import ndarray
@@ -19,7 +20,11 @@ from inference.core.env import (
     DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW,
     DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES,
     RUNS_ON_JETSON,
+    VIDEO_SOURCE_DECODING_MODE,
+    VIDEO_SOURCE_SHARED_MEMORY_BUFFER,
+    VIDEO_SOURCE_SHARED_MEMORY_SLOTS,
 )
+from inference.core.exceptions import InvalidEnvironmentVariableError
 from inference.core.interfaces.camera.entities import (
     SourceProperties,
     StatusUpdate,
@@ -33,6 +38,12 @@ from inference.core.interfaces.camera.exceptions import (
     SourceConnectionError,
     StreamOperationNotAllowedError,
 )
+from inference.core.interfaces.camera.frames_ring_buffer import (
+    FrameSlotReference,
+    SharedMemoryFramesRingBuffer,
+    get_ring_buffer_size,
+)
+from inference.core.utils.shared_memory import get_shared_memory_free_space
 
 VIDEO_SOURCE_CONTEXT = "video_source"
 VIDEO_CONSUMER_CONTEXT = "video_consumer"
@@ -45,6 +56,11 @@ VIDEO_CONSUMPTION_STARTED_EVENT = "VIDEO_CONSUMPTION_STARTED"
 VIDEO_CONSUMPTION_FINISHED_EVENT = "VIDEO_CONSUMPTION_FINISHED"
 
 POISON_PILL = "POISON_PILL"
+# time for which WAIT strategy waits for consumer to release shared memory slot
+FRAME_SLOT_ACQUISITION_TIMEOUT = 1.0
+# minimal number of frames to be skipped, for which seeking the video file is considered
+MINIMUM_FRAMES_SKIPPED_BY_SEEK = 8
+DECODING_COST_SMOOTHING_FACTOR = 0.1
 
 
 class StreamState(Enum):
@@ -107,6 +123,24 @@ class BufferConsumptionStrategy(Enum):
     EAGER = "EAGER"
 
 
+class DecodingMode(Enum):
+    FULL = "FULL"
+    SKIP_DECODE = "SKIP_DECODE"
+    KEY_FRAMES_ONLY = "KEY_FRAMES_ONLY"
+
+
+def get_default_decoding_mode(
+    decoding_mode: str = VIDEO_SOURCE_DECODING_MODE,
+) -> DecodingMode:
+    try:
+        return DecodingMode(decoding_mode.strip().upper())
+    except ValueError as error:
+        raise InvalidEnvironmentVariableError(
+            f"VIDEO_SOURCE_DECODING_MODE must be one of "
+            f"{[mode.value for mode in DecodingMode]}, got `{decoding_mode}`"
+        ) from error
+
+
 @dataclass(frozen=True)
 class SourceMetadata:
     source_properties: Optional[SourceProperties]
@@ -148,6 +182,15 @@ class CV2VideoFrameProducer(VideoFrameProducer):
     def retrieve(self) -> Tuple[bool, ndarray]:
         return self.stream.retrieve()
 
+    def retrieve_into(self, image: ndarray) -> Tuple[bool, ndarray]:
+        return self.stream.retrieve(image=image)
+
+    def get_position(self) -> Optional[int]:
+        return int(self.stream.get(cv2.CAP_PROP_POS_FRAMES))
+
+    def seek(self, position: int) -> bool:
+        return self.stream.set(cv2.CAP_PROP_POS_FRAMES, position)
+
     def initialize_source_properties(self, properties: Dict[str, float]) -> None:
         for property_id, value in properties.items():
             cv2_id = getattr(cv2, "CAP_PROP_" + property_id.upper())
@@ -170,6 +213,76 @@ class CV2VideoFrameProducer(VideoFrameProducer):
         self.stream.release()
 
 
+class KeyFramesVideoFrameProducer(VideoFrameProducer):
+    """Decodes only key frames of the video (other frames are discarded by the decoder
+    without being decoded) - suitable for analytics running at very low FPS."""
+
+    def __init__(self, video: str):
+        self._container: Optional[av.container.InputContainer] = None
+        self._frame: Optional[av.VideoFrame] = None
+        try:
+            self._container = av.open(video)
+        except av.error.FFmpegError as error:
+            logger.warning(f"Could not open video source {video}. Cause: {error}")
+            return None
+        self._stream = self._container.streams.video[0]
+        self._stream.codec_context.skip_frame = "NONKEY"
+        self._frames = self._container.decode(self._stream)
+
+    def isOpened(self) -> bool:
+        return self._container is not None
+
+    def grab(self) -> bool:
+        try:
+            self._frame = next(self._frames, None)
+        except av.error.FFmpegError as error:
+            logger.warning(f"Could not decode key frame. Cause: {error}")
+            self._frame = None
+        return self._frame is not None
+
+    def retrieve(self) -> Tuple[bool, ndarray]:
+        if self._frame is None:
+            return False, None
+        return True, self._frame.to_ndarray(format="bgr24")
+
+    def get_position(self) -> Optional[int]:
+        if self._frame is None or self._frame.time is None:
+            return None
+        return round(self._frame.time * self._get_fps()) + 1
+
+    def discover_source_properties(self) -> SourceProperties:
+        fps = self._get_fps()
+        total_frames = self._stream.frames
+        if total_frames <= 0:
+            # containers like mkv or webm do not store number of frames - it is
+            # estimated from duration (which is not known for streams)
+            total_frames = round(self._get_duration() * fps)
+        return SourceProperties(
+            width=self._stream.codec_context.width,
+            height=self._stream.codec_context.height,
+            total_frames=total_frames,
+            is_file=total_frames > 0,
+            fps=fps,
+        )
+
+    def release(self):
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+
+    def _get_fps(self) -> float:
+        if self._stream.average_rate is None:
+            return 0.0
+        return float(self._stream.average_rate)
+
+    def _get_duration(self) -> float:
+        if self._stream.duration is not None and self._stream.time_base is not None:
+            return float(self._stream.duration * self._stream.time_base)
+        if self._container.duration is not None:
+            return self._container.duration / av.time_base
+        return 0.0
+
+
 def _consumes_camera_on_jetson(video: Union[str, int]) -> bool:
     if not RUNS_ON_JETSON:
         return False
@@ -194,6 +307,8 @@ class VideoSource:
         video_source_properties: Optional[Dict[str, float]] = None,
         source_id: Optional[int] = None,
         desired_fps: Optional[Union[float, int]] = None,
+        shared_memory_buffer: bool = VIDEO_SOURCE_SHARED_MEMORY_BUFFER,
+        decoding_mode: Optional[DecodingMode] = None,
     ):
         """
         This class is meant to represent abstraction over video sources - both video files and
@@ -265,6 +380,27 @@ class VideoSource:
         reader pace and maximum number of consecutive frames dropped in ADAPTIVE mode are configurable by clients,
         with reasonable defaults being set.
 
+        With `shared_memory_buffer` enabled, frames are decoded directly into slots of
+        `SharedMemoryFramesRingBuffer` sized to the source resolution, instead of being allocated one by one.
+        Ring buffer holds VIDEO_SOURCE_SHARED_MEMORY_SLOTS slots (regardless of `buffer_size`) for frames waiting
+        in buffer and frames already taken by consumer - it is not created when there is not enough free space
+        in `/dev/shm`. `VideoFrame.image` is a view into the slot and
+        `VideoFrame.slot_reference` points to the slot (allowing other processes to read the frame without copy).
+        Slots are returned with `VideoFrame.release()` or once the frame is garbage collected. Frames dropped
+        according to buffering strategies release their slots immediately. When consumer holds all slots,
+        `WAIT` strategy waits for a slot to be released for a moment - then (and for other strategies - at once)
+        frame is decoded into regularly allocated array, so that the source never stalls on the ring buffer.
+
+        Effort spent on decoding frames that would not be used is dictated by `DecodingMode`:
+        * FULL - each grabbed frame is decoded, frames are dropped afterwards (default behaviour)
+        * SKIP_DECODE - frames exceeding `desired_fps` or the pace of consumer are only grabbed, never decoded
+        into images - for DROP_OLDEST and DROP_LATEST the consumer pace is taken into account in the same way as
+        for their ADAPTIVE versions. Video files are sub-sampled by seeking over skipped frames when it is
+        measured to be cheaper than grabbing them one by one.
+        * KEY_FRAMES_ONLY - SKIP_DECODE mode where decoder discards all frames apart from key frames, which is
+        the cheapest way to process video at very low FPS (applies to file and stream references - devices are
+        always decoded fully). Frames ids of video files still correspond to frames positions.
+
         `VideoSource` emits events regarding its activity - which can be intercepted by custom handlers. Take
         into account that they are always executed in context of thread invoking them (and should be fast to complete,
         otherwise may block the flow of stream consumption). All errors raised will be emitted as logger warnings only.
@@ -279,6 +415,9 @@ class VideoSource:
         * VIDEO_SOURCE_ADAPTIVE_MODE_READER_PACE_TOLERANCE - default: 5.0
         * VIDEO_SOURCE_MINIMUM_ADAPTIVE_MODE_SAMPLES - default: 10
         * VIDEO_SOURCE_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW - default: 16
+        * VIDEO_SOURCE_SHARED_MEMORY_BUFFER - default: False
+        * VIDEO_SOURCE_DECODING_MODE - default: FULL
+        * VIDEO_SOURCE_SHARED_MEMORY_SLOTS - default: 16
 
         As an `inference` user, please use .init() method instead of constructor to instantiate objects.
 
@@ -303,10 +442,15 @@ class VideoSource:
             source_id (Optional[int]): Optional identifier of video source - mainly useful to recognise specific source
                 when multiple ones are in use. Identifier will be added to emitted frames and updates. It is advised
                 to keep it unique within all sources in use.
+            desired_fps (Optional[Union[float, int]]): Target FPS of frames emitted by the source
+            shared_memory_buffer (bool): Flag to decode frames into shared memory ring buffer
+            decoding_mode (Optional[DecodingMode]): Mode of decoding - VIDEO_SOURCE_DECODING_MODE if not given
 
         Returns: Instance of `VideoSource` class
         """
         frames_buffer = Queue(maxsize=buffer_size)
+        if decoding_mode is None:
+            decoding_mode = get_default_decoding_mode()
         if status_update_handlers is None:
             status_update_handlers = []
         video_consumer = VideoConsumer.init(
@@ -317,6 +461,7 @@ class VideoSource:
             maximum_adaptive_frames_dropped_in_row=maximum_adaptive_frames_dropped_in_row,
             status_update_handlers=status_update_handlers,
             desired_fps=desired_fps,
+            decoding_mode=decoding_mode,
         )
         return cls(
             stream_reference=video_reference,
@@ -326,6 +471,7 @@ class VideoSource:
             video_consumer=video_consumer,
             video_source_properties=video_source_properties,
             source_id=source_id,
+            shared_memory_buffer=shared_memory_buffer,
         )
 
     def __init__(
@@ -337,6 +483,7 @@ class VideoSource:
         video_consumer: "VideoConsumer",
         video_source_properties: Optional[Dict[str, float]],
         source_id: Optional[int],
+        shared_memory_buffer: bool = False,
     ):
         self._stream_reference = stream_reference
         self._video: Optional[VideoFrameProducer] = None
@@ -352,6 +499,8 @@ class VideoSource:
         self._state_change_lock = Lock()
         self._video_source_properties = video_source_properties or {}
         self._source_id = source_id
+        self._shared_memory_buffer = shared_memory_buffer
+        self._frames_ring_buffer: Optional[SharedMemoryFramesRingBuffer] = None
 
     @property
     def source_id(self) -> Optional[int]:
@@ -441,6 +590,7 @@ class VideoSource:
             wait_on_frames_consumption=wait_on_frames_consumption,
             purge_frames_buffer=purge_frames_buffer,
         )
+        self._close_frames_ring_buffer()
 
     @lock_state_transition
     def pause(self) -> None:
@@ -586,6 +736,10 @@ class VideoSource:
         self._change_state(target_state=StreamState.INITIALISING)
         if callable(self._stream_reference):
             self._video = self._stream_reference()
+        elif self._video_consumer.decoding_mode is DecodingMode.KEY_FRAMES_ONLY and (
+            isinstance(self._stream_reference, str)
+        ):
+            self._video = KeyFramesVideoFrameProducer(self._stream_reference)
         else:
             self._video = CV2VideoFrameProducer(self._stream_reference)
         if not self._video.isOpened():
@@ -596,6 +750,7 @@ class VideoSource:
         self._video.initialize_source_properties(self._video_source_properties)
         self._source_properties = self._video.discover_source_properties()
         self._video_consumer.reset(source_properties=self._source_properties)
+        self._prepare_frames_ring_buffer()
         if self._source_properties.is_file:
             self._set_file_mode_consumption_strategies()
         else:
@@ -620,6 +775,49 @@ class VideoSource:
         if previous_state is not StreamState.ERROR:
             self._change_state(target_state=StreamState.ENDED)
 
+    def _prepare_frames_ring_buffer(self) -> None:
+        if not self._shared_memory_buffer:
+            return None
+        frame_shape = (self._source_properties.height, self._source_properties.width, 3)
+        if self._frames_ring_buffer is not None:
+            if self._frames_ring_buffer.frame_shape == frame_shape:
+                return None
+            self._close_frames_ring_buffer()
+        if frame_shape[0] <= 0 or frame_shape[1] <= 0:
+            logger.warning(
+                "Resolution of video source is unknown - frames will not be decoded "
+                "into shared memory buffer."
+            )
+            return None
+        slots = max(VIDEO_SOURCE_SHARED_MEMORY_SLOTS, 1)
+        required_size = get_ring_buffer_size(frame_shape=frame_shape, slots=slots)
+        free_space = get_shared_memory_free_space()
+        if free_space is not None and required_size > free_space:
+            # segment would be created anyway, but writes beyond the limit of /dev/shm
+            # would kill the process with SIGBUS
+            logger.warning(
+                f"Shared memory ring buffer for {slots} frames of shape {frame_shape} "
+                f"requires {required_size} bytes, while only {free_space} bytes of "
+                f"shared memory are free - frames will be allocated regularly."
+            )
+            return None
+        try:
+            self._frames_ring_buffer = SharedMemoryFramesRingBuffer(
+                frame_shape=frame_shape, slots=slots
+            )
+        except OSError as error:
+            logger.warning(
+                f"Could not create shared memory ring buffer - frames will be "
+                f"allocated regularly. Cause: {error}"
+            )
+
+    def _close_frames_ring_buffer(self) -> None:
+        if self._frames_ring_buffer is None:
+            return None
+        # frames already decoded stay valid until released by consumers
+        self._frames_ring_buffer.close()
+        self._frames_ring_buffer = None
+
     def _pause(self) -> None:
         self._playback_allowed.clear()
         self._change_state(target_state=StreamState.PAUSED)
@@ -671,6 +869,7 @@ class VideoSource:
                     buffer=self._frames_buffer,
                     frames_buffering_allowed=self._frames_buffering_allowed,
                     source_id=self._source_id,
+                    frames_ring_buffer=self._frames_ring_buffer,
                 )
                 if not success:
                     break
@@ -757,6 +956,7 @@ class VideoConsumer:
         maximum_adaptive_frames_dropped_in_row: int,
         status_update_handlers: List[Callable[[StatusUpdate], None]],
         desired_fps: Optional[Union[float, int]] = None,
+        decoding_mode: DecodingMode = DecodingMode.FULL,
     ) -> "VideoConsumer":
         minimum_adaptive_mode_samples = max(minimum_adaptive_mode_samples, 2)
         reader_pace_monitor = sv.FPSMonitor(
@@ -779,6 +979,7 @@ class VideoConsumer:
             stream_consumption_pace_monitor=stream_consumption_pace_monitor,
             decoding_pace_monitor=decoding_pace_monitor,
             desired_fps=desired_fps,
+            decoding_mode=decoding_mode,
         )
 
     def __init__(
@@ -793,6 +994,7 @@ class VideoConsumer:
         stream_consumption_pace_monitor: sv.FPSMonitor,
         decoding_pace_monitor: sv.FPSMonitor,
         desired_fps: Optional[Union[float, int]],
+        decoding_mode: DecodingMode = DecodingMode.FULL,
     ):
         self._buffer_filling_strategy = buffer_filling_strategy
         self._frame_counter = 0
@@ -811,11 +1013,20 @@ class VideoConsumer:
         self._is_source_video_file = None
         self._status_update_handlers = status_update_handlers
         self._next_frame_from_video_to_accept = 1
+        self._decoding_mode = decoding_mode
+        self._position_offset = 0
+        self._grab_duration: Optional[float] = None
+        self._seek_duration: Optional[float] = None
+        self._seeking_supported = True
 
     @property
     def buffer_filling_strategy(self) -> Optional[BufferFillingStrategy]:
         return self._buffer_filling_strategy
 
+    @property
+    def decoding_mode(self) -> DecodingMode:
+        return self._decoding_mode
+
     def reset(self, source_properties: SourceProperties) -> None:
         if source_properties.is_file:
             self._set_file_mode_buffering_strategies()
@@ -826,6 +1037,8 @@ class VideoConsumer:
         self._decoding_pace_monitor.reset()
         self._adaptive_frames_dropped_in_row = 0
         self._next_frame_from_video_to_accept = self._frame_counter + 1
+        self._position_offset = self._frame_counter
+        self._seeking_supported = True
 
     def reset_stream_consumption_pace(self) -> None:
         self._stream_consumption_pace_monitor.reset()
@@ -841,17 +1054,24 @@ class VideoConsumer:
         buffer: Queue,
         frames_buffering_allowed: bool,
         source_id: Optional[int] = None,
+        frames_ring_buffer: Optional[SharedMemoryFramesRingBuffer] = None,
     ) -> bool:
         if self._is_source_video_file is None:
             source_properties = video.discover_source_properties()
             self._is_source_video_file = source_properties.is_file
             self._declared_source_fps = source_properties.fps
+        if self._decoding_mode is not DecodingMode.FULL:
+            self._skip_frames_by_seeking(video=video)
         frame_timestamp = datetime.now()
+        grab_start = time.monotonic()
         success = video.grab()
         self._stream_consumption_pace_monitor.tick()
         if not success:
             return False
-        self._frame_counter += 1
+        self._grab_duration = update_moving_average(
+            average=self._grab_duration, value=time.monotonic() - grab_start
+        )
+        self._frame_counter = self._get_grabbed_frame_number(video=video)
         send_video_source_status_update(
             severity=UpdateSeverity.DEBUG,
             event_type=FRAME_CAPTURED_EVENT,
@@ -880,6 +1100,7 @@ class VideoConsumer:
             buffer=buffer,
             frames_buffering_allowed=frames_buffering_allowed,
             source_id=source_id,
+            frames_ring_buffer=frames_ring_buffer,
         )
 
     def _set_file_mode_buffering_strategies(self) -> None:
@@ -890,6 +1111,42 @@ class VideoConsumer:
         if self._buffer_filling_strategy is None:
             self._buffer_filling_strategy = BufferFillingStrategy.ADAPTIVE_DROP_OLDEST
 
+    def _skip_frames_by_seeking(self, video: VideoFrameProducer) -> None:
+        if (
+            not self._is_source_video_file
+            or self._desired_fps is None
+            or not self._seeking_supported
+        ):
+            return None
+        frames_to_skip = self._next_frame_from_video_to_accept - self._frame_counter - 1
+        if frames_to_skip < MINIMUM_FRAMES_SKIPPED_BY_SEEK:
+            return None
+        if (
+            self._seek_duration is not None
+            and self._grab_duration is not None
+            and frames_to_skip * self._grab_duration < self._seek_duration
+        ):
+            # grabbing frames one by one is cheaper
+            return None
+        seek_start = time.monotonic()
+        position = self._next_frame_from_video_to_accept - 1 - self._position_offset
+        if not video.seek(position=position):
+            self._seeking_supported = False
+            return None
+        self._seek_duration = update_moving_average(
+            average=self._seek_duration, value=time.monotonic() - seek_start
+        )
+        self._frame_counter = self._next_frame_from_video_to_accept - 1
+
+    def _get_grabbed_frame_number(self, video: VideoFrameProducer) -> int:
+        if self._decoding_mode is DecodingMode.FULL or not self._is_source_video_file:
+            return self._frame_counter + 1
+        # producer may have skipped frames (for instance - decoding only key frames)
+        position = video.get_position()
+        if position is None:
+            return self._frame_counter + 1
+        return max(self._position_offset + position, self._frame_counter + 1)
+
     def _video_fps_should_be_sub_sampled(self) -> bool:
         if self._desired_fps is None:
             return False
@@ -906,12 +1163,12 @@ class VideoConsumer:
                 actual_fps = self._stream_consumption_pace_monitor.fps
             else:
                 actual_fps = self._stream_consumption_pace_monitor()
-        if self._frame_counter == self._next_frame_from_video_to_accept:
+        if self._frame_counter >= self._next_frame_from_video_to_accept:
             stride = calculate_video_file_stride(
                 actual_fps=actual_fps,
                 desired_fps=self._desired_fps,
             )
-            self._next_frame_from_video_to_accept += stride
+            self._next_frame_from_video_to_accept = self._frame_counter + stride
             return False
         # skipping frame
         return True
@@ -926,6 +1183,7 @@ class VideoConsumer:
         buffer: Queue,
         frames_buffering_allowed: bool,
         source_id: Optional[int],
+        frames_ring_buffer: Optional[SharedMemoryFramesRingBuffer] = None,
     ) -> bool:
         """
         Returns: boolean flag with success status
@@ -966,6 +1224,12 @@ class VideoConsumer:
                 declared_source_fps=declared_source_fps,
                 measured_source_fps=measured_source_fps,
                 comes_from_video_file=is_source_video_file,
+                frames_ring_buffer=frames_ring_buffer,
+                frame_slot_acquisition_timeout=(
+                    FRAME_SLOT_ACQUISITION_TIMEOUT
+                    if self._buffer_filling_strategy is BufferFillingStrategy.WAIT
+                    else 0.0
+                ),
             )
         if self._buffer_filling_strategy in DROP_OLDEST_STRATEGIES:
             return self._process_stream_frame_dropping_oldest(
@@ -974,6 +1238,7 @@ class VideoConsumer:
                 buffer=buffer,
                 source_id=source_id,
                 is_video_file=is_source_video_file,
+                frames_ring_buffer=frames_ring_buffer,
             )
         send_frame_drop_update(
             frame_timestamp=frame_timestamp,
@@ -987,7 +1252,7 @@ class VideoConsumer:
     def _frame_should_be_adaptively_dropped(
         self, declared_source_fps: Optional[float]
     ) -> bool:
-        if self._buffer_filling_strategy not in ADAPTIVE_STRATEGIES:
+        if not self._adaptive_dropping_enabled():
             return False
         if (
             self._adaptive_frames_dropped_in_row
@@ -1037,6 +1302,15 @@ class VideoConsumer:
             return True
         return False
 
+    def _adaptive_dropping_enabled(self) -> bool:
+        if self._buffer_filling_strategy in ADAPTIVE_STRATEGIES:
+            return True
+        # frames consumer would not keep up with are not decoded in skip-decode modes
+        return (
+            self._decoding_mode is not DecodingMode.FULL
+            and self._buffer_filling_strategy is not BufferFillingStrategy.WAIT
+        )
+
     def _process_stream_frame_dropping_oldest(
         self,
         frame_timestamp: datetime,
@@ -1044,6 +1318,7 @@ class VideoConsumer:
         buffer: Queue,
         source_id: Optional[int],
         is_video_file: bool,
+        frames_ring_buffer: Optional[SharedMemoryFramesRingBuffer] = None,
     ) -> bool:
         drop_single_frame_from_buffer(
             buffer=buffer,
@@ -1058,6 +1333,7 @@ class VideoConsumer:
             decoding_pace_monitor=self._decoding_pace_monitor,
             source_id=source_id,
             comes_from_video_file=is_video_file,
+            frames_ring_buffer=frames_ring_buffer,
         )
 
 
@@ -1083,6 +1359,8 @@ def get_from_queue(
         except Empty:
             pass
     while not queue.empty() and purge:
+        if isinstance(result, VideoFrame):
+            result.release()
         result = queue.get()
         queue.task_done()
         on_successful_read()
@@ -1097,6 +1375,7 @@ def drop_single_frame_from_buffer(
     try:
         video_frame = buffer.get_nowait()
         buffer.task_done()
+        video_frame.release()
         send_frame_drop_update(
             frame_timestamp=video_frame.frame_timestamp,
             frame_id=video_frame.frame_id,
@@ -1166,8 +1445,18 @@ def decode_video_frame_to_buffer(
     declared_source_fps: Optional[float] = None,
     measured_source_fps: Optional[float] = None,
     comes_from_video_file: Optional[bool] = None,
+    frames_ring_buffer: Optional[SharedMemoryFramesRingBuffer] = None,
+    frame_slot_acquisition_timeout: Optional[float] = 0.0,
 ) -> bool:
-    success, image = video.retrieve()
+    slot_reference = None
+    if frames_ring_buffer is None:
+        success, image = video.retrieve()
+    else:
+        success, image, slot_reference = retrieve_video_frame_into_slot(
+            video=video,
+            frames_ring_buffer=frames_ring_buffer,
+            timeout=frame_slot_acquisition_timeout,
+        )
     if not success:
         return False
     decoding_pace_monitor.tick()
@@ -1179,11 +1468,34 @@ def decode_video_frame_to_buffer(
         measured_fps=measured_source_fps,
         source_id=source_id,
         comes_from_video_file=comes_from_video_file,
+        slot_reference=slot_reference,
     )
     buffer.put(video_frame)
     return True
 
 
+def retrieve_video_frame_into_slot(
+    video: VideoFrameProducer,
+    frames_ring_buffer: SharedMemoryFramesRingBuffer,
+    timeout: Optional[float],
+) -> Tuple[bool, Optional[ndarray], Optional[FrameSlotReference]]:
+    frame_slot = frames_ring_buffer.acquire(timeout=timeout)
+    if frame_slot is None:
+        # all slots are held by consumers
+        success, image = video.retrieve()
+        return success, image, None
+    slot_image, slot_reference = frame_slot
+    success, image = video.retrieve_into(slot_image)
+    if success and image is slot_image:
+        return True, image, slot_reference
+    if success and image.shape == slot_image.shape and image.dtype == slot_image.dtype:
+        # producer could not decode in-place
+        slot_image[...] = image
+        return True, slot_image, slot_reference
+    frames_ring_buffer.release(reference=slot_reference)
+    return success, image, None
+
+
 def get_fps_if_tick_happens_now(fps_monitor: sv.FPSMonitor) -> float:
     if len(fps_monitor.all_timestamps) == 0:
         return 0.0
@@ -1193,6 +1505,14 @@ def get_fps_if_tick_happens_now(fps_monitor: sv.FPSMonitor) -> float:
     return (len(fps_monitor.all_timestamps) + 1) / reader_taken_time
 
 
+def update_moving_average(average: Optional[float], value: float) -> float:
+    if average is None:
+        return value
+    return (
+        1 - DECODING_COST_SMOOTHING_FACTOR
+    ) * average + DECODING_COST_SMOOTHING_FACTOR * value
+
+
 def calculate_video_file_stride(
     actual_fps: Optional[Union[float, int]], desired_fps: Optional[Union[float, int]]
 ) -> int:
@@ -0,0 +1,222 @@
+import json
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Type, Union
+
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.datastructures import FormData, UploadFile
+from typing_extensions import get_args, get_origin
+
+from inference.core.entities.requests.inference import BaseRequest
+from inference.core.entities.requests.workflows import WorkflowInferenceRequest
+from inference.core.utils.image_utils import ImageType
+
+MULTIPART_MEDIA_TYPE = "multipart/form-data"
+OCTET_STREAM_MEDIA_TYPE = "application/octet-stream"
+REQUEST_FORM_FIELD = "request"
+IMAGE_FIELD = "image"
+WORKFLOW_INPUTS_FIELD = "inputs"
+
+RouteHandler = Callable[[Request], Coroutine[Any, Any, Response]]
+
+
+class BinaryUploadsRoute(APIRoute):
+    """Route accepting images as raw bytes - besides JSON body with base64 images.
+
+    Applies to routes with body being model inference request (with `image` field) or
+    workflow inference request. Other routes behave exactly as `APIRoute`.
+
+    * `multipart/form-data` - file parts are images (named `image` for model requests
+    and after workflow input for workflow requests, repeated part makes a batch), optional
+    `request` part holds the rest of JSON payload and plain form fields set top-level
+    request fields.
+    * `application/octet-stream` (only for model requests) - body is an image, request
+    fields are taken from query parameters.
+
+    Images are passed to the request as `{"type": "bytes", "value": <bytes>}` - decoder
+    gets uploaded buffer without base64 / JSON round-trip.
+    """
+
+    def get_route_handler(self) -> RouteHandler:
+        route_handler = super().get_route_handler()
+        body_model = get_binary_uploads_body_model(route=self)
+        if body_model is None:
+            return route_handler
+
+        async def binary_uploads_route_handler(request: Request) -> Response:
+            media_type = get_media_type(request=request)
+            if media_type == MULTIPART_MEDIA_TYPE:
+                payload = await build_payload_from_multipart(
+                    request=request, body_model=body_model
+                )
+            elif media_type == OCTET_STREAM_MEDIA_TYPE:
+                payload = await build_payload_from_octet_stream(
+                    request=request, body_model=body_model
+                )
+            else:
+                return await route_handler(request)
+            return await route_handler(PreParsedJSONRequest(request, payload=payload))
+
+        return binary_uploads_route_handler
+
+
+class PreParsedJSONRequest(Request):
+    """Request presenting already decoded payload as JSON body - such that FastAPI
+    validates it against body model of the route, as any other JSON request."""
+
+    def __init__(self, request: Request, payload: Dict[str, Any]):
+        scope = dict(request.scope)
+        scope["headers"] = [
+            (name, value)
+            for name, value in request.scope["headers"]
+            if name.lower() != b"content-type"
+        ] + [(b"content-type", b"application/json")]
+        super().__init__(scope, request.receive)
+        # FastAPI only parses non-empty bodies - original body is already consumed,
+        # so the placeholder is never decoded, as `json()` returns cached payload
+        self._body = b"{}"
+        self._json = payload
+
+
+def get_binary_uploads_body_model(route: APIRoute) -> Optional[Type[BaseModel]]:
+    body_model = getattr(route.body_field, "type_", None)
+    if not isinstance(body_model, type):
+        return None
+    if issubclass(body_model, WorkflowInferenceRequest):
+        return body_model
+    if issubclass(body_model, BaseRequest) and IMAGE_FIELD in body_model.model_fields:
+        return body_model
+    return None
+
+
+def get_media_type(request: Request) -> str:
+    content_type = request.headers.get("content-type", "")
+    return content_type.split(";")[0].strip().lower()
+
+
+async def build_payload_from_multipart(
+    request: Request, body_model: Type[BaseModel]
+) -> Dict[str, Any]:
+    form = await request.form()
+    try:
+        payload = decode_request_form_field(form=form)
+        images_destination = payload
+        if issubclass(body_model, WorkflowInferenceRequest):
+            images_destination = payload.setdefault(WORKFLOW_INPUTS_FIELD, {})
+        for name in dict.fromkeys(form.keys()):
+            if name == REQUEST_FORM_FIELD:
+                continue
+            values = form.getlist(name)
+            uploads = [v for v in values if isinstance(v, UploadFile)]
+            if uploads:
+                # uploads are read eagerly - form files are closed once response is
+                # sent, while request may still be used by background tasks
+                images = [await wrap_uploaded_image(upload=u) for u in uploads]
+                images_destination[name] = images if len(images) > 1 else images[0]
+            else:
+                payload[name] = coerce_plain_field(
+                    values=values, body_model=body_model, name=name
+                )
+    finally:
+        await form.close()
+    return payload
+
+
+async def build_payload_from_octet_stream(
+    request: Request, body_model: Type[BaseModel]
+) -> Dict[str, Any]:
+    if issubclass(body_model, WorkflowInferenceRequest):
+        # raw body does not say which workflow input the image belongs to
+        raise RequestValidationError(
+            [
+                {
+                    "type": "value_error",
+                    "loc": ("body",),
+                    "msg": f"Workflows do not accept `{OCTET_STREAM_MEDIA_TYPE}` body - "
+                    f"use `{MULTIPART_MEDIA_TYPE}` with file part named after workflow input",
+                    "input": {},
+                }
+            ]
+        )
+    payload = {
+        name: coerce_plain_field(
+            values=request.query_params.getlist(name),
+            body_model=body_model,
+            name=name,
+        )
+        for name in dict.fromkeys(request.query_params.keys())
+    }
+    payload[IMAGE_FIELD] = {
+        "type": ImageType.BYTES.value,
+        "value": await request.body(),
+    }
+    return payload
+
+
+def decode_request_form_field(form: FormData) -> Dict[str, Any]:
+    serialised_request = form.get(REQUEST_FORM_FIELD)
+    if serialised_request is None:
+        return {}
+    if isinstance(serialised_request, UploadFile):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "value_error",
+                    "loc": ("body", REQUEST_FORM_FIELD),
+                    "msg": f"Form field `{REQUEST_FORM_FIELD}` must be JSON string, not file",
+                    "input": {},
+                }
+            ]
+        )
+    try:
+        payload = json.loads(serialised_request)
+    except json.JSONDecodeError as error:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", REQUEST_FORM_FIELD, error.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": error.msg},
+                }
+            ],
+            body=error.doc,
+        ) from error
+    if not isinstance(payload, dict):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "dict_type",
+                    "loc": ("body", REQUEST_FORM_FIELD),
+                    "msg": f"Form field `{REQUEST_FORM_FIELD}` must be JSON object",
+                    "input": payload,
+                }
+            ]
+        )
+    return payload
+
+
+async def wrap_uploaded_image(upload: UploadFile) -> Dict[str, Any]:
+    return {"type": ImageType.BYTES.value, "value": await upload.read()}
+
+
+def coerce_plain_field(
+    values: List[str], body_model: Type[BaseModel], name: str
+) -> Union[str, List[str]]:
+    # form fields and query parameters are strings - pydantic coerces them to declared
+    # types, but list fields must be given as lists, even if single value is provided
+    field = body_model.model_fields.get(name)
+    if field is not None and accepts_list(annotation=field.annotation):
+        return values
+    return values[-1]
+
+
+def accepts_list(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin is list:
+        return True
+    if origin is Union:
+        return any(accepts_list(annotation=a) for a in get_args(annotation))
+    return False
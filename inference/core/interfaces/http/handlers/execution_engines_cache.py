@@ -0,0 +1,140 @@
+import hashlib
+import json
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Callable, Dict, Generator, Optional, Tuple
+
+from fastapi import BackgroundTasks
+
+from inference.core import logger
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+
+WorkflowIdentity = Tuple[str, str, Optional[str]]
+
+_CURRENT_BACKGROUND_TASKS: ContextVar[Optional[BackgroundTasks]] = ContextVar(
+    "current_background_tasks", default=None
+)
+
+
+class RequestScopedBackgroundTasks:
+    """Stands in for `BackgroundTasks` of the request being currently processed.
+
+    Blocks of a cached Execution Engine are initialised once, but each request comes with
+    its own `BackgroundTasks` - this object is injected into blocks instead and delegates to
+    the tasks bound with `bind_background_tasks(...)`. It is falsy when the request has no
+    background tasks, so blocks fall back to their regular behaviour.
+    """
+
+    def add_task(self, func: Callable[..., Any], *args, **kwargs) -> None:
+        background_tasks = _CURRENT_BACKGROUND_TASKS.get()
+        if background_tasks is None:
+            func(*args, **kwargs)
+            return None
+        background_tasks.add_task(func, *args, **kwargs)
+
+    def __bool__(self) -> bool:
+        return _CURRENT_BACKGROUND_TASKS.get() is not None
+
+
+@contextmanager
+def bind_background_tasks(
+    background_tasks: Optional[BackgroundTasks],
+) -> Generator[None, None, None]:
+    token = _CURRENT_BACKGROUND_TASKS.set(background_tasks)
+    try:
+        yield None
+    finally:
+        _CURRENT_BACKGROUND_TASKS.reset(token)
+
+
+class ExecutionEnginesCache:
+    """LRU cache of initialised Execution Engines - so that compilation of the Workflow
+    and initialisation of its blocks happen once, not on every request.
+
+    Engines are keyed by hash of the Workflow definition, `api_key` and `workflow_id`.
+    Engines of predefined Workflows are also tracked by their identity (workspace,
+    workflow id and api key) - when a different definition arrives for the same
+    identity (or the definition is explicitly re-fetched), the old engine is dropped.
+
+    Engines with steps not declared stateless (see `WorkflowBlock.is_stateless()`) are
+    never cached - state of trackers, counters, buffers, ... would leak between
+    concurrent and unrelated requests.
+    """
+
+    def __init__(self, cache_size: int):
+        self._cache_size = cache_size
+        self._engines: "OrderedDict[str, ExecutionEngine]" = OrderedDict()
+        self._keys_by_identity: Dict[WorkflowIdentity, str] = {}
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache_size > 0
+
+    def get_or_init(
+        self,
+        workflow_definition: dict,
+        api_key: Optional[str],
+        workflow_id: Optional[str],
+        init_engine: Callable[[], ExecutionEngine],
+        identity: Optional[WorkflowIdentity] = None,
+    ) -> ExecutionEngine:
+        if not self.enabled:
+            return init_engine()
+        key = _get_cache_key(
+            workflow_definition=workflow_definition,
+            api_key=api_key,
+            workflow_id=workflow_id,
+        )
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                return engine
+        # initialisation happens outside of the lock - concurrent misses for the same
+        # workflow may initialise it twice, but other workflows are not blocked
+        engine = init_engine()
+        if engine.has_stateful_steps():
+            return engine
+        with self._lock:
+            if identity is not None:
+                previous_key = self._keys_by_identity.get(identity)
+                if previous_key is not None and previous_key != key:
+                    logger.debug(
+                        f"Workflow {identity} changed - dropping cached engine"
+                    )
+                    self._engines.pop(previous_key, None)
+                self._keys_by_identity[identity] = key
+            self._engines[key] = engine
+            self._engines.move_to_end(key)
+            while len(self._engines) > self._cache_size:
+                self._engines.popitem(last=False)
+        return engine
+
+    def invalidate(self, identity: WorkflowIdentity) -> None:
+        with self._lock:
+            key = self._keys_by_identity.pop(identity, None)
+            if key is not None:
+                self._engines.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._engines.clear()
+            self._keys_by_identity.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._engines)
+
+
+def _get_cache_key(
+    workflow_definition: dict, api_key: Optional[str], workflow_id: Optional[str]
+) -> str:
+    hash_chunks = [
+        json.dumps(workflow_definition, sort_keys=True),
+        str(api_key),
+        str(workflow_id),
+    ]
+    return hashlib.md5("<|>".join(hash_chunks).encode("utf-8")).hexdigest()
@@ -4,13 +4,28 @@ import os
 import traceback
 from functools import partial, wraps
 from time import sleep
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 import asgi_correlation_id
 import uvicorn
-from fastapi import BackgroundTasks, Depends, FastAPI, Path, Query, Request
+from fastapi import (
+    BackgroundTasks,
+    Depends,
+    FastAPI,
+    Header,
+    Path,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse, Response
+from fastapi.responses import (
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi_cprofile.profiler import CProfileMiddleware
 from pydantic import BaseModel
@@ -130,6 +145,7 @@ from inference.core.env import (
     PRELOAD_MODELS,
     PROFILE,
     ROBOFLOW_SERVICE_SECRET,
+    WORKFLOWS_EXECUTION_ENGINES_CACHE_SIZE,
     WORKFLOWS_MAX_CONCURRENT_STEPS,
     WORKFLOWS_PROFILER_BUFFER_SIZE,
     WORKFLOWS_STEP_EXECUTION_MODE,
@@ -137,6 +153,7 @@ from inference.core.env import (
 from inference.core.exceptions import (
     ContentTypeInvalid,
     ContentTypeMissing,
+    InferenceExecutorQueueFullError,
     InferenceModelNotFound,
     InputImageLoadError,
     InvalidEnvironmentVariableError,
@@ -147,6 +164,8 @@ from inference.core.exceptions import (
     MissingApiKeyError,
     MissingServiceSecretError,
     ModelArtefactError,
+    ModelInferenceQueueFullError,
+    ModelLoadingInProgressError,
     OnnxProviderNotAvailable,
     PostProcessingError,
     PreProcessingError,
@@ -158,12 +177,23 @@ from inference.core.exceptions import (
     WorkspaceLoadError,
 )
 from inference.core.interfaces.base import BaseInterface
+from inference.core.interfaces.http.binary_uploads import BinaryUploadsRoute
+from inference.core.interfaces.http.handlers.execution_engines_cache import (
+    ExecutionEnginesCache,
+    RequestScopedBackgroundTasks,
+    WorkflowIdentity,
+    bind_background_tasks,
+)
 from inference.core.interfaces.http.handlers.workflows import (
     filter_out_unwanted_workflow_outputs,
     handle_describe_workflows_blocks_request,
     handle_describe_workflows_interface,
 )
 from inference.core.interfaces.http.middlewares.gzip import gzip_response_if_requested
+from inference.core.interfaces.http.msgpack_utils import (
+    accepts_msgpack,
+    msgpack_response,
+)
 from inference.core.interfaces.http.orjson_utils import orjson_response
 from inference.core.interfaces.stream_manager.api.entities import (
     CommandResponse,
@@ -183,8 +213,10 @@ from inference.core.interfaces.stream_manager.api.stream_manager_client import (
 )
 from inference.core.interfaces.stream_manager.manager_app.entities import (
     ConsumeResultsPayload,
+    DropPolicy,
     InitialisePipelinePayload,
     InitialiseWebRTCPipelinePayload,
+    SubscribeResultsPayload,
 )
 from inference.core.interfaces.stream_manager.manager_app.errors import (
     CommunicationProtocolError,
@@ -207,6 +239,9 @@ from inference.core.workflows.core_steps.common.query_language.errors import (
     InvalidInputTypeError,
     OperationTypeNotRecognisedError,
 )
+from inference.core.workflows.core_steps.common.serializers import (
+    use_detections_serialization_format,
+)
 from inference.core.workflows.errors import (
     DynamicBlockError,
     ExecutionGraphStructureError,
@@ -374,6 +409,14 @@ def with_route_exceptions(route):
                 },
             )
             traceback.print_exc()
+        except ModelInferenceQueueFullError:
+            resp = JSONResponse(
+                status_code=429,
+                content={
+                    "message": "Too many requests waiting for the model. Try again later."
+                },
+            )
+            traceback.print_exc()
         except (
             InvalidEnvironmentVariableError,
             MissingServiceSecretError,
@@ -419,6 +462,18 @@ def with_route_exceptions(route):
                 content={"message": "Internal error. Request to Roboflow API failed."},
             )
             traceback.print_exc()
+        except InferenceExecutorQueueFullError:
+            resp = JSONResponse(
+                status_code=503,
+                content={"message": "Server is overloaded. Try again later."},
+            )
+            traceback.print_exc()
+        except ModelLoadingInProgressError:
+            resp = JSONResponse(
+                status_code=503,
+                content={"message": "Model is being loaded. Try again later."},
+                headers={"Retry-After": "1"},
+            )
         except RoboflowAPIConnectionError:
             resp = JSONResponse(
                 status_code=503,
@@ -460,6 +515,34 @@ def with_route_exceptions(route):
     return wrapped_route
 
 
+def parse_results_subscription(
+    excluded_fields: List[str] = Query(default=[]),
+    max_batch_size: Optional[int] = Query(default=None, ge=1),
+    buffer_size: Optional[int] = Query(default=None, ge=1),
+    drop_policy: Optional[DropPolicy] = Query(default=None),
+) -> SubscribeResultsPayload:
+    subscription = {
+        "excluded_fields": excluded_fields,
+        "max_batch_size": max_batch_size,
+        "buffer_size": buffer_size,
+        "drop_policy": drop_policy,
+    }
+    return SubscribeResultsPayload.model_validate(
+        {k: v for k, v in subscription.items() if v is not None}
+    )
+
+
+async def format_server_sent_events(
+    messages: AsyncIterator[bytes],
+) -> AsyncIterator[bytes]:
+    try:
+        async for message in messages:
+            # JSON messages are single-line - safe to be sent as `data` field
+            yield b"data: " + message + b"\n\n"
+    finally:
+        await messages.aclose()
+
+
 class LambdaMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request, call_next):
         response = await call_next(request)
@@ -511,6 +594,8 @@ class HttpInterface(BaseInterface):
             },
             root_path=root_path,
         )
+        # model and workflow endpoints accept images as multipart / octet-stream uploads
+        app.router.route_class = BinaryUploadsRoute
 
         if ENABLE_PROMETHEUS:
             InferenceInstrumentator(
@@ -654,6 +739,10 @@ class HttpInterface(BaseInterface):
 
         self.app = app
         self.model_manager = model_manager
+        self.execution_engines_cache = ExecutionEnginesCache(
+            cache_size=WORKFLOWS_EXECUTION_ENGINES_CACHE_SIZE
+        )
+        execution_engines_cache = self.execution_engines_cache
         self.stream_manager_client: Optional[StreamManagerClient] = None
 
         if ENABLE_STREAM_API:
@@ -667,12 +756,15 @@ class HttpInterface(BaseInterface):
             )
 
         async def process_inference_request(
-            inference_request: InferenceRequest, **kwargs
+            inference_request: InferenceRequest,
+            msgpack_requested: bool = False,
+            **kwargs,
         ) -> InferenceResponse:
             """Processes an inference request by calling the appropriate model.
 
             Args:
                 inference_request (InferenceRequest): The request containing model ID and other inference details.
+                msgpack_requested (bool): If true, predictions are computed column-wise and response is encoded with msgpack.
 
             Returns:
                 InferenceResponse: The response containing the inference results.
@@ -680,10 +772,16 @@ class HttpInterface(BaseInterface):
             de_aliased_model_id = resolve_roboflow_model_alias(
                 model_id=inference_request.model_id
             )
-            self.model_manager.add_model(de_aliased_model_id, inference_request.api_key)
+            await self.model_manager.add_model_async(
+                de_aliased_model_id, inference_request.api_key
+            )
+            if msgpack_requested and hasattr(inference_request, "columnar_predictions"):
+                inference_request.columnar_predictions = True
             resp = await self.model_manager.infer_from_request(
                 de_aliased_model_id, inference_request, **kwargs
             )
+            if msgpack_requested:
+                return msgpack_response(resp)
             return orjson_response(resp)
 
         def process_workflow_inference_request(
@@ -691,28 +789,55 @@ class HttpInterface(BaseInterface):
             workflow_specification: dict,
             background_tasks: Optional[BackgroundTasks],
             profiler: WorkflowsProfiler,
+            workflow_identity: Optional[WorkflowIdentity] = None,
         ) -> WorkflowInferenceResponse:
-            workflow_init_parameters = {
-                "workflows_core.model_manager": model_manager,
-                "workflows_core.api_key": workflow_request.api_key,
-                "workflows_core.background_tasks": background_tasks,
-            }
-            execution_engine = ExecutionEngine.init(
-                workflow_definition=workflow_specification,
-                init_parameters=workflow_init_parameters,
-                max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-                prevent_local_images_loading=True,
-                profiler=profiler,
-                workflow_id=workflow_request.workflow_id,
-            )
+            def init_execution_engine(
+                background_tasks: Optional[BackgroundTasks],
+            ) -> ExecutionEngine:
+                workflow_init_parameters = {
+                    "workflows_core.model_manager": model_manager,
+                    "workflows_core.api_key": workflow_request.api_key,
+                    "workflows_core.background_tasks": background_tasks,
+                }
+                return ExecutionEngine.init(
+                    workflow_definition=workflow_specification,
+                    init_parameters=workflow_init_parameters,
+                    max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+                    prevent_local_images_loading=True,
+                    profiler=profiler,
+                    workflow_id=workflow_request.workflow_id,
+                )
+
+            if isinstance(profiler, NullWorkflowsProfiler):
+                # cached engines keep the profiler they were created with, so only
+                # requests without profiling reuse them
+                execution_engine = execution_engines_cache.get_or_init(
+                    workflow_definition=workflow_specification,
+                    api_key=workflow_request.api_key,
+                    workflow_id=workflow_request.workflow_id,
+                    init_engine=partial(
+                        init_execution_engine,
+                        background_tasks=RequestScopedBackgroundTasks(),
+                    ),
+                    identity=workflow_identity,
+                )
+            else:
+                execution_engine = init_execution_engine(
+                    background_tasks=background_tasks
+                )
             is_preview = False
             if hasattr(workflow_request, "is_preview"):
                 is_preview = workflow_request.is_preview
-            workflow_results = execution_engine.run(
-                runtime_parameters=workflow_request.inputs,
-                serialize_results=True,
-                _is_preview=is_preview,
-            )
+            with bind_background_tasks(
+                background_tasks=background_tasks
+            ), use_detections_serialization_format(
+                serialization_format=workflow_request.detections_serialization_format
+            ):
+                workflow_results = execution_engine.run(
+                    runtime_parameters=workflow_request.inputs,
+                    serialize_results=True,
+                    _is_preview=is_preview,
+                )
             with profiler.profile_execution_phase(
                 name="workflow_results_filtering",
                 categories=["inference_package_operation"],
@@ -904,7 +1029,9 @@ class HttpInterface(BaseInterface):
                     model_id=request.model_id
                 )
                 logger.info(f"Loading model: {de_aliased_model_id}")
-                self.model_manager.add_model(de_aliased_model_id, request.api_key)
+                await self.model_manager.add_model_async(
+                    de_aliased_model_id, request.api_key
+                )
                 models_descriptions = self.model_manager.describe_models()
                 return ModelsDescriptions.from_models_descriptions(
                     models_descriptions=models_descriptions
@@ -971,12 +1098,14 @@ class HttpInterface(BaseInterface):
             async def infer_object_detection(
                 inference_request: ObjectDetectionInferenceRequest,
                 background_tasks: BackgroundTasks,
+                accept: Optional[str] = Header(default=None),
             ):
                 """Run inference with the specified object detection model.
 
                 Args:
                     inference_request (ObjectDetectionInferenceRequest): The request containing the necessary details for object detection.
                     background_tasks: (BackgroundTasks) pool of fastapi background tasks
+                    accept: (Optional[str]) value of `Accept` header - `application/msgpack` selects binary response with columnar predictions
 
                 Returns:
                     Union[ObjectDetectionInferenceResponse, List[ObjectDetectionInferenceResponse]]: The response containing the inference results.
@@ -984,6 +1113,7 @@ class HttpInterface(BaseInterface):
                 logger.debug(f"Reached /infer/object_detection")
                 return await process_inference_request(
                     inference_request,
+                    msgpack_requested=accepts_msgpack(accept),
                     active_learning_eligible=True,
                     background_tasks=background_tasks,
                 )
@@ -1000,12 +1130,14 @@ class HttpInterface(BaseInterface):
             async def infer_instance_segmentation(
                 inference_request: InstanceSegmentationInferenceRequest,
                 background_tasks: BackgroundTasks,
+                accept: Optional[str] = Header(default=None),
             ):
                 """Run inference with the specified instance segmentation model.
 
                 Args:
                     inference_request (InstanceSegmentationInferenceRequest): The request containing the necessary details for instance segmentation.
                     background_tasks: (BackgroundTasks) pool of fastapi background tasks
+                    accept: (Optional[str]) value of `Accept` header - `application/msgpack` selects binary response with columnar predictions
 
                 Returns:
                     InstanceSegmentationInferenceResponse: The response containing the inference results.
@@ -1013,6 +1145,7 @@ class HttpInterface(BaseInterface):
                 logger.debug(f"Reached /infer/instance_segmentation")
                 return await process_inference_request(
                     inference_request,
+                    msgpack_requested=accepts_msgpack(accept),
                     active_learning_eligible=True,
                     background_tasks=background_tasks,
                 )
@@ -1163,6 +1296,13 @@ class HttpInterface(BaseInterface):
                     )
                 else:
                     profiler = NullWorkflowsProfiler.init()
+                workflow_identity = (
+                    workspace_name,
+                    workflow_id,
+                    workflow_request.api_key,
+                )
+                if not workflow_request.use_cache:
+                    execution_engines_cache.invalidate(identity=workflow_identity)
                 with profiler.profile_execution_phase(
                     name="workflow_definition_fetching",
                     categories=["inference_package_operation"],
@@ -1185,6 +1325,7 @@ class HttpInterface(BaseInterface):
                     workflow_specification=workflow_specification,
                     background_tasks=background_tasks if not LAMBDA else None,
                     profiler=profiler,
+                    workflow_identity=workflow_identity,
                 )
 
             @app.post(
@@ -1448,6 +1589,63 @@ class HttpInterface(BaseInterface):
                     excluded_fields=request.excluded_fields,
                 )
 
+            @app.get(
+                "/inference_pipelines/{pipeline_id}/results/stream",
+                summary="[EXPERIMENTAL] Streams InferencePipeline results as Server-Sent Events",
+                description="[EXPERIMENTAL] Pushes InferencePipeline results as they are produced. Each event "
+                "carries `results` accumulated since previous event (up to `max_batch_size`) and number of "
+                "`dropped_results` - dropped according to `drop_policy` once `buffer_size` results are waiting "
+                "for the subscriber.",
+            )
+            @with_route_exceptions
+            async def stream_results(
+                pipeline_id: str,
+                subscription: SubscribeResultsPayload = Depends(
+                    parse_results_subscription
+                ),
+            ) -> StreamingResponse:
+                messages = await self.stream_manager_client.subscribe_pipeline_results(
+                    pipeline_id=pipeline_id,
+                    subscription=subscription,
+                )
+                return StreamingResponse(
+                    format_server_sent_events(messages=messages),
+                    media_type="text/event-stream",
+                    headers={"Cache-Control": "no-cache"},
+                )
+
+            @app.websocket("/inference_pipelines/{pipeline_id}/results/ws")
+            async def stream_results_through_websocket(
+                websocket: WebSocket,
+                pipeline_id: str,
+                subscription: SubscribeResultsPayload = Depends(
+                    parse_results_subscription
+                ),
+            ) -> None:
+                try:
+                    messages = (
+                        await self.stream_manager_client.subscribe_pipeline_results(
+                            pipeline_id=pipeline_id,
+                            subscription=subscription,
+                        )
+                    )
+                except (ProcessesManagerClientError, CommunicationProtocolError) as e:
+                    logger.error(f"Could not subscribe to pipeline results: {e}")
+                    # close reason is limited to 123 bytes
+                    await websocket.close(
+                        code=1011, reason=(e.public_message or "")[:120]
+                    )
+                    return None
+                await websocket.accept()
+                try:
+                    async for message in messages:
+                        await websocket.send_text(message.decode("utf-8"))
+                    await websocket.close()
+                except WebSocketDisconnect:
+                    logger.info(f"Results subscriber of {pipeline_id} disconnected")
+                finally:
+                    await messages.aclose()
+
         # Enable preloading models at startup
         if (
             (PRELOAD_MODELS or DEDICATED_DEPLOYMENT_WORKSPACE_URL)
@@ -2356,7 +2554,7 @@ class HttpInterface(BaseInterface):
                 logger.debug(
                     f"State of model registry: {self.model_manager.describe_models()}"
                 )
-                self.model_manager.add_model(
+                await self.model_manager.add_model_async(
                     request_model_id, api_key, model_id_alias=model_id
                 )
 
@@ -2450,7 +2648,7 @@ class HttpInterface(BaseInterface):
                     f"Reached /start/{dataset_id}/{version_id} with {dataset_id}/{version_id}"
                 )
                 model_id = f"{dataset_id}/{version_id}"
-                self.model_manager.add_model(model_id, api_key)
+                await self.model_manager.add_model_async(model_id, api_key)
 
                 return JSONResponse(
                     {
@@ -0,0 +1,54 @@
+from typing import Any, List, Optional, Union
+
+import msgpack
+import numpy as np
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from inference.core.entities.responses.inference import InferenceResponse
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack"}
+NDARRAY_MARKER = "__ndarray__"
+
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=default, use_bin_type=True)
+
+
+def default(obj: Any) -> Any:
+    # arrays are sent as raw buffers, together with metadata needed to restore them
+    # with `np.frombuffer(...)` - without converting each element into msgpack value
+    if isinstance(obj, np.ndarray):
+        obj = np.ascontiguousarray(obj)
+        return {
+            NDARRAY_MARKER: True,
+            "dtype": obj.dtype.str,
+            "shape": list(obj.shape),
+            "data": obj.tobytes(),
+        }
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    if not accept:
+        return False
+    media_types = {
+        media_type.split(";")[0].strip().lower() for media_type in accept.split(",")
+    }
+    return not media_types.isdisjoint(MSGPACK_MEDIA_TYPES)
+
+
+def msgpack_response(
+    response: Union[List[InferenceResponse], InferenceResponse, BaseModel]
+) -> MsgPackResponse:
+    if isinstance(response, list):
+        content = [r.model_dump(by_alias=True, exclude_none=True) for r in response]
+    else:
+        content = response.model_dump(by_alias=True, exclude_none=True)
+    return MsgPackResponse(content=content)
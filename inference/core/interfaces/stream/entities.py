@@ -110,6 +110,7 @@ class LatencyMonitorReport:
     frame_decoding_latency: Optional[float] = None
     inference_latency: Optional[float] = None
     e2e_latency: Optional[float] = None
+    stages_latency: Optional[Dict[str, float]] = None
 
 
 @dataclass(frozen=True)
@@ -127,3 +128,19 @@ SinkHandler = Optional[
         Callable[[List[Optional[AnyPrediction]], List[Optional[VideoFrame]]], None],
     ]
 ]
+
+
+@dataclass(frozen=True)
+class InferenceStages:
+    """Inference handler split into stages that `InferencePipeline` runs in separate
+    threads - such that preprocessing of next frames overlaps with model execution
+    for previous ones.
+
+    `preprocess` receives video frames, `predict` - the output of `preprocess`,
+    `postprocess` - the output of `predict` together with video frames, returning
+    predictions as `InferenceHandler` does.
+    """
+
+    preprocess: Callable[[List[VideoFrame]], Any]
+    predict: Callable[[Any], Any]
+    postprocess: Callable[[Any, List[VideoFrame]], List[AnyPrediction]]
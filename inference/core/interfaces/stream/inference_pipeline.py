@@ -3,7 +3,8 @@ from datetime import datetime
 from enum import Enum
 from functools import partial
 from queue import Queue
-from threading import Thread
+from threading import Event, Thread
+from time import perf_counter
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 from inference.core import logger
@@ -18,8 +19,11 @@ from inference.core.env import (
     DISABLE_PREPROC_AUTO_ORIENT,
     ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING,
     ENABLE_WORKFLOWS_PROFILING,
+    INFERENCE_PIPELINE_PIPELINED_EXECUTION,
+    INFERENCE_PIPELINE_STAGES_QUEUE_SIZE,
     MAX_ACTIVE_MODELS,
     PREDICTIONS_QUEUE_SIZE,
+    VIDEO_SOURCE_DECODING_MODE,
     WORKFLOWS_PROFILER_BUFFER_SIZE,
 )
 from inference.core.exceptions import CannotInitialiseModelError, MissingApiKeyError
@@ -33,16 +37,20 @@ from inference.core.interfaces.camera.utils import multiplex_videos
 from inference.core.interfaces.camera.video_source import (
     BufferConsumptionStrategy,
     BufferFillingStrategy,
+    DecodingMode,
     VideoSource,
 )
 from inference.core.interfaces.stream.entities import (
     AnyPrediction,
     InferenceHandler,
+    InferenceStages,
     ModelConfig,
     SinkHandler,
 )
 from inference.core.interfaces.stream.model_handlers.roboflow_models import (
+    build_default_inference_stages,
     default_process_frame,
+    supports_inference_stages,
 )
 from inference.core.interfaces.stream.sinks import active_learning_sink, multi_sink
 from inference.core.interfaces.stream.utils import (
@@ -55,6 +63,7 @@ from inference.core.interfaces.stream.watchdog import (
 )
 from inference.core.managers.active_learning import BackgroundTaskActiveLearningManager
 from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+from inference.core.registries.base import ModelRegistry
 from inference.core.registries.roboflow import RoboflowModelRegistry
 from inference.core.utils.function import experimental
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
@@ -73,6 +82,9 @@ INFERENCE_THREAD_STARTED_EVENT = "INFERENCE_THREAD_STARTED"
 INFERENCE_THREAD_FINISHED_EVENT = "INFERENCE_THREAD_FINISHED"
 INFERENCE_COMPLETED_EVENT = "INFERENCE_COMPLETED"
 INFERENCE_ERROR_EVENT = "INFERENCE_ERROR"
+PREPROCESSING_STAGE = "preprocessing"
+INFERENCE_STAGE = "inference"
+POSTPROCESSING_STAGE = "postprocessing"
 
 
 class SinkMode(Enum):
@@ -108,6 +120,7 @@ class InferencePipeline:
         active_learning_target_dataset: Optional[str] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        pipelined_execution: Optional[bool] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from Roboflow models against video stream.
@@ -220,10 +233,16 @@ class InferencePipeline:
                 `video_frame: List[Optional[VideoFrame]]`. It is also possible to process multiple videos using
                 old sinks - but then `SinkMode.SEQUENTIAL` is to be used, causing sink to be called on each
                 prediction element.
+            pipelined_execution (Optional[bool]): Flag to run preprocessing, model inference and postprocessing
+                in separate threads connected with bounded queues - such that preprocessing of next frames
+                overlaps with model execution for previous ones. Order of frames is preserved. Applicable for
+                models which inference is composed of those stages only - other models are run sequentially.
+                If not given, env variable `INFERENCE_PIPELINE_PIPELINED_EXECUTION` will be used.
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
         * INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY - delay for restarts on stream connection drop
+        * INFERENCE_PIPELINE_STAGES_QUEUE_SIZE - size of buffers between stages of pipelined execution
         * ACTIVE_LEARNING_ENABLED - controls Active Learning middleware if explicit parameter not given
 
         Returns: Instance of InferencePipeline
@@ -247,6 +266,17 @@ class InferencePipeline:
         on_video_frame = partial(
             default_process_frame, model=model, inference_config=inference_config
         )
+        if pipelined_execution is None:
+            pipelined_execution = INFERENCE_PIPELINE_PIPELINED_EXECUTION
+        inference_stages = None
+        if pipelined_execution and supports_inference_stages(model=model):
+            inference_stages = build_default_inference_stages(
+                model=model, inference_config=inference_config
+            )
+        elif pipelined_execution:
+            logger.warning(
+                f"Model {model_id} does not support pipelined execution - running inference sequentially."
+            )
         active_learning_middleware = NullActiveLearningMiddleware()
         if active_learning_enabled is None:
             logger.info(
@@ -296,6 +326,7 @@ class InferencePipeline:
             video_source_properties=video_source_properties,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            inference_stages=inference_stages,
         )
 
     @classmethod
@@ -467,6 +498,7 @@ class InferencePipeline:
         profiling_directory: str = "./inference_profiling",
         use_workflow_definition_cache: bool = True,
         serialize_results: bool = False,
+        model_registry: Optional[ModelRegistry] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -543,6 +575,8 @@ class InferencePipeline:
                 newest version for the request. Only applies for Workflows definitions saved on Roboflow platform.
             serialize_results (bool): Boolean flag to decide if ExecutionEngine run should serialize workflow
                 results for each frame. If that is set true, sinks will receive serialized workflow responses.
+            model_registry (Optional[ModelRegistry]): Registry used to load models of the workflow - by default
+                `RoboflowModelRegistry` with all Roboflow models.
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
@@ -599,7 +633,8 @@ class InferencePipeline:
                         workflow_id=workflow_id,
                         use_cache=use_workflow_definition_cache,
                     )
-            model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
+            if model_registry is None:
+                model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
             model_manager = BackgroundTaskActiveLearningManager(
                 model_registry=model_registry, cache=cache
             )
@@ -675,6 +710,7 @@ class InferencePipeline:
         video_source_properties: Optional[Dict[str, float]] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        inference_stages: Optional[InferenceStages] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -741,10 +777,16 @@ class InferencePipeline:
                 `video_frame: List[Optional[VideoFrame]]`. It is also possible to process multiple videos using
                 old sinks - but then `SinkMode.SEQUENTIAL` is to be used, causing sink to be called on each
                 prediction element.
+            inference_stages (Optional[InferenceStages]): Optional split of `on_video_frame` into preprocessing,
+                inference and postprocessing stages. If given, stages are run in separate threads connected with
+                bounded queues (preserving order of frames) and `on_video_frame` is not used.
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
         * INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY - delay for restarts on stream connection drop
+        * INFERENCE_PIPELINE_STAGES_QUEUE_SIZE - size of buffers between inference stages
+        * VIDEO_SOURCE_DECODING_MODE - with SKIP_DECODE or KEY_FRAMES_ONLY, `max_fps` is applied by video sources
+            (like with `ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING=True`), so frames above it are not decoded
 
         Returns: Instance of InferencePipeline
 
@@ -758,7 +800,7 @@ class InferencePipeline:
             status_update_handlers = []
         status_update_handlers.append(watchdog.on_status_update)
         desired_source_fps = None
-        if ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING:
+        if max_fps_applied_by_video_sources():
             desired_source_fps = max_fps
         video_sources = prepare_video_sources(
             video_reference=video_reference,
@@ -782,6 +824,7 @@ class InferencePipeline:
             on_pipeline_end=on_pipeline_end,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            inference_stages=inference_stages,
         )
 
     def __init__(
@@ -797,6 +840,8 @@ class InferencePipeline:
         max_fps: Optional[float] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        inference_stages: Optional[InferenceStages] = None,
+        stages_queue_size: int = INFERENCE_PIPELINE_STAGES_QUEUE_SIZE,
     ):
         self._on_video_frame = on_video_frame
         self._video_sources = video_sources
@@ -814,10 +859,15 @@ class InferencePipeline:
         self._on_pipeline_end = on_pipeline_end
         self._batch_collection_timeout = batch_collection_timeout
         self._sink_mode = sink_mode
+        self._inference_stages = inference_stages
+        self._stages_queue_size = stages_queue_size
 
     def start(self, use_main_thread: bool = True) -> None:
         self._stop = False
-        self._inference_thread = Thread(target=self._execute_inference)
+        if self._inference_stages is not None:
+            self._inference_thread = Thread(target=self._execute_pipelined_inference)
+        else:
+            self._inference_thread = Thread(target=self._execute_inference)
         self._inference_thread.start()
         if self._on_pipeline_start is not None:
             self._on_pipeline_start()
@@ -872,35 +922,56 @@ class InferencePipeline:
                     frames=video_frames,
                 )
                 predictions = self._on_video_frame(video_frames)
-                self._watchdog.on_model_prediction_ready(
-                    frames=video_frames,
+                self._on_predictions_ready(
+                    predictions=predictions, video_frames=video_frames
                 )
-                self._predictions_queue.put((predictions, video_frames))
-                send_inference_pipeline_status_update(
-                    severity=UpdateSeverity.DEBUG,
-                    event_type=INFERENCE_COMPLETED_EVENT,
-                    payload={
-                        "frames_ids": [f.frame_id for f in video_frames],
-                        "frames_timestamps": [f.frame_timestamp for f in video_frames],
-                        "sources_id": [f.source_id for f in video_frames],
-                    },
-                    status_update_handlers=self._status_update_handlers,
-                )
-
         except Exception as error:
-            payload = {
-                "error_type": error.__class__.__name__,
-                "error_message": str(error),
-                "error_context": "inference_thread",
-            }
+            self._on_inference_error(error=error)
+        finally:
+            self._predictions_queue.put(None)
             send_inference_pipeline_status_update(
-                severity=UpdateSeverity.ERROR,
-                event_type=INFERENCE_ERROR_EVENT,
-                payload=payload,
+                severity=UpdateSeverity.INFO,
+                event_type=INFERENCE_THREAD_FINISHED_EVENT,
                 status_update_handlers=self._status_update_handlers,
             )
-            logger.exception(f"Encountered inference error: {error}")
+            logger.info(f"Inference thread finished")
+
+    def _execute_pipelined_inference(self) -> None:
+        # Stages run in separate threads, connected with bounded FIFO queues - which keeps order of
+        # frames. On error, no new frames are accepted, failed stage drains its input (so that no stage
+        # blocks on full queue) and frames processed before the error reach the sinks.
+        send_inference_pipeline_status_update(
+            severity=UpdateSeverity.INFO,
+            event_type=INFERENCE_THREAD_STARTED_EVENT,
+            status_update_handlers=self._status_update_handlers,
+        )
+        logger.info(f"Inference thread started in pipelined mode")
+        preprocessed_queue = Queue(maxsize=self._stages_queue_size)
+        predicted_queue = Queue(maxsize=self._stages_queue_size)
+        failure = Event()
+        stages_threads = [
+            Thread(
+                target=self._execute_preprocessing_stage,
+                args=(preprocessed_queue, failure),
+            ),
+            Thread(
+                target=self._execute_inference_stage,
+                args=(preprocessed_queue, predicted_queue, failure),
+            ),
+        ]
+        for stage_thread in stages_threads:
+            stage_thread.start()
+        try:
+            self._execute_pipeline_stage(
+                stage=POSTPROCESSING_STAGE,
+                process=self._inference_stages.postprocess,
+                input_queue=predicted_queue,
+                on_result=self._on_predictions_ready,
+                failure=failure,
+            )
         finally:
+            for stage_thread in stages_threads:
+                stage_thread.join()
             self._predictions_queue.put(None)
             send_inference_pipeline_status_update(
                 severity=UpdateSeverity.INFO,
@@ -909,6 +980,108 @@ class InferencePipeline:
             )
             logger.info(f"Inference thread finished")
 
+    def _execute_preprocessing_stage(self, output_queue: Queue, failure: Event) -> None:
+        try:
+            for video_frames in self._generate_frames():
+                if failure.is_set():
+                    break
+                self._watchdog.on_model_inference_started(
+                    frames=video_frames,
+                )
+                start = perf_counter()
+                preprocessed = self._inference_stages.preprocess(video_frames)
+                self._watchdog.on_inference_stage_completed(
+                    stage=PREPROCESSING_STAGE,
+                    frames=video_frames,
+                    duration=perf_counter() - start,
+                )
+                output_queue.put((preprocessed, video_frames))
+        except Exception as error:
+            failure.set()
+            self._on_inference_error(error=error)
+        finally:
+            output_queue.put(None)
+
+    def _execute_inference_stage(
+        self, input_queue: Queue, output_queue: Queue, failure: Event
+    ) -> None:
+        try:
+            self._execute_pipeline_stage(
+                stage=INFERENCE_STAGE,
+                process=lambda preprocessed, _: self._inference_stages.predict(
+                    preprocessed
+                ),
+                input_queue=input_queue,
+                on_result=lambda predicted, video_frames: output_queue.put(
+                    (predicted, video_frames)
+                ),
+                failure=failure,
+            )
+        finally:
+            output_queue.put(None)
+
+    def _execute_pipeline_stage(
+        self,
+        stage: str,
+        process: Callable[[Any, List[VideoFrame]], Any],
+        input_queue: Queue,
+        on_result: Callable[[Any, List[VideoFrame]], None],
+        failure: Event,
+    ) -> None:
+        stage_failed = False
+        while True:
+            stage_input = input_queue.get()
+            if stage_input is None:
+                return None
+            if stage_failed:
+                continue
+            payload, video_frames = stage_input
+            try:
+                start = perf_counter()
+                result = process(payload, video_frames)
+                self._watchdog.on_inference_stage_completed(
+                    stage=stage,
+                    frames=video_frames,
+                    duration=perf_counter() - start,
+                )
+                on_result(result, video_frames)
+            except Exception as error:
+                stage_failed = True
+                failure.set()
+                self._on_inference_error(error=error)
+
+    def _on_predictions_ready(
+        self, predictions: List[AnyPrediction], video_frames: List[VideoFrame]
+    ) -> None:
+        self._watchdog.on_model_prediction_ready(
+            frames=video_frames,
+        )
+        self._predictions_queue.put((predictions, video_frames))
+        send_inference_pipeline_status_update(
+            severity=UpdateSeverity.DEBUG,
+            event_type=INFERENCE_COMPLETED_EVENT,
+            payload={
+                "frames_ids": [f.frame_id for f in video_frames],
+                "frames_timestamps": [f.frame_timestamp for f in video_frames],
+                "sources_id": [f.source_id for f in video_frames],
+            },
+            status_update_handlers=self._status_update_handlers,
+        )
+
+    def _on_inference_error(self, error: Exception) -> None:
+        payload = {
+            "error_type": error.__class__.__name__,
+            "error_message": str(error),
+            "error_context": "inference_thread",
+        }
+        send_inference_pipeline_status_update(
+            severity=UpdateSeverity.ERROR,
+            event_type=INFERENCE_ERROR_EVENT,
+            payload=payload,
+            status_update_handlers=self._status_update_handlers,
+        )
+        logger.exception(f"Encountered inference error: {error}")
+
     def _dispatch_inference_results(self) -> None:
         while True:
             inference_results: Optional[
@@ -990,7 +1163,7 @@ class InferencePipeline:
         for video_source in self._video_sources:
             video_source.start()
         max_fps = None
-        if not ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING:
+        if not max_fps_applied_by_video_sources():
             max_fps = self._max_fps
         yield from multiplex_videos(
             videos=self._video_sources,
@@ -1000,6 +1173,13 @@ class InferencePipeline:
         )
 
 
+def max_fps_applied_by_video_sources() -> bool:
+    return (
+        ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING
+        or DecodingMode(VIDEO_SOURCE_DECODING_MODE) is not DecodingMode.FULL
+    )
+
+
 def send_inference_pipeline_status_update(
     severity: UpdateSeverity,
     event_type: str,
@@ -1,9 +1,33 @@
-from typing import List
+import inspect
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
+from inference.core.env import MAX_BATCH_SIZE
 from inference.core.interfaces.camera.entities import VideoFrame
-from inference.core.interfaces.stream.entities import ModelConfig
+from inference.core.interfaces.stream.entities import InferenceStages, ModelConfig
 from inference.core.interfaces.stream.utils import wrap_in_list
+from inference.core.models.classification_base import (
+    ClassificationBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.instance_segmentation_base import (
+    InstanceSegmentationBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.object_detection_base import (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+)
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.batching import create_batches
+from inference.usage_tracking.collector import usage_collector
+
+# models which `infer(...)` only chains `preprocess(...)`, `predict(...)` and `postprocess(...)`
+MODELS_WITH_INFERENCE_STAGES = (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+    InstanceSegmentationBaseOnnxRoboflowInferenceModel,
+    ClassificationBaseOnnxRoboflowInferenceModel,
+)
 
 
 def default_process_frame(
@@ -13,11 +37,7 @@ def default_process_frame(
 ) -> List[dict]:
     postprocessing_args = inference_config.to_postprocessing_params()
     # TODO: handle batch input in usage
-    fps = video_frame[0].fps
-    if video_frame[0].measured_fps:
-        fps = video_frame[0].measured_fps
-    if not fps:
-        fps = 0
+    fps = get_frames_fps(video_frame=video_frame)
     predictions = wrap_in_list(
         model.infer(
             [f.image for f in video_frame],
@@ -33,3 +53,121 @@ def default_process_frame(
         )
         for p in predictions
     ]
+
+
+def get_frames_fps(video_frame: List[VideoFrame]) -> float:
+    fps = video_frame[0].fps
+    if video_frame[0].measured_fps:
+        fps = video_frame[0].measured_fps
+    if not fps:
+        fps = 0
+    return fps
+
+
+def supports_inference_stages(model: Any) -> bool:
+    infer_owner = next(
+        (cls for cls in type(model).__mro__ if "infer" in cls.__dict__), None
+    )
+    return infer_owner in MODELS_WITH_INFERENCE_STAGES
+
+
+def build_default_inference_stages(
+    model: OnnxRoboflowInferenceModel,
+    inference_config: ModelConfig,
+) -> InferenceStages:
+    """Splits `default_process_frame(...)` into stages of `InferencePipeline` - only
+    for models that pass `supports_inference_stages(...)` check."""
+    inference_kwargs = resolve_inference_kwargs(
+        model=model, kwargs=inference_config.to_postprocessing_params()
+    )
+    return InferenceStages(
+        preprocess=partial(
+            default_preprocess_frames, model=model, inference_kwargs=inference_kwargs
+        ),
+        predict=partial(
+            default_predict, model=model, inference_kwargs=inference_kwargs
+        ),
+        postprocess=partial(
+            default_postprocess_frames, model=model, inference_kwargs=inference_kwargs
+        ),
+    )
+
+
+def resolve_inference_kwargs(model: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    # stages must receive the same parameters that `infer(...)` passes to them
+    signature = inspect.signature(model.infer)
+    bound_arguments = signature.bind_partial(**kwargs)
+    bound_arguments.apply_defaults()
+    result = dict(bound_arguments.arguments)
+    result.pop("image", None)
+    for name, parameter in signature.parameters.items():
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            result.update(result.pop(name, {}))
+    return result
+
+
+def default_preprocess_frames(
+    video_frame: List[VideoFrame],
+    model: OnnxRoboflowInferenceModel,
+    inference_kwargs: Dict[str, Any],
+) -> List[Tuple[np.ndarray, PreprocessReturnMetadata]]:
+    max_batch_size = MAX_BATCH_SIZE if model.batching_enabled else model.batch_size
+    images = [f.image for f in video_frame]
+    if max_batch_size == float("inf"):
+        max_batch_size = len(images)
+    return [
+        model.preprocess(batch, **inference_kwargs)
+        for batch in create_batches(sequence=images, batch_size=max_batch_size)
+    ]
+
+
+def default_predict(
+    preprocessed: List[Tuple[np.ndarray, PreprocessReturnMetadata]],
+    model: OnnxRoboflowInferenceModel,
+    inference_kwargs: Dict[str, Any],
+) -> List[Tuple[Tuple[np.ndarray, ...], PreprocessReturnMetadata]]:
+    return [
+        (model.predict(img_in, **inference_kwargs), preprocess_return_metadata)
+        for img_in, preprocess_return_metadata in preprocessed
+    ]
+
+
+def default_postprocess_frames(
+    predicted: List[Tuple[Tuple[np.ndarray, ...], PreprocessReturnMetadata]],
+    video_frame: List[VideoFrame],
+    model: OnnxRoboflowInferenceModel,
+    inference_kwargs: Dict[str, Any],
+) -> List[dict]:
+    fps = get_frames_fps(video_frame=video_frame)
+    predictions = []
+    for batch_predictions, preprocess_return_metadata in predicted:
+        predictions.extend(
+            wrap_in_list(
+                _postprocess_with_usage_tracking(
+                    model,
+                    batch_predictions,
+                    preprocess_return_metadata,
+                    usage_fps=fps,
+                    usage_api_key=model.api_key,
+                    **inference_kwargs,
+                )
+            )
+        )
+    return [
+        p.dict(
+            by_alias=True,
+            exclude_none=True,
+        )
+        for p in predictions
+    ]
+
+
+@usage_collector
+def _postprocess_with_usage_tracking(
+    self: OnnxRoboflowInferenceModel,
+    predictions: Tuple[np.ndarray, ...],
+    preprocess_return_metadata: PreprocessReturnMetadata,
+    **kwargs,
+) -> Any:
+    # `self` lets usage collector attribute usage to the model, as for `infer(...)`
+    return self.postprocess(predictions, preprocess_return_metadata, **kwargs)
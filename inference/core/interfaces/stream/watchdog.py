@@ -4,8 +4,9 @@ observability. Please consider them internal details of implementation.
 """
 
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
+from threading import Lock
 from typing import Any, Deque, Dict, Iterable, List, Optional, TypeVar
 
 import supervision as sv
@@ -54,6 +55,15 @@ class PipelineWatchDog(ABC):
     ) -> None:
         pass
 
+    def on_inference_stage_completed(
+        self,
+        stage: str,
+        frames: List[VideoFrame],
+        duration: float,
+    ) -> None:
+        # invoked only when InferencePipeline runs inference in separate stages
+        pass
+
     @abstractmethod
     def get_report(self) -> Optional[PipelineStateReport]:
         pass
@@ -79,44 +89,68 @@ class NullPipelineWatchdog(PipelineWatchDog):
 class LatencyMonitor:
     def __init__(self, source_id: Optional[int]):
         self._source_id = source_id
+        # with pipelined inference, few frames are in flight at the same time
+        self._inference_start_events: Dict[int, ModelActivityEvent] = OrderedDict()
         self._inference_start_event: Optional[ModelActivityEvent] = None
         self._prediction_ready_event: Optional[ModelActivityEvent] = None
         self._reports: Deque[LatencyMonitorReport] = deque(maxlen=MAX_LATENCY_CONTEXT)
+        self._stages_latencies: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=MAX_LATENCY_CONTEXT)
+        )
+        self._lock = Lock()
 
     def register_inference_start(
         self, frame_timestamp: datetime, frame_id: int
     ) -> None:
-        self._inference_start_event = ModelActivityEvent(
-            event_timestamp=datetime.now(),
-            frame_id=frame_id,
-            frame_decoding_timestamp=frame_timestamp,
-        )
+        with self._lock:
+            self._inference_start_events[frame_id] = ModelActivityEvent(
+                event_timestamp=datetime.now(),
+                frame_id=frame_id,
+                frame_decoding_timestamp=frame_timestamp,
+            )
+            while len(self._inference_start_events) > MAX_LATENCY_CONTEXT:
+                self._inference_start_events.popitem(last=False)
 
     def register_prediction_ready(
         self, frame_timestamp: datetime, frame_id: int
     ) -> None:
-        self._prediction_ready_event = ModelActivityEvent(
-            event_timestamp=datetime.now(),
-            frame_id=frame_id,
-            frame_decoding_timestamp=frame_timestamp,
-        )
-        self._generate_report()
+        with self._lock:
+            self._inference_start_event = self._inference_start_events.pop(
+                frame_id, None
+            )
+            self._prediction_ready_event = ModelActivityEvent(
+                event_timestamp=datetime.now(),
+                frame_id=frame_id,
+                frame_decoding_timestamp=frame_timestamp,
+            )
+            self._generate_report()
+
+    def register_stage_latency(self, stage: str, latency: float) -> None:
+        with self._lock:
+            self._stages_latencies[stage].append(latency)
 
     def summarise_reports(self) -> LatencyMonitorReport:
+        with self._lock:
+            reports = list(self._reports)
+            avg_stages_latency = {
+                stage: safe_average(values=list(latencies))
+                for stage, latencies in self._stages_latencies.items()
+            }
         avg_frame_decoding_latency = average_property_values(
-            examined_objects=self._reports, property_name="frame_decoding_latency"
+            examined_objects=reports, property_name="frame_decoding_latency"
         )
         avg_inference_latency = average_property_values(
-            examined_objects=self._reports, property_name="inference_latency"
+            examined_objects=reports, property_name="inference_latency"
         )
         avg_e2e_latency = average_property_values(
-            examined_objects=self._reports, property_name="e2e_latency"
+            examined_objects=reports, property_name="e2e_latency"
         )
         return LatencyMonitorReport(
             source_id=self._source_id,
             frame_decoding_latency=avg_frame_decoding_latency,
             inference_latency=avg_inference_latency,
             e2e_latency=avg_e2e_latency,
+            stages_latency=avg_stages_latency or None,
         )
 
     def _generate_report(self) -> None:
@@ -237,6 +271,14 @@ class BasePipelineWatchDog(PipelineWatchDog):
             )
             self._inference_throughput_monitor.tick()
 
+    def on_inference_stage_completed(
+        self, stage: str, frames: List[VideoFrame], duration: float
+    ) -> None:
+        for frame in frames:
+            self._latency_monitors[frame.source_id].register_stage_latency(
+                stage=stage, latency=duration
+            )
+
     def get_report(self) -> PipelineStateReport:
         sources_metadata = []
         if self._video_sources is not None:
@@ -3,7 +3,7 @@ import json
 from asyncio import StreamReader, StreamWriter
 from enum import Enum
 from json import JSONDecodeError
-from typing import List, Optional, Tuple, Union
+from typing import AsyncIterator, List, Optional, Tuple, Union
 
 from inference.core import logger
 from inference.core.interfaces.stream_manager.api.entities import (
@@ -36,6 +36,7 @@ from inference.core.interfaces.stream_manager.manager_app.entities import (
     InitialisePipelinePayload,
     InitialiseWebRTCPipelinePayload,
     OperationStatus,
+    SubscribeResultsPayload,
 )
 from inference.core.interfaces.stream_manager.manager_app.errors import (
     CommunicationProtocolError,
@@ -200,6 +201,46 @@ class StreamManagerClient:
             ],
         )
 
+    async def subscribe_pipeline_results(
+        self,
+        pipeline_id: str,
+        subscription: SubscribeResultsPayload,
+    ) -> AsyncIterator[bytes]:
+        """Opens stream of results pushed by the pipeline as they are produced.
+
+        Returns:
+            AsyncIterator[bytes]: JSON messages (serialised once, in pipeline process) with
+                `results` (list of payloads like the ones returned by
+                `consume_pipeline_result(...)`) and `dropped_results` (number of results
+                dropped since previous message as the subscriber did not keep up). Iteration
+                ends when pipeline is terminated.
+        """
+        command = {
+            TYPE_KEY: CommandType.SUBSCRIBE_RESULTS,
+            PIPELINE_ID_KEY: pipeline_id,
+        }
+        response = await self._handle_command(command=command)
+        port = response[RESPONSE_KEY]["port"]
+        try:
+            reader, writer = await establish_socket_connection(
+                host=self._host, port=port, timeout=self._operations_timeout
+            )
+        except (OSError, asyncio.TimeoutError) as error:
+            raise ConnectivityError(
+                private_message=f"Could not connect to results stream of InferencePipeline",
+                public_message="Could not connect to results stream of InferencePipeline",
+                inner_error=error,
+            ) from error
+        await send_message(
+            writer=writer,
+            message=subscription.dict(),
+            header_size=self._header_size,
+            timeout=self._operations_timeout,
+        )
+        return receive_stream_messages(
+            reader=reader, writer=writer, header_size=self._header_size
+        )
+
     async def _handle_command(self, command: dict) -> dict:
         response = await send_command(
             host=self._host,
@@ -326,6 +367,21 @@ async def receive_message(
     return received
 
 
+async def receive_stream_messages(
+    reader: StreamReader, writer: StreamWriter, header_size: int
+) -> AsyncIterator[bytes]:
+    try:
+        while True:
+            try:
+                header = await reader.readexactly(header_size)
+                payload_size = int.from_bytes(bytes=header, byteorder="big")
+                yield await reader.readexactly(payload_size)
+            except asyncio.IncompleteReadError:
+                return
+    finally:
+        writer.close()
+
+
 def is_request_unsuccessful(response: dict) -> bool:
     return (
         response.get(RESPONSE_KEY, {}).get(STATUS_KEY, OperationStatus.FAILURE.value)
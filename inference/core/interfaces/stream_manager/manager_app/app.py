@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from inference.core import logger
+from inference.core.env import STREAM_API_SHARED_MODEL_SERVERS
 from inference.core.interfaces.camera.video_source import StreamState
 from inference.core.interfaces.stream_manager.manager_app.communication import (
     receive_socket_data,
@@ -36,6 +37,9 @@ from inference.core.interfaces.stream_manager.manager_app.errors import (
 from inference.core.interfaces.stream_manager.manager_app.inference_pipeline_manager import (
     InferencePipelineManager,
 )
+from inference.core.interfaces.stream_manager.manager_app.model_server import (
+    ModelServersSupervisor,
+)
 from inference.core.interfaces.stream_manager.manager_app.serialisation import (
     describe_error,
     prepare_error_response,
@@ -58,6 +62,7 @@ class ManagedInferencePipeline:
 
 PROCESSES_TABLE: Dict[str, ManagedInferencePipeline] = {}
 PROCESSES_TABLE_LOCK = Lock()
+MODEL_SERVERS_SUPERVISOR: Optional[ModelServersSupervisor] = None
 HEADER_SIZE = 4
 SOCKET_BUFFER_SIZE = 16384
 HOST = os.getenv("STREAM_MANAGER_HOST", "127.0.0.1")
@@ -289,6 +294,9 @@ def execute_termination(
             logger.info(f"Joining pipeline: {pipeline_id}")
             processes_table[pipeline_id][0].join()
             logger.info(f"Pipeline: {pipeline_id} joined.")
+        if MODEL_SERVERS_SUPERVISOR is not None:
+            logger.info("Terminating model servers")
+            MODEL_SERVERS_SUPERVISOR.terminate()
         logger.info(f"Termination handler completed.")
         sys.exit(0)
 
@@ -413,6 +421,11 @@ def spawn_managed_pipeline_process(
         pipeline_id=pipeline_id,
         command_queue=command_queue,
         responses_queue=responses_queue,
+        model_servers_address=(
+            MODEL_SERVERS_SUPERVISOR.address
+            if MODEL_SERVERS_SUPERVISOR is not None
+            else None
+        ),
     )
     inference_pipeline_manager.start()
     processes_table[pipeline_id] = ManagedInferencePipeline(
@@ -428,6 +441,15 @@ def spawn_managed_pipeline_process(
 
 
 def start(expected_warmed_up_pipelines: int = 0) -> None:
+    global MODEL_SERVERS_SUPERVISOR
+    if STREAM_API_SHARED_MODEL_SERVERS:
+        # pipelines send inputs of models to one server per model, instead of loading
+        # model copy in each pipeline process
+        MODEL_SERVERS_SUPERVISOR = ModelServersSupervisor()
+        MODEL_SERVERS_SUPERVISOR.start()
+        logger.info(
+            f"Model servers supervisor listens at {MODEL_SERVERS_SUPERVISOR.address}"
+        )
     signal.signal(
         signal.SIGINT, partial(execute_termination, processes_table=PROCESSES_TABLE)
     )
@@ -43,6 +43,7 @@ class CommandType(str, Enum):
     TERMINATE = "terminate"
     LIST_PIPELINES = "list_pipelines"
     CONSUME_RESULT = "consume_result"
+    SUBSCRIBE_RESULTS = "subscribe_results"
 
 
 class VideoConfiguration(BaseModel):
@@ -111,3 +112,28 @@ class ConsumeResultsPayload(BaseModel):
         default_factory=list,
         description="List of workflow output fields to be filtered out from response",
     )
+
+
+class DropPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class SubscribeResultsPayload(ConsumeResultsPayload):
+    max_batch_size: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of results sent in single message - results "
+        "accumulated while subscriber was receiving previous message are sent together",
+    )
+    buffer_size: int = Field(
+        default=32,
+        ge=1,
+        description="Number of results buffered for subscriber which does not keep up "
+        "with the pipeline - once exceeded, results are dropped according to `drop_policy`",
+    )
+    drop_policy: DropPolicy = Field(
+        default=DropPolicy.DROP_OLDEST,
+        description="Results dropped when buffer is full - `drop_oldest` keeps the most "
+        "recent results, `drop_newest` keeps continuity of already buffered ones",
+    )
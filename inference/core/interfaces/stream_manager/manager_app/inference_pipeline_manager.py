@@ -22,9 +22,6 @@ from inference.core.exceptions import (
 )
 from inference.core.interfaces.camera.entities import VideoFrame
 from inference.core.interfaces.camera.exceptions import StreamOperationNotAllowedError
-from inference.core.interfaces.http.orjson_utils import (
-    serialise_single_workflow_result_element,
-)
 from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
 from inference.core.interfaces.stream.sinks import InMemoryBufferSink, multi_sink
 from inference.core.interfaces.stream.watchdog import (
@@ -40,6 +37,13 @@ from inference.core.interfaces.stream_manager.manager_app.entities import (
     InitialiseWebRTCPipelinePayload,
     OperationStatus,
 )
+from inference.core.interfaces.stream_manager.manager_app.model_server import (
+    SharedModelServersRegistry,
+)
+from inference.core.interfaces.stream_manager.manager_app.results_streaming import (
+    ResultsBroadcaster,
+    serialise_pipeline_result,
+)
 from inference.core.interfaces.stream_manager.manager_app.serialisation import (
     describe_error,
 )
@@ -48,9 +52,12 @@ from inference.core.interfaces.stream_manager.manager_app.webrtc import (
     WebRTCVideoFrameProducer,
     init_rtc_peer_connection,
 )
+from inference.core.registries.base import ModelRegistry
+from inference.core.registries.roboflow import RoboflowModelRegistry
 from inference.core.utils.async_utils import Queue as SyncAsyncQueue
 from inference.core.workflows.errors import WorkflowSyntaxError
 from inference.core.workflows.execution_engine.entities.base import WorkflowImageData
+from inference.models.utils import ROBOFLOW_MODEL_TYPES
 
 
 def ignore_signal(signal_number: int, frame: FrameType) -> None:
@@ -63,23 +70,36 @@ def ignore_signal(signal_number: int, frame: FrameType) -> None:
 class InferencePipelineManager(Process):
     @classmethod
     def init(
-        cls, pipeline_id: str, command_queue: Queue, responses_queue: Queue
+        cls,
+        pipeline_id: str,
+        command_queue: Queue,
+        responses_queue: Queue,
+        model_servers_address: Optional[str] = None,
     ) -> "InferencePipelineManager":
         return cls(
             pipeline_id=pipeline_id,
             command_queue=command_queue,
             responses_queue=responses_queue,
+            model_servers_address=model_servers_address,
         )
 
-    def __init__(self, pipeline_id: str, command_queue: Queue, responses_queue: Queue):
+    def __init__(
+        self,
+        pipeline_id: str,
+        command_queue: Queue,
+        responses_queue: Queue,
+        model_servers_address: Optional[str] = None,
+    ):
         super().__init__()
         self._pipeline_id = pipeline_id
         self._command_queue = command_queue
         self._responses_queue = responses_queue
+        self._model_servers_address = model_servers_address
         self._inference_pipeline: Optional[InferencePipeline] = None
         self._watchdog: Optional[PipelineWatchDog] = None
         self._stop = False
         self._buffer_sink: Optional[InMemoryBufferSink] = None
+        self._results_broadcaster: Optional[ResultsBroadcaster] = None
         self._last_consume_time = (
             time.monotonic()
         )  # Track last consume time for the pipeline
@@ -104,6 +124,12 @@ class InferencePipelineManager(Process):
             self._handle_command(request_id=request_id, payload=payload)
 
     def _check_pipeline_timeout(self) -> None:
+        if (
+            self._results_broadcaster is not None
+            and self._results_broadcaster.has_subscribers()
+        ):
+            # results are consumed by subscribers
+            self._last_consume_time = time.monotonic()
         if self._inference_pipeline and self._consumption_timeout is not None:
             time_since_last_consume = time.monotonic() - self._last_consume_time
             if time_since_last_consume > self._consumption_timeout:
@@ -140,6 +166,8 @@ class InferencePipelineManager(Process):
                 return self._get_pipeline_status(request_id=request_id)
             if command_type is CommandType.CONSUME_RESULT:
                 return self._consume_results(request_id=request_id, payload=payload)
+            if command_type is CommandType.SUBSCRIBE_RESULTS:
+                return self._subscribe_results(request_id=request_id)
             raise NotImplementedError(
                 f"Command type `{command_type}` cannot be handled"
             )
@@ -174,6 +202,7 @@ class InferencePipelineManager(Process):
                 queue_size=parsed_payload.sink_configuration.results_buffer_size,
             )
             self._buffer_sink = buffer_sink
+            self._results_broadcaster = ResultsBroadcaster()
             self._inference_pipeline = InferencePipeline.init_with_workflow(
                 video_reference=parsed_payload.video_configuration.video_reference,
                 workflow_specification=parsed_payload.processing_configuration.workflow_specification,
@@ -182,7 +211,13 @@ class InferencePipelineManager(Process):
                 api_key=parsed_payload.api_key,
                 image_input_name=parsed_payload.processing_configuration.image_input_name,
                 workflows_parameters=parsed_payload.processing_configuration.workflows_parameters,
-                on_prediction=self._buffer_sink.on_prediction,
+                on_prediction=partial(
+                    multi_sink,
+                    sinks=[
+                        self._buffer_sink.on_prediction,
+                        self._results_broadcaster.on_prediction,
+                    ],
+                ),
                 max_fps=parsed_payload.video_configuration.max_fps,
                 watchdog=self._watchdog,
                 source_buffer_filling_strategy=parsed_payload.video_configuration.source_buffer_filling_strategy,
@@ -192,6 +227,7 @@ class InferencePipelineManager(Process):
                 cancel_thread_pool_tasks_on_exit=parsed_payload.processing_configuration.cancel_thread_pool_tasks_on_exit,
                 video_metadata_input_name=parsed_payload.processing_configuration.video_metadata_input_name,
                 batch_collection_timeout=parsed_payload.video_configuration.batch_collection_timeout,
+                model_registry=self._build_model_registry(),
             )
             self._consumption_timeout = parsed_payload.consumption_timeout
             self._last_consume_time = time.monotonic()
@@ -236,6 +272,14 @@ class InferencePipelineManager(Process):
                 error_type=ErrorType.INVALID_PAYLOAD,
             )
 
+    def _build_model_registry(self) -> Optional[ModelRegistry]:
+        if self._model_servers_address is None:
+            return None
+        return SharedModelServersRegistry(
+            registry=RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES),
+            supervisor_address=self._model_servers_address,
+        )
+
     def _start_webrtc(self, request_id: str, payload: dict):
         try:
             self._watchdog = BasePipelineWatchDog()
@@ -321,8 +365,14 @@ class InferencePipelineManager(Process):
                 queue_size=parsed_payload.sink_configuration.results_buffer_size,
             )
             self._buffer_sink = buffer_sink
+            self._results_broadcaster = ResultsBroadcaster()
             chained_sink = partial(
-                multi_sink, sinks=[buffer_sink.on_prediction, webrtc_sink]
+                multi_sink,
+                sinks=[
+                    buffer_sink.on_prediction,
+                    self._results_broadcaster.on_prediction,
+                    webrtc_sink,
+                ],
             )
 
             self._inference_pipeline = InferencePipeline.init_with_workflow(
@@ -343,6 +393,7 @@ class InferencePipelineManager(Process):
                 cancel_thread_pool_tasks_on_exit=parsed_payload.processing_configuration.cancel_thread_pool_tasks_on_exit,
                 video_metadata_input_name=parsed_payload.processing_configuration.video_metadata_input_name,
                 batch_collection_timeout=parsed_payload.video_configuration.batch_collection_timeout,
+                model_registry=self._build_model_registry(),
             )
             self._inference_pipeline.start(use_main_thread=False)
             self._responses_queue.put(
@@ -427,6 +478,8 @@ class InferencePipelineManager(Process):
     def _execute_termination(self) -> None:
         self._inference_pipeline.terminate()
         self._inference_pipeline.join()
+        if self._results_broadcaster is not None:
+            self._results_broadcaster.close()
         self._stop = True
 
     def _mute_pipeline(self, request_id: str) -> None:
@@ -514,33 +567,13 @@ class InferencePipelineManager(Process):
             excluded_fields = payload.get("excluded_fields")
             predictions, frames = self._buffer_sink.consume_prediction()
             self._last_consume_time = time.monotonic()
-            predictions = [
-                (
-                    serialise_single_workflow_result_element(
-                        result_element=result_element,
-                        excluded_fields=excluded_fields,
-                    )
-                    if result_element is not None
-                    else None
-                )
-                for result_element in predictions
-            ]
-            frames_metadata = []
-            for frame in frames:
-                if frame is None:
-                    frames_metadata.append(None)
-                else:
-                    frames_metadata.append(
-                        {
-                            "frame_timestamp": frame.frame_timestamp.isoformat(),
-                            "frame_id": frame.frame_id,
-                            "source_id": frame.source_id,
-                        }
-                    )
             response_payload = {
                 STATUS_KEY: OperationStatus.SUCCESS,
-                "outputs": predictions,
-                "frames_metadata": frames_metadata,
+                **serialise_pipeline_result(
+                    predictions=predictions,
+                    frames=frames,
+                    excluded_fields=excluded_fields,
+                ),
             }
             self._responses_queue.put((request_id, response_payload))
         except Exception as error:
@@ -551,6 +584,27 @@ class InferencePipelineManager(Process):
                 error_type=ErrorType.OPERATION_ERROR,
             )
 
+    def _subscribe_results(self, request_id: str) -> None:
+        if self._results_broadcaster is None:
+            return self._handle_error(
+                request_id=request_id,
+                public_error_message="Cannot subscribe to results of InferencePipeline which is not initialised.",
+                error_type=ErrorType.OPERATION_ERROR,
+            )
+        try:
+            port = self._results_broadcaster.start()
+            self._last_consume_time = time.monotonic()
+            self._responses_queue.put(
+                (request_id, {STATUS_KEY: OperationStatus.SUCCESS, "port": port})
+            )
+        except Exception as error:
+            self._handle_error(
+                request_id=request_id,
+                error=error,
+                public_error_message="Could not open results stream of InferencePipeline.",
+                error_type=ErrorType.OPERATION_ERROR,
+            )
+
     def _handle_error(
         self,
         request_id: str,
@@ -0,0 +1,573 @@
+import os
+import signal
+import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Client, Connection, Listener
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Queue
+from threading import Event, Lock, Thread
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.env import (
+    STREAM_API_MODEL_SERVER_BATCH_COLLECTION_TIMEOUT,
+    STREAM_API_MODEL_SERVER_IDLE_TIMEOUT,
+    STREAM_API_MODEL_SERVER_MAX_BATCH_SIZE,
+    STREAM_API_MODEL_SERVER_STARTUP_TIMEOUT,
+)
+from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+from inference.core.models.utils.onnx_io_binding import onnx_buffers_scope
+from inference.core.registries.base import ModelRegistry
+from inference.core.utils.shared_memory import (
+    attach_shared_memory,
+    close_detached_shared_memories,
+    create_shared_memory,
+    shared_memory_array,
+    unlink_shared_memory,
+)
+
+# Unix domain sockets keep the transport local-only. Connections are authenticated with
+# `authkey` of the process - inherited by all processes spawned by the stream manager.
+CONNECTION_FAMILY = "AF_UNIX"
+SUPERVISOR_SOCKET_NAME = "supervisor.sock"
+ARRAYS_ALIGNMENT = 64
+IDLE_CHECK_INTERVAL = 1.0
+
+ArraySpec = Tuple[Tuple[int, ...], str, int]
+
+
+class ModelServerError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class SharedArraysDescriptor:
+    name: str
+    arrays: List[ArraySpec]
+
+
+class SharedArraysWriter:
+    """Writes arrays into shared memory segment owned by the writer - segment is reused
+    (and grown when needed) by subsequent writes, so reader must consume arrays before
+    next write."""
+
+    def __init__(self):
+        self._memory: Optional[SharedMemory] = None
+
+    def write(self, arrays: List[np.ndarray]) -> SharedArraysDescriptor:
+        specs, size = [], 0
+        for array in arrays:
+            specs.append((tuple(array.shape), array.dtype.str, size))
+            size += -(-array.nbytes // ARRAYS_ALIGNMENT) * ARRAYS_ALIGNMENT
+        self._ensure_capacity(size=size)
+        for array, (shape, dtype, offset) in zip(arrays, specs):
+            target = np.ndarray(
+                shape, dtype=dtype, buffer=self._memory.buf, offset=offset
+            )
+            target[...] = array
+            del target
+        return SharedArraysDescriptor(name=self._memory.name, arrays=specs)
+
+    def close(self) -> None:
+        if self._memory is None:
+            return None
+        self._memory.close()
+        unlink_shared_memory(memory=self._memory)
+        self._memory = None
+
+    def _ensure_capacity(self, size: int) -> None:
+        if self._memory is not None and self._memory.size >= size:
+            return None
+        current_size = self._memory.size if self._memory is not None else 0
+        self.close()
+        self._memory = create_shared_memory(size=max(size, 2 * current_size, 1))
+
+
+class SharedArraysReader:
+    """Reads arrays described by `SharedArraysDescriptor` - keeps the segment of the
+    last writer attached."""
+
+    def __init__(self):
+        self._memory: Optional[SharedMemory] = None
+        self._detached_memories: List[SharedMemory] = []
+
+    def read(
+        self, descriptor: SharedArraysDescriptor, copy: bool = True
+    ) -> List[np.ndarray]:
+        if self._memory is None or self._memory.name != descriptor.name:
+            self.close()
+            self._memory = attach_shared_memory(name=descriptor.name)
+        arrays = [
+            shared_memory_array(
+                memory=self._memory, shape=shape, dtype=dtype, offset=offset
+            )
+            for shape, dtype, offset in descriptor.arrays
+        ]
+        if copy:
+            arrays = [array.copy() for array in arrays]
+        return arrays
+
+    def close(self) -> None:
+        if self._memory is not None:
+            self._detached_memories.append(self._memory)
+            self._memory = None
+        # segments with views still referenced are unmapped on subsequent calls
+        self._detached_memories = close_detached_shared_memories(
+            memories=self._detached_memories
+        )
+
+
+def _close_listener(listener: Listener, address: str) -> None:
+    try:
+        # wakes up thread blocked in `accept()` - closing the socket does not
+        Client(address=address, family=CONNECTION_FAMILY).close()
+    except Exception:
+        pass
+    listener.close()
+
+
+@dataclass
+class _PendingRequest:
+    request_id: str
+    inputs: np.ndarray
+    connection: Connection
+    outputs_writer: SharedArraysWriter
+    done: Event = field(default_factory=Event)
+
+    def respond(
+        self, outputs: Optional[List[np.ndarray]], error: Optional[str] = None
+    ) -> None:
+        try:
+            descriptor = (
+                self.outputs_writer.write(outputs) if outputs is not None else None
+            )
+            self.connection.send((self.request_id, descriptor, error))
+        except (OSError, ValueError) as send_error:
+            logger.warning(
+                f"Could not respond to model server client. Cause: {send_error}"
+            )
+        finally:
+            # releases view of client shared memory
+            self.inputs = None
+            self.done.set()
+
+
+class ModelServer:
+    """Runs ONNX session of a single model on behalf of multiple InferencePipeline
+    processes.
+
+    Clients send preprocessed inputs through shared memory, the server batches inputs of
+    matching shapes sent by different clients (for models accepting dynamic batch size)
+    into single session run, and sends outputs back through shared memory. Each
+    connection has at most one request in flight.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        address: str,
+        max_batch_size: int = STREAM_API_MODEL_SERVER_MAX_BATCH_SIZE,
+        batch_collection_timeout: float = STREAM_API_MODEL_SERVER_BATCH_COLLECTION_TIMEOUT,
+        idle_timeout: Optional[float] = STREAM_API_MODEL_SERVER_IDLE_TIMEOUT,
+    ):
+        self._model = model
+        self._address = address
+        self._max_batch_size = max_batch_size if model.batching_enabled else 1
+        self._batch_collection_timeout = batch_collection_timeout
+        self._idle_timeout = idle_timeout
+        self._listener = Listener(address=address, family=CONNECTION_FAMILY)
+        self._pending_requests: "Queue[Optional[_PendingRequest]]" = Queue()
+        self._active_connections = 0
+        self._last_activity = time.monotonic()
+        self._state_lock = Lock()
+        self._stop = Event()
+
+    @property
+    def address(self) -> str:
+        return self._address
+
+    def serve_forever(self) -> None:
+        batching_thread = Thread(target=self._process_requests, daemon=True)
+        batching_thread.start()
+        Thread(target=self._accept_connections, daemon=True).start()
+        while not self._stop.wait(timeout=IDLE_CHECK_INTERVAL):
+            if self._is_idle():
+                logger.info(f"Model server {self.address} idle - shutting down.")
+                break
+        self.shutdown()
+        batching_thread.join()
+
+    def shutdown(self) -> None:
+        if self._stop.is_set():
+            return None
+        self._stop.set()
+        _close_listener(listener=self._listener, address=self.address)
+        self._pending_requests.put(None)
+
+    def _is_idle(self) -> bool:
+        if self._idle_timeout is None:
+            return False
+        with self._state_lock:
+            return (
+                self._active_connections == 0
+                and time.monotonic() - self._last_activity > self._idle_timeout
+            )
+
+    def _accept_connections(self) -> None:
+        while not self._stop.is_set():
+            try:
+                connection = self._listener.accept()
+            except Exception as error:
+                logger.warning(f"Model server rejected connection. Cause: {error}")
+                continue
+            if self._stop.is_set():
+                connection.close()
+                return None
+            Thread(
+                target=self._handle_connection, args=(connection,), daemon=True
+            ).start()
+
+    def _handle_connection(self, connection: Connection) -> None:
+        inputs_reader, outputs_writer = SharedArraysReader(), SharedArraysWriter()
+        with self._state_lock:
+            self._active_connections += 1
+        try:
+            while not self._stop.is_set():
+                try:
+                    request_id, descriptor = connection.recv()
+                except (EOFError, OSError):
+                    break
+                request = _PendingRequest(
+                    request_id=request_id,
+                    inputs=inputs_reader.read(descriptor=descriptor, copy=False)[0],
+                    connection=connection,
+                    outputs_writer=outputs_writer,
+                )
+                self._pending_requests.put(request)
+                # inputs are views of client segment - must not be released earlier
+                request.done.wait()
+                del request
+        finally:
+            with self._state_lock:
+                self._active_connections -= 1
+                self._last_activity = time.monotonic()
+            inputs_reader.close()
+            outputs_writer.close()
+            connection.close()
+
+    def _process_requests(self) -> None:
+        carried_request = None
+        while True:
+            request = carried_request or self._pending_requests.get()
+            carried_request = None
+            if request is None:
+                return self._reject_pending_requests()
+            batch, batch_size = [request], len(request.inputs)
+            deadline = time.monotonic() + self._batch_collection_timeout
+            while batch_size < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    next_request = self._pending_requests.get(timeout=max(remaining, 0))
+                except Empty:
+                    break
+                if (
+                    next_request is None
+                    or batch_size + len(next_request.inputs) > self._max_batch_size
+                ):
+                    carried_request = next_request
+                    break
+                batch.append(next_request)
+                batch_size += len(next_request.inputs)
+            for requests_group in _group_by_input_spec(requests=batch):
+                self._run_batch(requests=requests_group)
+            del batch, request
+
+    def _reject_pending_requests(self) -> None:
+        while True:
+            try:
+                request = self._pending_requests.get_nowait()
+            except Empty:
+                return None
+            if request is not None:
+                request.respond(outputs=None, error="Model server shut down")
+
+    def _run_batch(self, requests: List[_PendingRequest]) -> None:
+        try:
+            batch_size = sum(len(r.inputs) for r in requests)
+            if len(requests) == 1:
+                inputs = requests[0].inputs
+            else:
+                inputs = np.concatenate([r.inputs for r in requests])
+            with onnx_buffers_scope():
+                outputs = self._model.run_onnx_session(inputs)
+                del inputs
+                if len(requests) > 1 and any(
+                    np.ndim(output) == 0 or len(output) != batch_size
+                    for output in outputs
+                ):
+                    # outputs are not batch-major - cannot be split between requests
+                    for request in requests:
+                        self._run_batch(requests=[request])
+                    return None
+                start = 0
+                for request in requests:
+                    end = start + len(request.inputs)
+                    if len(requests) == 1:
+                        request_outputs = list(outputs)
+                    else:
+                        request_outputs = [output[start:end] for output in outputs]
+                    request.respond(outputs=request_outputs)
+                    start = end
+        except Exception as error:
+            logger.exception("Model server could not run the model")
+            for request in requests:
+                if not request.done.is_set():
+                    request.respond(
+                        outputs=None, error=f"{error.__class__.__name__}: {error}"
+                    )
+
+
+def _group_by_input_spec(
+    requests: List[_PendingRequest],
+) -> List[List[_PendingRequest]]:
+    groups: Dict[Tuple[Tuple[int, ...], str], List[_PendingRequest]] = {}
+    for request in requests:
+        key = (request.inputs.shape[1:], request.inputs.dtype.str)
+        groups.setdefault(key, []).append(request)
+    return list(groups.values())
+
+
+def ignore_signal(signal_number: int, frame: FrameType) -> None:
+    logger.info(f"Ignoring signal {signal_number} in model server {os.getpid()}")
+
+
+class ModelServerProcess(Process):
+    def __init__(
+        self,
+        model_id: str,
+        api_key: Optional[str],
+        address: str,
+        startup_status: Connection,
+    ):
+        super().__init__(daemon=True)
+        self._model_id = model_id
+        self._api_key = api_key
+        self._address = address
+        self._startup_status = startup_status
+
+    def run(self) -> None:
+        signal.signal(signal.SIGINT, ignore_signal)
+        try:
+            from inference.core.registries.roboflow import RoboflowModelRegistry
+            from inference.models.utils import ROBOFLOW_MODEL_TYPES
+
+            registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
+            model = registry.get_model(self._model_id, self._api_key)(
+                model_id=self._model_id, api_key=self._api_key
+            )
+            server = ModelServer(model=model, address=self._address)
+        except Exception as error:
+            logger.exception(f"Could not start model server for {self._model_id}")
+            self._startup_status.send(f"{error.__class__.__name__}: {error}")
+            return None
+        self._startup_status.send(None)
+        logger.info(f"Model server for {self._model_id} ready at {self._address}")
+        server.serve_forever()
+
+
+@dataclass
+class _ManagedModelServer:
+    process: Optional[ModelServerProcess] = None
+    address: Optional[str] = None
+    lock: Lock = field(default_factory=Lock)
+
+
+class ModelServersSupervisor:
+    """Spawns (on demand) one `ModelServerProcess` per model, and tells pipelines
+    processes where to find the server of a model."""
+
+    def __init__(
+        self,
+        sockets_directory: Optional[str] = None,
+        startup_timeout: float = STREAM_API_MODEL_SERVER_STARTUP_TIMEOUT,
+    ):
+        if sockets_directory is None:
+            sockets_directory = tempfile.mkdtemp(prefix="inference-model-servers-")
+        self._sockets_directory = sockets_directory
+        self._startup_timeout = startup_timeout
+        self._servers: Dict[str, _ManagedModelServer] = {}
+        self._servers_lock = Lock()
+        self._listener: Optional[Listener] = None
+        self._stopped = Event()
+
+    @property
+    def address(self) -> str:
+        return os.path.join(self._sockets_directory, SUPERVISOR_SOCKET_NAME)
+
+    def start(self) -> None:
+        self._listener = Listener(address=self.address, family=CONNECTION_FAMILY)
+        Thread(target=self._accept_connections, daemon=True).start()
+
+    def ensure_model_server(self, model_id: str, api_key: Optional[str]) -> str:
+        with self._servers_lock:
+            managed_server = self._servers.setdefault(model_id, _ManagedModelServer())
+        with managed_server.lock:
+            if managed_server.process is not None and managed_server.process.is_alive():
+                return managed_server.address
+            address = os.path.join(self._sockets_directory, f"{uuid4().hex}.sock")
+            status_receiver, status_sender = Pipe(duplex=False)
+            process = ModelServerProcess(
+                model_id=model_id,
+                api_key=api_key,
+                address=address,
+                startup_status=status_sender,
+            )
+            process.start()
+            if not status_receiver.poll(self._startup_timeout):
+                process.terminate()
+                raise ModelServerError(
+                    f"Model server for {model_id} did not start within "
+                    f"{self._startup_timeout} seconds"
+                )
+            error = status_receiver.recv()
+            if error is not None:
+                process.join()
+                raise ModelServerError(
+                    f"Model server for {model_id} could not start. Cause: {error}"
+                )
+            managed_server.process, managed_server.address = process, address
+            return address
+
+    def terminate(self) -> None:
+        self._stopped.set()
+        if self._listener is not None:
+            _close_listener(listener=self._listener, address=self.address)
+        with self._servers_lock:
+            processes = [s.process for s in self._servers.values() if s.process]
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+    def _accept_connections(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                connection = self._listener.accept()
+            except Exception as error:
+                logger.warning(f"Supervisor rejected connection. Cause: {error}")
+                continue
+            if self._stopped.is_set():
+                connection.close()
+                return None
+            Thread(
+                target=self._handle_connection, args=(connection,), daemon=True
+            ).start()
+
+    def _handle_connection(self, connection: Connection) -> None:
+        with connection:
+            try:
+                model_id, api_key = connection.recv()
+                address = self.ensure_model_server(model_id=model_id, api_key=api_key)
+                connection.send((address, None))
+            except (EOFError, OSError):
+                return None
+            except Exception as error:
+                connection.send((None, str(error)))
+
+
+def request_model_server(
+    supervisor_address: str, model_id: str, api_key: Optional[str]
+) -> str:
+    with Client(address=supervisor_address, family=CONNECTION_FAMILY) as connection:
+        connection.send((model_id, api_key))
+        address, error = connection.recv()
+    if error is not None:
+        raise ModelServerError(error)
+    return address
+
+
+class ModelServerClient:
+    """Runs ONNX session of the model in `ModelServer` - to be bound as
+    `run_onnx_session(...)` of model instance which does not load weights."""
+
+    def __init__(self, address: str):
+        self._connection = Client(address=address, family=CONNECTION_FAMILY)
+        self._inputs_writer = SharedArraysWriter()
+        self._outputs_reader = SharedArraysReader()
+        self._lock = Lock()
+
+    def run(self, img_in: np.ndarray) -> List[np.ndarray]:
+        with self._lock:
+            request_id = uuid4().hex
+            descriptor = self._inputs_writer.write([np.ascontiguousarray(img_in)])
+            self._connection.send((request_id, descriptor))
+            response_id, outputs_descriptor, error = self._connection.recv()
+            if response_id != request_id:
+                raise ModelServerError(
+                    f"Model server responded to request {response_id}, "
+                    f"while {request_id} was expected"
+                )
+            if error is not None:
+                raise ModelServerError(f"Model server could not run model: {error}")
+            return self._outputs_reader.read(descriptor=outputs_descriptor)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+            self._outputs_reader.close()
+            self._inputs_writer.close()
+
+
+class SharedModelServersRegistry(ModelRegistry):
+    """Wraps registry, such that ONNX models are loaded without weights (just model
+    metadata, needed to pre- and post-process), running ONNX session in model server
+    shared by all pipelines using the model."""
+
+    def __init__(self, registry: ModelRegistry, supervisor_address: str):
+        super().__init__(registry_dict=registry.registry_dict)
+        self._registry = registry
+        self._supervisor_address = supervisor_address
+
+    def get_model(self, model_id: str, api_key: str) -> Any:
+        model_class = self._registry.get_model(model_id, api_key)
+        if not _supports_model_server(model_class=model_class):
+            return model_class
+        return partial(self._load_model, model_class)
+
+    def _load_model(self, model_class: type, model_id: str, api_key: str) -> Any:
+        address = request_model_server(
+            supervisor_address=self._supervisor_address,
+            model_id=model_id,
+            api_key=api_key,
+        )
+        model = model_class(model_id=model_id, api_key=api_key, load_weights=False)
+        model.model_server_client = ModelServerClient(address=address)
+        model.run_onnx_session = model.model_server_client.run
+        # connection and shared memory segments of the client are released along with
+        # the model - once it is removed (or evicted) from model manager
+        model.unload = partial(
+            _unload_model_served_remotely, model.unload, model.model_server_client
+        )
+        return model
+
+
+def _unload_model_served_remotely(
+    unload_model: Callable[[], None], model_server_client: ModelServerClient
+) -> None:
+    try:
+        unload_model()
+    finally:
+        model_server_client.close()
+
+
+def _supports_model_server(model_class: Any) -> bool:
+    return isinstance(model_class, type) and issubclass(
+        model_class, OnnxRoboflowInferenceModel
+    )
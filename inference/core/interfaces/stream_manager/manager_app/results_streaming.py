@@ -0,0 +1,264 @@
+import json
+import os
+import socket
+from collections import deque
+from threading import Condition, Lock, Thread, current_thread
+from typing import Deque, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from inference.core import logger
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.http.orjson_utils import (
+    serialise_single_workflow_result_element,
+)
+from inference.core.interfaces.stream_manager.manager_app.communication import (
+    receive_socket_data,
+)
+from inference.core.interfaces.stream_manager.manager_app.entities import (
+    DropPolicy,
+    SubscribeResultsPayload,
+)
+from inference.core.interfaces.stream_manager.manager_app.errors import (
+    CommunicationProtocolError,
+)
+from inference.core.interfaces.stream_manager.manager_app.serialisation import (
+    serialise_to_json,
+)
+
+# results are served on the interface the stream manager listens on
+RESULTS_STREAMING_HOST = os.getenv("STREAM_MANAGER_HOST", "127.0.0.1")
+HEADER_SIZE = 4
+SOCKET_BUFFER_SIZE = 16384
+SEND_TIMEOUT = 10.0
+FLUSH_TIMEOUT = 5.0
+
+PipelineResult = Tuple[List[Optional[dict]], List[Optional[VideoFrame]]]
+
+
+def serialise_pipeline_result(
+    predictions: List[Optional[dict]],
+    frames: List[Optional[VideoFrame]],
+    excluded_fields: Optional[List[str]],
+) -> dict:
+    outputs = [
+        (
+            serialise_single_workflow_result_element(
+                result_element=result_element,
+                excluded_fields=excluded_fields,
+            )
+            if result_element is not None
+            else None
+        )
+        for result_element in predictions
+    ]
+    frames_metadata = []
+    for frame in frames:
+        if frame is None:
+            frames_metadata.append(None)
+        else:
+            frames_metadata.append(
+                {
+                    "frame_timestamp": frame.frame_timestamp.isoformat(),
+                    "frame_id": frame.frame_id,
+                    "source_id": frame.source_id,
+                }
+            )
+    return {"outputs": outputs, "frames_metadata": frames_metadata}
+
+
+class ResultsSubscriber:
+    """Pushes results of the pipeline to single subscriber connection.
+
+    Results are buffered per subscriber, so that slow subscriber does not slow down
+    the pipeline nor other subscribers - when buffer is full, results are dropped
+    according to `drop_policy` of the subscription and number of dropped results is
+    reported in next message. Each message carries all buffered results (up to
+    `max_batch_size`), serialised once in the sending thread.
+    """
+
+    def __init__(
+        self, connection: socket.socket, subscription: SubscribeResultsPayload
+    ):
+        self._connection = connection
+        self._subscription = subscription
+        self._results: Deque[PipelineResult] = deque()
+        self._dropped_results = 0
+        self._closed = False
+        self._condition = Condition()
+
+    def push(self, result: PipelineResult) -> None:
+        with self._condition:
+            if self._closed:
+                return None
+            if len(self._results) >= self._subscription.buffer_size:
+                self._dropped_results += 1
+                if self._subscription.drop_policy is DropPolicy.DROP_NEWEST:
+                    return None
+                self._results.popleft()
+            self._results.append(result)
+            self._condition.notify()
+
+    def serve(self) -> None:
+        try:
+            while True:
+                with self._condition:
+                    while not self._results and not self._closed:
+                        self._condition.wait()
+                    if not self._results:
+                        return None
+                    batch_size = min(
+                        len(self._results), self._subscription.max_batch_size
+                    )
+                    batch = [self._results.popleft() for _ in range(batch_size)]
+                    dropped_results = self._dropped_results
+                    self._dropped_results = 0
+                self._send(batch=batch, dropped_results=dropped_results)
+        except OSError as error:
+            logger.info(f"Results subscriber disconnected. Cause: {error}")
+        finally:
+            self.close()
+            self._connection.close()
+
+    def close(self) -> None:
+        """Stops accepting results - already buffered ones are still sent."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def _send(self, batch: List[PipelineResult], dropped_results: int) -> None:
+        payload = {
+            "results": [
+                serialise_pipeline_result(
+                    predictions=predictions,
+                    frames=frames,
+                    excluded_fields=self._subscription.excluded_fields,
+                )
+                for predictions, frames in batch
+            ],
+            "dropped_results": dropped_results,
+        }
+        data = json.dumps(payload, default=serialise_to_json).encode("utf-8")
+        header = len(data).to_bytes(length=HEADER_SIZE, byteorder="big")
+        self._connection.sendall(header + data)
+
+
+class ResultsBroadcaster:
+    """Sink of the pipeline pushing results to subscribers connected through TCP
+    socket. Socket is opened with first subscription - until then the sink does
+    nothing."""
+
+    def __init__(self, host: str = RESULTS_STREAMING_HOST):
+        self._host = host
+        self._server_socket: Optional[socket.socket] = None
+        self._subscribers: List[ResultsSubscriber] = []
+        self._subscribers_threads: List[Thread] = []
+        self._lock = Lock()
+        self._closed = False
+
+    def on_prediction(
+        self,
+        predictions: Union[dict, List[Optional[dict]]],
+        video_frame: Union[VideoFrame, List[Optional[VideoFrame]]],
+    ) -> None:
+        if not self._subscribers:
+            return None
+        if not isinstance(predictions, list):
+            predictions = [predictions]
+        if not isinstance(video_frame, list):
+            video_frame = [video_frame]
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.push(result=(predictions, video_frame))
+
+    def has_subscribers(self) -> bool:
+        return len(self._subscribers) > 0
+
+    def start(self) -> int:
+        """Starts listening for subscribers (if not started yet).
+
+        Returns:
+            int: Port subscribers should connect to.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Results broadcaster is closed")
+            if self._server_socket is None:
+                server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                server_socket.bind((self._host, 0))
+                server_socket.listen()
+                self._server_socket = server_socket
+                Thread(target=self._accept_subscribers, daemon=True).start()
+            return self._server_socket.getsockname()[1]
+
+    def close(self) -> None:
+        """Stops accepting subscribers and waits (up to `FLUSH_TIMEOUT`) until results
+        buffered for subscribers are sent."""
+        with self._lock:
+            self._closed = True
+            server_socket, self._server_socket = self._server_socket, None
+            subscribers = list(self._subscribers)
+            threads = list(self._subscribers_threads)
+        if server_socket is not None:
+            try:
+                # wakes up thread blocked in `accept()` - closing the socket does not
+                server_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            server_socket.close()
+        for subscriber in subscribers:
+            subscriber.close()
+        for thread in threads:
+            thread.join(timeout=FLUSH_TIMEOUT)
+
+    def _accept_subscribers(self) -> None:
+        server_socket = self._server_socket
+        while True:
+            try:
+                connection, _ = server_socket.accept()
+            except OSError:
+                return None
+            connection.settimeout(SEND_TIMEOUT)
+            thread = Thread(
+                target=self._handle_subscriber, args=(connection,), daemon=True
+            )
+            with self._lock:
+                if self._closed:
+                    connection.close()
+                    return None
+                self._subscribers_threads.append(thread)
+            thread.start()
+
+    def _handle_subscriber(self, connection: socket.socket) -> None:
+        try:
+            self._serve_subscriber(connection=connection)
+        finally:
+            with self._lock:
+                self._subscribers_threads.remove(current_thread())
+
+    def _serve_subscriber(self, connection: socket.socket) -> None:
+        try:
+            subscription = SubscribeResultsPayload.model_validate(
+                receive_socket_data(
+                    source=connection,
+                    header_size=HEADER_SIZE,
+                    buffer_size=SOCKET_BUFFER_SIZE,
+                )
+            )
+        except (OSError, CommunicationProtocolError, ValidationError) as error:
+            logger.warning(f"Rejected results subscription. Cause: {error}")
+            connection.close()
+            return None
+        subscriber = ResultsSubscriber(connection=connection, subscription=subscription)
+        with self._lock:
+            if self._closed:
+                connection.close()
+                return None
+            self._subscribers.append(subscriber)
+        logger.info("Results subscriber connected.")
+        try:
+            subscriber.serve()
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
@@ -7,7 +7,10 @@ from inference.core import logger
 from inference.core.active_learning.middlewares import ActiveLearningMiddleware
 from inference.core.cache.base import BaseCache
 from inference.core.entities.requests.inference import InferenceRequest
-from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.entities.responses.inference import (
+    ColumnarDetectionsInferenceResponse,
+    InferenceResponse,
+)
 from inference.core.env import DISABLE_PREPROC_AUTO_ORIENT
 from inference.core.managers.base import ModelManager
 from inference.core.registries.base import ModelRegistry
@@ -133,11 +136,11 @@ class ActiveLearningManager(ModelManager):
         if not issubclass(type(inference_inputs), list):
             inference_inputs = [inference_inputs]
         if not issubclass(type(prediction), list):
-            results_dicts = [prediction.dict(by_alias=True, exclude={"visualization"})]
-        else:
-            results_dicts = [
-                e.dict(by_alias=True, exclude={"visualization"}) for e in prediction
-            ]
+            prediction = [prediction]
+        results_dicts = [
+            _to_detections_response(e).dict(by_alias=True, exclude={"visualization"})
+            for e in prediction
+        ]
         prediction_type = self.get_task_type(model_id=model_id)
         disable_preproc_auto_orient = (
             getattr(request, "disable_preproc_auto_orient", False)
@@ -214,3 +217,9 @@ class BackgroundTaskActiveLearningManager(ActiveLearningManager):
                 self.register, prediction=prediction, model_id=model_id, request=request
             )
         return prediction
+
+
+def _to_detections_response(prediction: InferenceResponse) -> InferenceResponse:
+    if isinstance(prediction, ColumnarDetectionsInferenceResponse):
+        return prediction.to_detections_response()
+    return prediction
@@ -2,26 +2,24 @@ import time
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from fastapi.encoders import jsonable_encoder
 
-from inference.core.cache import cache
-from inference.core.cache.serializers import to_cachable_inference_item
-from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.env import (
     DISABLE_INFERENCE_CACHE,
     METRICS_ENABLED,
-    METRICS_INTERVAL,
     ROBOFLOW_SERVER_UUID,
 )
 from inference.core.exceptions import InferenceModelNotFound
 from inference.core.logger import logger
 from inference.core.managers.entities import ModelDescription
+from inference.core.managers.metrics_recorder import metrics_recorder
 from inference.core.managers.pingback import PingbackInfo
 from inference.core.models.base import Model, PreprocessReturnMetadata
 from inference.core.registries.base import ModelRegistry
 
+MICRO_BATCHER_PARAM = "micro_batcher"
+
 
 class ModelManager:
     """Model managers keep track of a dictionary of Model objects and is responsible for passing requests to the right model using the infer method."""
@@ -65,6 +63,18 @@ class ModelManager:
         logger.debug("ModelManager - model successfully loaded.")
         self._models[resolved_identifier] = model
 
+    async def add_model_async(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
+    ) -> None:
+        """Adds a new model to the manager - to be used from async code. By default, the model
+        is loaded synchronously, model managers that load models in background override it.
+
+        Args:
+            model_id (str): The identifier of the model.
+            model (Model): The model instance.
+        """
+        return self.add_model(model_id, api_key, model_id_alias=model_id_alias)
+
     def check_for_model(self, model_id: str) -> None:
         """Checks whether the model with the given ID is in the manager.
 
@@ -102,52 +112,15 @@ class ModelManager:
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                logger.debug(
-                    f"ModelManager - caching inference request started for model_id={model_id}"
-                )
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                if (
-                    hasattr(request, "image")
-                    and hasattr(request.image, "type")
-                    and request.image.type == "numpy"
-                ):
-                    request.image.value = str(request.image.value)
-                cache.zadd(
-                    f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                logger.debug(
-                    f"ModelManager - caching inference request finished for model_id={model_id}"
+                self._record_inference_metrics(
+                    model_id=model_id, request=request, response=rtn_val
                 )
             return rtn_val
         except Exception as e:
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                cache.zadd(
-                    f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value={
-                        "request": jsonable_encoder(
-                            request.dict(exclude={"image", "subject", "prompt"})
-                        ),
-                        "error": str(e),
-                    },
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+                metrics_recorder.record_error(
+                    model_id=model_id, request=request, error=e, finish_time=time.time()
                 )
             raise
 
@@ -176,63 +149,57 @@ class ModelManager:
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                logger.debug(
-                    f"ModelManager - caching inference request started for model_id={model_id}"
-                )
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                if (
-                    hasattr(request, "image")
-                    and hasattr(request.image, "type")
-                    and request.image.type == "numpy"
-                ):
-                    request.image.value = str(request.image.value)
-                cache.zadd(
-                    f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                logger.debug(
-                    f"ModelManager - caching inference request finished for model_id={model_id}"
+                self._record_inference_metrics(
+                    model_id=model_id, request=request, response=rtn_val
                 )
             return rtn_val
         except Exception as e:
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                cache.zadd(
-                    f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value={
-                        "request": jsonable_encoder(
-                            request.dict(exclude={"image", "subject", "prompt"})
-                        ),
-                        "error": str(e),
-                    },
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+                metrics_recorder.record_error(
+                    model_id=model_id, request=request, error=e, finish_time=time.time()
                 )
             raise
 
+    def _record_inference_metrics(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        response: Union[List[InferenceResponse], InferenceResponse],
+    ) -> None:
+        finish_time = time.time()
+        if (
+            hasattr(request, "image")
+            and hasattr(request.image, "type")
+            and request.image.type == "numpy"
+        ):
+            request.image.value = str(request.image.value)
+        # serialisation and writes to cache happen in background
+        metrics_recorder.record_inference(
+            model_id=model_id,
+            request=request,
+            response=response,
+            finish_time=finish_time,
+        )
+
     async def model_infer(self, model_id: str, request: InferenceRequest, **kwargs):
         self.check_for_model(model_id)
+        micro_batcher = kwargs.get(MICRO_BATCHER_PARAM)
+        if micro_batcher is not None:
+            return await micro_batcher.async_infer(
+                model_id=model_id, model=self._models[model_id], request=request
+            )
         return self._models[model_id].infer_from_request(request)
 
     def model_infer_sync(
         self, model_id: str, request: InferenceRequest, **kwargs
     ) -> Union[List[InferenceResponse], InferenceResponse]:
         self.check_for_model(model_id)
+        micro_batcher = kwargs.get(MICRO_BATCHER_PARAM)
+        if micro_batcher is not None:
+            return micro_batcher.infer(
+                model_id=model_id, model=self._models[model_id], request=request
+            )
         return self._models[model_id].infer_from_request(request)
 
     def make_response(
@@ -338,6 +305,7 @@ class ModelManager:
             logger.debug(f"Removing model {model_id} from base model manager")
             self.check_for_model(model_id)
             self._models[model_id].clear_cache()
+            self._models[model_id].unload()
             del self._models[model_id]
         except InferenceModelNotFound:
             logger.warning(
@@ -404,6 +372,8 @@ class ModelManager:
                 batch_size=getattr(model, "batch_size", None),
                 input_width=getattr(model, "img_size_w", None),
                 input_height=getattr(model, "img_size_h", None),
+                session_settings=getattr(model, "onnx_session_settings", None),
             )
-            for model_id, model in self._models.items()
+            # snapshot - models may be added by loader threads in the meantime
+            for model_id, model in list(self._models.items())
         ]
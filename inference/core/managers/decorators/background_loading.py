@@ -0,0 +1,137 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from threading import Lock
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from inference.core import logger
+from inference.core.env import MODEL_LOADING_WAIT_TIMEOUT, MODEL_LOADING_WORKERS
+from inference.core.exceptions import ModelLoadingInProgressError
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.base import ModelManagerDecorator
+from inference.core.managers.entities import ModelDescription
+
+
+class WithBackgroundModelLoading(ModelManagerDecorator):
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_workers: int = MODEL_LOADING_WORKERS,
+        wait_timeout: Optional[float] = MODEL_LOADING_WAIT_TIMEOUT,
+    ):
+        """Background loading decorator - models are loaded in worker threads, so that the event loop
+        keeps serving requests to other models while a cold model is initialised.
+
+        Concurrent requests for the same model share a single load (single-flight). Each of them
+        waits at most `wait_timeout` seconds for the model - after that `ModelLoadingInProgressError`
+        is raised while the load continues in background. Failed loads are reported to every waiting
+        request and retried by the next one.
+
+        Args:
+            model_manager (ModelManager): Instance of a ModelManager.
+            max_workers (int, optional): Number of models loaded at the same time. Defaults to 2.
+            wait_timeout (Optional[float], optional): Max time (in seconds) to wait for the model. Defaults to None (wait until loaded).
+        """
+        super().__init__(model_manager)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="model-loader"
+        )
+        self._wait_timeout = wait_timeout
+        self._loads: Dict[str, Future] = {}
+        self._lock = Lock()
+
+    def add_model(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
+    ) -> None:
+        """Adds a model to the manager, joining the load in progress if there is one.
+
+        Args:
+            model_id (str): The identifier of the model.
+            model (Model): The model instance.
+
+        Raises:
+            ModelLoadingInProgressError: If the model is not loaded within wait timeout.
+        """
+        load = self._get_or_start_load(
+            model_id=model_id, api_key=api_key, model_id_alias=model_id_alias
+        )
+        if load is None:
+            return None
+        try:
+            return load.result(timeout=self._wait_timeout)
+        except FutureTimeoutError as error:
+            raise ModelLoadingInProgressError(
+                f"Model {model_id} is still being loaded."
+            ) from error
+
+    async def add_model_async(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
+    ) -> None:
+        """Adds a model to the manager without blocking the event loop.
+
+        Args:
+            model_id (str): The identifier of the model.
+            model (Model): The model instance.
+
+        Raises:
+            ModelLoadingInProgressError: If the model is not loaded within wait timeout.
+        """
+        load = self._get_or_start_load(
+            model_id=model_id, api_key=api_key, model_id_alias=model_id_alias
+        )
+        if load is None:
+            return None
+        try:
+            # shielded - timeout of one request must not cancel the load shared with others
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(load)), timeout=self._wait_timeout
+            )
+        except asyncio.TimeoutError as error:
+            raise ModelLoadingInProgressError(
+                f"Model {model_id} is still being loaded."
+            ) from error
+
+    def is_loading(self, model_id: str) -> bool:
+        with self._lock:
+            return model_id in self._loads
+
+    def describe_models(self) -> List[ModelDescription]:
+        return self.model_manager.describe_models()
+
+    def _get_or_start_load(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str]
+    ) -> Optional[Future]:
+        load_id = model_id if model_id_alias is None else model_id_alias
+        with self._lock:
+            load = self._loads.get(load_id)
+            if load is not None:
+                logger.debug(f"Joining load of model {load_id} in progress.")
+                return load
+            if load_id in self:
+                # let decorators below (e.g. caches) register usage of the model
+                self.model_manager.add_model(
+                    model_id, api_key, model_id_alias=model_id_alias
+                )
+                return None
+            logger.debug(f"Starting background load of model {load_id}.")
+            load = self._executor.submit(
+                self._load_model,
+                model_id=model_id,
+                api_key=api_key,
+                model_id_alias=model_id_alias,
+            )
+            self._loads[load_id] = load
+        load.add_done_callback(lambda _: self._finish_load(load_id=load_id))
+        return load
+
+    def _load_model(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str]
+    ) -> None:
+        start = perf_counter()
+        self.model_manager.add_model(model_id, api_key, model_id_alias=model_id_alias)
+        logger.debug(f"Model {model_id} loaded in {perf_counter() - start:.3f}s.")
+
+    def _finish_load(self, load_id: str) -> None:
+        with self._lock:
+            self._loads.pop(load_id, None)
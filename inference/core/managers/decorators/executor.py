@@ -0,0 +1,146 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from time import perf_counter
+from typing import Any, Dict, Tuple
+
+from inference.core import logger
+from inference.core.entities.requests.inference import InferenceRequest
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import (
+    INFERENCE_EXECUTOR_MAX_CONCURRENCY_PER_MODEL,
+    INFERENCE_EXECUTOR_MAX_QUEUE_SIZE,
+    INFERENCE_EXECUTOR_MAX_QUEUE_SIZE_PER_MODEL,
+    INFERENCE_EXECUTOR_WORKERS,
+)
+from inference.core.exceptions import (
+    InferenceExecutorQueueFullError,
+    ModelInferenceQueueFullError,
+)
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.base import ModelManagerDecorator
+
+EVENT_LOOP_EXECUTION_MODE = "event_loop"
+THREAD_POOL_EXECUTION_MODE = "thread_pool"
+
+
+@dataclass
+class _ModelExecutionSlots:
+    semaphore: asyncio.Semaphore
+    in_flight: int = field(default=0)
+
+
+class WithInferenceExecutor(ModelManagerDecorator):
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_workers: int = INFERENCE_EXECUTOR_WORKERS,
+        max_queue_size: int = INFERENCE_EXECUTOR_MAX_QUEUE_SIZE,
+        max_concurrency_per_model: int = INFERENCE_EXECUTOR_MAX_CONCURRENCY_PER_MODEL,
+        max_queue_size_per_model: int = INFERENCE_EXECUTOR_MAX_QUEUE_SIZE_PER_MODEL,
+    ):
+        """Executor decorator - async inference requests are executed in a bounded thread pool
+        instead of blocking the event loop of HTTP server.
+
+        Requests beyond `max_concurrency_per_model` wait for their model, at most
+        `max_queue_size_per_model` of them - further ones are rejected with
+        `ModelInferenceQueueFullError`. When more than `max_workers + max_queue_size` requests
+        are in flight in total, new ones are rejected with `InferenceExecutorQueueFullError`.
+        Time spent waiting is reported as `queue_time` of the response, `time` still
+        denotes the processing time.
+
+        Args:
+            model_manager (ModelManager): Instance of a ModelManager.
+            max_workers (int, optional): Number of threads running inference. Defaults to 4.
+            max_queue_size (int, optional): Number of requests waiting for a thread. Defaults to 64.
+            max_concurrency_per_model (int, optional): Concurrent requests per model. Defaults to 2.
+            max_queue_size_per_model (int, optional): Requests waiting per model. Defaults to 32.
+        """
+        super().__init__(model_manager)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="inference-executor"
+        )
+        self._max_in_flight = max_workers + max_queue_size
+        self._max_concurrency_per_model = max_concurrency_per_model
+        self._max_in_flight_per_model = (
+            max_concurrency_per_model + max_queue_size_per_model
+        )
+        self._in_flight = 0
+        self._models_slots: Dict[str, _ModelExecutionSlots] = {}
+
+    async def infer_from_request(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> InferenceResponse:
+        """Runs inference in thread pool, waiting for free execution slot if needed.
+
+        Args:
+            model_id (str): The identifier of the model.
+            request (InferenceRequest): The request to process.
+
+        Returns:
+            InferenceResponse: The response from the inference.
+
+        Raises:
+            ModelInferenceQueueFullError: If too many requests wait for the model.
+            InferenceExecutorQueueFullError: If executor cannot accept more requests.
+        """
+        enqueued_at = perf_counter()
+        model_slots = self._models_slots.get(model_id)
+        if model_slots is None:
+            model_slots = _ModelExecutionSlots(
+                semaphore=asyncio.Semaphore(self._max_concurrency_per_model)
+            )
+            self._models_slots[model_id] = model_slots
+        if model_slots.in_flight >= self._max_in_flight_per_model:
+            raise ModelInferenceQueueFullError(
+                f"Too many requests waiting for model {model_id}."
+            )
+        if self._in_flight >= self._max_in_flight:
+            raise InferenceExecutorQueueFullError(
+                "Inference executor cannot accept more requests."
+            )
+        self._in_flight += 1
+        model_slots.in_flight += 1
+        try:
+            async with model_slots.semaphore:
+                loop = asyncio.get_running_loop()
+                started_at, response = await loop.run_in_executor(
+                    self._executor,
+                    partial(
+                        self._timed_infer_from_request_sync,
+                        model_id=model_id,
+                        request=request,
+                        kwargs=kwargs,
+                    ),
+                )
+        finally:
+            self._in_flight -= 1
+            model_slots.in_flight -= 1
+        queue_time = started_at - enqueued_at
+        logger.debug(
+            f"WithInferenceExecutor - request to {model_id} waited {queue_time:.4f}s for execution"
+        )
+        responses = response if isinstance(response, list) else [response]
+        for element in responses:
+            if isinstance(element, InferenceResponse):
+                element.queue_time = queue_time
+        return response
+
+    def remove(self, model_id: str):
+        model_slots = self._models_slots.get(model_id)
+        if model_slots is not None and model_slots.in_flight == 0:
+            del self._models_slots[model_id]
+        return super().remove(model_id)
+
+    def describe_models(self):
+        return self.model_manager.describe_models()
+
+    def _timed_infer_from_request_sync(
+        self, model_id: str, request: InferenceRequest, kwargs: Dict[str, Any]
+    ) -> Tuple[float, InferenceResponse]:
+        started_at = perf_counter()
+        response = self.model_manager.infer_from_request_sync(
+            model_id, request, **kwargs
+        )
+        return started_at, response
@@ -1,30 +1,80 @@
-from collections import deque
-from typing import List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import RLock
+from time import perf_counter
+from typing import List, Optional, Set
 
 from inference.core import logger
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import MODEL_CACHE_EVICTION_POLICY, MODEL_CACHE_MEMORY_BUDGET_MB
 from inference.core.managers.base import Model, ModelManager
 from inference.core.managers.decorators.base import ModelManagerDecorator
 from inference.core.managers.entities import ModelDescription
+from inference.core.models.utils.memory import estimate_model_memory_usage
+
+LRU_EVICTION_POLICY = "lru"
+GDSF_EVICTION_POLICY = "gdsf"
+EVICTION_POLICIES = {LRU_EVICTION_POLICY, GDSF_EVICTION_POLICY}
+
+
+@dataclass
+class _CachedModelStats:
+    load_time: float = 0.0
+    memory_usage: int = 0
+    hits: int = 1
+    priority: float = 0.0
 
 
 class WithFixedSizeCache(ModelManagerDecorator):
-    def __init__(self, model_manager: ModelManager, max_size: int = 8):
-        """Cache decorator, models will be evicted based on the last utilization (`.infer` call). Internally, a [double-ended queue](https://docs.python.org/3/library/collections.html#collections.deque) is used to keep track of model utilization.
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_size: int = 8,
+        memory_budget_mb: Optional[int] = MODEL_CACHE_MEMORY_BUDGET_MB,
+        eviction_policy: str = MODEL_CACHE_EVICTION_POLICY,
+    ):
+        """Cache decorator, models will be evicted when either `max_size` models are loaded or
+        their estimated memory usage exceeds `memory_budget_mb`.
+
+        With `lru` policy, the least recently used model (`.infer` call) is evicted. With `gdsf`
+        (GreedyDual-Size-Frequency) policy, the model with the lowest `clock + hits * load_time / memory_usage`
+        priority is evicted - models that are frequently used, slow to load and small are kept longest.
+        Internally, an [ordered dictionary](https://docs.python.org/3/library/collections.html#collections.OrderedDict)
+        is used to keep track of model utilization in O(1).
+
+        Models may be added from multiple threads (see `WithBackgroundModelLoading`) - bookkeeping and eviction
+        are serialised with a lock, while models themselves are loaded outside it. Models being loaded count
+        towards `max_size`, but are never evicted.
 
         Args:
             model_manager (ModelManager): Instance of a ModelManager.
             max_size (int, optional): Max number of models at the same time. Defaults to 8.
+            memory_budget_mb (Optional[int], optional): Max estimated memory usage of models (in MB). Defaults to None (no limit).
+            eviction_policy (str, optional): Eviction policy - `lru` or `gdsf`. Defaults to `lru`.
         """
         super().__init__(model_manager)
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown model cache eviction policy: {eviction_policy}. "
+                f"Use one of: {sorted(EVICTION_POLICIES)}"
+            )
         self.max_size = max_size
-        self._key_queue = deque(self.model_manager.keys())
+        self.memory_budget = (
+            memory_budget_mb * 1024 * 1024 if memory_budget_mb is not None else None
+        )
+        self.eviction_policy = eviction_policy
+        self._clock = 0.0
+        self._key_queue: "OrderedDict[str, _CachedModelStats]" = OrderedDict(
+            (model_id, _CachedModelStats()) for model_id in self.model_manager.keys()
+        )
+        self._loading: Set[str] = set()
+        self._lock = RLock()
 
     def add_model(
         self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
     ) -> None:
-        """Adds a model to the manager and evicts the least recently used if the cache is full.
+        """Adds a model to the manager and evicts models if the cache is full.
 
         Args:
             model_id (str): The identifier of the model.
@@ -33,32 +83,42 @@ class WithFixedSizeCache(ModelManagerDecorator):
         queue_id = self._resolve_queue_id(
             model_id=model_id, model_id_alias=model_id_alias
         )
-        if queue_id in self:
-            logger.debug(
-                f"Detected {queue_id} in WithFixedSizeCache models queue -> marking as most recently used."
-            )
-            self._key_queue.remove(queue_id)
-            self._key_queue.append(queue_id)
-            return None
-
-        logger.debug(f"Current capacity of ModelManager: {len(self)}/{self.max_size}")
-        while len(self) >= self.max_size:
-            to_remove_model_id = self._key_queue.popleft()
+        with self._lock:
+            if queue_id in self:
+                logger.debug(
+                    f"Detected {queue_id} in WithFixedSizeCache models queue -> marking as most recently used."
+                )
+                self._mark_as_used(queue_id)
+                return None
             logger.debug(
-                f"Reached maximum capacity of ModelManager. Unloading model {to_remove_model_id}"
+                f"Current capacity of ModelManager: {len(self)}/{self.max_size}"
             )
-            super().remove(to_remove_model_id)
-            logger.debug(f"Model {to_remove_model_id} successfully unloaded.")
-        logger.debug(f"Marking new model {queue_id} as most recently used.")
-        self._key_queue.append(queue_id)
+            while len(self) + len(self._loading) >= self.max_size:
+                if not self._evict(reason="Reached maximum capacity of ModelManager"):
+                    break
+            logger.debug(f"Marking new model {queue_id} as most recently used.")
+            self._key_queue[queue_id] = _CachedModelStats()
+            self._loading.add(queue_id)
+        start = perf_counter()
         try:
-            return super().add_model(model_id, api_key, model_id_alias=model_id_alias)
+            result = super().add_model(model_id, api_key, model_id_alias=model_id_alias)
         except Exception as error:
             logger.debug(
                 f"Could not initialise model {queue_id}. Removing from WithFixedSizeCache models queue."
             )
-            self._key_queue.remove(queue_id)
+            with self._lock:
+                self._loading.discard(queue_id)
+                self._key_queue.pop(queue_id, None)
             raise error
+        with self._lock:
+            self._loading.discard(queue_id)
+            stats = self._key_queue.get(queue_id)
+            if stats is not None:
+                stats.load_time = perf_counter() - start
+                stats.memory_usage = self._estimate_memory_usage(queue_id)
+                stats.priority = self._compute_priority(stats)
+            self._enforce_memory_budget(protected_model_id=queue_id)
+        return result
 
     def clear(self) -> None:
         """Removes all models from the manager."""
@@ -66,13 +126,12 @@ class WithFixedSizeCache(ModelManagerDecorator):
             self.remove(model_id)
 
     def remove(self, model_id: str) -> Model:
-        try:
-            self._key_queue.remove(model_id)
-        except ValueError:
-            logger.warning(
-                f"Could not successfully purge model {model_id} from  WithFixedSizeCache models queue"
-            )
-        return super().remove(model_id)
+        with self._lock:
+            if self._key_queue.pop(model_id, None) is None:
+                logger.warning(
+                    f"Could not successfully purge model {model_id} from  WithFixedSizeCache models queue"
+                )
+            return super().remove(model_id)
 
     async def infer_from_request(
         self, model_id: str, request: InferenceRequest, **kwargs
@@ -86,8 +145,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id)
         return await super().infer_from_request(model_id, request, **kwargs)
 
     def infer_from_request_sync(
@@ -102,8 +160,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id)
         return super().infer_from_request_sync(model_id, request, **kwargs)
 
     def infer_only(self, model_id: str, request, img_in, img_dims, batch_size=None):
@@ -119,8 +176,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             Response from the inference-only operation.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id)
         return super().infer_only(model_id, request, img_in, img_dims, batch_size)
 
     def preprocess(self, model_id: str, request):
@@ -130,8 +186,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
             model_id (str): The identifier of the model.
             request (InferenceRequest): The request to preprocess.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_as_used(model_id)
         return super().preprocess(model_id, request)
 
     def describe_models(self) -> List[ModelDescription]:
@@ -141,3 +196,74 @@ class WithFixedSizeCache(ModelManagerDecorator):
         self, model_id: str, model_id_alias: Optional[str] = None
     ) -> str:
         return model_id if model_id_alias is None else model_id_alias
+
+    def _mark_as_used(self, model_id: str) -> None:
+        with self._lock:
+            stats = self._key_queue.get(model_id)
+            if stats is None:
+                return None
+            self._key_queue.move_to_end(model_id)
+            stats.hits += 1
+            stats.priority = self._compute_priority(stats)
+
+    def _compute_priority(self, stats: _CachedModelStats) -> float:
+        if self.eviction_policy != GDSF_EVICTION_POLICY:
+            return 0.0
+        memory_usage_mb = max(stats.memory_usage / (1024 * 1024), 1.0)
+        return self._clock + stats.hits * stats.load_time / memory_usage_mb
+
+    def _enforce_memory_budget(self, protected_model_id: str) -> None:
+        if self.memory_budget is None:
+            return None
+        for model_id, stats in self._key_queue.items():
+            if model_id != protected_model_id and model_id not in self._loading:
+                # caches of models (e.g. image embeddings) grow while they are used
+                stats.memory_usage = self._estimate_memory_usage(model_id)
+        while self._get_memory_usage() > self.memory_budget:
+            if not self._evict(
+                reason="Exceeded memory budget of ModelManager",
+                protected_model_id=protected_model_id,
+            ):
+                logger.warning(
+                    f"Model {protected_model_id} alone exceeds memory budget of ModelManager."
+                )
+                return None
+
+    def _get_memory_usage(self) -> int:
+        return sum(stats.memory_usage for stats in self._key_queue.values())
+
+    def _evict(self, reason: str, protected_model_id: Optional[str] = None) -> bool:
+        to_remove_model_id = self._select_model_to_evict(
+            protected_model_id=protected_model_id
+        )
+        if to_remove_model_id is None:
+            return False
+        logger.debug(f"{reason}. Unloading model {to_remove_model_id}")
+        stats = self._key_queue.pop(to_remove_model_id)
+        if self.eviction_policy == GDSF_EVICTION_POLICY:
+            self._clock = stats.priority
+        super().remove(to_remove_model_id)
+        logger.debug(f"Model {to_remove_model_id} successfully unloaded.")
+        return True
+
+    def _select_model_to_evict(
+        self, protected_model_id: Optional[str] = None
+    ) -> Optional[str]:
+        candidates = (
+            (model_id, stats)
+            for model_id, stats in self._key_queue.items()
+            if model_id != protected_model_id and model_id not in self._loading
+        )
+        if self.eviction_policy == LRU_EVICTION_POLICY:
+            return next((model_id for model_id, _ in candidates), None)
+        # GDSF needs the lowest priority - the number of loaded models is small,
+        # so linear scan is cheaper than maintaining a heap on every hit
+        selected = min(candidates, key=lambda e: e[1].priority, default=None)
+        return selected[0] if selected is not None else None
+
+    def _estimate_memory_usage(self, model_id: str) -> int:
+        try:
+            return estimate_model_memory_usage(self.model_manager[model_id])
+        except Exception as error:
+            logger.debug(f"Could not estimate memory usage of {model_id}: {error}")
+            return 0
@@ -0,0 +1,342 @@
+import asyncio
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from threading import Lock, Thread
+from time import monotonic, perf_counter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.entities.requests.inference import InferenceRequest
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import (
+    DEDICATED_DEPLOYMENT_ID,
+    FIX_BATCH_SIZE,
+    MAX_BATCH_SIZE,
+    MICRO_BATCHING_MAX_BATCH_SIZE,
+    MICRO_BATCHING_MAX_WAIT_TIME,
+)
+from inference.core.managers.base import MICRO_BATCHER_PARAM, Model, ModelManager
+from inference.core.managers.decorators.base import ModelManagerDecorator
+from inference.core.models.types import PreprocessReturnMetadata
+from inference.usage_tracking.collector import usage_collector
+
+
+@dataclass
+class _PendingRequest:
+    request: InferenceRequest
+    future: Future
+    start: float = field(default_factory=perf_counter)
+
+
+@dataclass
+class _PreprocessedRequest:
+    pending: _PendingRequest
+    request_params: Dict[str, Any]
+    img_in: np.ndarray
+    preprocess_return_metadata: PreprocessReturnMetadata
+
+
+class ModelRequestsBatcher:
+    """Collects requests to a single model and runs them through the model as one batch.
+
+    Requests are preprocessed one-by-one, then all inputs of the same shape are
+    concatenated and passed to a single `predict(...)` call. Model outputs are split
+    back and post-processed with parameters of each request. A batch is flushed when
+    either `max_batch_size` requests are collected or `max_wait_time` elapsed since
+    the first request of the batch arrived. Models with outputs that cannot be split
+    along the batch axis are detected on the first batch and served request by request.
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        model: Model,
+        max_batch_size: int,
+        max_wait_time: float,
+    ):
+        self._model_id = model_id
+        self._model = model
+        self._max_batch_size = max_batch_size
+        self._max_wait_time = max_wait_time
+        self._outputs_batch_major = True
+        self._queue: "Queue[Optional[_PendingRequest]]" = Queue()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, request: InferenceRequest) -> Future:
+        future = Future()
+        self._queue.put(_PendingRequest(request=request, future=future))
+        return future
+
+    def stop(self) -> None:
+        # requests queued before stop are still served
+        self._queue.put(None)
+
+    def _run(self) -> None:
+        while True:
+            pending = self._queue.get()
+            if pending is None:
+                return None
+            batch, stop_requested = self._collect_batch(first=pending)
+            self._process_batch(batch=batch)
+            if stop_requested:
+                return None
+
+    def _collect_batch(
+        self, first: _PendingRequest
+    ) -> Tuple[List[_PendingRequest], bool]:
+        batch = [first]
+        deadline = monotonic() + self._max_wait_time
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            try:
+                pending = self._queue.get(timeout=remaining)
+            except Empty:
+                break
+            if pending is None:
+                return batch, True
+            batch.append(pending)
+        return batch, False
+
+    def _process_batch(self, batch: List[_PendingRequest]) -> None:
+        logger.debug(
+            f"Micro-batching - running batch of size {len(batch)} for model {self._model_id}"
+        )
+        preprocessed = []
+        for pending in batch:
+            if not pending.future.set_running_or_notify_cancel():
+                continue
+            try:
+                request_params = pending.request.dict()
+                img_in, preprocess_return_metadata = self._model.preprocess(
+                    **request_params
+                )
+                preprocessed.append(
+                    _PreprocessedRequest(
+                        pending=pending,
+                        request_params=request_params,
+                        img_in=img_in,
+                        preprocess_return_metadata=preprocess_return_metadata,
+                    )
+                )
+            except Exception as error:
+                pending.future.set_exception(error)
+        for group in _group_by_input_shape(preprocessed=preprocessed):
+            try:
+                self._infer_group(group=group)
+            except Exception as error:
+                for element in group:
+                    if not element.pending.future.done():
+                        element.pending.future.set_exception(error)
+
+    def _infer_group(self, group: List[_PreprocessedRequest]) -> None:
+        if len(group) > 1 and not self._outputs_batch_major:
+            for element in group:
+                self._infer_group(group=[element])
+            return None
+        if len(group) == 1:
+            img_in = group[0].img_in
+        else:
+            img_in = np.concatenate([element.img_in for element in group], axis=0)
+        predictions = self._model.predict(img_in)
+        if len(group) > 1 and any(
+            np.ndim(prediction) == 0 or len(prediction) != img_in.shape[0]
+            for prediction in predictions
+        ):
+            # some outputs are not batch-major (like prototypes of Yolact) - they
+            # cannot be split between requests, so the model is served per request
+            logger.warning(
+                f"Micro-batching - outputs of model {self._model_id} cannot be split "
+                f"between requests, running requests one by one."
+            )
+            self._outputs_batch_major = False
+            for element in group:
+                self._infer_group(group=[element])
+            return None
+        start_index = 0
+        for element in group:
+            end_index = start_index + element.img_in.shape[0]
+            if len(group) == 1:
+                element_predictions = tuple(predictions)
+            else:
+                element_predictions = tuple(
+                    prediction[start_index:end_index] for prediction in predictions
+                )
+            start_index = end_index
+            try:
+                response = self._postprocess(
+                    element=element, predictions=element_predictions
+                )
+                element.pending.future.set_result(response)
+            except Exception as error:
+                element.pending.future.set_exception(error)
+
+    def _postprocess(
+        self, element: _PreprocessedRequest, predictions: Tuple[np.ndarray, ...]
+    ) -> InferenceResponse:
+        request = element.pending.request
+        postprocess_params = dict(element.request_params)
+        postprocess_params["return_image_dims"] = False
+        responses = self._model.postprocess(
+            predictions, element.preprocess_return_metadata, **postprocess_params
+        )
+        self._record_usage(request=request)
+        response = responses[0]
+        response.time = perf_counter() - element.pending.start
+        if request.id:
+            response.inference_id = request.id
+        if getattr(request, "visualize_predictions", False):
+            response.visualization = self._model.draw_predictions(request, response)
+        return response
+
+    def _record_usage(self, request: InferenceRequest) -> None:
+        # batched requests do not go through `Model.infer(...)`, which is decorated
+        # with `usage_collector` - usage is recorded here for each request instead
+        resource_details = {
+            "billable": request.usage_billable,
+            "task_type": self._model.task_type,
+        }
+        if DEDICATED_DEPLOYMENT_ID:
+            resource_details["dedicated_deployment_id"] = DEDICATED_DEPLOYMENT_ID
+        if request.source is not None:
+            resource_details["source"] = request.source
+        usage_collector.record_usage(
+            source=None,
+            category="model",
+            api_key=request.api_key or getattr(self._model, "api_key", None),
+            resource_details=resource_details,
+            resource_id=self._model_id,
+        )
+
+
+class MicroBatcher:
+    """Keeps one `ModelRequestsBatcher` per model and decides which requests can be batched."""
+
+    def __init__(self, max_batch_size: int, max_wait_time: float):
+        if MAX_BATCH_SIZE != float("inf"):
+            max_batch_size = min(max_batch_size, MAX_BATCH_SIZE)
+        self._max_batch_size = max(max_batch_size, 1)
+        self._max_wait_time = max_wait_time
+        self._batchers: Dict[str, ModelRequestsBatcher] = {}
+        self._lock = Lock()
+
+    def is_applicable(self, model: Model, request: InferenceRequest) -> bool:
+        if FIX_BATCH_SIZE or self._max_batch_size < 2:
+            return False
+        if not getattr(model, "batching_enabled", False):
+            return False
+        if not isinstance(model, Model):
+            return False
+        if type(model).infer_from_request is not Model.infer_from_request:
+            # models with custom request handling are not batched
+            return False
+        image = getattr(request, "image", None)
+        if image is None or isinstance(image, list):
+            return False
+        return not getattr(request, "fix_batch_size", False)
+
+    def infer(
+        self, model_id: str, model: Model, request: InferenceRequest
+    ) -> Union[List[InferenceResponse], InferenceResponse]:
+        if not self.is_applicable(model=model, request=request):
+            return model.infer_from_request(request)
+        return (
+            self._get_batcher(model_id=model_id, model=model).submit(request).result()
+        )
+
+    async def async_infer(
+        self, model_id: str, model: Model, request: InferenceRequest
+    ) -> Union[List[InferenceResponse], InferenceResponse]:
+        if not self.is_applicable(model=model, request=request):
+            return model.infer_from_request(request)
+        future = self._get_batcher(model_id=model_id, model=model).submit(request)
+        return await asyncio.wrap_future(future)
+
+    def stop(self, model_id: str) -> None:
+        with self._lock:
+            batcher = self._batchers.pop(model_id, None)
+        if batcher is not None:
+            batcher.stop()
+
+    def stop_all(self) -> None:
+        with self._lock:
+            batchers = list(self._batchers.values())
+            self._batchers = {}
+        for batcher in batchers:
+            batcher.stop()
+
+    def _get_batcher(self, model_id: str, model: Model) -> ModelRequestsBatcher:
+        with self._lock:
+            batcher = self._batchers.get(model_id)
+            if batcher is None:
+                batcher = ModelRequestsBatcher(
+                    model_id=model_id,
+                    model=model,
+                    max_batch_size=self._max_batch_size,
+                    max_wait_time=self._max_wait_time,
+                )
+                self._batchers[model_id] = batcher
+            return batcher
+
+
+class WithMicroBatching(ModelManagerDecorator):
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_batch_size: int = MICRO_BATCHING_MAX_BATCH_SIZE,
+        max_wait_time: float = MICRO_BATCHING_MAX_WAIT_TIME,
+    ):
+        """Micro-batching decorator - concurrent single-image requests to the same model
+        (that supports dynamic batch size) are merged into a single `predict(...)` call.
+
+        Pre- and post-processing, metrics and active learning registration still happen
+        per request - only the model forward pass is shared.
+
+        Batches are never larger than the number of concurrent requests reaching this
+        decorator - when it is wrapped with `WithInferenceExecutor`, executor workers and
+        concurrency per model must be at least `max_batch_size` for batches to fill up
+        (default concurrency per model of executor is 2).
+
+        Args:
+            model_manager (ModelManager): Instance of a ModelManager.
+            max_batch_size (int, optional): Max number of requests in a batch. Defaults to 8.
+            max_wait_time (float, optional): Max time (in seconds) to wait for batch to fill. Defaults to 0.005.
+        """
+        super().__init__(model_manager)
+        self.micro_batcher = MicroBatcher(
+            max_batch_size=max_batch_size, max_wait_time=max_wait_time
+        )
+
+    async def infer_from_request(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> InferenceResponse:
+        kwargs[MICRO_BATCHER_PARAM] = self.micro_batcher
+        return await super().infer_from_request(model_id, request, **kwargs)
+
+    def infer_from_request_sync(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> InferenceResponse:
+        kwargs[MICRO_BATCHER_PARAM] = self.micro_batcher
+        return super().infer_from_request_sync(model_id, request, **kwargs)
+
+    def remove(self, model_id: str) -> Model:
+        self.micro_batcher.stop(model_id=model_id)
+        return super().remove(model_id)
+
+    def describe_models(self):
+        return self.model_manager.describe_models()
+
+
+def _group_by_input_shape(
+    preprocessed: List[_PreprocessedRequest],
+) -> List[List[_PreprocessedRequest]]:
+    groups: Dict[Tuple[tuple, str], List[_PreprocessedRequest]] = {}
+    for element in preprocessed:
+        key = (element.img_in.shape[1:], element.img_in.dtype.str)
+        groups.setdefault(key, []).append(element)
+    return list(groups.values())
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
 @dataclass(frozen=True)
@@ -9,3 +9,4 @@ class ModelDescription:
     batch_size: Optional[int]
     input_height: Optional[int]
     input_width: Optional[int]
+    session_settings: Optional[Dict[str, Any]] = None
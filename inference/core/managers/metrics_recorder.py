@@ -0,0 +1,189 @@
+import random
+from dataclasses import dataclass
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, List, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from inference.core.cache import cache
+from inference.core.cache.base import BaseCache
+from inference.core.cache.serializers import to_cachable_inference_item
+from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
+from inference.core.entities.requests.inference import InferenceRequest
+from inference.core.env import (
+    METRICS_INTERVAL,
+    METRICS_RECORDER_BATCH_SIZE,
+    METRICS_RECORDER_FLUSH_INTERVAL,
+    METRICS_RECORDER_QUEUE_SIZE,
+    METRICS_RECORDER_SAMPLING_THRESHOLD,
+)
+from inference.core.logger import logger
+
+
+@dataclass(frozen=True)
+class _InferenceMetricsEvent:
+    model_id: str
+    request: InferenceRequest
+    finish_time: float
+    response: Any = None
+    error: Optional[str] = None
+
+
+class InferenceMetricsRecorder:
+    """Records inference metrics in cache from a background thread.
+
+    Events are put into a bounded queue and written in batches with `cache.zadd_many(...)`
+    (a single pipeline for Redis). Serialisation of requests and responses also happens in
+    the background. When the queue is filled above `sampling_threshold`, events are accepted
+    with decreasing probability - and when it is full, they are dropped - so that recording
+    never adds latency to the request. Both sampled-out and dropped events are counted in
+    `dropped_events`.
+    """
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        max_queue_size: int = METRICS_RECORDER_QUEUE_SIZE,
+        batch_size: int = METRICS_RECORDER_BATCH_SIZE,
+        flush_interval: float = METRICS_RECORDER_FLUSH_INTERVAL,
+        sampling_threshold: float = METRICS_RECORDER_SAMPLING_THRESHOLD,
+    ):
+        self._cache = cache
+        self._max_queue_size = max(max_queue_size, 1)
+        self._batch_size = max(batch_size, 1)
+        self._flush_interval = flush_interval
+        self._sampling_threshold = min(max(sampling_threshold, 0.0), 1.0)
+        self._queue: "Queue[_InferenceMetricsEvent]" = Queue(
+            maxsize=self._max_queue_size
+        )
+        self._dropped_events = 0
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def dropped_events(self) -> int:
+        return self._dropped_events
+
+    def record_inference(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        response: Any,
+        finish_time: float,
+    ) -> None:
+        self._submit(
+            _InferenceMetricsEvent(
+                model_id=model_id,
+                request=request,
+                response=response,
+                finish_time=finish_time,
+            )
+        )
+
+    def record_error(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        error: Exception,
+        finish_time: float,
+    ) -> None:
+        self._submit(
+            _InferenceMetricsEvent(
+                model_id=model_id,
+                request=request,
+                error=str(error),
+                finish_time=finish_time,
+            )
+        )
+
+    def flush(self) -> None:
+        """Blocks until all accepted events are written into cache."""
+        self._queue.join()
+
+    def _submit(self, event: _InferenceMetricsEvent) -> None:
+        self._ensure_thread_started()
+        if not self._is_sampled_in():
+            self._count_dropped_event()
+            return None
+        try:
+            self._queue.put_nowait(event)
+        except Full:
+            self._count_dropped_event()
+
+    def _is_sampled_in(self) -> bool:
+        fill_ratio = self._queue.qsize() / self._max_queue_size
+        if fill_ratio <= self._sampling_threshold:
+            return True
+        acceptance_probability = (1.0 - fill_ratio) / (1.0 - self._sampling_threshold)
+        return random.random() < acceptance_probability
+
+    def _count_dropped_event(self) -> None:
+        with self._lock:
+            self._dropped_events += 1
+
+    def _ensure_thread_started(self) -> None:
+        if self._thread is not None:
+            return None
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            try:
+                self._cache.zadd_many(
+                    entries=[entry for event in batch for entry in _to_entries(event)]
+                )
+            except Exception as error:
+                logger.warning(f"Could not record inference metrics: {error}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _collect_batch(self) -> List[_InferenceMetricsEvent]:
+        batch = [self._queue.get()]
+        deadline = monotonic() + self._flush_interval
+        while len(batch) < self._batch_size:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except Empty:
+                break
+        return batch
+
+
+def _to_entries(
+    event: _InferenceMetricsEvent,
+) -> List[Tuple[str, Any, float, Optional[float]]]:
+    expire = METRICS_INTERVAL * 2
+    request = event.request
+    entries = [
+        (
+            "models",
+            f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{event.model_id}",
+            event.finish_time,
+            expire,
+        )
+    ]
+    if event.error is not None:
+        value = {
+            "request": jsonable_encoder(
+                request.dict(exclude={"image", "subject", "prompt"})
+            ),
+            "error": event.error,
+        }
+        key = f"error:{GLOBAL_INFERENCE_SERVER_ID}:{event.model_id}"
+    else:
+        value = to_cachable_inference_item(request, event.response)
+        key = f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{event.model_id}"
+    entries.append((key, value, event.finish_time, expire))
+    return entries
+
+
+metrics_recorder = InferenceMetricsRecorder(cache=cache)
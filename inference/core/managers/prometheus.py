@@ -9,6 +9,8 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.logger import logger
 from inference.core.managers.metrics import get_model_metrics
+from inference.core.managers.metrics_recorder import metrics_recorder
+from inference.core.models.utils.image_loader_pool import IMAGE_LOADER_POOL
 
 
 class InferenceInstrumentator:
@@ -100,3 +102,24 @@ class CustomCollector(Collector):
             f"Total number of errors in {self.time_window}s",
             value=num_errors_total,
         )
+        yield CounterMetricFamily(
+            "inference_metrics_dropped_events",
+            "Number of inference metrics events dropped or sampled out under load",
+            value=metrics_recorder.dropped_events,
+        )
+        image_loader_pool_metrics = IMAGE_LOADER_POOL.get_metrics()
+        yield GaugeMetricFamily(
+            "image_loader_pool_active_tasks",
+            "Number of images being decoded by shared image loader pool",
+            value=image_loader_pool_metrics["active_tasks"],
+        )
+        yield GaugeMetricFamily(
+            "image_loader_pool_pending_tasks",
+            "Number of images waiting for a thread of shared image loader pool",
+            value=image_loader_pool_metrics["pending_tasks"],
+        )
+        yield GaugeMetricFamily(
+            "image_loader_pool_saturation",
+            "Fraction of busy threads of shared image loader pool",
+            value=image_loader_pool_metrics["saturation"],
+        )
@@ -82,6 +82,7 @@ class Model(BaseInference):
     Methods:
         log(m): Print the given message.
         clear_cache(): Clears any cache if necessary.
+        unload(): Releases resources held by the model.
     """
 
     def log(self, m):
@@ -96,6 +97,10 @@ class Model(BaseInference):
         """Clears any cache if necessary. This method should be implemented in derived classes as needed."""
         pass
 
+    def unload(self):
+        """Releases resources held by the model when it is removed from a model manager. This method should be implemented in derived classes as needed."""
+        pass
+
     def infer_from_request(
         self,
         request: InferenceRequest,
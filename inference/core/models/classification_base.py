@@ -181,54 +181,29 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         )
 
     def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})
+        predictions = self.run_onnx_session(img_in)
         return (predictions,)
 
     def preprocess(
         self, image: Any, **kwargs
     ) -> Tuple[np.ndarray, PreprocessReturnMetadata]:
-        if isinstance(image, list):
-            imgs_with_dims = [
-                self.preproc_image(
-                    i,
-                    disable_preproc_auto_orient=kwargs.get(
-                        "disable_preproc_auto_orient", False
-                    ),
-                    disable_preproc_contrast=kwargs.get(
-                        "disable_preproc_contrast", False
-                    ),
-                    disable_preproc_grayscale=kwargs.get(
-                        "disable_preproc_grayscale", False
-                    ),
-                    disable_preproc_static_crop=kwargs.get(
-                        "disable_preproc_static_crop", False
-                    ),
-                )
-                for i in image
-            ]
-            imgs, img_dims = zip(*imgs_with_dims)
-            img_in = np.concatenate(imgs, axis=0)
-        else:
-            img_in, img_dims = self.preproc_image(
-                image,
-                disable_preproc_auto_orient=kwargs.get(
-                    "disable_preproc_auto_orient", False
-                ),
-                disable_preproc_contrast=kwargs.get("disable_preproc_contrast", False),
-                disable_preproc_grayscale=kwargs.get(
-                    "disable_preproc_grayscale", False
-                ),
-                disable_preproc_static_crop=kwargs.get(
-                    "disable_preproc_static_crop", False
-                ),
-            )
-            img_dims = [img_dims]
+        img_in, img_dims = self.load_image(
+            image,
+            disable_preproc_auto_orient=kwargs.get(
+                "disable_preproc_auto_orient", False
+            ),
+            disable_preproc_contrast=kwargs.get("disable_preproc_contrast", False),
+            disable_preproc_grayscale=kwargs.get("disable_preproc_grayscale", False),
+            disable_preproc_static_crop=kwargs.get(
+                "disable_preproc_static_crop", False
+            ),
+        )
 
         img_in /= 255.0
 
         mean = self.preprocess_means
         std = self.preprocess_stds
-        img_in = img_in.astype(np.float32)
+        img_in = img_in.astype(np.float32, copy=False)
 
         img_in[:, 0, :, :] = (img_in[:, 0, :, :] - mean[0]) / std[0]
         img_in[:, 1, :, :] = (img_in[:, 1, :, :] - mean[1]) / std[1]
@@ -353,7 +328,7 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         e_x = np.exp(x - np.max(x))
         return e_x / e_x.sum()
 
-    def get_model_output_shape(self) -> Tuple[int, int, int]:
+    def probe_model_output_shape(self) -> Tuple[int, int, int, int]:
         test_image = (np.random.rand(1024, 1024, 3) * 255).astype(np.uint8)
         test_image, _ = self.preprocess(test_image)
         output = np.array(self.predict(test_image))
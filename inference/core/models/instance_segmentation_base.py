@@ -3,6 +3,7 @@ from typing import Any, List, Tuple, Union
 import numpy as np
 
 from inference.core.entities.responses.inference import (
+    ColumnarDetectionsInferenceResponse,
     InferenceResponseImage,
     InstanceSegmentationInferenceResponse,
     InstanceSegmentationPrediction,
@@ -11,6 +12,7 @@ from inference.core.entities.responses.inference import (
 from inference.core.exceptions import InvalidMaskDecodeArgument
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
 from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.columnar import build_columnar_predictions
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
@@ -108,6 +110,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             max_detections=max_detections,
             return_image_dims=return_image_dims,
             tradeoff_factor=tradeoff_factor,
+            columnar_predictions=kwargs.get("columnar_predictions", False),
         )
 
     def postprocess(
@@ -221,10 +224,12 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
         masks: List[List[List[float]]],
         img_dims: List[Tuple[int, int]],
         class_filter: List[str] = [],
+        columnar_predictions: bool = False,
         **kwargs,
     ) -> Union[
         InstanceSegmentationInferenceResponse,
         List[InstanceSegmentationInferenceResponse],
+        List[ColumnarDetectionsInferenceResponse],
     ]:
         """
         Create instance segmentation inference response objects for the provided predictions and masks.
@@ -234,14 +239,22 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             masks (List[List[List[float]]]): List of masks corresponding to the predictions.
             img_dims (List[Tuple[int, int]]): List of image dimensions corresponding to the processed images.
             class_filter (List[str], optional): List of class names to filter predictions by. Defaults to an empty list (no filtering).
+            columnar_predictions (bool, optional): If true, predictions are stored column-wise, without building objects for each prediction and point. Defaults to False.
 
         Returns:
-            Union[InstanceSegmentationInferenceResponse, List[InstanceSegmentationInferenceResponse]]: A single instance segmentation response or a list of instance segmentation responses based on the number of processed images.
+            Union[InstanceSegmentationInferenceResponse, List[InstanceSegmentationInferenceResponse], List[ColumnarDetectionsInferenceResponse]]: A single instance segmentation response or a list of instance segmentation responses based on the number of processed images.
 
         Notes:
             - For each image, constructs an `InstanceSegmentationInferenceResponse` object.
             - Each response contains a list of `InstanceSegmentationPrediction` objects.
         """
+        if columnar_predictions:
+            return self.make_columnar_response(
+                predictions=predictions,
+                masks=masks,
+                img_dims=img_dims,
+                class_filter=class_filter,
+            )
         responses = []
         for ind, (batch_predictions, batch_masks) in enumerate(zip(predictions, masks)):
             predictions = []
@@ -273,6 +286,39 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             responses.append(response)
         return responses
 
+    def make_columnar_response(
+        self,
+        predictions: List[np.ndarray],
+        masks: List[List[List[Tuple[float, float]]]],
+        img_dims: List[Tuple[int, int]],
+        class_filter: List[str],
+    ) -> List[ColumnarDetectionsInferenceResponse]:
+        responses = []
+        for ind, (batch_predictions, batch_masks) in enumerate(zip(predictions, masks)):
+            batch_predictions = np.asarray(batch_predictions)
+            if class_filter and batch_predictions.size > 0:
+                batch_class_names = np.asarray(self.class_names, dtype=object)[
+                    batch_predictions[:, 6].astype(int)
+                ]
+                to_keep = ~np.isin(batch_class_names, class_filter)
+                batch_predictions = batch_predictions[to_keep]
+                batch_masks = [
+                    mask for mask, keep in zip(batch_masks, to_keep.tolist()) if keep
+                ]
+            responses.append(
+                ColumnarDetectionsInferenceResponse(
+                    predictions=build_columnar_predictions(
+                        predictions=batch_predictions,
+                        class_names=self.class_names,
+                        polygons=list(batch_masks),
+                    ),
+                    image=InferenceResponseImage(
+                        width=img_dims[ind][1], height=img_dims[ind][0]
+                    ),
+                )
+            )
+        return responses
+
     def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
         """Runs inference on the ONNX model.
 
@@ -1,13 +1,14 @@
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import numpy as np
 
 from inference.core.entities.responses.inference import (
+    ColumnarDetectionsInferenceResponse,
     InferenceResponseImage,
     ObjectDetectionInferenceResponse,
     ObjectDetectionPrediction,
 )
-from inference.core.env import FIX_BATCH_SIZE, MAX_BATCH_SIZE
+from inference.core.env import FIX_BATCH_SIZE, MAX_BATCH_SIZE, NMS_IMPLEMENTATION
 from inference.core.logger import logger
 from inference.core.models.defaults import (
     DEFAULT_CLASS_AGNOSTIC_NMS,
@@ -18,10 +19,16 @@ from inference.core.models.defaults import (
 )
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
 from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.columnar import build_columnar_predictions
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
-from inference.core.nms import w_np_non_max_suppression
+from inference.core.nms import (
+    LEGACY_NMS_IMPLEMENTATION,
+    VECTORIZED_NMS_IMPLEMENTATION,
+    batched_non_max_suppression,
+    w_np_non_max_suppression,
+)
 from inference.core.utils.postprocess import post_process_bboxes
 
 
@@ -30,6 +37,7 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
 
     task_type = "object-detection"
     box_format = "xywh"
+    nms_implementation = NMS_IMPLEMENTATION
 
     def infer(
         self,
@@ -95,17 +103,22 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         img_dims: List[Tuple[int, int]],
         class_filter: Optional[List[str]] = None,
         *args,
+        columnar_predictions: bool = False,
         **kwargs,
-    ) -> List[ObjectDetectionInferenceResponse]:
+    ) -> Union[
+        List[ObjectDetectionInferenceResponse],
+        List[ColumnarDetectionsInferenceResponse],
+    ]:
         """Constructs object detection response objects based on predictions.
 
         Args:
             predictions (List[List[float]]): The list of predictions.
             img_dims (List[Tuple[int, int]]): Dimensions of the images.
             class_filter (Optional[List[str]]): A list of class names to filter, if provided.
+            columnar_predictions (bool): If true, predictions are stored column-wise, without building object for each prediction.
 
         Returns:
-            List[ObjectDetectionInferenceResponse]: A list of response objects containing object detection predictions.
+            Union[List[ObjectDetectionInferenceResponse], List[ColumnarDetectionsInferenceResponse]]: A list of response objects containing object detection predictions.
         """
 
         if isinstance(img_dims, dict) and "img_dims" in img_dims:
@@ -114,6 +127,10 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         predictions = predictions[
             : len(img_dims)
         ]  # If the batch size was fixed we have empty preds at the end
+        if columnar_predictions:
+            return self.make_columnar_response(
+                predictions=predictions, img_dims=img_dims, class_filter=class_filter
+            )
         responses = [
             ObjectDetectionInferenceResponse(
                 predictions=[
@@ -141,6 +158,35 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         ]
         return responses
 
+    def make_columnar_response(
+        self,
+        predictions: List[np.ndarray],
+        img_dims: List[Tuple[int, int]],
+        class_filter: Optional[List[str]] = None,
+    ) -> List[ColumnarDetectionsInferenceResponse]:
+        responses = []
+        for ind, batch_predictions in enumerate(predictions):
+            batch_predictions = np.asarray(batch_predictions)
+            if class_filter and batch_predictions.size > 0:
+                batch_class_names = np.asarray(self.class_names, dtype=object)[
+                    batch_predictions[:, 6].astype(int)
+                ]
+                batch_predictions = batch_predictions[
+                    np.isin(batch_class_names, class_filter)
+                ]
+            responses.append(
+                ColumnarDetectionsInferenceResponse(
+                    predictions=build_columnar_predictions(
+                        predictions=batch_predictions,
+                        class_names=self.class_names,
+                    ),
+                    image=InferenceResponseImage(
+                        width=img_dims[ind][1], height=img_dims[ind][0]
+                    ),
+                )
+            )
+        return responses
+
     def postprocess(
         self,
         predictions: Tuple[np.ndarray, ...],
@@ -151,6 +197,7 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         max_candidates: int = DEFAULT_MAX_CANDIDATES,
         max_detections: int = DEFAUlT_MAX_DETECTIONS,
         return_image_dims: bool = False,
+        nms_implementation: Optional[str] = None,
         **kwargs,
     ) -> List[ObjectDetectionInferenceResponse]:
         """Postprocesses the object detection predictions.
@@ -163,12 +210,14 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
             iou_threshold (float): IoU threshold for non-max suppression. Default is 0.5.
             max_candidates (int): Maximum number of candidate detections. Default is 3000.
             max_detections (int): Maximum number of final detections. Default is 300.
+            nms_implementation (Optional[str]): NMS implementation to use - "vectorized" or "legacy". Defaults to `nms_implementation` of the model class.
 
         Returns:
             List[ObjectDetectionInferenceResponse]: The post-processed predictions.
         """
         predictions = predictions[0]
-        predictions = w_np_non_max_suppression(
+        nms = self._select_nms(nms_implementation=nms_implementation)
+        predictions = nms(
             predictions,
             conf_thresh=confidence,
             iou_thresh=iou_threshold,
@@ -192,6 +241,18 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         )
         return self.make_response(predictions, img_dims, **kwargs)
 
+    def _select_nms(self, nms_implementation: Optional[str]) -> Callable:
+        if nms_implementation is None:
+            nms_implementation = self.nms_implementation
+        if nms_implementation == VECTORIZED_NMS_IMPLEMENTATION:
+            return batched_non_max_suppression
+        if nms_implementation == LEGACY_NMS_IMPLEMENTATION:
+            return w_np_non_max_suppression
+        raise ValueError(
+            f"Unknown NMS implementation: {nms_implementation}. "
+            f"Expected one of: {VECTORIZED_NMS_IMPLEMENTATION}, {LEGACY_NMS_IMPLEMENTATION}"
+        )
+
     def preprocess(
         self,
         image: Any,
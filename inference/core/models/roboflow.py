@@ -4,15 +4,16 @@ import os
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from threading import Thread
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import cv2
 import numpy as np
 import onnxruntime
 from PIL import Image
 
 from inference.core.cache import cache
+from inference.core.cache.downloads import file_lock
 from inference.core.cache.model_artifacts import (
     are_all_files_cached,
     clear_cache,
@@ -37,11 +38,17 @@ from inference.core.env import (
     AWS_SECRET_ACCESS_KEY,
     CORE_MODEL_BUCKET,
     DISABLE_PREPROC_AUTO_ORIENT,
+    ENABLE_ONNX_IO_BINDING,
+    ENABLE_REDUCED_RESOLUTION_JPEG_DECODING,
     INFER_BUCKET,
     LAMBDA,
     MAX_BATCH_SIZE,
     MODEL_CACHE_DIR,
+    MODEL_VALIDATION_CACHE_ENABLED,
     MODEL_VALIDATION_DISABLED,
+    MODEL_WARMUP_MODE,
+    ONNX_IO_BINDING_MAX_BUFFERS_PER_SHAPE,
+    ONNX_IO_BINDING_MAX_SHAPES,
     ONNXRUNTIME_EXECUTION_PROVIDERS,
     REQUIRED_ONNX_PROVIDERS,
     TENSORRT_CACHE_PATH,
@@ -50,21 +57,51 @@ from inference.core.exceptions import ModelArtefactError, OnnxProviderNotAvailab
 from inference.core.logger import logger
 from inference.core.models.base import Model
 from inference.core.models.utils.batching import create_batches
-from inference.core.models.utils.onnx import has_trt
+from inference.core.models.utils.image_loader_pool import IMAGE_LOADER_POOL
+from inference.core.models.utils.onnx_io_binding import (
+    OnnxBuffersPool,
+    OnnxSessionIOBindingRunner,
+    onnx_buffers_scope,
+    onnx_buffers_scope_active,
+)
+from inference.core.models.utils.onnx_session import (
+    create_inference_session,
+    get_onnx_session_profile,
+)
+from inference.core.models.utils.validate import (
+    MODEL_VALIDATION_RESULT_FILE,
+    get_weights_hash,
+    load_model_validation_result,
+    save_model_validation_result,
+)
 from inference.core.roboflow_api import (
     ModelEndpointType,
+    download_from_url,
     get_from_url,
     get_roboflow_model_data,
 )
-from inference.core.utils.image_utils import load_image
+from inference.core.utils.image_utils import (
+    choose_image_decoding_flags,
+    extract_encoded_image_payload,
+    get_jpeg_dimensions,
+    is_jpeg,
+    load_image,
+    load_image_from_encoded_bytes,
+)
 from inference.core.utils.onnx import get_onnxruntime_execution_providers
-from inference.core.utils.preprocess import letterbox_image, prepare
+from inference.core.utils.preprocess import (
+    choose_jpeg_reduction_factor,
+    prepare,
+    resize_image_into_tensor,
+    static_crop_should_be_applied,
+)
 from inference.core.utils.roboflow import get_model_id_chunks
 from inference.core.utils.visualisation import draw_detection_predictions
 from inference.models.aliases import resolve_roboflow_model_alias
 
 NUM_S3_RETRY = 5
 SLEEP_SECONDS_BETWEEN_RETRIES = 3
+MODEL_ARTEFACTS_LOCK_FILE = "model_artefacts.lock"
 MODEL_METADATA_CACHE_EXPIRATION_TIMEOUT = 3600  # 1 hour
 
 S3_CLIENT = None
@@ -219,10 +256,17 @@ class RoboflowInferenceModel(Model):
         infer_bucket_files = self.get_all_required_infer_bucket_file()
         if are_all_files_cached(files=infer_bucket_files, model_id=self.endpoint):
             return None
-        if is_model_artefacts_bucket_available():
-            self.download_model_artefacts_from_s3()
-            return None
-        self.download_model_artifacts_from_roboflow_api()
+        lock_path = get_cache_file_path(
+            file=MODEL_ARTEFACTS_LOCK_FILE, model_id=self.endpoint
+        )
+        with file_lock(path=lock_path):
+            # artefacts may have been downloaded by other process in the meantime
+            if are_all_files_cached(files=infer_bucket_files, model_id=self.endpoint):
+                return None
+            if is_model_artefacts_bucket_available():
+                self.download_model_artefacts_from_s3()
+                return None
+            self.download_model_artifacts_from_roboflow_api()
 
     def get_all_required_infer_bucket_file(self) -> List[str]:
         infer_bucket_files = self.get_infer_bucket_file_list()
@@ -278,13 +322,18 @@ class RoboflowInferenceModel(Model):
             raise ModelArtefactError(
                 "Could not find `environment` key in roboflow API model description response."
             )
-        environment = get_from_url(api_data["environment"])
-        model_weights_response = get_from_url(api_data["model"], json_response=False)
-        save_bytes_in_cache(
-            content=model_weights_response.content,
-            file=self.weights_file,
-            model_id=self.endpoint,
-        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # `download_from_url(...)` maps errors to Roboflow API errors, which
+            # `.result()` re-raises as they are
+            weights_download = executor.submit(
+                download_from_url,
+                url=api_data["model"],
+                target_path=get_cache_file_path(
+                    file=self.weights_file, model_id=self.endpoint
+                ),
+            )
+            environment = get_from_url(api_data["environment"])
+            weights_download.result()
         if "colors" in api_data:
             environment["COLORS"] = api_data["colors"]
         save_json_in_cache(
@@ -370,61 +419,126 @@ class RoboflowInferenceModel(Model):
         disable_preproc_contrast: bool = False,
         disable_preproc_grayscale: bool = False,
         disable_preproc_static_crop: bool = False,
+        out: Optional[np.ndarray] = None,
     ) -> Tuple[np.ndarray, Tuple[int, int]]:
         """
         Preprocesses an inference request image by loading it, then applying any pre-processing specified by the Roboflow platform, then scaling it to the inference input dimensions.
 
+        JPEG images given as encoded bytes are decoded at reduced resolution whenever model input size allows that.
+        Resize, RGB conversion and transposition into NCHW are done in a single pass writing into the output tensor.
+
         Args:
             image (Union[Any, InferenceRequestImage]): An object containing information necessary to load the image for inference.
             disable_preproc_auto_orient (bool, optional): If true, the auto orient preprocessing step is disabled for this call. Default is False.
             disable_preproc_contrast (bool, optional): If true, the contrast preprocessing step is disabled for this call. Default is False.
             disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
             disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+            out (Optional[np.ndarray], optional): Float32 array of shape (1, 3, height, width) to write the image into - e.g. slice of batch tensor. Allocated if not given.
 
         Returns:
             Tuple[np.ndarray, Tuple[int, int]]: A tuple containing a numpy array of the preprocessed image pixel data and a tuple of the images original size.
         """
-        np_image, is_bgr = load_image(
-            image,
-            disable_preproc_auto_orient=disable_preproc_auto_orient
+        disable_preproc_auto_orient = (
+            disable_preproc_auto_orient
             or "auto-orient" not in self.preproc.keys()
-            or DISABLE_PREPROC_AUTO_ORIENT,
+            or DISABLE_PREPROC_AUTO_ORIENT
         )
-        preprocessed_image, img_dims = self.preprocess_image(
+        encoded_image = None
+        if ENABLE_REDUCED_RESOLUTION_JPEG_DECODING:
+            encoded_image = extract_encoded_image_payload(value=image)
+        img_dims = None
+        if encoded_image is not None:
+            np_image, img_dims = self.decode_image(
+                encoded_image=encoded_image,
+                disable_preproc_auto_orient=disable_preproc_auto_orient,
+                disable_preproc_static_crop=disable_preproc_static_crop,
+            )
+            is_bgr = True
+        else:
+            np_image, is_bgr = load_image(
+                image,
+                disable_preproc_auto_orient=disable_preproc_auto_orient,
+            )
+        preprocessed_image, decoded_img_dims = self.preprocess_image(
             np_image,
             disable_preproc_contrast=disable_preproc_contrast,
             disable_preproc_grayscale=disable_preproc_grayscale,
             disable_preproc_static_crop=disable_preproc_static_crop,
         )
+        # for images decoded at reduced resolution, model input geometry must match the one
+        # of full resolution image - as predictions are scaled back into original dimensions
+        reference_shape = img_dims
+        if img_dims is None:
+            img_dims = decoded_img_dims
+        if out is None:
+            out = self.allocate_input_tensor(batch_size=1)
+        resize_image_into_tensor(
+            image=preprocessed_image,
+            tensor=out[0],
+            resize_method=self.resize_method,
+            reference_shape=reference_shape,
+            is_bgr=is_bgr,
+        )
+        return out, img_dims
 
-        if self.resize_method == "Stretch to":
-            resized = cv2.resize(
-                preprocessed_image, (self.img_size_w, self.img_size_h), cv2.INTER_CUBIC
-            )
-        elif self.resize_method == "Fit (black edges) in":
-            resized = letterbox_image(
-                preprocessed_image, (self.img_size_w, self.img_size_h)
-            )
-        elif self.resize_method == "Fit (white edges) in":
-            resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
-                color=(255, 255, 255),
-            )
-        elif self.resize_method == "Fit (grey edges) in":
-            resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
-                color=(114, 114, 114),
-            )
+    def allocate_input_tensor(self, batch_size: int) -> np.ndarray:
+        """Allocates float32 tensor of shape (batch_size, 3, height, width) for model input.
 
-        if is_bgr:
-            resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-        img_in = np.transpose(resized, (2, 0, 1))
-        img_in = img_in.astype(np.float32)
-        img_in = np.expand_dims(img_in, axis=0)
+        Args:
+            batch_size (int): Number of images in the batch.
 
-        return img_in, img_dims
+        Returns:
+            np.ndarray: Uninitialised tensor.
+        """
+        return np.empty(
+            (batch_size, 3, self.img_size_h, self.img_size_w), dtype=np.float32
+        )
+
+    def decode_image(
+        self,
+        encoded_image: bytes,
+        disable_preproc_auto_orient: bool = False,
+        disable_preproc_static_crop: bool = False,
+    ) -> Tuple[np.ndarray, Optional[Tuple[int, int]]]:
+        """
+        Decodes encoded image - JPEG images are decoded at 1/2, 1/4 or 1/8 of resolution if the image is
+        still not smaller than model input after such reduction.
+
+        Args:
+            encoded_image (bytes): Encoded image.
+            disable_preproc_auto_orient (bool, optional): If true, EXIF orientation is not applied.
+            disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call.
+
+        Returns:
+            Tuple[np.ndarray, Optional[Tuple[int, int]]]: Decoded image and original image dimensions - given only if
+                the image was decoded at reduced resolution.
+        """
+        reduction_factor = 1
+        # static crop bounds are not aligned with reduced resolution pixels - crop of reduced image would be
+        # shifted against the crop of original image
+        if is_jpeg(payload=encoded_image) and not static_crop_should_be_applied(
+            preprocessing_config=self.preproc,
+            disable_preproc_static_crop=disable_preproc_static_crop,
+        ):
+            img_dims = get_jpeg_dimensions(
+                payload=encoded_image,
+                respect_orientation=not disable_preproc_auto_orient,
+            )
+            reduction_factor = choose_jpeg_reduction_factor(
+                image_shape=img_dims,
+                desired_size=(self.img_size_w, self.img_size_h),
+                resize_method=self.resize_method,
+            )
+        cv_imread_flags = choose_image_decoding_flags(
+            disable_preproc_auto_orient=disable_preproc_auto_orient,
+            reduction_factor=reduction_factor,
+        )
+        np_image = load_image_from_encoded_bytes(
+            value=encoded_image, cv_imread_flags=cv_imread_flags
+        )
+        if reduction_factor == 1:
+            return np_image, None
+        return np_image, img_dims
 
     def preprocess_image(
         self,
@@ -609,13 +723,23 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 expanded_execution_providers.append(ep)
             self.onnxruntime_execution_providers = expanded_execution_providers
 
+        self.onnx_buffers_pool = OnnxBuffersPool(
+            max_buffers_per_shape=ONNX_IO_BINDING_MAX_BUFFERS_PER_SHAPE,
+            max_shapes=ONNX_IO_BINDING_MAX_SHAPES,
+        )
+        self.onnx_io_binding_runner = None
+        self.onnx_session_profile = get_onnx_session_profile(model_id=self.endpoint)
+        self.onnx_session_settings = None
+        self.model_output_shape: Optional[Tuple[int, ...]] = None
         self.initialize_model()
-        self.image_loader_threadpool = ThreadPoolExecutor(max_workers=None)
+        self.image_loader_threadpool = IMAGE_LOADER_POOL.acquire()
+        self._image_loader_pool_acquired = True
         try:
             self.validate_model()
         except ModelArtefactError as e:
             logger.error(f"Unable to validate model artifacts, clearing cache: {e}")
             self.clear_cache()
+            self.unload()
             raise ModelArtefactError from e
 
     def infer(self, image: Any, **kwargs) -> Any:
@@ -626,20 +750,66 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         input_elements = len(image) if isinstance(image, list) else 1
         max_batch_size = MAX_BATCH_SIZE if self.batching_enabled else self.batch_size
         if (input_elements == 1) or (max_batch_size == float("inf")):
-            return super().infer(image, **kwargs)
+            with onnx_buffers_scope():
+                return super().infer(image, **kwargs)
         logger.debug(
             f"Inference will be executed in batches, as there is {input_elements} input elements and "
             f"maximum batch size for a model is set to: {max_batch_size}"
         )
         inference_results = []
         for batch_input in create_batches(sequence=image, batch_size=max_batch_size):
-            batch_inference_results = super().infer(batch_input, **kwargs)
+            with onnx_buffers_scope():
+                batch_inference_results = super().infer(batch_input, **kwargs)
             inference_results.append(batch_inference_results)
         return self.merge_inference_results(inference_results=inference_results)
 
     def merge_inference_results(self, inference_results: List[Any]) -> Any:
         return list(itertools.chain(*inference_results))
 
+    def allocate_input_tensor(self, batch_size: int) -> np.ndarray:
+        """Leases model input tensor from the pool of ONNX session buffers - tensor is
+        reused by subsequent requests once inference which leased it finishes.
+
+        Args:
+            batch_size (int): Number of images in the batch.
+
+        Returns:
+            np.ndarray: Uninitialised tensor.
+        """
+        return self.onnx_buffers_pool.lease(
+            shape=(batch_size, 3, self.img_size_h, self.img_size_w), dtype=np.float32
+        )
+
+    def run_onnx_session(self, img_in: np.ndarray) -> List[np.ndarray]:
+        """Runs ONNX session of the model on given input.
+
+        During inference (within `infer(...)`), outputs are written into buffers of the
+        model - which are only valid until the inference finishes. Elsewhere, outputs are
+        allocated by ONNX Runtime.
+
+        Args:
+            img_in (np.ndarray): Preprocessed input tensor.
+
+        Returns:
+            List[np.ndarray]: Outputs of the session.
+        """
+        if self.onnx_io_binding_runner is None or not onnx_buffers_scope_active():
+            return self.onnx_session.run(None, {self.input_name: img_in})
+        return self.onnx_io_binding_runner.run(
+            input_name=self.input_name, img_in=img_in
+        )
+
+    def unload(self) -> None:
+        """Releases the shared image loader pool acquired by the model.
+
+        Reference to the pool is kept - requests still running against evicted model
+        can use it, pool restarts its threads on demand.
+        """
+        if not getattr(self, "_image_loader_pool_acquired", False):
+            return None
+        self._image_loader_pool_acquired = False
+        self.image_loader_threadpool.release()
+
     def validate_model(self) -> None:
         if MODEL_VALIDATION_DISABLED:
             logger.debug("Model validation disabled.")
@@ -653,17 +823,67 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             raise ModelArtefactError(
                 "ONNX session not initialized. Check that the model weights are available."
             ) from e
-        try:
-            self.run_test_inference()
-        except Exception as e:
-            raise ModelArtefactError(f"Unable to run test inference. Cause: {e}") from e
+        validation_result_path = self.cache_file(MODEL_VALIDATION_RESULT_FILE)
+        weights_path = self.cache_file(self.weights_file)
+        validation_result, weights_hash = None, None
+        if MODEL_VALIDATION_CACHE_ENABLED and os.path.isfile(weights_path):
+            validation_result = load_model_validation_result(
+                cache_path=validation_result_path
+            )
+            weights_hash = get_weights_hash(
+                weights_path=weights_path, validation_result=validation_result
+            )
+            if (
+                validation_result is not None
+                and validation_result.get("weights_hash") != weights_hash
+            ):
+                validation_result = None
+        if validation_result is None:
+            try:
+                self.run_test_inference()
+            except Exception as e:
+                raise ModelArtefactError(
+                    f"Unable to run test inference. Cause: {e}"
+                ) from e
+        else:
+            logger.debug("Skipping test inference - model weights already validated")
+            if validation_result.get("output_shape") is not None:
+                self.model_output_shape = tuple(validation_result["output_shape"])
         try:
             self.validate_model_classes()
         except Exception as e:
             raise ModelArtefactError(
                 f"Unable to validate model classes. Cause: {e}"
             ) from e
+        if validation_result is None and weights_hash is not None:
+            save_model_validation_result(
+                cache_path=validation_result_path,
+                weights_path=weights_path,
+                weights_hash=weights_hash,
+                output_shape=self.model_output_shape,
+            )
         logger.debug("Model validation finished")
+        if validation_result is not None:
+            self.warm_up()
+
+    def warm_up(self) -> None:
+        """Runs test inference to warm up the model, according to `MODEL_WARMUP_MODE` -
+        in background thread, before returning or not at all."""
+        if MODEL_WARMUP_MODE == "disabled":
+            return None
+        if MODEL_WARMUP_MODE == "async":
+            warmup_thread = Thread(
+                target=self._run_warm_up, name=f"warmup-{self.endpoint}", daemon=True
+            )
+            warmup_thread.start()
+            return None
+        self._run_warm_up()
+
+    def _run_warm_up(self) -> None:
+        try:
+            self.run_test_inference()
+        except Exception as error:
+            logger.warning(f"Warmup of model {self.endpoint} failed: {error}")
 
     def run_test_inference(self) -> None:
         test_image = (np.random.rand(1024, 1024, 3) * 255).astype(np.uint8)
@@ -672,7 +892,12 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         logger.debug(f"Test inference finished.")
         return result
 
-    def get_model_output_shape(self) -> Tuple[int, int, int]:
+    def get_model_output_shape(self) -> Tuple[int, ...]:
+        if self.model_output_shape is None:
+            self.model_output_shape = tuple(self.probe_model_output_shape())
+        return self.model_output_shape
+
+    def probe_model_output_shape(self) -> Tuple[int, ...]:
         test_image = (np.random.rand(1024, 1024, 3) * 255).astype(np.uint8)
         logger.debug(f"Getting model output shape. Image size: {test_image.shape}")
         test_image, _ = self.preprocess(test_image)
@@ -704,17 +929,12 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             if not self.load_weights:
                 providers = ["OpenVINOExecutionProvider", "CPUExecutionProvider"]
             try:
-                session_options = onnxruntime.SessionOptions()
-                session_options.log_severity_level = 3
-                # TensorRT does better graph optimization for its EP than onnx
-                if has_trt(providers):
-                    session_options.graph_optimization_level = (
-                        onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+                self.onnx_session, self.onnx_session_settings = (
+                    create_inference_session(
+                        weights_path=self.cache_file(self.weights_file),
+                        profile=self.onnx_session_profile,
+                        providers=providers,
                     )
-                self.onnx_session = onnxruntime.InferenceSession(
-                    self.cache_file(self.weights_file),
-                    providers=providers,
-                    sess_options=session_options,
                 )
             except Exception as e:
                 self.clear_cache()
@@ -768,6 +988,12 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             self.write_model_metadata_to_memcache(model_metadata)
             if not self.load_weights:  # had to load weights to get metadata
                 del self.onnx_session
+                self.onnx_session_settings = None
+            elif ENABLE_ONNX_IO_BINDING:
+                self.onnx_io_binding_runner = OnnxSessionIOBindingRunner(
+                    session=self.onnx_session,
+                    buffers_pool=self.onnx_buffers_pool,
+                )
         else:
             if not self.has_model_metadata:
                 raise ValueError(
@@ -806,9 +1032,14 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 disable_preproc_grayscale=disable_preproc_grayscale,
                 disable_preproc_static_crop=disable_preproc_static_crop,
             )
-            imgs_with_dims = self.image_loader_threadpool.map(preproc_image, image)
-            imgs, img_dims = zip(*imgs_with_dims)
-            img_in = np.concatenate(imgs, axis=0)
+            # each image is written directly into its slot of the batch tensor - tensor is
+            # leased per call, as the loader pool is shared between models and requests
+            img_in = self.allocate_input_tensor(batch_size=len(image))
+            imgs_with_dims = self.image_loader_threadpool.map(
+                lambda i: preproc_image(image[i], out=img_in[i : i + 1]),
+                range(len(image)),
+            )
+            _, img_dims = zip(*imgs_with_dims)
         else:
             img_in, img_dims = self.preproc_image(
                 image,
@@ -0,0 +1,56 @@
+from typing import List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from inference.core.entities.responses.inference import ColumnarDetectionsPredictions
+
+Polygon = Sequence[Tuple[float, float]]
+
+
+def build_columnar_predictions(
+    predictions: np.ndarray,
+    class_names: List[str],
+    polygons: Optional[List[Polygon]] = None,
+) -> ColumnarDetectionsPredictions:
+    """Builds columns of predictions out of post-processed model output.
+
+    Args:
+        predictions (np.ndarray): Array of shape (N, 7+) - with rows in format
+            `[x_min, y_min, x_max, y_max, confidence, class_confidence, class_id, ...]`.
+        class_names (List[str]): Class names of the model.
+        polygons (Optional[List[Polygon]]): Instance polygon for each prediction -
+            to be provided for instance segmentation models.
+
+    Returns:
+        ColumnarDetectionsPredictions: Predictions stored column-wise.
+    """
+    predictions = np.asarray(predictions)
+    if predictions.size == 0:
+        predictions = np.empty((0, 7), dtype=np.float32)
+    class_id = predictions[:, 6].astype(int)
+    points, points_offsets = None, None
+    if polygons is not None:
+        points, points_offsets = _concatenate_polygons(polygons=polygons)
+    return ColumnarDetectionsPredictions(
+        xyxy=np.ascontiguousarray(predictions[:, :4]),
+        confidence=np.ascontiguousarray(predictions[:, 4]),
+        class_id=class_id,
+        class_name=[class_names[i] for i in class_id.tolist()],
+        detection_id=[str(uuid4()) for _ in range(len(class_id))],
+        points=points,
+        points_offsets=points_offsets,
+    )
+
+
+def _concatenate_polygons(
+    polygons: List[Polygon],
+) -> Tuple[np.ndarray, np.ndarray]:
+    polygons = [
+        np.asarray(polygon, dtype=np.float64).reshape(-1, 2) for polygon in polygons
+    ]
+    points_offsets = np.zeros((len(polygons) + 1,), dtype=np.int64)
+    points_offsets[1:] = np.cumsum([len(polygon) for polygon in polygons])
+    if not polygons:
+        return np.empty((0, 2), dtype=np.float64), points_offsets
+    return np.concatenate(polygons), points_offsets
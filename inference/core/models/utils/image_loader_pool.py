@@ -0,0 +1,108 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+from inference.core.env import IMAGE_LOADER_POOL_SIZE, ONNXRUNTIME_INTRA_OP_NUM_THREADS
+from inference.core.logger import logger
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class SharedImageLoaderPool:
+    """Process-wide, bounded thread pool used by models to decode and preprocess images.
+
+    Models `acquire()` the pool when they are created and `release()` it when they are
+    removed from model manager - threads are started lazily and shut down when the last
+    user releases the pool. Pool keeps track of tasks waiting and running to expose its
+    saturation.
+    """
+
+    def __init__(self, max_workers: int):
+        self._max_workers = max(max_workers, 1)
+        self._lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._users = 0
+        self._pending_tasks = 0
+        self._active_tasks = 0
+        self._completed_tasks = 0
+        self._peak_pending_tasks = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def acquire(self) -> "SharedImageLoaderPool":
+        with self._lock:
+            self._users += 1
+            self._ensure_executor()
+        return self
+
+    def release(self) -> None:
+        with self._lock:
+            if self._users == 0:
+                return None
+            self._users -= 1
+            if self._users > 0 or self._executor is None:
+                return None
+            logger.debug("Shutting down image loader pool - no models use it.")
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        with self._lock:
+            executor = self._ensure_executor()
+            items = list(items)
+            self._pending_tasks += len(items)
+            self._peak_pending_tasks = max(
+                self._peak_pending_tasks, self._pending_tasks
+            )
+            futures = [executor.submit(self._run_task, fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    def get_metrics(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "max_workers": self._max_workers,
+                "users": self._users,
+                "pending_tasks": self._pending_tasks,
+                "active_tasks": self._active_tasks,
+                "completed_tasks": self._completed_tasks,
+                "peak_pending_tasks": self._peak_pending_tasks,
+                "saturation": self._active_tasks / self._max_workers,
+            }
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="image-loader"
+            )
+        return self._executor
+
+    def _run_task(self, fn: Callable[[T], R], item: T) -> R:
+        with self._lock:
+            self._pending_tasks -= 1
+            self._active_tasks += 1
+        try:
+            return fn(item)
+        finally:
+            with self._lock:
+                self._active_tasks -= 1
+                self._completed_tasks += 1
+
+
+def get_default_image_loader_pool_size() -> int:
+    if IMAGE_LOADER_POOL_SIZE is not None:
+        return IMAGE_LOADER_POOL_SIZE
+    cpu_count = os.cpu_count() or 1
+    if ONNXRUNTIME_INTRA_OP_NUM_THREADS:
+        # leave the cores ONNX Runtime is allowed to use for model execution
+        return max(cpu_count - ONNXRUNTIME_INTRA_OP_NUM_THREADS, 2)
+    # by default ONNX Runtime uses all cores, decoding gets half of them
+    return max(cpu_count // 2, 2)
+
+
+IMAGE_LOADER_POOL = SharedImageLoaderPool(
+    max_workers=get_default_image_loader_pool_size()
+)
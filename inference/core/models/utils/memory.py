@@ -0,0 +1,80 @@
+import os
+import sys
+from typing import Any
+
+import numpy as np
+
+from inference.core.logger import logger
+from inference.core.models.utils.onnx_session import is_optimized_model_file
+
+
+def estimate_model_memory_usage(model: Any) -> int:
+    """Estimates number of bytes kept in memory by the model.
+
+    Models may provide exact value through `get_memory_usage()` method. Otherwise, the
+    estimate is the larger of: size of model artefacts in model cache directory (weights
+    loaded into ONNX sessions) and size of torch modules parameters - plus the size of
+    arrays kept in dictionaries of the model (like embedding caches of SAM models).
+    """
+    if hasattr(model, "get_memory_usage"):
+        return int(model.get_memory_usage())
+    try:
+        weights_size = max(
+            _get_directory_size(getattr(model, "cache_dir", None)),
+            _get_torch_modules_size(model),
+        )
+        return weights_size + _get_cached_arrays_size(model)
+    except Exception as error:
+        logger.debug(f"Could not estimate memory usage of model: {error}")
+        return 0
+
+
+def _get_directory_size(path: Any) -> int:
+    if not isinstance(path, str) or not os.path.isdir(path):
+        return 0
+    total_size = 0
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            file_path = os.path.join(root, file_name)
+            # optimised graph is loaded instead of original weights, never alongside
+            if is_optimized_model_file(file_path):
+                continue
+            if os.path.isfile(file_path):
+                total_size += os.path.getsize(file_path)
+    return total_size
+
+
+def _get_torch_modules_size(model: Any) -> int:
+    torch = sys.modules.get("torch")
+    if torch is None:
+        # torch is not imported, so model cannot keep torch modules
+        return 0
+    total_size = 0
+    for value in vars(model).values():
+        if not isinstance(value, torch.nn.Module):
+            continue
+        for tensor in list(value.parameters()) + list(value.buffers()):
+            total_size += tensor.numel() * tensor.element_size()
+    return total_size
+
+
+def _get_cached_arrays_size(model: Any) -> int:
+    return sum(
+        _get_arrays_size(value, depth=2)
+        for value in vars(model).values()
+        if isinstance(value, dict)
+    )
+
+
+def _get_arrays_size(value: Any, depth: int) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, "element_size") and hasattr(value, "numel"):
+        return value.numel() * value.element_size()
+    if depth < 0:
+        return 0
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return 0
+    return sum(_get_arrays_size(element, depth=depth - 1) for element in value)
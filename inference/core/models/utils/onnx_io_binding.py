@@ -0,0 +1,168 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Dict, Generator, List, Optional, Tuple
+
+import numpy as np
+
+from inference.core.logger import logger
+
+BufferKey = Tuple[Tuple[int, ...], str]
+OutputsSpecs = List[Tuple[Tuple[int, ...], np.dtype]]
+
+_LEASED_BUFFERS: ContextVar[Optional[List[Tuple["OnnxBuffersPool", np.ndarray]]]] = (
+    ContextVar("leased_onnx_buffers", default=None)
+)
+
+
+class OnnxBuffersPool:
+    """Pool of preallocated arrays for inputs and outputs of ONNX session.
+
+    Arrays are kept per (shape, dtype) - so in practice per batch size, as input size of
+    the model is fixed. Arrays are leased for the duration of `onnx_buffers_scope()` and
+    returned to the pool once the scope is closed, which makes them safe to be used by
+    concurrent requests. Outside of the scope, arrays are allocated and never pooled.
+    """
+
+    def __init__(self, max_buffers_per_shape: int, max_shapes: int):
+        self._max_buffers_per_shape = max_buffers_per_shape
+        self._max_shapes = max_shapes
+        self._free_buffers: Dict[BufferKey, List[np.ndarray]] = OrderedDict()
+        self._lock = Lock()
+
+    def lease(self, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        leased_buffers = _LEASED_BUFFERS.get()
+        if leased_buffers is None:
+            return np.empty(shape, dtype=dtype)
+        key = (tuple(shape), np.dtype(dtype).str)
+        buffer = None
+        with self._lock:
+            free_buffers = self._free_buffers.get(key)
+            if free_buffers:
+                buffer = free_buffers.pop()
+        if buffer is None:
+            buffer = np.empty(shape, dtype=dtype)
+        leased_buffers.append((self, buffer))
+        return buffer
+
+    def release(self, buffer: np.ndarray) -> None:
+        key = (buffer.shape, buffer.dtype.str)
+        with self._lock:
+            free_buffers = self._free_buffers.pop(key, [])
+            if len(free_buffers) < self._max_buffers_per_shape:
+                free_buffers.append(buffer)
+            # most recently used shapes are kept at the end
+            self._free_buffers[key] = free_buffers
+            while len(self._free_buffers) > self._max_shapes:
+                self._free_buffers.popitem(last=False)
+
+    def get_metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "shapes": len(self._free_buffers),
+                "free_buffers": sum(len(b) for b in self._free_buffers.values()),
+                "free_bytes": sum(
+                    buffer.nbytes
+                    for buffers in self._free_buffers.values()
+                    for buffer in buffers
+                ),
+            }
+
+
+@contextmanager
+def onnx_buffers_scope() -> Generator[None, None, None]:
+    """Scope within which buffers leased from `OnnxBuffersPool` stay valid.
+
+    Results of inference must not reference model input or raw outputs once the scope is
+    closed - buffers are given away to subsequent requests. Nested scopes release only
+    buffers leased within them.
+    """
+    token = _LEASED_BUFFERS.set([])
+    try:
+        yield None
+    finally:
+        leased_buffers = _LEASED_BUFFERS.get()
+        _LEASED_BUFFERS.reset(token)
+        for pool, buffer in leased_buffers:
+            pool.release(buffer)
+
+
+def onnx_buffers_scope_active() -> bool:
+    return _LEASED_BUFFERS.get() is not None
+
+
+class OnnxSessionIOBindingRunner:
+    """Runs ONNX session with outputs bound to arrays leased from `OnnxBuffersPool`.
+
+    Shapes of outputs are learned from the first run for given input shape (when outputs
+    are allocated by ONNX Runtime) - subsequent runs write directly into pooled arrays.
+    Input shapes for which outputs shapes turn out to be data-dependent fall back to
+    outputs allocated by ONNX Runtime.
+    """
+
+    def __init__(self, session, buffers_pool: OnnxBuffersPool):
+        self._session = session
+        self._buffers_pool = buffers_pool
+        self._output_names = [o.name for o in session.get_outputs()]
+        self._outputs_specs: Dict[Tuple[int, ...], Optional[OutputsSpecs]] = {}
+        self._lock = Lock()
+
+    def run(self, input_name: str, img_in: np.ndarray) -> List[np.ndarray]:
+        img_in = np.ascontiguousarray(img_in)
+        binding = self._session.io_binding()
+        binding.bind_cpu_input(input_name, img_in)
+        with self._lock:
+            input_shape_seen = img_in.shape in self._outputs_specs
+            outputs_specs = self._outputs_specs.get(img_in.shape)
+        if outputs_specs is None:
+            return self._run_with_allocated_outputs(
+                binding=binding,
+                input_shape=img_in.shape,
+                learn_outputs_specs=not input_shape_seen,
+            )
+        outputs = [
+            self._buffers_pool.lease(shape=shape, dtype=dtype)
+            for shape, dtype in outputs_specs
+        ]
+        for name, output in zip(self._output_names, outputs):
+            binding.bind_output(
+                name=name,
+                device_type="cpu",
+                device_id=0,
+                element_type=output.dtype,
+                shape=output.shape,
+                buffer_ptr=output.ctypes.data,
+            )
+        try:
+            self._session.run_with_iobinding(binding)
+        except Exception as error:
+            logger.debug(
+                f"Could not run ONNX session with preallocated outputs for input of "
+                f"shape {img_in.shape} - falling back to outputs allocated by ONNX "
+                f"Runtime. Cause: {error}"
+            )
+            with self._lock:
+                self._outputs_specs[img_in.shape] = None
+            binding.clear_binding_outputs()
+            return self._run_with_allocated_outputs(
+                binding=binding, input_shape=img_in.shape, learn_outputs_specs=False
+            )
+        return outputs
+
+    def _run_with_allocated_outputs(
+        self,
+        binding,
+        input_shape: Tuple[int, ...],
+        learn_outputs_specs: bool,
+    ) -> List[np.ndarray]:
+        for name in self._output_names:
+            binding.bind_output(name=name, device_type="cpu")
+        self._session.run_with_iobinding(binding)
+        outputs = binding.copy_outputs_to_cpu()
+        if learn_outputs_specs:
+            with self._lock:
+                self._outputs_specs[input_shape] = [
+                    (output.shape, output.dtype) for output in outputs
+                ]
+        return outputs
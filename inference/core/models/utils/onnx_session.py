@@ -0,0 +1,336 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, fields, replace
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
+
+import onnxruntime
+
+from inference.core.env import (
+    MAX_ACTIVE_MODELS,
+    ONNXRUNTIME_ALLOW_SPINNING,
+    ONNXRUNTIME_ENABLE_CPU_MEM_ARENA,
+    ONNXRUNTIME_EXECUTION_MODE,
+    ONNXRUNTIME_INTER_OP_NUM_THREADS,
+    ONNXRUNTIME_INTRA_OP_NUM_THREADS,
+    ONNXRUNTIME_PERSIST_OPTIMIZED_MODELS,
+    ONNXRUNTIME_SESSION_PROFILES,
+    ONNXRUNTIME_SHARED_CPU_MEM_ARENA,
+    ONNXRUNTIME_THREADS_BUDGET,
+)
+from inference.core.exceptions import InvalidEnvironmentVariableError
+from inference.core.logger import logger
+from inference.core.models.utils.onnx import has_trt
+from inference.core.models.utils.validate import (
+    MODEL_VALIDATION_RESULT_FILE,
+    get_weights_hash,
+    load_model_validation_result,
+)
+
+ExecutionProvider = Union[str, Tuple[str, Dict[str, Any]]]
+
+EXECUTION_MODES = {
+    "sequential": onnxruntime.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": onnxruntime.ExecutionMode.ORT_PARALLEL,
+}
+# graphs optimised for other providers (OpenVINO, TensorRT, CoreML) contain compiled
+# nodes that cannot be serialised - TensorRT keeps its own engine cache anyway
+OPTIMIZED_MODEL_PROVIDERS = {"CPUExecutionProvider", "CUDAExecutionProvider"}
+OPTIMIZED_MODEL_MARKER = ".optimized."
+
+_SHARED_CPU_MEM_ARENA_LOCK = Lock()
+_SHARED_CPU_MEM_ARENA_REGISTERED = False
+
+
+@dataclass(frozen=True)
+class OnnxSessionProfile:
+    intra_op_num_threads: Optional[int] = None
+    inter_op_num_threads: Optional[int] = None
+    execution_mode: str = "sequential"
+    allow_spinning: bool = True
+    enable_cpu_mem_arena: bool = True
+    shared_cpu_mem_arena: bool = False
+    persist_optimized_model: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def get_default_onnx_session_profile() -> OnnxSessionProfile:
+    intra_op_num_threads = ONNXRUNTIME_INTRA_OP_NUM_THREADS
+    if intra_op_num_threads is None and ONNXRUNTIME_THREADS_BUDGET is not None:
+        intra_op_num_threads = max(ONNXRUNTIME_THREADS_BUDGET // MAX_ACTIVE_MODELS, 1)
+    return OnnxSessionProfile(
+        intra_op_num_threads=intra_op_num_threads,
+        inter_op_num_threads=ONNXRUNTIME_INTER_OP_NUM_THREADS,
+        execution_mode=ONNXRUNTIME_EXECUTION_MODE,
+        allow_spinning=ONNXRUNTIME_ALLOW_SPINNING,
+        enable_cpu_mem_arena=ONNXRUNTIME_ENABLE_CPU_MEM_ARENA,
+        shared_cpu_mem_arena=ONNXRUNTIME_SHARED_CPU_MEM_ARENA,
+        persist_optimized_model=ONNXRUNTIME_PERSIST_OPTIMIZED_MODELS,
+    )
+
+
+def get_onnx_session_profile(
+    model_id: str,
+    session_profiles: Optional[str] = ONNXRUNTIME_SESSION_PROFILES,
+) -> OnnxSessionProfile:
+    """Resolves settings of ONNX Runtime session for the model.
+
+    Global settings are overridden by settings given for the dataset of the model and
+    then by settings given for the exact model id.
+
+    Args:
+        model_id (str): Identifier of the model.
+        session_profiles (Optional[str]): JSON object mapping model id (or dataset id)
+            into overrides of session settings.
+
+    Returns:
+        OnnxSessionProfile: Settings of the session.
+
+    Raises:
+        InvalidEnvironmentVariableError: If session profiles are malformed.
+    """
+    profile = get_default_onnx_session_profile()
+    overrides = parse_onnx_session_profiles(session_profiles=session_profiles)
+    dataset_id = model_id.split("/")[0]
+    for key in dict.fromkeys([dataset_id, model_id]):
+        if key in overrides:
+            profile = replace(profile, **overrides[key])
+    if profile.execution_mode not in EXECUTION_MODES:
+        raise InvalidEnvironmentVariableError(
+            f"ONNX Runtime execution mode must be one of {list(EXECUTION_MODES)}, "
+            f"got `{profile.execution_mode}` for model {model_id}"
+        )
+    return profile
+
+
+def parse_onnx_session_profiles(
+    session_profiles: Optional[str],
+) -> Dict[str, Dict[str, Any]]:
+    if not session_profiles:
+        return {}
+    try:
+        parsed_profiles = json.loads(session_profiles)
+    except json.JSONDecodeError as error:
+        raise InvalidEnvironmentVariableError(
+            f"ONNXRUNTIME_SESSION_PROFILES must be JSON object. Cause: {error}"
+        ) from error
+    if not isinstance(parsed_profiles, dict) or not all(
+        isinstance(p, dict) for p in parsed_profiles.values()
+    ):
+        raise InvalidEnvironmentVariableError(
+            "ONNXRUNTIME_SESSION_PROFILES must map model ids into JSON objects"
+        )
+    known_settings = {f.name for f in fields(OnnxSessionProfile)}
+    for key, profile in parsed_profiles.items():
+        unknown_settings = set(profile).difference(known_settings)
+        if unknown_settings:
+            raise InvalidEnvironmentVariableError(
+                f"ONNXRUNTIME_SESSION_PROFILES defines unknown settings for {key}: "
+                f"{sorted(unknown_settings)}. Known settings: {sorted(known_settings)}"
+            )
+    return parsed_profiles
+
+
+def build_session_options(
+    profile: OnnxSessionProfile,
+    providers: List[ExecutionProvider],
+) -> onnxruntime.SessionOptions:
+    session_options = onnxruntime.SessionOptions()
+    session_options.log_severity_level = 3
+    if profile.intra_op_num_threads:
+        session_options.intra_op_num_threads = profile.intra_op_num_threads
+    if profile.inter_op_num_threads:
+        session_options.inter_op_num_threads = profile.inter_op_num_threads
+    session_options.execution_mode = EXECUTION_MODES[profile.execution_mode]
+    session_options.enable_cpu_mem_arena = profile.enable_cpu_mem_arena
+    allow_spinning = "1" if profile.allow_spinning else "0"
+    session_options.add_session_config_entry(
+        "session.intra_op.allow_spinning", allow_spinning
+    )
+    session_options.add_session_config_entry(
+        "session.inter_op.allow_spinning", allow_spinning
+    )
+    if profile.shared_cpu_mem_arena and profile.enable_cpu_mem_arena:
+        register_shared_cpu_mem_arena()
+        session_options.add_session_config_entry("session.use_env_allocators", "1")
+    # TensorRT does better graph optimization for its EP than onnx
+    if has_trt(providers):
+        session_options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+        )
+    return session_options
+
+
+def register_shared_cpu_mem_arena() -> None:
+    global _SHARED_CPU_MEM_ARENA_REGISTERED
+    with _SHARED_CPU_MEM_ARENA_LOCK:
+        if _SHARED_CPU_MEM_ARENA_REGISTERED:
+            return None
+        memory_info = onnxruntime.OrtMemoryInfo(
+            "Cpu",
+            onnxruntime.OrtAllocatorType.ORT_ARENA_ALLOCATOR,
+            0,
+            onnxruntime.OrtMemType.DEFAULT,
+        )
+        # empty config keeps ONNX Runtime defaults for arena settings
+        onnxruntime.create_and_register_allocator(
+            memory_info, onnxruntime.OrtArenaCfg({})
+        )
+        _SHARED_CPU_MEM_ARENA_REGISTERED = True
+
+
+def create_inference_session(
+    weights_path: str,
+    profile: OnnxSessionProfile,
+    providers: List[ExecutionProvider],
+) -> Tuple[onnxruntime.InferenceSession, Dict[str, Any]]:
+    """Creates ONNX Runtime session with given settings.
+
+    Graph optimised by ONNX Runtime is saved next to the weights (for given weights, ONNX
+    Runtime version and providers) and loaded instead of original weights on subsequent
+    starts.
+    If optimised graph cannot be used, session is created from original weights.
+
+    Args:
+        weights_path (str): Path to ONNX weights.
+        profile (OnnxSessionProfile): Settings of the session.
+        providers (List[ExecutionProvider]): Execution providers in priority order.
+
+    Returns:
+        Tuple[onnxruntime.InferenceSession, Dict[str, Any]]: Session and its effective
+            settings.
+    """
+    optimized_model_path = None
+    if profile.persist_optimized_model and can_persist_optimized_model(providers):
+        optimized_model_path = get_optimized_model_path(
+            weights_path=weights_path, providers=providers
+        )
+    if optimized_model_path is not None and os.path.isfile(optimized_model_path):
+        session_options = build_session_options(profile=profile, providers=providers)
+        # graph is already optimised - only cheap, provider-independent passes are left
+        session_options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC
+        )
+        try:
+            session = onnxruntime.InferenceSession(
+                optimized_model_path,
+                providers=providers,
+                sess_options=session_options,
+            )
+            return session, describe_session(
+                session=session,
+                profile=profile,
+                optimized_model_path=optimized_model_path,
+                optimized_model_loaded=True,
+            )
+        except Exception as error:
+            logger.warning(
+                f"Could not load optimised model from {optimized_model_path} - "
+                f"loading original weights. Cause: {error}"
+            )
+            _remove_file(path=optimized_model_path)
+    session_options = build_session_options(profile=profile, providers=providers)
+    if optimized_model_path is None:
+        session = onnxruntime.InferenceSession(
+            weights_path, providers=providers, sess_options=session_options
+        )
+        return session, describe_session(session=session, profile=profile)
+    # written under temporary name, such that concurrent loads never see partial file
+    temporary_path = f"{optimized_model_path}.{uuid4().hex}.tmp"
+    session_options.optimized_model_filepath = temporary_path
+    try:
+        session = onnxruntime.InferenceSession(
+            weights_path, providers=providers, sess_options=session_options
+        )
+        os.replace(temporary_path, optimized_model_path)
+    except Exception as error:
+        logger.warning(
+            f"Could not save optimised model into {optimized_model_path}. Cause: {error}"
+        )
+        _remove_file(path=temporary_path)
+        session_options.optimized_model_filepath = ""
+        session = onnxruntime.InferenceSession(
+            weights_path, providers=providers, sess_options=session_options
+        )
+        optimized_model_path = None
+    return session, describe_session(
+        session=session,
+        profile=profile,
+        optimized_model_path=optimized_model_path,
+        optimized_model_loaded=False,
+    )
+
+
+def can_persist_optimized_model(providers: List[ExecutionProvider]) -> bool:
+    return all(
+        name in OPTIMIZED_MODEL_PROVIDERS
+        for name in get_available_providers_names(providers=providers)
+    )
+
+
+def get_optimized_model_path(
+    weights_path: str, providers: List[ExecutionProvider]
+) -> str:
+    # optimised graph may contain nodes specific to hardware and ONNX Runtime version,
+    # hash of weights makes sure that graph optimised for replaced weights is not used
+    # (saved along with model validation result - it is not recomputed on each load)
+    validation_result = load_model_validation_result(
+        cache_path=os.path.join(
+            os.path.dirname(weights_path), MODEL_VALIDATION_RESULT_FILE
+        )
+    )
+    weights_hash = get_weights_hash(
+        weights_path=weights_path, validation_result=validation_result
+    )
+    fingerprint = json.dumps(
+        [
+            onnxruntime.__version__,
+            get_available_providers_names(providers=providers),
+            weights_hash,
+        ]
+    )
+    digest = hashlib.md5(fingerprint.encode("utf-8")).hexdigest()[:12]
+    weights_root, _ = os.path.splitext(weights_path)
+    return f"{weights_root}{OPTIMIZED_MODEL_MARKER}{digest}.onnx"
+
+
+def is_optimized_model_file(path: str) -> bool:
+    return OPTIMIZED_MODEL_MARKER in os.path.basename(path)
+
+
+def get_available_providers_names(providers: List[ExecutionProvider]) -> List[str]:
+    # ONNX Runtime silently skips requested providers that are not available
+    available_providers = set(onnxruntime.get_available_providers())
+    names = [_get_provider_name(provider=p) for p in providers]
+    return [name for name in names if name in available_providers]
+
+
+def describe_session(
+    session: onnxruntime.InferenceSession,
+    profile: OnnxSessionProfile,
+    optimized_model_path: Optional[str] = None,
+    optimized_model_loaded: bool = False,
+) -> Dict[str, Any]:
+    return {
+        **profile.to_dict(),
+        "providers": session.get_providers(),
+        "optimized_model_path": optimized_model_path,
+        "optimized_model_loaded": optimized_model_loaded,
+    }
+
+
+def _get_provider_name(provider: ExecutionProvider) -> str:
+    if isinstance(provider, tuple):
+        return provider[0]
+    return provider
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -1,3 +1,88 @@
+import hashlib
+import os
+from typing import Optional, Tuple
+
+from inference.core.logger import logger
+from inference.core.utils.file_system import dump_json, read_json
+
+MODEL_VALIDATION_RESULT_FILE = "model_validation.json"
+MODEL_VALIDATION_RESULT_VERSION = 1
+WEIGHTS_HASH_CHUNK_SIZE = 1024 * 1024
+
+
 def get_num_classes_from_model_prediction_shape(len_prediction, masks=0, keypoints=0):
     num_classes = len_prediction - 5 - masks - (keypoints * 3)
     return num_classes
+
+
+def load_model_validation_result(cache_path: str) -> Optional[dict]:
+    """Loads result of model validation saved for earlier loads of the model.
+
+    Args:
+        cache_path (str): Path to validation result in model cache.
+
+    Returns:
+        Optional[dict]: Validation result - None if missing or malformed.
+    """
+    if not os.path.isfile(cache_path):
+        return None
+    try:
+        validation_result = read_json(path=cache_path)
+    except (OSError, ValueError) as error:
+        logger.warning(f"Could not read model validation result: {error}")
+        return None
+    if not isinstance(validation_result, dict):
+        return None
+    if validation_result.get("version") != MODEL_VALIDATION_RESULT_VERSION:
+        return None
+    return validation_result
+
+
+def save_model_validation_result(
+    cache_path: str,
+    weights_path: str,
+    weights_hash: str,
+    output_shape: Optional[Tuple[int, ...]],
+) -> None:
+    weights_stat = os.stat(weights_path)
+    validation_result = {
+        "version": MODEL_VALIDATION_RESULT_VERSION,
+        "weights_hash": weights_hash,
+        "weights_size": weights_stat.st_size,
+        "weights_mtime_ns": weights_stat.st_mtime_ns,
+        "output_shape": list(output_shape) if output_shape is not None else None,
+    }
+    try:
+        dump_json(path=cache_path, content=validation_result, allow_override=True)
+    except OSError as error:
+        logger.warning(f"Could not save model validation result: {error}")
+
+
+def get_weights_hash(
+    weights_path: str, validation_result: Optional[dict] = None
+) -> str:
+    """Computes hash of model weights.
+
+    Hash saved along with validation result is reused if size and modification time
+    of weights did not change since it was computed.
+
+    Args:
+        weights_path (str): Path to model weights.
+        validation_result (Optional[dict]): Validation result saved earlier.
+
+    Returns:
+        str: Hash of the weights file.
+    """
+    weights_stat = os.stat(weights_path)
+    if (
+        validation_result is not None
+        and validation_result.get("weights_size") == weights_stat.st_size
+        and validation_result.get("weights_mtime_ns") == weights_stat.st_mtime_ns
+        and validation_result.get("weights_hash")
+    ):
+        return validation_result["weights_hash"]
+    weights_hash = hashlib.sha256()
+    with open(weights_path, "rb") as f:
+        for chunk in iter(lambda: f.read(WEIGHTS_HASH_CHUNK_SIZE), b""):
+            weights_hash.update(chunk)
+    return weights_hash.hexdigest()
@@ -1,7 +1,10 @@
-from typing import Optional
+from typing import List, Optional
 
 import numpy as np
 
+LEGACY_NMS_IMPLEMENTATION = "legacy"
+VECTORIZED_NMS_IMPLEMENTATION = "vectorized"
+
 
 def w_np_non_max_suppression(
     prediction,
@@ -161,3 +164,141 @@ def non_max_suppression_fast(boxes, overlapThresh):
     # return only the bounding boxes that were picked using the
     # integer data type
     return boxes[pick].astype("float")
+
+
+def batched_non_max_suppression(
+    prediction: np.ndarray,
+    conf_thresh: float = 0.25,
+    iou_thresh: float = 0.45,
+    class_agnostic: bool = False,
+    max_detections: int = 300,
+    max_candidate_detections: int = 3000,
+    num_masks: int = 0,
+    box_format: str = "xywh",
+) -> List[np.ndarray]:
+    """Applies vectorized non-maximum suppression to predictions.
+
+    Drop-in replacement for `w_np_non_max_suppression` - it uses the same overlap
+    criterion and output format, but sorts candidates once, runs class-aware NMS
+    for all classes in a single pass (by offsetting boxes of each class so that
+    they never overlap boxes of other classes) and enforces `max_candidate_detections`
+    by keeping only the most confident candidates. Input array is not modified.
+
+    Args:
+        prediction (np.ndarray): Array of predictions. Format for single prediction is
+            [bbox x 4, max_class_confidence, (confidence) x num_of_classes, additional_element x num_masks]
+        conf_thresh (float, optional): Confidence threshold. Defaults to 0.25.
+        iou_thresh (float, optional): IOU threshold. Defaults to 0.45.
+        class_agnostic (bool, optional): Whether to ignore class labels. Defaults to False.
+        max_detections (int, optional): Maximum number of detections. Defaults to 300.
+        max_candidate_detections (int, optional): Maximum number of candidate detections. Defaults to 3000.
+        num_masks (int, optional): Number of masks. Defaults to 0.
+        box_format (str, optional): Format of bounding boxes. Either 'xywh' or 'xyxy'. Defaults to 'xywh'.
+
+    Returns:
+        List[np.ndarray]: Array of filtered predictions for each image in batch, sorted
+            by confidence. Format of a single result is:
+            [bbox x 4, max_class_confidence, max_class_confidence, id_of_class_with_max_confidence,
+            additional_element x num_masks]
+    """
+    if box_format not in {"xywh", "xyxy"}:
+        raise ValueError(
+            "box_format must be either 'xywh' or 'xyxy', got {}".format(box_format)
+        )
+    num_classes = prediction.shape[2] - 5 - num_masks
+    return [
+        _batched_non_max_suppression_for_image(
+            image_prediction=image_prediction,
+            num_classes=num_classes,
+            num_masks=num_masks,
+            conf_thresh=conf_thresh,
+            iou_thresh=iou_thresh,
+            class_agnostic=class_agnostic,
+            max_detections=max_detections,
+            max_candidate_detections=max_candidate_detections,
+            box_format=box_format,
+        )
+        for image_prediction in prediction
+    ]
+
+
+def _batched_non_max_suppression_for_image(
+    image_prediction: np.ndarray,
+    num_classes: int,
+    num_masks: int,
+    conf_thresh: float,
+    iou_thresh: float,
+    class_agnostic: bool,
+    max_detections: int,
+    max_candidate_detections: int,
+    box_format: str,
+) -> np.ndarray:
+    output_width = 7 + num_masks
+    candidates = image_prediction[image_prediction[:, 4] >= conf_thresh]
+    if candidates.shape[0] == 0 or num_classes <= 0 or max_detections <= 0:
+        return np.zeros((0, output_width))
+    order = np.argsort(-candidates[:, 4], kind="stable")
+    if max_candidate_detections is not None:
+        order = order[:max_candidate_detections]
+    candidates = candidates[order]
+    class_confidences = candidates[:, 5 : 5 + num_classes]
+    class_ids = np.argmax(class_confidences, axis=1)
+    detections = np.empty((candidates.shape[0], output_width))
+    if box_format == "xywh":
+        half_sizes = candidates[:, 2:4] / 2
+        detections[:, 0:2] = candidates[:, 0:2] - half_sizes
+        detections[:, 2:4] = candidates[:, 0:2] + half_sizes
+    else:
+        detections[:, :4] = candidates[:, :4]
+    detections[:, 4] = candidates[:, 4]
+    detections[:, 5] = np.take_along_axis(
+        class_confidences, class_ids[:, None], axis=1
+    )[:, 0]
+    detections[:, 6] = class_ids
+    detections[:, 7:] = candidates[:, 5 + num_classes :]
+    boxes = detections[:, :4]
+    if not class_agnostic:
+        boxes = _offset_boxes_by_class(boxes=boxes, class_ids=class_ids)
+    keep = _greedy_non_max_suppression(
+        boxes=boxes,
+        overlap_thresh=iou_thresh,
+        max_detections=max_detections,
+    )
+    return detections[keep]
+
+
+def _offset_boxes_by_class(boxes: np.ndarray, class_ids: np.ndarray) -> np.ndarray:
+    # shifting each class by more than the span of all coordinates (+1 for the
+    # inclusive pixel convention used in overlap calculation) makes boxes of
+    # different classes disjoint, so one NMS pass is equivalent to per-class NMS
+    span = boxes.max() - boxes.min() + 2
+    return boxes + (class_ids * span)[:, None]
+
+
+def _greedy_non_max_suppression(
+    boxes: np.ndarray,
+    overlap_thresh: float,
+    max_detections: int,
+) -> np.ndarray:
+    # boxes are expected to be sorted by confidence (descending)
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    areas = (x2 - x1 + 1) * (y2 - y1 + 1)
+    boxes_number = boxes.shape[0]
+    suppressed = np.zeros(boxes_number, dtype=bool)
+    keep = np.empty(min(boxes_number, max_detections), dtype=np.int64)
+    kept = 0
+    for i in range(boxes_number):
+        if suppressed[i]:
+            continue
+        keep[kept] = i
+        kept += 1
+        if kept == keep.shape[0]:
+            break
+        w = np.maximum(
+            0, np.minimum(x2[i], x2[i + 1 :]) - np.maximum(x1[i], x1[i + 1 :]) + 1
+        )
+        h = np.maximum(
+            0, np.minimum(y2[i], y2[i + 1 :]) - np.maximum(y1[i], y1[i + 1 :]) + 1
+        )
+        suppressed[i + 1 :] |= (w * h) / areas[i + 1 :] > overlap_thresh
+    return keep[:kept]
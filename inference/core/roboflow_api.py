@@ -12,6 +12,7 @@ from requests_toolbelt import MultipartEncoder
 from inference.core import logger
 from inference.core.cache import cache
 from inference.core.cache.base import BaseCache
+from inference.core.cache.downloads import download_file
 from inference.core.entities.types import (
     DatasetID,
     ModelID,
@@ -638,6 +639,15 @@ def get_from_url(
     return _get_from_url(url=url, json_response=json_response)
 
 
+@wrap_roboflow_api_errors()
+def download_from_url(url: str, target_path: str) -> None:
+    download_file(
+        url=wrap_url(url),
+        target_path=target_path,
+        headers=build_roboflow_api_headers(),
+    )
+
+
 def _get_from_url(url: str, json_response: bool = True) -> Union[Response, dict]:
     response = requests.get(
         wrap_url(url),
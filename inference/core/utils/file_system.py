@@ -1,7 +1,9 @@
 import json
 import os.path
 import re
-from typing import List, Optional, Union
+from contextlib import contextmanager
+from typing import Generator, List, Optional, Union
+from uuid import uuid4
 
 
 def read_text_file(
@@ -32,8 +34,9 @@ def dump_json(
 ) -> None:
     ensure_write_is_allowed(path=path, allow_override=allow_override)
     ensure_parent_dir_exists(path=path)
-    with open(path, "w") as f:
-        json.dump(content, fp=f, **kwargs)
+    with atomic_path(path=path) as temporary_path:
+        with open(temporary_path, "w") as f:
+            json.dump(content, fp=f, **kwargs)
 
 
 def dump_text_lines(
@@ -44,15 +47,30 @@ def dump_text_lines(
 ) -> None:
     ensure_write_is_allowed(path=path, allow_override=allow_override)
     ensure_parent_dir_exists(path=path)
-    with open(path, "w") as f:
-        f.write(lines_connector.join(content))
+    with atomic_path(path=path) as temporary_path:
+        with open(temporary_path, "w") as f:
+            f.write(lines_connector.join(content))
 
 
 def dump_bytes(path: str, content: bytes, allow_override: bool = False) -> None:
     ensure_write_is_allowed(path=path, allow_override=allow_override)
     ensure_parent_dir_exists(path=path)
-    with open(path, "wb") as f:
-        f.write(content)
+    with atomic_path(path=path) as temporary_path:
+        with open(temporary_path, "wb") as f:
+            f.write(content)
+
+
+@contextmanager
+def atomic_path(path: str) -> Generator[str, None, None]:
+    """Gives temporary path to write into, which is renamed into `path` once writing
+    succeeds - such that readers never see partially written file."""
+    temporary_path = f"{path}.{uuid4().hex}.tmp"
+    try:
+        yield temporary_path
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
 
 
 def ensure_parent_dir_exists(path: str) -> None:
@@ -38,10 +38,21 @@ from inference.core.utils.function import deprecated
 from inference.core.utils.requests import api_key_safe_raise_for_status
 
 BASE64_DATA_TYPE_PATTERN = re.compile(r"^data:image\/[a-z]+;base64,")
+JPEG_MAGIC_BYTES = b"\xff\xd8\xff"
+EXIF_ORIENTATION_TAG = 0x0112
+# EXIF orientations which swap image width and height
+TRANSPOSING_EXIF_ORIENTATIONS = {5, 6, 7, 8}
+REDUCED_DECODING_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
 
 
 class ImageType(Enum):
     BASE64 = "base64"
+    BYTES = "bytes"
     FILE = "file"
     MULTIPART = "multipart"
     NUMPY = "numpy"
@@ -104,16 +115,20 @@ def load_image(
     return np_image, is_bgr
 
 
-def choose_image_decoding_flags(disable_preproc_auto_orient: bool) -> int:
+def choose_image_decoding_flags(
+    disable_preproc_auto_orient: bool, reduction_factor: int = 1
+) -> int:
     """Choose the appropriate OpenCV image decoding flags.
 
     Args:
         disable_preproc_auto_orient (bool): Flag to disable preprocessing auto-orientation.
+        reduction_factor (int): Factor of resolution reduction applied while decoding JPEG
+            images - one of 1, 2, 4, 8.
 
     Returns:
         int: OpenCV image decoding flags.
     """
-    cv_imread_flags = cv2.IMREAD_COLOR
+    cv_imread_flags = REDUCED_DECODING_FLAGS[reduction_factor]
     if disable_preproc_auto_orient:
         cv_imread_flags = cv_imread_flags | cv2.IMREAD_IGNORE_ORIENTATION
     return cv_imread_flags
@@ -266,6 +281,26 @@ def load_image_base64(
     Returns:
         np.ndarray: The loaded image as a numpy array.
     """
+    value = decode_base64_image_payload(value=value)
+    image_np = np.frombuffer(value, np.uint8)
+    result = cv2.imdecode(image_np, cv_imread_flags)
+    if result is None:
+        raise InputImageLoadError(
+            message="Could not load valid image from base64 string.",
+            public_message="Malformed base64 input image.",
+        )
+    return result
+
+
+def decode_base64_image_payload(value: Union[str, bytes]) -> bytes:
+    """Decodes base64 image payload into encoded image bytes.
+
+    Args:
+        value (Union[str, bytes]): Base64 encoded image, optionally prefixed with data URI header.
+
+    Returns:
+        bytes: Encoded image bytes.
+    """
     # New routes accept images via json body (str), legacy routes accept bytes which need to be decoded as strings
     if not isinstance(value, str):
         value = value.decode("utf-8")
@@ -282,14 +317,7 @@ def load_image_base64(
             message="Could not load valid image from base64 string.",
             public_message="Empty image payload.",
         )
-    image_np = np.frombuffer(value, np.uint8)
-    result = cv2.imdecode(image_np, cv_imread_flags)
-    if result is None:
-        raise InputImageLoadError(
-            message="Could not load valid image from base64 string.",
-            public_message="Malformed base64 input image.",
-        )
-    return result
+    return value
 
 
 def load_image_from_buffer(
@@ -494,19 +522,32 @@ def _ensure_location_matches_destination_blacklist(destination: str) -> None:
 
 
 def load_image_from_encoded_bytes(
-    value: bytes, cv_imread_flags: int = cv2.IMREAD_COLOR
+    value: Union[bytes, bytearray, memoryview],
+    cv_imread_flags: int = cv2.IMREAD_COLOR,
 ) -> np.ndarray:
     """
     Load an image from encoded bytes.
 
+    The buffer is handed to the decoder as is - without copying the payload.
+
     Args:
-        value (bytes): The byte sequence representing the image.
+        value (Union[bytes, bytearray, memoryview]): The byte sequence representing the image.
         cv_imread_flags (int): OpenCV flags used for image reading.
 
     Returns:
         np.ndarray: The loaded image as a numpy array.
     """
-    image_np = np.asarray(bytearray(value), dtype=np.uint8)
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        raise InputImageLoadError(
+            message=f"Expected image bytes, got value of type: {type(value)}.",
+            public_message="Image of type `bytes` must be sent as binary payload.",
+        )
+    if len(value) == 0:
+        raise InputImageLoadError(
+            message="Could not decode empty bytes as image.",
+            public_message="Empty image payload.",
+        )
+    image_np = np.frombuffer(value, dtype=np.uint8)
     image = cv2.imdecode(image_np, cv_imread_flags)
     if image is None:
         raise InputImageLoadError(
@@ -516,8 +557,65 @@ def load_image_from_encoded_bytes(
     return image
 
 
+def extract_encoded_image_payload(value: Any) -> Optional[bytes]:
+    """Extracts encoded bytes of the image - without decoding it.
+
+    Only images declared as base64, raw bytes or multipart uploads are handled.
+
+    Args:
+        value (Any): Image value - InferenceRequestImage or dict with 'type' and 'value' keys.
+
+    Returns:
+        Optional[bytes]: Encoded image bytes or None if the image is not given as encoded bytes.
+    """
+    value, image_type = extract_image_payload_and_type(value=value)
+    if image_type is ImageType.BASE64:
+        return decode_base64_image_payload(value=value)
+    if image_type is ImageType.BYTES:
+        return value
+    if image_type is ImageType.MULTIPART:
+        value.seek(0)
+        return value.read()
+    return None
+
+
+def is_jpeg(payload: Union[bytes, bytearray, memoryview]) -> bool:
+    return bytes(payload[: len(JPEG_MAGIC_BYTES)]) == JPEG_MAGIC_BYTES
+
+
+def get_jpeg_dimensions(
+    payload: Union[bytes, bytearray, memoryview],
+    respect_orientation: bool = True,
+) -> Tuple[int, int]:
+    """Reads dimensions of JPEG image from its header - without decoding the image.
+
+    Args:
+        payload (Union[bytes, bytearray, memoryview]): Encoded JPEG image.
+        respect_orientation (bool): If true, dimensions are given after EXIF orientation
+            is applied - as it is done by OpenCV while decoding.
+
+    Returns:
+        Tuple[int, int]: Height and width of the image.
+    """
+    try:
+        with Image.open(BytesIO(payload)) as image:
+            width, height = image.size
+            orientation = None
+            if respect_orientation:
+                orientation = image.getexif().get(EXIF_ORIENTATION_TAG)
+    except Exception as error:
+        raise InputImageLoadError(
+            message=f"Could not read JPEG image header. Details: {error}",
+            public_message="Could not decode bytes into image.",
+        ) from error
+    if orientation in TRANSPOSING_EXIF_ORIENTATIONS:
+        return width, height
+    return height, width
+
+
 IMAGE_LOADERS = {
     ImageType.BASE64: load_image_base64,
+    ImageType.BYTES: load_image_from_encoded_bytes,
     ImageType.FILE: cv2.imread,
     ImageType.MULTIPART: load_image_from_buffer,
     ImageType.NUMPY: lambda v, _: load_image_from_numpy_str(v),
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -17,6 +17,13 @@ CONTRAST_KEY = "contrast"
 GRAYSCALE_KEY = "grayscale"
 ENABLED_KEY = "enabled"
 TYPE_KEY = "type"
+STRETCH_RESIZE_METHOD = "Stretch to"
+LETTERBOX_PADDING_COLORS = {
+    "Fit (black edges) in": (0, 0, 0),
+    "Fit (white edges) in": (255, 255, 255),
+    "Fit (grey edges) in": (114, 114, 114),
+}
+JPEG_REDUCTION_FACTORS = (8, 4, 2)
 
 
 class ContrastAdjustmentType(Enum):
@@ -100,12 +107,21 @@ def static_crop_should_be_applied(
 
 
 def take_static_crop(image: np.ndarray, crop_parameters: Dict[str, int]) -> np.ndarray:
-    height, width = image.shape[0:2]
+    x_min, y_min, x_max, y_max = get_static_crop_bounds(
+        image_shape=image.shape[0:2], crop_parameters=crop_parameters
+    )
+    return image[y_min:y_max, x_min:x_max, :]
+
+
+def get_static_crop_bounds(
+    image_shape: Tuple[int, int], crop_parameters: Dict[str, int]
+) -> Tuple[int, int, int, int]:
+    height, width = image_shape
     x_min = int(crop_parameters["x_min"] / 100 * width)
     y_min = int(crop_parameters["y_min"] / 100 * height)
     x_max = int(crop_parameters["x_max"] / 100 * width)
     y_max = int(crop_parameters["y_max"] / 100 * height)
-    return image[y_min:y_max, x_min:x_max, :]
+    return x_min, y_min, x_max, y_max
 
 
 def contrast_adjustments_should_be_applied(
@@ -226,7 +242,22 @@ def resize_image_keeping_aspect_ratio(
     - image: numpy array representing the image.
     - desired_size: tuple (width, height) representing the target dimensions.
     """
-    img_ratio = image.shape[1] / image.shape[0]
+    new_size = get_size_keeping_aspect_ratio(
+        image_shape=image.shape[:2], desired_size=desired_size
+    )
+    # Resize the image to new dimensions
+    return cv2.resize(image, new_size)
+
+
+def get_size_keeping_aspect_ratio(
+    image_shape: Tuple[int, int],
+    desired_size: Tuple[int, int],
+) -> Tuple[int, int]:
+    """
+    Size (width, height) of the image with given shape (height, width) fitted into
+    desired size (width, height) - with aspect ratio preserved.
+    """
+    img_ratio = image_shape[1] / image_shape[0]
     desired_ratio = desired_size[0] / desired_size[1]
 
     # Determine the new dimensions
@@ -238,6 +269,102 @@ def resize_image_keeping_aspect_ratio(
         # Resize by height
         new_height = desired_size[1]
         new_width = int(desired_size[1] * img_ratio)
+    return new_width, new_height
 
-    # Resize the image to new dimensions
-    return cv2.resize(image, (new_width, new_height))
+
+def get_resize_geometry(
+    image_shape: Tuple[int, int],
+    desired_size: Tuple[int, int],
+    resize_method: str,
+) -> Tuple[Tuple[int, int], Tuple[int, int], Optional[Tuple[int, int, int]]]:
+    """
+    Geometry of resizing image with given shape (height, width) into desired size (width, height)
+    using one of model resize methods.
+
+    Returns:
+    - size (width, height) of resized image
+    - padding (left, top) of resized image
+    - padding color (B, G, R) - None for "Stretch to" method
+    """
+    if resize_method == STRETCH_RESIZE_METHOD:
+        return desired_size, (0, 0), None
+    if resize_method not in LETTERBOX_PADDING_COLORS:
+        raise PreProcessingError(
+            f"Pre-processing of image failed due to unknown resize method: {resize_method}."
+        )
+    new_width, new_height = get_size_keeping_aspect_ratio(
+        image_shape=image_shape, desired_size=desired_size
+    )
+    padding = (desired_size[0] - new_width) // 2, (desired_size[1] - new_height) // 2
+    return (new_width, new_height), padding, LETTERBOX_PADDING_COLORS[resize_method]
+
+
+def choose_jpeg_reduction_factor(
+    image_shape: Tuple[int, int],
+    desired_size: Tuple[int, int],
+    resize_method: str,
+) -> int:
+    """
+    Chooses the largest JPEG decoding reduction factor (1, 2, 4 or 8) for which image with given
+    shape (height, width) is still not smaller than its resized version - such that resizing
+    into model input only downscales the image.
+    """
+    (new_width, new_height), _, _ = get_resize_geometry(
+        image_shape=image_shape,
+        desired_size=desired_size,
+        resize_method=resize_method,
+    )
+    for factor in JPEG_REDUCTION_FACTORS:
+        if (
+            image_shape[0] // factor >= new_height
+            and image_shape[1] // factor >= new_width
+        ):
+            return factor
+    return 1
+
+
+def resize_image_into_tensor(
+    image: np.ndarray,
+    tensor: np.ndarray,
+    resize_method: str,
+    reference_shape: Optional[Tuple[int, int]] = None,
+    is_bgr: bool = True,
+) -> None:
+    """
+    Resizes (stretching or letterboxing) the image and writes it into (3, height, width) float tensor
+    in RGB channels order - in a single pass, without intermediate padded, transposed and casted copies.
+
+    Parameters:
+    - image: numpy array representing the image.
+    - tensor: (3, height, width) array to be filled.
+    - resize_method: model resize method.
+    - reference_shape: shape (height, width) used to compute geometry of letterbox - to be given if image
+        is decoded at reduced resolution, such that model input matches the one of full resolution image.
+        Defaults to the shape of the image.
+    - is_bgr: flag to denote channels order of the image.
+    """
+    if reference_shape is None:
+        reference_shape = image.shape[:2]
+    desired_size = tensor.shape[2], tensor.shape[1]
+    (new_width, new_height), (left, top), color = get_resize_geometry(
+        image_shape=reference_shape,
+        desired_size=desired_size,
+        resize_method=resize_method,
+    )
+    if image.shape[1] != new_width or image.shape[0] != new_height:
+        image = cv2.resize(image, (new_width, new_height))
+    source_channels = (2, 1, 0) if is_bgr else (0, 1, 2)
+    for target_channel, source_channel in enumerate(source_channels):
+        plane = tensor[target_channel]
+        np.copyto(
+            plane[top : top + new_height, left : left + new_width],
+            image[:, :, source_channel],
+            casting="unsafe",
+        )
+        if color is None:
+            continue
+        value = color[source_channel]
+        plane[:top] = value
+        plane[top + new_height :] = value
+        plane[top : top + new_height, :left] = value
+        plane[top : top + new_height, left + new_width :] = value
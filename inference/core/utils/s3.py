@@ -1,20 +1,31 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from botocore.client import BaseClient
 
+from inference.core.env import MODEL_ARTEFACTS_DOWNLOAD_WORKERS
+
 
 def download_s3_files_to_directory(
     bucket: str,
     keys: List[str],
     target_dir: str,
     s3_client: BaseClient,
+    max_workers: int = MODEL_ARTEFACTS_DOWNLOAD_WORKERS,
 ) -> None:
     os.makedirs(target_dir, exist_ok=True)
-    for key in keys:
-        target_path = os.path.join(target_dir, key)
-        s3_client.download_file(
-            bucket,
-            key,
-            target_path,
-        )
+    if not keys:
+        return None
+    with ThreadPoolExecutor(max_workers=max(min(max_workers, len(keys)), 1)) as pool:
+        futures = [
+            pool.submit(
+                s3_client.download_file,
+                bucket,
+                key,
+                os.path.join(target_dir, key),
+            )
+            for key in keys
+        ]
+        for future in futures:
+            future.result()
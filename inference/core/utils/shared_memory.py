@@ -0,0 +1,87 @@
+import os
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+SHARED_MEMORY_MOUNT_POINT = "/dev/shm"
+
+
+def create_shared_memory(size: int) -> SharedMemory:
+    """Creates segment owned (and to be unlinked) by the current process."""
+    memory = SharedMemory(create=True, size=size)
+    with _CREATED_SEGMENTS_LOCK:
+        _CREATED_SEGMENTS.add(memory.name)
+    return memory
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """Attaches to existing segment owned by another process - such that the segment
+    is not unlinked once the attaching process exits."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    memory = SharedMemory(name=name)
+    with _CREATED_SEGMENTS_LOCK:
+        created_by_current_process = name in _CREATED_SEGMENTS
+    if os.name == "posix" and not created_by_current_process:
+        # before Python 3.13 each attachment is registered in resource tracker, which
+        # unlinks the segment at exit of the process - cleanup belongs to the owner
+        # (registration of segments created here is the one of the owner)
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
+
+
+def unlink_shared_memory(memory: SharedMemory) -> None:
+    with _CREATED_SEGMENTS_LOCK:
+        _CREATED_SEGMENTS.discard(memory.name)
+    try:
+        memory.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def shared_memory_array(
+    memory: SharedMemory, shape: Tuple[int, ...], dtype: str, offset: int = 0
+) -> np.ndarray:
+    """View of the segment - unlike `np.ndarray(..., buffer=memory.buf)` it holds the
+    buffer exported, so the segment cannot be unmapped while the view is alive."""
+    dtype = np.dtype(dtype)
+    count = int(np.prod(shape, dtype=np.int64))
+    return np.frombuffer(memory.buf, dtype=dtype, count=count, offset=offset).reshape(
+        shape
+    )
+
+
+def get_shared_memory_free_space() -> Optional[int]:
+    """Bytes available for new segments - `None` when it cannot be determined
+    (on platforms without `/dev/shm`)."""
+    try:
+        stats = os.statvfs(SHARED_MEMORY_MOUNT_POINT)
+    except (AttributeError, OSError):
+        return None
+    return stats.f_bavail * stats.f_frsize
+
+
+def try_close_shared_memory(memory: SharedMemory) -> bool:
+    """Unmaps the segment - fails (returning False) while arrays created from its
+    buffer are still referenced."""
+    try:
+        memory.close()
+        return True
+    except BufferError:
+        return False
+
+
+def close_detached_shared_memories(
+    memories: List[SharedMemory],
+) -> List[SharedMemory]:
+    """Unmaps given segments, returning those that are still in use - to be closed
+    on subsequent calls."""
+    return [memory for memory in memories if not try_close_shared_memory(memory=memory)]
+
+
+_CREATED_SEGMENTS: Set[str] = set()
+_CREATED_SEGMENTS_LOCK = Lock()
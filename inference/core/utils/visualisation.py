@@ -9,6 +9,7 @@ from inference.core.entities.requests.inference import (
     ObjectDetectionInferenceRequest,
 )
 from inference.core.entities.responses.inference import (
+    ColumnarDetectionsPredictions,
     InstanceSegmentationPrediction,
     Keypoint,
     KeypointsPrediction,
@@ -33,7 +34,10 @@ def draw_detection_predictions(
     colors: Dict[str, str],
 ) -> bytes:
     image = load_image_rgb(inference_request.image)
-    for box in inference_response.predictions:
+    predictions = inference_response.predictions
+    if isinstance(predictions, ColumnarDetectionsPredictions):
+        predictions = predictions.to_predictions()
+    for box in predictions:
         color = tuple(
             int(colors.get(box.class_name, "#4892EA")[i : i + 2], 16) for i in (1, 3, 5)
         )
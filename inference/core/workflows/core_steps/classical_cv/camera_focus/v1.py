@@ -85,6 +85,10 @@ class CameraFocusBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[CameraFocusManifest]:
         return CameraFocusManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(self, image: WorkflowImageData, *args, **kwargs) -> BlockResult:
         # Calculate the Brenner measure
         brenner_image, brenner_value = calculate_brenner_measure(image.numpy_image)
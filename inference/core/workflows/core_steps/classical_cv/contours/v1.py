@@ -104,6 +104,10 @@ class ImageContoursDetectionBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[ImageContoursDetectionManifest]:
         return ImageContoursDetectionManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self, image: WorkflowImageData, line_thickness: int, *args, **kwargs
     ) -> BlockResult:
@@ -76,6 +76,10 @@ class ConvertGrayscaleBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[ConvertGrayscaleManifest]:
         return ConvertGrayscaleManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
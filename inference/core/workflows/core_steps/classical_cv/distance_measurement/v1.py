@@ -168,6 +168,10 @@ class DistanceMeasurementBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         predictions: sv.Detections,
@@ -102,6 +102,10 @@ class DominantColorBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[DominantColorManifest]:
         return DominantColorManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
@@ -95,6 +95,10 @@ class ImageBlurBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[ImageBlurManifest]:
         return ImageBlurManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
@@ -135,6 +135,10 @@ class ImagePreprocessingBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[ImagePreprocessingManifest]:
         return ImagePreprocessingManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
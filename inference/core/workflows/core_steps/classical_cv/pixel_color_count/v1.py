@@ -87,6 +87,10 @@ class PixelationCountBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[ColorPixelCountManifest]:
         return ColorPixelCountManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
@@ -90,6 +90,10 @@ class SIFTBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[SIFTDetectionManifest]:
         return SIFTDetectionManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(self, image: WorkflowImageData, *args, **kwargs) -> BlockResult:
         img_with_kp, keypoints, descriptors = apply_sift(image.numpy_image)
         output_image = WorkflowImageData.copy_and_replace(
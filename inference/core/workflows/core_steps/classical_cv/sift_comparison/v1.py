@@ -82,6 +82,10 @@ class SIFTComparisonBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return SIFTComparisonBlockManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         descriptor_1: np.ndarray,
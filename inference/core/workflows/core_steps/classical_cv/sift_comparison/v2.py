@@ -131,6 +131,10 @@ class SIFTComparisonBlockV2(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return SIFTComparisonBlockManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         input_1: Union[np.ndarray, WorkflowImageData],
@@ -238,6 +238,10 @@ class SizeMeasurementBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return SizeMeasurementManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         reference_predictions: sv.Detections,
@@ -130,6 +130,10 @@ class TemplateMatchingBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[TemplateMatchingManifest]:
         return TemplateMatchingManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
@@ -108,6 +108,10 @@ class ImageThresholdBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[ImageThresholdManifest]:
         return ImageThresholdManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         image: WorkflowImageData,
@@ -0,0 +1,297 @@
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.query_language.entities.enums import (
+    DetectionsProperty,
+    StatementsGroupsOperator,
+)
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    DEFAULT_OPERAND_NAME,
+    TYPE_PARAMETER_NAME,
+    BinaryStatement,
+    DynamicOperand,
+    ExtractDetectionProperty,
+    StatementGroup,
+    StaticOperand,
+    UnaryStatement,
+)
+from inference.core.workflows.core_steps.common.query_language.errors import (
+    EvaluationEngineError,
+    RoboflowQueryLanguageError,
+    UndeclaredSymbolError,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
+    BINARY_OPERATORS,
+    create_operand_builder,
+)
+
+DetectionsMaskFunction = Callable[[sv.Detections, Dict[str, Any]], Optional[np.ndarray]]
+
+NUMERIC_PROPERTIES_EXTRACTORS = {
+    DetectionsProperty.X_MIN: lambda detections: detections.xyxy[:, 0],
+    DetectionsProperty.Y_MIN: lambda detections: detections.xyxy[:, 1],
+    DetectionsProperty.X_MAX: lambda detections: detections.xyxy[:, 2],
+    DetectionsProperty.Y_MAX: lambda detections: detections.xyxy[:, 3],
+    DetectionsProperty.CONFIDENCE: lambda detections: detections.confidence,
+    DetectionsProperty.CLASS_ID: lambda detections: detections.class_id,
+    DetectionsProperty.SIZE: lambda detections: (
+        (detections.xyxy[:, 3] - detections.xyxy[:, 1])
+        * (detections.xyxy[:, 2] - detections.xyxy[:, 0])
+    ),
+}
+
+CATEGORICAL_PROPERTIES_EXTRACTORS = {
+    DetectionsProperty.CLASS_NAME: lambda detections: detections.data.get("class_name"),
+}
+
+NUMERIC_COMPARATORS = {
+    "==",
+    "!=",
+    "(Number) ==",
+    "(Number) !=",
+    "(Number) >",
+    "(Number) >=",
+    "(Number) <",
+    "(Number) <=",
+}
+
+MASKS_COMBINERS = {
+    StatementsGroupsOperator.AND: np.logical_and,
+    StatementsGroupsOperator.OR: np.logical_or,
+}
+
+# operations yielding different result each time they are evaluated - operands using them
+# must be evaluated once per detection, as in row-by-row evaluation
+NON_DETERMINISTIC_OPERATIONS = {"RandomNumber"}
+
+
+def build_detections_mask_function(
+    definition: Union[BinaryStatement, UnaryStatement, StatementGroup],
+    execution_context: str = "<root>",
+) -> Optional[DetectionsMaskFunction]:
+    """Compiles filtering predicate into function evaluated over whole `sv.Detections`.
+
+    Supported are binary statements comparing a single property of detection (coordinates,
+    size, confidence, class id or class name) with operand not depending on the detection,
+    combined with `and` / `or` groups. Returns `None` when the predicate cannot be compiled -
+    the mask function itself returns `None` when input data cannot be handled at runtime
+    (e.g. missing property) - in both cases row-by-row evaluation must be used.
+    """
+    if isinstance(definition, BinaryStatement):
+        return build_binary_statement_mask_function(
+            definition=definition, execution_context=execution_context
+        )
+    if not isinstance(definition, StatementGroup):
+        return None
+    if not definition.statements or definition.operator not in MASKS_COMBINERS:
+        return None
+    statements_functions = []
+    for statement_id, statement in enumerate(definition.statements):
+        statement_function = build_detections_mask_function(
+            definition=statement,
+            execution_context=f"{execution_context}.statements[{statement_id}]",
+        )
+        if statement_function is None:
+            return None
+        statements_functions.append(statement_function)
+    return partial(
+        compound_mask_eval,
+        statements_functions=statements_functions,
+        combiner=MASKS_COMBINERS[definition.operator],
+    )
+
+
+def build_binary_statement_mask_function(
+    definition: BinaryStatement,
+    execution_context: str,
+) -> Optional[DetectionsMaskFunction]:
+    comparator_parameters = [
+        t for t in type(definition.comparator).model_fields if t != TYPE_PARAMETER_NAME
+    ]
+    if comparator_parameters:
+        return None
+    left_property = get_extracted_detection_property(operand=definition.left_operand)
+    right_property = get_extracted_detection_property(operand=definition.right_operand)
+    if (left_property is None) == (right_property is None):
+        return None
+    detection_on_left = left_property is not None
+    property_name = left_property if detection_on_left else right_property
+    other_operand = (
+        definition.right_operand if detection_on_left else definition.left_operand
+    )
+    if not is_independent_of_detection(operand=other_operand):
+        return None
+    return partial(
+        binary_mask_eval,
+        property_name=property_name,
+        detection_on_left=detection_on_left,
+        other_operand_builder=create_operand_builder(
+            definition=other_operand, execution_context=execution_context
+        ),
+        comparator_type=definition.comparator.type,
+        negate=definition.negate,
+        operation_type=definition.type,
+        execution_context=execution_context,
+    )
+
+
+def get_extracted_detection_property(
+    operand: Union[StaticOperand, DynamicOperand],
+) -> Optional[DetectionsProperty]:
+    if not isinstance(operand, DynamicOperand):
+        return None
+    if operand.operand_name != DEFAULT_OPERAND_NAME or len(operand.operations) != 1:
+        return None
+    operation = operand.operations[0]
+    if not isinstance(operation, ExtractDetectionProperty):
+        return None
+    if (
+        operation.property_name not in NUMERIC_PROPERTIES_EXTRACTORS
+        and operation.property_name not in CATEGORICAL_PROPERTIES_EXTRACTORS
+    ):
+        return None
+    return operation.property_name
+
+
+def is_independent_of_detection(operand: Union[StaticOperand, DynamicOperand]) -> bool:
+    if (
+        isinstance(operand, DynamicOperand)
+        and operand.operand_name == DEFAULT_OPERAND_NAME
+    ):
+        return False
+    return _is_independent_of_detection(
+        serialised_definition=[o.model_dump() for o in operand.operations]
+    )
+
+
+def _is_independent_of_detection(serialised_definition: Any) -> bool:
+    if isinstance(serialised_definition, list):
+        return all(_is_independent_of_detection(e) for e in serialised_definition)
+    if not isinstance(serialised_definition, dict):
+        return True
+    if serialised_definition.get(TYPE_PARAMETER_NAME) in NON_DETERMINISTIC_OPERATIONS:
+        return False
+    if serialised_definition.get("operand_name") == DEFAULT_OPERAND_NAME:
+        return False
+    return all(_is_independent_of_detection(v) for v in serialised_definition.values())
+
+
+def binary_mask_eval(
+    detections: sv.Detections,
+    values: Dict[str, Any],
+    property_name: DetectionsProperty,
+    detection_on_left: bool,
+    other_operand_builder: Callable[[Dict[str, Any]], Any],
+    comparator_type: str,
+    negate: bool,
+    operation_type: str,
+    execution_context: str,
+) -> Optional[np.ndarray]:
+    try:
+        other_operand = other_operand_builder(values)
+        if property_name in NUMERIC_PROPERTIES_EXTRACTORS:
+            property_values = NUMERIC_PROPERTIES_EXTRACTORS[property_name](detections)
+        else:
+            property_values = CATEGORICAL_PROPERTIES_EXTRACTORS[property_name](
+                detections
+            )
+        if property_values is None or len(property_values) != len(detections):
+            return None
+        operator = BINARY_OPERATORS[comparator_type]
+        if comparator_type in NUMERIC_COMPARATORS and _is_numeric_comparison(
+            property_values=property_values, other_operand=other_operand
+        ):
+            property_values = _as_python_precision(property_values=property_values)
+            result = (
+                operator(property_values, other_operand)
+                if detection_on_left
+                else operator(other_operand, property_values)
+            )
+        else:
+            result = _eval_over_unique_values(
+                property_values=property_values,
+                operator=operator,
+                other_operand=other_operand,
+                detection_on_left=detection_on_left,
+            )
+        if result is None:
+            return None
+        result = np.asarray(result, dtype=bool)
+        if negate:
+            result = ~result
+        return result
+    except UndeclaredSymbolError as error:
+        raise UndeclaredSymbolError(
+            public_message=f"Attempted to execute evaluation of type: {operation_type} in context {execution_context}, "
+            f"but encountered error: {error.public_message}",
+            context=f"step_execution | roboflow_query_language_evaluation | {execution_context}",
+        ) from error
+    except RoboflowQueryLanguageError as error:
+        raise error
+    except Exception as error:
+        raise EvaluationEngineError(
+            public_message=f"Attempted to execute evaluation of type: {operation_type} in context {execution_context}, "
+            f"but encountered error: {error}",
+            context=f"step_execution | roboflow_query_language_evaluation | {execution_context}",
+            inner_error=error,
+        ) from error
+
+
+def compound_mask_eval(
+    detections: sv.Detections,
+    values: Dict[str, Any],
+    statements_functions: List[DetectionsMaskFunction],
+    combiner: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> Optional[np.ndarray]:
+    result = None
+    for statement_function in statements_functions:
+        statement_result = statement_function(detections, values)
+        if statement_result is None:
+            return None
+        result = (
+            statement_result if result is None else combiner(result, statement_result)
+        )
+    return result
+
+
+def _is_numeric_comparison(property_values: np.ndarray, other_operand: Any) -> bool:
+    return np.issubdtype(property_values.dtype, np.number) and isinstance(
+        other_operand, (int, float, np.number)
+    )
+
+
+def _as_python_precision(property_values: np.ndarray) -> np.ndarray:
+    # row-by-row evaluation compares Python floats - lower precision arrays would
+    # otherwise be compared against the operand cast down to their dtype
+    if np.issubdtype(property_values.dtype, np.floating):
+        return property_values.astype(np.float64)
+    return property_values
+
+
+def _eval_over_unique_values(
+    property_values: np.ndarray,
+    operator: Callable[[Any, Any], bool],
+    other_operand: Any,
+    detection_on_left: bool,
+) -> Optional[np.ndarray]:
+    # operator is applied to Python values, exactly as in row-by-row evaluation - but only
+    # once per distinct value (e.g. per class name)
+    try:
+        unique_values, inverse = np.unique(property_values, return_inverse=True)
+    except TypeError:
+        return None
+    unique_results = np.array(
+        [
+            bool(
+                operator(value, other_operand)
+                if detection_on_left
+                else operator(other_operand, value)
+            )
+            for value in unique_values.tolist()
+        ],
+        dtype=bool,
+    )
+    return unique_results[inverse.reshape(-1)]
@@ -162,12 +162,19 @@ def build_detections_filter_operation(
     from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
         build_eval_function,
     )
+    from inference.core.workflows.core_steps.common.query_language.evaluation_engine.detection.vectorized import (
+        build_detections_mask_function,
+    )
 
     filtering_fun = build_eval_function(
         definition=definition.filter_operation,
         execution_context=execution_context,
     )
-    return partial(filter_detections, filtering_fun=filtering_fun)
+    mask_fun = build_detections_mask_function(
+        definition=definition.filter_operation,
+        execution_context=execution_context,
+    )
+    return partial(filter_detections, filtering_fun=filtering_fun, mask_fun=mask_fun)
 
 
 REGISTERED_SIMPLE_OPERATIONS = {
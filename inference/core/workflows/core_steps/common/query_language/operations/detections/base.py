@@ -1,5 +1,5 @@
 from copy import copy, deepcopy
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 import supervision as sv
@@ -59,6 +59,9 @@ def filter_detections(
     detections: Any,
     filtering_fun: Callable[[Dict[str, Any]], bool],
     global_parameters: Dict[str, Any],
+    mask_fun: Optional[
+        Callable[[sv.Detections, Dict[str, Any]], Optional[np.ndarray]]
+    ] = None,
 ) -> sv.Detections:
     if not isinstance(detections, sv.Detections):
         value_as_str = safe_stringify(value=detections)
@@ -67,6 +70,10 @@ def filter_detections(
             f"got {value_as_str} of type {type(detections)}",
             context="step_execution | roboflow_query_language_evaluation",
         )
+    if mask_fun is not None and len(detections) > 0:
+        mask = mask_fun(detections, global_parameters)
+        if mask is not None:
+            return detections[mask]
     local_parameters = copy(global_parameters)
     result = []
     for detection in detections:
@@ -1,4 +1,6 @@
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Generator, List
 
 import numpy as np
 import supervision as sv
@@ -42,106 +44,249 @@ from inference.core.workflows.execution_engine.entities.base import (
 
 MIN_SECRET_LENGTH_TO_REVEAL_PREFIX = 8
 
+DEFAULT_DETECTIONS_SERIALIZATION_FORMAT = "default"
+COMPACT_DETECTIONS_SERIALIZATION_FORMAT = "compact"
+
+_DETECTIONS_SERIALIZATION_FORMAT: ContextVar[str] = ContextVar(
+    "detections_serialization_format",
+    default=DEFAULT_DETECTIONS_SERIALIZATION_FORMAT,
+)
+
+
+@contextmanager
+def use_detections_serialization_format(
+    serialization_format: str,
+) -> Generator[None, None, None]:
+    """Selects format in which detections are serialised into Workflow outputs within
+    the context - see `serialise_sv_detections_in_requested_format(...)`."""
+    token = _DETECTIONS_SERIALIZATION_FORMAT.set(serialization_format)
+    try:
+        yield None
+    finally:
+        _DETECTIONS_SERIALIZATION_FORMAT.reset(token)
+
+
+def serialise_sv_detections_in_requested_format(detections: sv.Detections) -> dict:
+    if (
+        _DETECTIONS_SERIALIZATION_FORMAT.get()
+        == COMPACT_DETECTIONS_SERIALIZATION_FORMAT
+    ):
+        return serialise_sv_detections_compact(detections=detections)
+    return serialise_sv_detections(detections=detections)
+
 
 def serialise_sv_detections(detections: sv.Detections) -> dict:
+    columns = _get_detections_columns(detections=detections)
     serialized_detections = []
-    image_dimensions = None
-    for xyxy, mask, confidence, class_id, tracker_id, data in detections:
-        detection_dict = {}
-        image_dimensions = data.get(IMAGE_DIMENSIONS_KEY)
-        if isinstance(xyxy, np.ndarray):
-            xyxy = xyxy.astype(float).tolist()
-        x1, y1, x2, y2 = xyxy
-        detection_dict[WIDTH_KEY] = abs(x2 - x1)
-        detection_dict[HEIGHT_KEY] = abs(y2 - y1)
-        detection_dict[X_KEY] = x1 + detection_dict[WIDTH_KEY] / 2
-        detection_dict[Y_KEY] = y1 + detection_dict[HEIGHT_KEY] / 2
-
-        detection_dict[CONFIDENCE_KEY] = float(confidence)
-        detection_dict[CLASS_ID_KEY] = int(class_id)
-        if mask is not None:
-            polygon = sv.mask_to_polygons(mask=mask)
-            detection_dict[POLYGON_KEY] = []
-            for x, y in polygon[0]:
-                detection_dict[POLYGON_KEY].append(
-                    {
-                        X_KEY: float(x),
-                        Y_KEY: float(y),
-                    }
-                )
-        if tracker_id is not None:
-            detection_dict[TRACKER_ID_KEY] = int(tracker_id)
-        detection_dict[CLASS_NAME_KEY] = str(data["class_name"])
-        detection_dict[DETECTION_ID_KEY] = str(data[DETECTION_ID_KEY])
-        if PATH_DEVIATION_KEY_IN_SV_DETECTIONS in data:
-            detection_dict[PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE] = data[
-                PATH_DEVIATION_KEY_IN_SV_DETECTIONS
-            ]
-        if TIME_IN_ZONE_KEY_IN_SV_DETECTIONS in data:
-            detection_dict[TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE] = data[
-                TIME_IN_ZONE_KEY_IN_SV_DETECTIONS
-            ]
-        if (
-            BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS in data
-        ):
-            detection_dict[BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS
+    for i in range(len(detections)):
+        detection_dict = {
+            WIDTH_KEY: columns[WIDTH_KEY][i],
+            HEIGHT_KEY: columns[HEIGHT_KEY][i],
+            X_KEY: columns[X_KEY][i],
+            Y_KEY: columns[Y_KEY][i],
+            CONFIDENCE_KEY: columns[CONFIDENCE_KEY][i],
+            CLASS_ID_KEY: columns[CLASS_ID_KEY][i],
+        }
+        if POLYGON_KEY in columns:
+            detection_dict[POLYGON_KEY] = [
+                {X_KEY: x, Y_KEY: y} for x, y in columns[POLYGON_KEY][i]
             ]
-            detection_dict[BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS
+        if TRACKER_ID_KEY in columns:
+            detection_dict[TRACKER_ID_KEY] = columns[TRACKER_ID_KEY][i]
+        detection_dict[CLASS_NAME_KEY] = columns[CLASS_NAME_KEY][i]
+        detection_dict[DETECTION_ID_KEY] = columns[DETECTION_ID_KEY][i]
+        for key in _OPTIONAL_COLUMNS:
+            if key in columns:
+                detection_dict[key] = columns[key][i]
+        if KEYPOINTS_KEY_IN_INFERENCE_RESPONSE in columns:
+            detection_dict[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = [
+                {
+                    "class_id": keypoint_class_id,
+                    "class": keypoint_class_name,
+                    "confidence": keypoint_confidence,
+                    "x": x,
+                    "y": y,
+                }
+                for (
+                    keypoint_class_id,
+                    keypoint_class_name,
+                    keypoint_confidence,
+                    (x, y),
+                ) in columns[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE][i]
             ]
-            detection_dict[BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS
+        if DETECTED_CODE_KEY in columns:
+            detection_dict[DETECTED_CODE_KEY] = columns[DETECTED_CODE_KEY][i]
+        serialized_detections.append(detection_dict)
+    return {
+        "image": _get_image_metadata(detections=detections),
+        "predictions": serialized_detections,
+    }
+
+
+def serialise_sv_detections_compact(detections: sv.Detections) -> dict:
+    """Serialises detections into parallel arrays - `predictions` holds one list per
+    field (e.g. `predictions["x"][i]` is `x` of i-th detection) instead of one dictionary
+    per detection. Polygons are lists of `[x, y]` pairs and keypoints lists of
+    `[class_id, class, confidence, x, y]` entries."""
+    columns = _get_detections_columns(detections=detections)
+    if KEYPOINTS_KEY_IN_INFERENCE_RESPONSE in columns:
+        columns[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = [
+            [
+                [class_id, class_name, confidence, x, y]
+                for class_id, class_name, confidence, (x, y) in keypoints
             ]
-            detection_dict[BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS
+            for keypoints in columns[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE]
+        ]
+    return {
+        "image": _get_image_metadata(detections=detections),
+        "predictions": columns,
+    }
+
+
+_OPTIONAL_COLUMNS = [
+    PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE,
+    TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE,
+    BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE,
+    BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE,
+    BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE,
+    BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE,
+    PARENT_ID_KEY,
+]
+
+
+def _get_detections_columns(detections: sv.Detections) -> Dict[str, list]:
+    if len(detections) == 0:
+        return {
+            key: []
+            for key in [
+                WIDTH_KEY,
+                HEIGHT_KEY,
+                X_KEY,
+                Y_KEY,
+                CONFIDENCE_KEY,
+                CLASS_ID_KEY,
+                CLASS_NAME_KEY,
+                DETECTION_ID_KEY,
             ]
-        if PARENT_ID_KEY in data:
-            detection_dict[PARENT_ID_KEY] = str(data[PARENT_ID_KEY])
-        if (
-            KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_XY_KEY_IN_SV_DETECTIONS in data
-        ):
-            kp_class_id = data[KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS]
-            kp_class_name = data[KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS]
-            kp_confidence = data[KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS]
-            kp_xy = data[KEYPOINTS_XY_KEY_IN_SV_DETECTIONS]
-            detection_dict[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = []
-            for (
-                keypoint_class_id,
-                keypoint_class_name,
-                keypoint_confidence,
-                (x, y),
-            ) in zip(kp_class_id, kp_class_name, kp_confidence, kp_xy):
-                detection_dict[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE].append(
-                    {
-                        "class_id": int(keypoint_class_id),
-                        "class": str(keypoint_class_name),
-                        "confidence": float(keypoint_confidence),
-                        "x": float(x),
-                        "y": float(y),
-                    }
+        }
+    xyxy = np.asarray(detections.xyxy).astype(float).reshape(-1, 4)
+    width = np.abs(xyxy[:, 2] - xyxy[:, 0])
+    height = np.abs(xyxy[:, 3] - xyxy[:, 1])
+    columns = {
+        WIDTH_KEY: width.tolist(),
+        HEIGHT_KEY: height.tolist(),
+        X_KEY: (xyxy[:, 0] + width / 2).tolist(),
+        Y_KEY: (xyxy[:, 1] + height / 2).tolist(),
+        CONFIDENCE_KEY: [float(c) for c in _as_list(detections.confidence)],
+        CLASS_ID_KEY: [int(c) for c in _as_list(detections.class_id)],
+    }
+    if detections.mask is not None:
+        columns[POLYGON_KEY] = [
+            polygon.astype(float).tolist()
+            for polygon in masks_to_first_polygons(masks=detections.mask)
+        ]
+    if detections.tracker_id is not None:
+        columns[TRACKER_ID_KEY] = [int(t) for t in detections.tracker_id.tolist()]
+    data = detections.data
+    columns[CLASS_NAME_KEY] = [str(c) for c in data["class_name"]]
+    columns[DETECTION_ID_KEY] = [str(i) for i in data[DETECTION_ID_KEY]]
+    if PATH_DEVIATION_KEY_IN_SV_DETECTIONS in data:
+        columns[PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE] = list(
+            data[PATH_DEVIATION_KEY_IN_SV_DETECTIONS]
+        )
+    if TIME_IN_ZONE_KEY_IN_SV_DETECTIONS in data:
+        columns[TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE] = list(
+            data[TIME_IN_ZONE_KEY_IN_SV_DETECTIONS]
+        )
+    if (
+        BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS in data
+        and BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS in data
+        and BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS in data
+        and BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS in data
+    ):
+        columns[BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE] = list(
+            data[BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS]
+        )
+        columns[BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE] = list(
+            data[BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS]
+        )
+        columns[BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE] = list(
+            data[BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS]
+        )
+        columns[BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE] = list(
+            data[BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS]
+        )
+    if PARENT_ID_KEY in data:
+        columns[PARENT_ID_KEY] = [str(p) for p in data[PARENT_ID_KEY]]
+    if (
+        KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_XY_KEY_IN_SV_DETECTIONS in data
+    ):
+        columns[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = [
+            list(
+                zip(
+                    [int(c) for c in _as_list(kp_class_id)],
+                    [str(c) for c in _as_list(kp_class_name)],
+                    [float(c) for c in _as_list(kp_confidence)],
+                    [(float(x), float(y)) for x, y in _as_list(kp_xy)],
                 )
-        if DETECTED_CODE_KEY in data:
-            detection_dict[DETECTED_CODE_KEY] = data[DETECTED_CODE_KEY]
-        serialized_detections.append(detection_dict)
+            )
+            for kp_class_id, kp_class_name, kp_confidence, kp_xy in zip(
+                data[KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS],
+                data[KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS],
+                data[KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS],
+                data[KEYPOINTS_XY_KEY_IN_SV_DETECTIONS],
+            )
+        ]
+    if DETECTED_CODE_KEY in data:
+        columns[DETECTED_CODE_KEY] = list(data[DETECTED_CODE_KEY])
+    return columns
+
+
+def _as_list(value: Any) -> list:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return list(value)
+
+
+def _get_image_metadata(detections: sv.Detections) -> dict:
     image_metadata = {
         "width": None,
         "height": None,
     }  # TODO: this breaks the contract of
     # standard inference, but to fix that problem, we would need sv.Detections to provide
     # detection-level metadata.
-    if image_dimensions is not None:
+    image_dimensions = detections.data.get(IMAGE_DIMENSIONS_KEY)
+    if len(detections) > 0 and image_dimensions is not None:
         image_metadata = {
-            "width": image_dimensions[1].item(),
-            "height": image_dimensions[0].item(),
+            "width": image_dimensions[-1][1].item(),
+            "height": image_dimensions[-1][0].item(),
         }
-    return {"image": image_metadata, "predictions": serialized_detections}
+    return image_metadata
+
+
+def masks_to_first_polygons(masks: np.ndarray) -> List[np.ndarray]:
+    """Equivalent of `sv.mask_to_polygons(mask)[0]` for each mask, but contours are only
+    traced within bounding box of mask pixels (with 1px margin) - bounding boxes of all
+    masks are found in one pass over the stack of masks."""
+    if len(masks) == 0:
+        return []
+    rows_occupied = masks.any(axis=2)
+    columns_occupied = masks.any(axis=1)
+    height, width = masks.shape[1:]
+    polygons = []
+    for mask, mask_rows, mask_columns in zip(masks, rows_occupied, columns_occupied):
+        rows, columns = np.flatnonzero(mask_rows), np.flatnonzero(mask_columns)
+        if len(rows) == 0:
+            polygons.append(sv.mask_to_polygons(mask=mask)[0])
+            continue
+        y_min, y_max = max(rows[0] - 1, 0), min(rows[-1] + 2, height)
+        x_min, x_max = max(columns[0] - 1, 0), min(columns[-1] + 2, width)
+        polygon = sv.mask_to_polygons(mask=mask[y_min:y_max, x_min:x_max])[0]
+        polygons.append(polygon + np.array([x_min, y_min], dtype=polygon.dtype))
+    return polygons
 
 
 def serialise_image(image: WorkflowImageData) -> Dict[str, Any]:
@@ -164,7 +309,7 @@ def serialize_wildcard_kind(value: Any) -> Any:
     elif isinstance(value, list):
         value = serialize_list(elements=value)
     elif isinstance(value, sv.Detections):
-        value = serialise_sv_detections(detections=value)
+        value = serialise_sv_detections_in_requested_format(detections=value)
     return value
 
 
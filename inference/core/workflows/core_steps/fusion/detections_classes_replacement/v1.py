@@ -115,6 +115,10 @@ class DetectionsClassesReplacementBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         object_detection_predictions: Optional[sv.Detections],
@@ -183,6 +183,10 @@ class DetectionsConsensusBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         predictions_batches: List[Batch[sv.Detections]],
@@ -344,27 +348,15 @@ def agree_on_consensus_for_all_detections_sources(
         predictions=detections_from_sources,
         classes_to_consider=classes_to_consider,
     )
-    detections_already_considered = set()
-    consensus_detections = []
-    for source_id, detection in enumerate_detections(
-        detections_from_sources=detections_from_sources
-    ):
-        (
-            consensus_detections_update,
-            detections_already_considered,
-        ) = get_consensus_for_single_detection(
-            detection=detection,
-            source_id=source_id,
-            detections_from_sources=detections_from_sources,
-            iou_threshold=iou_threshold,
-            class_aware=class_aware,
-            required_votes=required_votes,
-            confidence=confidence,
-            detections_merge_confidence_aggregation=detections_merge_confidence_aggregation,
-            detections_merge_coordinates_aggregation=detections_merge_coordinates_aggregation,
-            detections_already_considered=detections_already_considered,
-        )
-        consensus_detections += consensus_detections_update
+    consensus_detections = find_consensus_detections(
+        detections_from_sources=detections_from_sources,
+        iou_threshold=iou_threshold,
+        class_aware=class_aware,
+        required_votes=required_votes,
+        confidence=confidence,
+        detections_merge_confidence_aggregation=detections_merge_confidence_aggregation,
+        detections_merge_coordinates_aggregation=detections_merge_coordinates_aggregation,
+    )
     consensus_detections = sv.Detections.merge(consensus_detections)
     (
         object_present,
@@ -383,6 +375,214 @@ def agree_on_consensus_for_all_detections_sources(
     )
 
 
+def find_consensus_detections(
+    detections_from_sources: List[sv.Detections],
+    iou_threshold: float,
+    class_aware: bool,
+    required_votes: int,
+    confidence: float,
+    detections_merge_confidence_aggregation: AggregationMode,
+    detections_merge_coordinates_aggregation: AggregationMode,
+) -> List[sv.Detections]:
+    """Equivalent of applying `get_consensus_for_single_detection(...)` to each detection
+    in order of `enumerate_detections(...)` - but overlaps are looked up in IoU matrices
+    computed once for each pair of sources, and detections already considered are
+    tracked as boolean mask, instead of slicing `sv.Detections` for each pair of boxes.
+    """
+    detections_ids = get_detections_ids_indices(
+        detections_from_sources=detections_from_sources
+    )
+    detections_already_considered = np.zeros(
+        sum(len(ids) for ids in detections_ids), dtype=bool
+    )
+    sources_overlaps = {}
+    merged_sources, sources_offsets = merge_detections_from_sources(
+        detections_from_sources=detections_from_sources
+    )
+    consensus_detections = []
+    for source_id, detections in enumerate(detections_from_sources):
+        for detection_index in range(len(detections)):
+            if detections_already_considered[
+                detections_ids[source_id][detection_index]
+            ]:
+                continue
+            detections_with_max_overlap = get_indices_of_detections_with_max_overlap(
+                detection_index=detection_index,
+                source=source_id,
+                detections_from_sources=detections_from_sources,
+                detections_ids=detections_ids,
+                detections_already_considered=detections_already_considered,
+                iou_threshold=iou_threshold,
+                class_aware=class_aware,
+                sources_overlaps=sources_overlaps,
+            )
+            if len(detections_with_max_overlap) < (required_votes - 1):
+                continue
+            if merged_sources is not None:
+                detections_to_merge = merged_sources[
+                    [sources_offsets[source_id] + detection_index]
+                    + [
+                        sources_offsets[other_source] + other_index
+                        for other_source, other_index in detections_with_max_overlap.items()
+                    ]
+                ]
+            else:
+                detections_to_merge = sv.Detections.merge(
+                    [detections[detection_index]]
+                    + [
+                        detections_from_sources[other_source][other_index]
+                        for other_source, other_index in detections_with_max_overlap.items()
+                    ]
+                )
+            merged_detection = merge_detections(
+                detections=detections_to_merge,
+                confidence_aggregation_mode=detections_merge_confidence_aggregation,
+                boxes_aggregation_mode=detections_merge_coordinates_aggregation,
+            )
+            if merged_detection.confidence[0] < confidence:
+                continue
+            consensus_detections.append(merged_detection)
+            detections_already_considered[
+                detections_ids[source_id][detection_index]
+            ] = True
+            for other_source, other_index in detections_with_max_overlap.items():
+                detections_already_considered[
+                    detections_ids[other_source][other_index]
+                ] = True
+    return consensus_detections
+
+
+def merge_detections_from_sources(
+    detections_from_sources: List[sv.Detections],
+) -> Tuple[Optional[sv.Detections], List[int]]:
+    # selecting matched detections from all sources merged upfront gives the same result
+    # as merging them one by one - unless sources differ in arrays types, in which case
+    # `None` is returned and matched detections must be merged separately
+    sources_offsets = np.cumsum(
+        [0] + [len(detections) for detections in detections_from_sources]
+    ).tolist()
+    non_empty_sources = [d for d in detections_from_sources if len(d) > 0]
+    if len(non_empty_sources) == 0:
+        return None, sources_offsets
+    reference = non_empty_sources[0]
+    for detections in non_empty_sources[1:]:
+        if _get_arrays_types(detections) != _get_arrays_types(reference):
+            return None, sources_offsets
+    return sv.Detections.merge(detections_from_sources), sources_offsets
+
+
+def _get_arrays_types(detections: sv.Detections) -> tuple:
+    fields = [
+        detections.xyxy,
+        detections.mask,
+        detections.confidence,
+        detections.class_id,
+        detections.tracker_id,
+    ]
+    fields_types = tuple(None if f is None else f.dtype for f in fields)
+    data_types = tuple(
+        sorted(
+            (key, _get_dtype_signature(np.asarray(value).dtype))
+            for key, value in detections.data.items()
+        )
+    )
+    return fields_types, data_types
+
+
+def _get_dtype_signature(dtype: np.dtype) -> str:
+    # width of strings does not matter - strings are copied into merged detection
+    # one by one
+    if dtype.kind in {"U", "S"}:
+        return dtype.kind
+    return dtype.str
+
+
+def get_detections_ids_indices(
+    detections_from_sources: List[sv.Detections],
+) -> List[np.ndarray]:
+    # detections are considered by their identifiers - the same identifier in
+    # different sources is mapped into the same index
+    ids = [
+        (
+            detections[DETECTION_ID_KEY]
+            if len(detections) > 0
+            else np.zeros((0,), dtype=str)
+        )
+        for detections in detections_from_sources
+    ]
+    if not any(len(source_ids) for source_ids in ids):
+        return [np.zeros((0,), dtype=int) for _ in ids]
+    _, indices = np.unique(
+        np.concatenate([source_ids.astype(str) for source_ids in ids]),
+        return_inverse=True,
+    )
+    indices = indices.reshape(-1)
+    splits = np.cumsum([len(source_ids) for source_ids in ids])[:-1]
+    return np.split(indices, splits)
+
+
+def get_indices_of_detections_with_max_overlap(
+    detection_index: int,
+    source: int,
+    detections_from_sources: List[sv.Detections],
+    detections_ids: List[np.ndarray],
+    detections_already_considered: np.ndarray,
+    iou_threshold: float,
+    class_aware: bool,
+    sources_overlaps: Dict[Tuple[int, int], Tuple[np.ndarray, Optional[np.ndarray]]],
+) -> Dict[int, int]:
+    matches = {}
+    for other_source in range(len(detections_from_sources)):
+        if other_source == source:
+            continue
+        candidates = ~detections_already_considered[detections_ids[other_source]]
+        if not candidates.any():
+            continue
+        iou, classes_match = get_sources_overlaps(
+            detections_from_sources=detections_from_sources,
+            source=source,
+            other_source=other_source,
+            class_aware=class_aware,
+            sources_overlaps=sources_overlaps,
+        )
+        iou = iou[detection_index]
+        if classes_match is not None:
+            candidates &= classes_match[detection_index]
+        candidates &= iou > iou_threshold
+        if not candidates.any():
+            continue
+        # first detection with max IoU wins - as in sequential comparison
+        matches[other_source] = int(np.argmax(np.where(candidates, iou, -np.inf)))
+    return matches
+
+
+def get_sources_overlaps(
+    detections_from_sources: List[sv.Detections],
+    source: int,
+    other_source: int,
+    class_aware: bool,
+    sources_overlaps: Dict[Tuple[int, int], Tuple[np.ndarray, Optional[np.ndarray]]],
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    key = (min(source, other_source), max(source, other_source))
+    if key not in sources_overlaps:
+        detections_a = detections_from_sources[key[0]]
+        detections_b = detections_from_sources[key[1]]
+        # cast to float64 - thresholds are compared against IoU as Python float
+        iou = sv.box_iou_batch(detections_a.xyxy, detections_b.xyxy).astype(np.float64)
+        iou = np.nan_to_num(iou)
+        classes_match = None
+        if class_aware:
+            classes_match = (
+                detections_a["class_name"][:, None]
+                == detections_b["class_name"][None, :]
+            )
+        sources_overlaps[key] = (iou, classes_match)
+    iou, classes_match = sources_overlaps[key]
+    if key[0] == source:
+        return iou, classes_match
+    return iou.T, None if classes_match is None else classes_match.T
+
+
 def get_consensus_for_single_detection(
     detection: sv.Detections,
     source_id: int,
@@ -79,5 +79,9 @@ class DimensionCollapseBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(self, data: Batch[Any]) -> BlockResult:
         return {"output": [e for e in data]}
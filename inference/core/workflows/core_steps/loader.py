@@ -93,7 +93,7 @@ from inference.core.workflows.core_steps.common.deserializers import (
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.core_steps.common.serializers import (
     serialise_image,
-    serialise_sv_detections,
+    serialise_sv_detections_in_requested_format,
     serialize_secret,
     serialize_video_metadata_kind,
     serialize_wildcard_kind,
@@ -444,11 +444,11 @@ REGISTERED_INITIALIZERS = {
 KINDS_SERIALIZERS = {
     IMAGE_KIND.name: serialise_image,
     VIDEO_METADATA_KIND.name: serialize_video_metadata_kind,
-    OBJECT_DETECTION_PREDICTION_KIND.name: serialise_sv_detections,
-    INSTANCE_SEGMENTATION_PREDICTION_KIND.name: serialise_sv_detections,
-    KEYPOINT_DETECTION_PREDICTION_KIND.name: serialise_sv_detections,
-    QR_CODE_DETECTION_KIND.name: serialise_sv_detections,
-    BAR_CODE_DETECTION_KIND.name: serialise_sv_detections,
+    OBJECT_DETECTION_PREDICTION_KIND.name: serialise_sv_detections_in_requested_format,
+    INSTANCE_SEGMENTATION_PREDICTION_KIND.name: serialise_sv_detections_in_requested_format,
+    KEYPOINT_DETECTION_PREDICTION_KIND.name: serialise_sv_detections_in_requested_format,
+    QR_CODE_DETECTION_KIND.name: serialise_sv_detections_in_requested_format,
+    BAR_CODE_DETECTION_KIND.name: serialise_sv_detections_in_requested_format,
     SECRET_KIND.name: serialize_secret,
     WILDCARD_KIND.name: serialize_wildcard_kind,
 }
@@ -65,6 +65,10 @@ class CosineSimilarityBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(self, embedding_1: List[float], embedding_2: List[float]) -> BlockResult:
         if len(embedding_1) != len(embedding_2):
             raise RuntimeError(
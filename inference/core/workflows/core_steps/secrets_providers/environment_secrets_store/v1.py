@@ -96,6 +96,10 @@ class EnvironmentSecretsStoreBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     @classmethod
     def get_init_parameters(cls) -> List[str]:
         return ["allow_access_to_environmental_variables"]
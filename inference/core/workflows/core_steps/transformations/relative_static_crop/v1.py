@@ -87,6 +87,10 @@ class RelativeStaticCropBlockV1(WorkflowBlock):
     def get_manifest(cls) -> Type[BaseModel]:
         return BlockManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def run(
         self,
         images: Batch[WorkflowImageData],
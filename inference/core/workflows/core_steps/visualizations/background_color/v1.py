@@ -84,6 +84,10 @@ class BackgroundColorVisualizationBlockV1(PredictionsVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BackgroundColorManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         color: str,
@@ -69,6 +69,10 @@ class BlurVisualizationBlockV1(PredictionsVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlurManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         kernel_size: int,
@@ -80,6 +80,10 @@ class BoundingBoxVisualizationBlockV1(ColorableVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BoundingBoxManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         color_palette: str,
@@ -71,6 +71,10 @@ class CircleVisualizationBlockV1(ColorableVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return CircleManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         color_palette: str,
@@ -182,6 +182,10 @@ class ClassificationLabelVisualizationBlockV1(ColorableVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return ClassificationLabelManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         color_palette: str,
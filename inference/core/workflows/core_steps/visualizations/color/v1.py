@@ -72,6 +72,10 @@ class ColorVisualizationBlockV1(ColorableVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return ColorManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         color_palette: str,
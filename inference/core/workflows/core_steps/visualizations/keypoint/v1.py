@@ -159,6 +159,10 @@ class KeypointVisualizationBlockV1(VisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return KeypointManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         color: str,
@@ -115,6 +115,10 @@ class LineCounterZoneVisualizationBlockV1(VisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return LineCounterZoneVisualizationManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         **kwargs,
@@ -120,6 +120,10 @@ class ModelComparisonVisualizationBlockV1(PredictionsVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return ModelComparisonManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         color_a: str,
@@ -69,6 +69,10 @@ class PixelateVisualizationBlockV1(PredictionsVisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return PixelateManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         pixel_size: int,
@@ -87,6 +87,10 @@ class PolygonZoneVisualizationBlockV1(VisualizationBlock):
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return PolygonZoneVisualizationManifest
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        return True
+
     def getAnnotator(
         self,
         **kwargs,
@@ -74,6 +74,9 @@ class ExecutionEngine(BaseExecutionEngine):
             serialize_results=serialize_results,
         )
 
+    def has_stateful_steps(self) -> bool:
+        return self._engine.has_stateful_steps()
+
 
 def retrieve_requested_execution_engine_version(workflow_definition: dict) -> Version:
     raw_version = workflow_definition.get("version")
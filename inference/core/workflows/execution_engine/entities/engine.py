@@ -28,3 +28,7 @@ class BaseExecutionEngine(ABC):
         serialize_results: bool = False,
     ) -> List[Dict[str, Any]]:
         pass
+
+    def has_stateful_steps(self) -> bool:
+        # engines unable to tell are assumed to keep state between runs
+        return True
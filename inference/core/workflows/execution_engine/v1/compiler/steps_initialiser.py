@@ -127,3 +127,10 @@ def call_if_callable(value: Union[Any, Callable[[None], Any]]) -> Any:
     if callable(value):
         return value()
     return value
+
+
+def is_step_stateful(step: InitialisedStep) -> bool:
+    """Tells if block instance may keep state between runs (trackers, counters,
+    buffers, ...) - unless block explicitly declares itself stateless, it is assumed
+    to do so and must not be shared across unrelated Workflow runs."""
+    return not step.step.is_stateless()
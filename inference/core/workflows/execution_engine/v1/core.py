@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from packaging.version import Version
 
+from inference.core.env import WORKFLOWS_STEPS_SCHEDULING_MODE
 from inference.core.logger import logger
+from inference.core.workflows.errors import WorkflowEnvironmentConfigurationError
 from inference.core.workflows.execution_engine.entities.engine import (
     BaseExecutionEngine,
 )
@@ -14,13 +17,22 @@ from inference.core.workflows.execution_engine.v1.compiler.core import compile_w
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     CompiledWorkflow,
 )
-from inference.core.workflows.execution_engine.v1.executor.core import run_workflow
+from inference.core.workflows.execution_engine.v1.compiler.steps_initialiser import (
+    is_step_stateful,
+)
+from inference.core.workflows.execution_engine.v1.executor.core import (
+    STEPS_SCHEDULING_MODES,
+    run_workflow,
+)
 from inference.core.workflows.execution_engine.v1.executor.runtime_input_assembler import (
     assemble_runtime_parameters,
 )
 from inference.core.workflows.execution_engine.v1.executor.runtime_input_validator import (
     validate_runtime_input,
 )
+from inference.core.workflows.execution_engine.v1.executor.utils import (
+    get_steps_executor,
+)
 
 EXECUTION_ENGINE_V1_VERSION = Version("1.4.0")
 
@@ -36,6 +48,8 @@ class ExecutionEngineV1(BaseExecutionEngine):
         prevent_local_images_loading: bool = False,
         workflow_id: Optional[str] = None,
         profiler: Optional[WorkflowsProfiler] = None,
+        steps_executor: Optional[ThreadPoolExecutor] = None,
+        steps_scheduling_mode: str = WORKFLOWS_STEPS_SCHEDULING_MODE,
     ) -> "ExecutionEngineV1":
         if init_parameters is None:
             init_parameters = {}
@@ -54,6 +68,8 @@ class ExecutionEngineV1(BaseExecutionEngine):
             profiler=profiler,
             workflow_id=workflow_id,
             internal_id=workflow_definition.get("id"),
+            steps_executor=steps_executor,
+            steps_scheduling_mode=steps_scheduling_mode,
         )
 
     def __init__(
@@ -64,13 +80,25 @@ class ExecutionEngineV1(BaseExecutionEngine):
         profiler: WorkflowsProfiler,
         workflow_id: Optional[str] = None,
         internal_id: Optional[str] = None,
+        steps_executor: Optional[ThreadPoolExecutor] = None,
+        steps_scheduling_mode: str = WORKFLOWS_STEPS_SCHEDULING_MODE,
     ):
+        if steps_scheduling_mode not in STEPS_SCHEDULING_MODES:
+            raise WorkflowEnvironmentConfigurationError(
+                public_message=f"Steps scheduling mode `{steps_scheduling_mode}` is not supported. "
+                f"Use one of: {sorted(STEPS_SCHEDULING_MODES)}.",
+                context="workflow_compilation | engine_initialisation",
+            )
+        if steps_executor is None:
+            steps_executor = get_steps_executor()
         self._compiled_workflow = compiled_workflow
         self._max_concurrent_steps = max_concurrent_steps
         self._prevent_local_images_loading = prevent_local_images_loading
         self._workflow_id = workflow_id
         self._profiler = profiler
         self._internal_id = internal_id
+        self._steps_executor = steps_executor
+        self._steps_scheduling_mode = steps_scheduling_mode
 
     def run(
         self,
@@ -109,6 +137,14 @@ class ExecutionEngineV1(BaseExecutionEngine):
             kinds_serializers=self._compiled_workflow.kinds_serializers,
             serialize_results=serialize_results,
             profiler=self._profiler,
+            steps_executor=self._steps_executor,
+            steps_scheduling_mode=self._steps_scheduling_mode,
         )
         self._profiler.end_workflow_run()
         return result
+
+    def has_stateful_steps(self) -> bool:
+        return any(
+            is_step_stateful(step=step)
+            for step in self._compiled_workflow.steps.values()
+        )
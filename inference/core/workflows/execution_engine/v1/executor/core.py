@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Set
@@ -24,16 +25,22 @@ from inference.core.workflows.execution_engine.v1.executor.execution_data_manage
 )
 from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
     ParallelStepExecutionCoordinator,
+    get_steps_dependencies,
 )
 from inference.core.workflows.execution_engine.v1.executor.output_constructor import (
     construct_workflow_output,
 )
 from inference.core.workflows.execution_engine.v1.executor.utils import (
+    run_steps_following_dependencies,
     run_steps_in_parallel,
 )
 from inference.core.workflows.prototypes.block import WorkflowBlock
 from inference.usage_tracking.collector import usage_collector
 
+WAVES_SCHEDULING_MODE = "waves"
+DEPENDENCIES_SCHEDULING_MODE = "dependencies"
+STEPS_SCHEDULING_MODES = {WAVES_SCHEDULING_MODE, DEPENDENCIES_SCHEDULING_MODE}
+
 
 @usage_collector
 @execution_phase(
@@ -47,24 +54,38 @@ def run_workflow(
     kinds_serializers: Optional[Dict[str, Callable[[Any], Any]]],
     serialize_results: bool = False,
     profiler: Optional[WorkflowsProfiler] = None,
+    steps_executor: Optional[ThreadPoolExecutor] = None,
+    steps_scheduling_mode: str = WAVES_SCHEDULING_MODE,
 ) -> List[Dict[str, Any]]:
     execution_data_manager = ExecutionDataManager.init(
         execution_graph=workflow.execution_graph,
         runtime_parameters=runtime_parameters,
     )
-    execution_coordinator = ParallelStepExecutionCoordinator.init(
-        execution_graph=workflow.execution_graph,
-    )
-    next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
-    while next_steps is not None:
-        execute_steps(
-            next_steps=next_steps,
+    if steps_scheduling_mode == DEPENDENCIES_SCHEDULING_MODE:
+        execute_steps_following_dependencies(
             workflow=workflow,
             execution_data_manager=execution_data_manager,
             max_concurrent_steps=max_concurrent_steps,
+            steps_executor=steps_executor,
             profiler=profiler,
         )
+    else:
+        execution_coordinator = ParallelStepExecutionCoordinator.init(
+            execution_graph=workflow.execution_graph,
+        )
         next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
+        while next_steps is not None:
+            execute_steps(
+                next_steps=next_steps,
+                workflow=workflow,
+                execution_data_manager=execution_data_manager,
+                max_concurrent_steps=max_concurrent_steps,
+                steps_executor=steps_executor,
+                profiler=profiler,
+            )
+            next_steps = execution_coordinator.get_steps_to_execute_next(
+                profiler=profiler
+            )
     with profiler.profile_execution_phase(
         name="outputs_construction",
         categories=["execution_engine_operation"],
@@ -88,6 +109,7 @@ def execute_steps(
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     max_concurrent_steps: int,
+    steps_executor: Optional[ThreadPoolExecutor] = None,
     profiler: Optional[WorkflowsProfiler] = None,
 ) -> None:
     logger.info(f"Executing steps: {next_steps}.")
@@ -101,7 +123,40 @@ def execute_steps(
         )
         for step_selector in next_steps
     ]
-    _ = run_steps_in_parallel(steps=steps_functions, max_workers=max_concurrent_steps)
+    _ = run_steps_in_parallel(
+        steps=steps_functions,
+        max_workers=max_concurrent_steps,
+        executor=steps_executor,
+    )
+
+
+@execution_phase(
+    name="steps_execution_following_dependencies",
+    categories=["execution_engine_operation"],
+    runtime_metadata=["max_concurrent_steps"],
+)
+def execute_steps_following_dependencies(
+    workflow: CompiledWorkflow,
+    execution_data_manager: ExecutionDataManager,
+    max_concurrent_steps: int,
+    steps_executor: Optional[ThreadPoolExecutor] = None,
+    profiler: Optional[WorkflowsProfiler] = None,
+) -> None:
+    steps_dependencies = get_steps_dependencies(
+        execution_graph=workflow.execution_graph
+    )
+    logger.info(f"Executing steps following dependencies: {steps_dependencies}.")
+    run_steps_following_dependencies(
+        steps_dependencies=steps_dependencies,
+        run_step=partial(
+            safe_execute_step,
+            workflow=workflow,
+            execution_data_manager=execution_data_manager,
+            profiler=profiler,
+        ),
+        max_workers=max_concurrent_steps,
+        executor=steps_executor,
+    )
 
 
 @execution_phase(
@@ -1,5 +1,5 @@
 import abc
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 import networkx as nx
 
@@ -66,6 +66,19 @@ class ParallelStepExecutionCoordinator(StepExecutionCoordinator):
         return next_step
 
 
+def get_steps_dependencies(execution_graph: nx.DiGraph) -> Dict[str, Set[str]]:
+    super_start_node = "<start>"
+    steps_flow_graph = construct_steps_flow_graph(
+        execution_graph=execution_graph,
+        super_start_node=super_start_node,
+    )
+    return {
+        step_node: set(steps_flow_graph.predecessors(step_node)) - {super_start_node}
+        for step_node in steps_flow_graph.nodes
+        if step_node != super_start_node
+    }
+
+
 def establish_execution_order(
     execution_graph: nx.DiGraph,
 ) -> List[List[str]]:
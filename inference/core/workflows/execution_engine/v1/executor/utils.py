@@ -1,16 +1,141 @@
-import concurrent
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, List, TypeVar
+import contextvars
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, TypeVar
+
+from inference.core.env import WORKFLOWS_STEPS_EXECUTOR_WORKERS
 
 T = TypeVar("T")
 
+STEPS_EXECUTOR_THREAD_NAME_PREFIX = "workflows_steps_executor"
+
+_STEPS_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_STEPS_EXECUTOR_LOCK = threading.Lock()
+_STEPS_EXECUTOR_THREAD_STATE = threading.local()
+
+
+def mark_steps_executor_thread() -> None:
+    """Initializer of steps executor threads - steps dispatched from the marked
+    threads run in place (see `run_steps_following_dependencies(...)`). Custom
+    executors given to Execution Engine should use it as well."""
+    _STEPS_EXECUTOR_THREAD_STATE.is_steps_executor_thread = True
+
+
+def get_steps_executor() -> ThreadPoolExecutor:
+    """Returns executor shared by all Execution Engines of the process.
+
+    Created lazily and kept alive for the lifetime of the process - so that threads are
+    not spawned and joined for every group of steps. Its size bounds the number of steps
+    running concurrently across all workflow runs.
+    """
+    global _STEPS_EXECUTOR
+    if _STEPS_EXECUTOR is not None:
+        return _STEPS_EXECUTOR
+    with _STEPS_EXECUTOR_LOCK:
+        if _STEPS_EXECUTOR is None:
+            _STEPS_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max(WORKFLOWS_STEPS_EXECUTOR_WORKERS, 1),
+                thread_name_prefix=STEPS_EXECUTOR_THREAD_NAME_PREFIX,
+                initializer=mark_steps_executor_thread,
+            )
+    return _STEPS_EXECUTOR
+
 
 def run_steps_in_parallel(
-    steps: List[Callable[[], T]], max_workers: int = 1
+    steps: List[Callable[[], T]],
+    max_workers: int = 1,
+    executor: Optional[ThreadPoolExecutor] = None,
 ) -> List[T]:
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        return list(executor.map(_run, steps))
+    results: List[Optional[T]] = [None] * len(steps)
+
+    def run_step(step_index: int) -> None:
+        results[step_index] = steps[step_index]()
+
+    run_steps_following_dependencies(
+        steps_dependencies={step_index: set() for step_index in range(len(steps))},
+        run_step=run_step,
+        max_workers=max_workers,
+        executor=executor,
+    )
+    return results
+
+
+def run_steps_following_dependencies(
+    steps_dependencies: Dict[Hashable, Set[Hashable]],
+    run_step: Callable[[Hashable], Any],
+    max_workers: int = 1,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> None:
+    """Runs each step as soon as all of its dependencies are finished, keeping at most
+    `max_workers` of them running at a time.
+
+    Steps are dispatched to `executor` (the shared steps executor by default). When only
+    one step may run at a time, or when called from a thread of the steps executor (e.g.
+    by a block running nested workflow), steps run in the calling thread - so that the
+    bounded executor never waits on itself. After the first failure no new steps are
+    dispatched, steps already running are awaited and the error is re-raised.
+    """
+    if executor is None:
+        executor = get_steps_executor()
+    max_workers = max(max_workers, 1)
+    if max_workers == 1 or _is_steps_executor_thread():
+        submit = _run_in_current_thread
+    else:
+        submit = partial(_submit_to_executor, executor)
+    remaining_dependencies = {
+        step: set(dependencies) for step, dependencies in steps_dependencies.items()
+    }
+    dependent_steps = defaultdict(list)
+    for step, dependencies in steps_dependencies.items():
+        for dependency in dependencies:
+            dependent_steps[dependency].append(step)
+    ready_steps = deque(
+        step
+        for step, dependencies in remaining_dependencies.items()
+        if not dependencies
+    )
+    running_steps: Dict[Future, Hashable] = {}
+    error: Optional[BaseException] = None
+    while ready_steps or running_steps:
+        while error is None and ready_steps and len(running_steps) < max_workers:
+            step = ready_steps.popleft()
+            running_steps[submit(partial(run_step, step))] = step
+        if not running_steps:
+            break
+        done, _ = wait(running_steps, return_when=FIRST_COMPLETED)
+        for future in done:
+            step = running_steps.pop(future)
+            step_error = future.exception()
+            if step_error is not None:
+                error = error or step_error
+                continue
+            for dependent_step in dependent_steps[step]:
+                remaining_dependencies[dependent_step].discard(step)
+                if not remaining_dependencies[dependent_step]:
+                    ready_steps.append(dependent_step)
+    if error is not None:
+        raise error
+
+
+def _is_steps_executor_thread() -> bool:
+    return getattr(_STEPS_EXECUTOR_THREAD_STATE, "is_steps_executor_thread", False)
+
+
+def _submit_to_executor(
+    executor: ThreadPoolExecutor, fun: Callable[[], T]
+) -> "Future[T]":
+    # each step runs in a copy of caller's context, so that context variables
+    # (e.g. bound to the request being processed) are visible to steps
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fun)
 
 
-def _run(fun: Callable[[], T]) -> T:
-    return fun()
+def _run_in_current_thread(fun: Callable[[], T]) -> "Future[T]":
+    future = Future()
+    try:
+        future.set_result(fun())
+    except Exception as error:
+        future.set_exception(error)
+    return future
@@ -83,6 +83,13 @@ class WorkflowBlock(ABC):
     def get_init_parameters(cls) -> List[str]:
         return []
 
+    @classmethod
+    def is_stateless(cls) -> bool:
+        """Blocks keeping no state between runs may opt-in - only then Execution Engine
+        (with initialised block instances) may be shared among unrelated Workflow runs.
+        """
+        return False
+
     @classmethod
     @abstractmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
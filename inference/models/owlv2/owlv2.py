@@ -271,6 +271,9 @@ class LazyImageRetrievalWrapper:
                 if type(image_payload) is str:
                     image_payload = image_payload.encode("utf-8")
                 self._image_hash = hash_function(image_payload)
+            elif image_type is ImageType.BYTES:
+                # compressed image bytes uploaded directly - hashed the same way as base64 payload
+                self._image_hash = hash_function(image_payload)
             else:
                 # not clear that there is something safe or faster to do than just loading the numpy array
                 # and hashing that
@@ -35,5 +35,5 @@ class YOLOv5ObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
         Returns:
             Tuple[np.ndarray]: NumPy array representing the predictions.
         """
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})[0]
+        predictions = self.run_onnx_session(img_in)[0]
         return (predictions,)
@@ -38,7 +38,7 @@ class YOLOv8InstanceSegmentation(InstanceSegmentationBaseOnnxRoboflowInferenceMo
         Returns:
             Tuple[np.ndarray, np.ndarray]: Tuple containing two NumPy arrays representing the predictions and protos. The predictions include boxes, confidence scores, class confidence scores, and masks.
         """
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})
+        predictions = self.run_onnx_session(img_in)
         protos = predictions[1]
         predictions = predictions[0]
         predictions = predictions.transpose(0, 2, 1)
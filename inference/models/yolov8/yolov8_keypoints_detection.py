@@ -40,7 +40,7 @@ class YOLOv8KeypointsDetection(KeypointsDetectionBaseOnnxRoboflowInferenceModel)
         Returns:
             Tuple[np.ndarray]: NumPy array representing the predictions, including boxes, confidence scores, and class confidence scores.
         """
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})[0]
+        predictions = self.run_onnx_session(img_in)[0]
         predictions = predictions.transpose(0, 2, 1)
         boxes = predictions[:, :, :4]
         number_of_classes = len(self.get_class_names)
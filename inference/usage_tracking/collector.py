@@ -607,7 +607,7 @@ class UsageCollector:
             if not isinstance(images, list):
                 images = [images]
             image = images[0]
-            if isinstance(image, dict):
+            if isinstance(image, dict) and image.get("type") != "bytes":
                 source = image.get("value")
             elif hasattr(image, "_image_reference"):
                 source = image._image_reference
@@ -35,6 +35,14 @@ from inference_sdk.http.utils.aliases import (
     resolve_ocr_path,
     resolve_roboflow_model_alias,
 )
+from inference_sdk.http.utils.columnar import (
+    MSGPACK_MEDIA_TYPE,
+    adjust_columnar_prediction_to_client_scaling_factor,
+    columnar_predictions_to_detections,
+    decode_msgpack_payload,
+    is_columnar_prediction,
+    is_msgpack_response,
+)
 from inference_sdk.http.utils.executors import (
     RequestMethod,
     execute_requests_packages,
@@ -80,6 +88,7 @@ NEW_INFERENCE_ENDPOINTS = {
     CLASSIFICATION_TASK: "/infer/classification",
     KEYPOINTS_DETECTION_TASK: "/infer/keypoints_detection",
 }
+COLUMNAR_PREDICTIONS_TASKS = {INSTANCE_SEGMENTATION_TASK, OBJECT_DETECTION_TASK}
 CLIP_ARGUMENT_TYPES = {"image", "text"}
 
 BufferFillingStrategy = Literal[
@@ -626,14 +635,19 @@ class InferenceHTTPClient:
                 task_type=model_description.task_type,
             )
         )
+        columnar_predictions = self.__columnar_predictions_requested(
+            task_type=model_description.task_type
+        )
         requests_data = prepare_requests_data(
             url=f"{self.__api_url}{endpoint}",
             encoded_inference_inputs=encoded_inference_inputs,
-            headers=DEFAULT_HEADERS,
+            headers=_get_v1_inference_headers(
+                columnar_predictions=columnar_predictions
+            ),
             parameters=None,
             payload=payload,
             max_batch_size=self.__inference_configuration.max_batch_size,
-            image_placement=ImagePlacement.JSON,
+            image_placement=self.__select_image_placement(),
         )
         responses = execute_requests_packages(
             requests_data=requests_data,
@@ -642,24 +656,21 @@ class InferenceHTTPClient:
         )
         results = []
         for request_data, response in zip(requests_data, responses):
-            parsed_response = response.json()
+            if is_msgpack_response(content_type=response.headers.get("Content-Type")):
+                parsed_response = decode_msgpack_payload(payload=response.content)
+            else:
+                parsed_response = response.json()
             if not issubclass(type(parsed_response), list):
                 parsed_response = [parsed_response]
             for parsed_response_element, scaling_factor in zip(
                 parsed_response, request_data.image_scaling_factors
             ):
-                if parsed_response_element.get("visualization") is not None:
-                    parsed_response_element["visualization"] = (
-                        transform_base64_visualisation(
-                            visualisation=parsed_response_element["visualization"],
-                            expected_format=self.__inference_configuration.output_visualisation_format,
-                        )
+                results.append(
+                    self.__post_process_v1_response_element(
+                        parsed_response_element=parsed_response_element,
+                        scaling_factor=scaling_factor,
                     )
-                parsed_response_element = adjust_prediction_to_client_scaling_factor(
-                    prediction=parsed_response_element,
-                    scaling_factor=scaling_factor,
                 )
-                results.append(parsed_response_element)
         return unwrap_single_element_list(sequence=results)
 
     async def infer_from_api_v1_async(
@@ -699,14 +710,19 @@ class InferenceHTTPClient:
                 task_type=model_description.task_type,
             )
         )
+        columnar_predictions = self.__columnar_predictions_requested(
+            task_type=model_description.task_type
+        )
         requests_data = prepare_requests_data(
             url=f"{self.__api_url}{endpoint}",
             encoded_inference_inputs=encoded_inference_inputs,
-            headers=DEFAULT_HEADERS,
+            headers=_get_v1_inference_headers(
+                columnar_predictions=columnar_predictions
+            ),
             parameters=None,
             payload=payload,
             max_batch_size=self.__inference_configuration.max_batch_size,
-            image_placement=ImagePlacement.JSON,
+            image_placement=self.__select_image_placement(),
         )
         responses = await execute_requests_packages_async(
             requests_data=requests_data,
@@ -715,25 +731,65 @@ class InferenceHTTPClient:
         )
         results = []
         for request_data, parsed_response in zip(requests_data, responses):
+            # msgpack responses are decoded by executor, based on `Content-Type`
             if not issubclass(type(parsed_response), list):
                 parsed_response = [parsed_response]
             for parsed_response_element, scaling_factor in zip(
                 parsed_response, request_data.image_scaling_factors
             ):
-                if parsed_response_element.get("visualization") is not None:
-                    parsed_response_element["visualization"] = (
-                        transform_base64_visualisation(
-                            visualisation=parsed_response_element["visualization"],
-                            expected_format=self.__inference_configuration.output_visualisation_format,
-                        )
+                results.append(
+                    self.__post_process_v1_response_element(
+                        parsed_response_element=parsed_response_element,
+                        scaling_factor=scaling_factor,
                     )
-                parsed_response_element = adjust_prediction_to_client_scaling_factor(
-                    prediction=parsed_response_element,
-                    scaling_factor=scaling_factor,
                 )
-                results.append(parsed_response_element)
         return unwrap_single_element_list(sequence=results)
 
+    def __select_image_placement(self) -> ImagePlacement:
+        # hosted Roboflow APIs (v0 mode) only accept base64 images
+        if (
+            self.__inference_configuration.multipart_image_uploads
+            and self.__client_mode is HTTPClientMode.V1
+        ):
+            return ImagePlacement.MULTIPART
+        return ImagePlacement.JSON
+
+    def __columnar_predictions_requested(self, task_type: str) -> bool:
+        return (
+            self.__inference_configuration.columnar_predictions
+            and task_type in COLUMNAR_PREDICTIONS_TASKS
+        )
+
+    def __post_process_v1_response_element(
+        self,
+        parsed_response_element: dict,
+        scaling_factor: Optional[float],
+    ) -> dict:
+        visualisation = parsed_response_element.get("visualization")
+        if isinstance(visualisation, bytes):
+            parsed_response_element["visualization"] = transform_visualisation_bytes(
+                visualisation=visualisation,
+                expected_format=self.__inference_configuration.output_visualisation_format,
+            )
+        elif visualisation is not None:
+            parsed_response_element["visualization"] = transform_base64_visualisation(
+                visualisation=visualisation,
+                expected_format=self.__inference_configuration.output_visualisation_format,
+            )
+        if not is_columnar_prediction(prediction=parsed_response_element):
+            return adjust_prediction_to_client_scaling_factor(
+                prediction=parsed_response_element,
+                scaling_factor=scaling_factor,
+            )
+        parsed_response_element = adjust_columnar_prediction_to_client_scaling_factor(
+            prediction=parsed_response_element,
+            scaling_factor=scaling_factor,
+        )
+        parsed_response_element["predictions"] = columnar_predictions_to_detections(
+            prediction=parsed_response_element
+        )
+        return parsed_response_element
+
     def get_model_description(
         self, model_id: str, allow_loading: bool = True
     ) -> ModelDescription:
@@ -2059,7 +2115,7 @@ class InferenceHTTPClient:
             parameters=None,
             payload=payload,
             max_batch_size=self.__inference_configuration.max_batch_size,
-            image_placement=ImagePlacement.JSON,
+            image_placement=self.__select_image_placement(),
         )
         responses = execute_requests_packages(
             requests_data=requests_data,
@@ -2092,7 +2148,7 @@ class InferenceHTTPClient:
             parameters=None,
             payload=payload,
             max_batch_size=self.__inference_configuration.max_batch_size,
-            image_placement=ImagePlacement.JSON,
+            image_placement=self.__select_image_placement(),
         )
         responses = await execute_requests_packages_async(
             requests_data=requests_data,
@@ -2132,6 +2188,12 @@ def _determine_client_downsizing_parameters(
     return model_description.input_height, model_description.input_width
 
 
+def _get_v1_inference_headers(columnar_predictions: bool) -> Dict[str, str]:
+    if not columnar_predictions:
+        return DEFAULT_HEADERS
+    return {**DEFAULT_HEADERS, "Accept": MSGPACK_MEDIA_TYPE}
+
+
 def _determine_client_mode(api_url: str) -> HTTPClientMode:
     if any(api_url.startswith(roboflow_url) for roboflow_url in ALL_ROBOFLOW_API_URLS):
         return HTTPClientMode.V0
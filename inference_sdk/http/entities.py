@@ -113,6 +113,11 @@ class InferenceConfiguration:
         max_detections: The maximum number of detections for the inference.
         iou_threshold: The intersection over union threshold for the inference.
         stroke_width: The stroke width for the inference.
+        columnar_predictions: If true, object detection and instance segmentation models
+            respond with columns of predictions encoded with msgpack - returned
+            as `sv.Detections` under `predictions` key.
+        multipart_image_uploads: If true, images are sent to model endpoints as raw
+            bytes in `multipart/form-data` body - instead of base64 strings in JSON.
     """
 
     confidence_threshold: Optional[float] = None
@@ -150,6 +155,8 @@ class InferenceConfiguration:
     source: Optional[str] = None
     source_info: Optional[str] = None
     profiling_directory: str = "./inference_profiling"
+    columnar_predictions: bool = False
+    multipart_image_uploads: bool = False
 
     @classmethod
     def init_default(cls) -> "InferenceConfiguration":
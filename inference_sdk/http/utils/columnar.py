@@ -0,0 +1,132 @@
+from typing import Any, Optional
+
+import msgpack
+import numpy as np
+import supervision as sv
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+NDARRAY_MARKER = "__ndarray__"
+
+
+def decode_msgpack_payload(payload: bytes) -> Any:
+    """Decode a msgpack response of inference server.
+
+    Args:
+        payload: The bytes of response.
+
+    Returns:
+        Decoded response, with columns of predictions restored as numpy arrays.
+    """
+    return msgpack.unpackb(payload, object_hook=_decode_ndarray, raw=False)
+
+
+def is_msgpack_response(content_type: Optional[str]) -> bool:
+    """Check if response of inference server is encoded with msgpack.
+
+    Args:
+        content_type: The `Content-Type` header of response.
+
+    Returns:
+        True if response is encoded with msgpack, False otherwise.
+    """
+    if not content_type:
+        return False
+    return content_type.split(";")[0].strip().lower() == MSGPACK_MEDIA_TYPE
+
+
+def _decode_ndarray(obj: dict) -> Any:
+    if not obj.get(NDARRAY_MARKER):
+        return obj
+    return np.frombuffer(obj["data"], dtype=np.dtype(obj["dtype"])).reshape(
+        obj["shape"]
+    )
+
+
+def is_columnar_prediction(prediction: dict) -> bool:
+    """Check if predictions of the response are stored column-wise.
+
+    Args:
+        prediction: The prediction to check.
+
+    Returns:
+        True if predictions are stored column-wise, False otherwise.
+    """
+    return isinstance(prediction.get("predictions"), dict) and (
+        "xyxy" in prediction["predictions"]
+    )
+
+
+def adjust_columnar_prediction_to_client_scaling_factor(
+    prediction: dict,
+    scaling_factor: Optional[float],
+) -> dict:
+    """Adjust a prediction with columns of detections to the client scaling factor.
+
+    Args:
+        prediction: The prediction to adjust.
+        scaling_factor: The scaling factor.
+
+    Returns:
+        The adjusted prediction.
+    """
+    if scaling_factor is None:
+        return prediction
+    if "image" in prediction:
+        prediction["image"] = {
+            "width": round(prediction["image"]["width"] / scaling_factor),
+            "height": round(prediction["image"]["height"] / scaling_factor),
+        }
+    columns = prediction["predictions"]
+    columns["xyxy"] = columns["xyxy"] / scaling_factor
+    if columns.get("points") is not None:
+        columns["points"] = columns["points"] / scaling_factor
+    return prediction
+
+
+def columnar_predictions_to_detections(prediction: dict) -> sv.Detections:
+    """Convert columns of detections into `sv.Detections` - without going through
+    dictionary for each detection.
+
+    Instance polygons are rasterised into masks the same way as in
+    `sv.Detections.from_inference(...)` - including dropping instances with polygons
+    of less than 3 points.
+
+    Args:
+        prediction: The prediction with columns of detections.
+
+    Returns:
+        The detections.
+    """
+    columns = prediction["predictions"]
+    xyxy = np.asarray(columns["xyxy"], dtype=np.float64).reshape(-1, 4)
+    to_keep = np.ones((len(xyxy),), dtype=bool)
+    mask = None
+    if columns.get("points") is not None:
+        resolution_wh = (
+            int(prediction["image"]["width"]),
+            int(prediction["image"]["height"]),
+        )
+        points, offsets = columns["points"], columns["points_offsets"]
+        masks = []
+        for i in range(len(xyxy)):
+            polygon = points[offsets[i] : offsets[i + 1]]
+            if len(polygon) < 3:
+                to_keep[i] = False
+                continue
+            masks.append(
+                sv.polygon_to_mask(polygon.astype(int), resolution_wh=resolution_wh)
+            )
+        if masks:
+            mask = np.array(masks, dtype=bool)
+    if not to_keep.any():
+        return sv.Detections.empty()
+    return sv.Detections(
+        xyxy=xyxy[to_keep],
+        mask=mask,
+        confidence=np.asarray(columns["confidence"], dtype=np.float64)[to_keep],
+        class_id=np.asarray(columns["class_id"]).astype(int)[to_keep],
+        data={
+            "class_name": np.array(columns["class_name"])[to_keep],
+            "detection_id": np.array(columns["detection_id"])[to_keep],
+        },
+    )
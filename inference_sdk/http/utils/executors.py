@@ -16,6 +16,10 @@ from aiohttp import (
 )
 from requests import Response
 
+from inference_sdk.http.utils.columnar import (
+    decode_msgpack_payload,
+    is_msgpack_response,
+)
 from inference_sdk.http.utils.iterables import make_batches
 from inference_sdk.http.utils.request_building import RequestData
 from inference_sdk.http.utils.requests import api_key_safe_raise_for_status
@@ -243,10 +247,13 @@ async def make_request_async(
         data=request_data.data,
         json=request_data.payload,
     ) as response:
-        try:
-            response_data = await response.json()
-        except:
-            response_data = await response.read()
+        if is_msgpack_response(content_type=response.headers.get("Content-Type")):
+            response_data = decode_msgpack_payload(payload=await response.read())
+        else:
+            try:
+                response_data = await response.json()
+            except:
+                response_data = await response.read()
         if response_is_not_retryable_error(response=response):
             response.raise_for_status()
         return response.status, response_data
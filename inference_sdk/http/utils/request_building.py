@@ -4,12 +4,16 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from inference_sdk.http.utils.iterables import make_batches
-from inference_sdk.http.utils.requests import inject_images_into_payload
+from inference_sdk.http.utils.requests import (
+    encode_images_as_multipart_body,
+    inject_images_into_payload,
+)
 
 
 class ImagePlacement(Enum):
     DATA = "data"
     JSON = "json"
+    MULTIPART = "multipart"
 
 
 @dataclass(frozen=True)
@@ -112,6 +116,13 @@ def assembly_request_data(
         )
     elif image_placement is ImagePlacement.DATA:
         data = batch_inference_inputs[0][0]
+    elif image_placement is ImagePlacement.MULTIPART:
+        data, content_type = encode_images_as_multipart_body(
+            payload=payload if payload is not None else {},
+            encoded_images=batch_inference_inputs,
+        )
+        headers = {**(headers or {}), "Content-Type": content_type}
+        payload = None
     else:
         raise NotImplemented(
             f"Not implemented request building method for {image_placement}"
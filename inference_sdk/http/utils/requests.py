@@ -1,7 +1,10 @@
+import base64
+import json
 import re
 from typing import List, Optional, Tuple, Union
 
 from requests import Response
+from urllib3 import encode_multipart_formdata
 
 API_KEY_PATTERN = re.compile(r"api_key=(.[^&]*)")
 KEY_VALUE_GROUP = 1
@@ -77,6 +80,39 @@ def inject_images_into_payload(
     return payload
 
 
+def encode_images_as_multipart_body(
+    payload: dict,
+    encoded_images: List[Tuple[str, Optional[float]]],
+    key: str = "image",
+    request_field: str = "request",
+) -> Tuple[bytes, str]:
+    """Encode images as file parts of `multipart/form-data` body - sent as raw bytes,
+    without base64 overhead.
+
+    Args:
+        payload: The rest of the payload - sent as JSON in `request_field` part.
+        encoded_images: The encoded images.
+        key: The name of parts with images.
+        request_field: The name of part with the payload.
+
+    Returns:
+        The body and the value of `Content-Type` header.
+    """
+    fields = [(request_field, json.dumps(payload))]
+    for image_id, (image, _) in enumerate(encoded_images):
+        fields.append(
+            (
+                key,
+                (
+                    f"{key}_{image_id}",
+                    base64.b64decode(image),
+                    "application/octet-stream",
+                ),
+            )
+        )
+    return encode_multipart_formdata(fields)
+
+
 def inject_nested_batches_of_images_into_payload(
     payload: dict,
     encoded_images: Union[list, Tuple[str, Optional[float]]],
@@ -0,0 +1,282 @@
+import base64
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator, List, Optional
+
+import pytest
+
+from inference.core.cache.downloads import download_file, file_lock
+from inference.core.exceptions import ModelArtefactError
+
+CONTENT = os.urandom(256 * 1024)
+
+
+class ArtefactsServer:
+    def __init__(self):
+        self.files = {"/weights.onnx": CONTENT, "/other.bin": CONTENT[:1000]}
+        self.announced_md5 = {}
+        self.support_ranges = True
+        self.drop_connections_after: List[int] = []
+        self.requests: List[Optional[str]] = []
+        self.lock = threading.Lock()
+
+
+@pytest.fixture
+def server() -> Generator[ArtefactsServer, None, None]:
+    state = ArtefactsServer()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            with state.lock:
+                state.requests.append(self.headers.get("Range"))
+                drop_after = (
+                    state.drop_connections_after.pop(0)
+                    if state.drop_connections_after
+                    else None
+                )
+            content = state.files.get(self.path)
+            if content is None:
+                self.send_response(404)
+                self.end_headers()
+                return None
+            start = 0
+            requested_range = self.headers.get("Range")
+            if requested_range and state.support_ranges:
+                start = int(requested_range[len("bytes=") : -1])
+                if start >= len(content):
+                    self.send_response(416)
+                    self.end_headers()
+                    return None
+                self.send_response(206)
+                self.send_header(
+                    "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+                )
+            else:
+                self.send_response(200)
+            md5 = state.announced_md5.get(self.path, hashlib.md5(content).digest())
+            self.send_header(
+                "x-goog-hash", f"crc32c=AAAAAA==,md5={base64.b64encode(md5).decode()}"
+            )
+            self.send_header("Content-Length", str(len(content) - start))
+            self.end_headers()
+            body = content[start:]
+            if drop_after is not None:
+                body = body[:drop_after]
+            self.wfile.write(body)
+            if drop_after is not None:
+                self.wfile.flush()
+                self.close_connection = True
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    http_server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    state.url = f"http://127.0.0.1:{http_server.server_address[1]}"
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    yield state
+    http_server.shutdown()
+    http_server.server_close()
+
+
+def test_download_file(server: ArtefactsServer, tmp_path) -> None:
+    # given
+    target_path = os.path.join(tmp_path, "model", "weights.onnx")
+
+    # when
+    download_file(url=f"{server.url}/weights.onnx", target_path=target_path)
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT
+    assert not os.path.exists(f"{target_path}.part")
+    assert server.requests == [None]
+
+
+def test_download_file_resumes_interrupted_transfer(
+    server: ArtefactsServer, tmp_path
+) -> None:
+    # given
+    target_path = os.path.join(tmp_path, "weights.onnx")
+    server.drop_connections_after = [1000, 5000]
+
+    # when
+    download_file(
+        url=f"{server.url}/weights.onnx", target_path=target_path, retry_backoff=0
+    )
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT
+    assert server.requests == [None, "bytes=1000-", "bytes=6000-"]
+
+
+def test_download_file_resumes_partial_file_left_by_other_process(
+    server: ArtefactsServer, tmp_path
+) -> None:
+    # given
+    target_path = os.path.join(tmp_path, "weights.onnx")
+    with open(f"{target_path}.part", "wb") as f:
+        f.write(CONTENT[:100])
+
+    # when
+    download_file(url=f"{server.url}/weights.onnx", target_path=target_path)
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT
+    assert server.requests == ["bytes=100-"]
+
+
+def test_download_file_when_server_does_not_support_ranges(
+    server: ArtefactsServer, tmp_path
+) -> None:
+    # given
+    target_path = os.path.join(tmp_path, "weights.onnx")
+    server.support_ranges = False
+    server.drop_connections_after = [1000]
+
+    # when
+    download_file(
+        url=f"{server.url}/weights.onnx", target_path=target_path, retry_backoff=0
+    )
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT
+    assert server.requests == [None, "bytes=1000-"]
+
+
+def test_download_file_when_partial_file_cannot_be_resumed(
+    server: ArtefactsServer, tmp_path
+) -> None:
+    # given
+    target_path = os.path.join(tmp_path, "other.bin")
+    with open(f"{target_path}.part", "wb") as f:
+        f.write(CONTENT[:2000])
+
+    # when
+    download_file(
+        url=f"{server.url}/other.bin", target_path=target_path, retry_backoff=0
+    )
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT[:1000]
+    assert server.requests == ["bytes=2000-", None]
+
+
+def test_download_file_when_announced_checksum_does_not_match(
+    server: ArtefactsServer, tmp_path
+) -> None:
+    # given
+    target_path = os.path.join(tmp_path, "weights.onnx")
+    server.announced_md5["/weights.onnx"] = hashlib.md5(b"other").digest()
+
+    # when
+    with pytest.raises(ModelArtefactError):
+        download_file(url=f"{server.url}/weights.onnx", target_path=target_path)
+
+    # then
+    assert not os.path.exists(target_path)
+    assert not os.path.exists(f"{target_path}.part")
+
+
+def test_download_file_when_expected_sha256_given(
+    server: ArtefactsServer, tmp_path
+) -> None:
+    # given
+    target_path = os.path.join(tmp_path, "weights.onnx")
+
+    # when
+    download_file(
+        url=f"{server.url}/weights.onnx",
+        target_path=target_path,
+        expected_sha256=hashlib.sha256(CONTENT).hexdigest(),
+    )
+    with pytest.raises(ModelArtefactError):
+        download_file(
+            url=f"{server.url}/other.bin",
+            target_path=os.path.join(tmp_path, "other.bin"),
+            expected_sha256=hashlib.sha256(b"other").hexdigest(),
+        )
+
+    # then
+    assert os.path.isfile(target_path)
+    assert not os.path.exists(os.path.join(tmp_path, "other.bin"))
+
+
+def test_download_file_when_retries_are_exhausted(
+    server: ArtefactsServer, tmp_path
+) -> None:
+    # given
+    target_path = os.path.join(tmp_path, "weights.onnx")
+    server.drop_connections_after = [10, 10, 10]
+
+    # when
+    with pytest.raises(ModelArtefactError):
+        download_file(
+            url=f"{server.url}/weights.onnx",
+            target_path=target_path,
+            max_retries=2,
+            retry_backoff=0,
+        )
+
+    # then
+    assert not os.path.exists(target_path)
+    assert os.path.getsize(f"{target_path}.part") == 30
+
+
+def test_download_file_when_file_is_missing(server: ArtefactsServer, tmp_path) -> None:
+    # when
+    with pytest.raises(Exception):
+        download_file(
+            url=f"{server.url}/missing.onnx",
+            target_path=os.path.join(tmp_path, "missing.onnx"),
+        )
+
+    # then
+    assert not os.path.exists(os.path.join(tmp_path, "missing.onnx"))
+
+
+def test_download_file_is_performed_once_by_concurrent_workers(
+    server: ArtefactsServer, tmp_path
+) -> None:
+    # given
+    target_path = os.path.join(tmp_path, "weights.onnx")
+    workers = [
+        threading.Thread(
+            target=download_file,
+            kwargs={"url": f"{server.url}/weights.onnx", "target_path": target_path},
+        )
+        for _ in range(4)
+    ]
+
+    # when
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == CONTENT
+    assert server.requests == [None]
+
+
+def test_file_lock_when_lock_is_held(tmp_path) -> None:
+    # given
+    lock_path = os.path.join(tmp_path, "some.lock")
+
+    # when
+    with file_lock(path=lock_path):
+        with pytest.raises(TimeoutError):
+            with file_lock(path=lock_path, timeout=0.2):
+                pass
+    with file_lock(path=lock_path, timeout=0.2):
+        pass
+
+    # then
+    assert os.path.isfile(lock_path)
@@ -0,0 +1,89 @@
+import time
+
+from inference.core.cache.memory import MemoryCache
+
+
+def test_zadd_keeps_members_with_identical_scores() -> None:
+    # given
+    cache = MemoryCache()
+
+    # when
+    cache.zadd("some", value={"a": 1}, score=1.0)
+    cache.zadd("some", value={"b": 2}, score=1.0)
+    cache.zadd("some", value={"c": 3}, score=0.5)
+
+    # then
+    assert cache.zrangebyscore("some") == [{"c": 3}, {"a": 1}, {"b": 2}]
+
+
+def test_zrangebyscore_returns_members_within_inclusive_range() -> None:
+    # given
+    cache = MemoryCache()
+    for score in range(10):
+        cache.zadd("some", value=f"v{score}", score=score)
+
+    # when
+    result = cache.zrangebyscore("some", min=3, max=5, withscores=True)
+
+    # then
+    assert result == [("v3", 3), ("v4", 4), ("v5", 5)]
+
+
+def test_zrangebyscore_when_key_does_not_exist() -> None:
+    # given
+    cache = MemoryCache()
+
+    # when
+    result = cache.zrangebyscore("some")
+
+    # then
+    assert result == []
+
+
+def test_zremrangebyscore_removes_members_within_range() -> None:
+    # given
+    cache = MemoryCache()
+    for score in range(10):
+        cache.zadd("some", value=f"v{score}", score=score)
+    cache.zadd("some", value="duplicate", score=4)
+
+    # when
+    removed = cache.zremrangebyscore("some", min=2, max=4)
+
+    # then
+    assert removed == 4
+    assert cache.zrangebyscore("some") == [
+        f"v{score}" for score in [0, 1, 5, 6, 7, 8, 9]
+    ]
+
+
+def test_expired_entries_are_removed() -> None:
+    # given
+    cache = MemoryCache()
+    cache.set("key", "value", expire=0.01)
+    cache.set("other", "value", expire=10)
+    cache.zadd("some", value="short", score=1, expire=0.01)
+    cache.zadd("some", value="long", score=2, expire=10)
+
+    # when
+    time.sleep(0.02)
+    cache._remove_expired_entries(now=time.time())
+
+    # then
+    assert "key" not in cache.cache
+    assert cache.get("other") == "value"
+    assert cache.zrangebyscore("some") == ["long"]
+
+
+def test_set_again_replaces_previous_expiration() -> None:
+    # given
+    cache = MemoryCache()
+    cache.set("key", "old", expire=0.01)
+    cache.set("key", "new", expire=10)
+
+    # when
+    time.sleep(0.02)
+    cache._remove_expired_entries(now=time.time())
+
+    # then
+    assert cache.get("key") == "new"
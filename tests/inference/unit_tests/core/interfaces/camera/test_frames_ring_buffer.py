@@ -0,0 +1,86 @@
+import gc
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.exceptions import StaleFrameSlotError
+from inference.core.interfaces.camera.frames_ring_buffer import (
+    SharedMemoryFramesRingBuffer,
+    attach_frame_slot,
+    detach_frames_ring_buffers,
+    release_frame_slot,
+)
+
+
+def test_frames_ring_buffer_when_all_slots_are_leased() -> None:
+    # given
+    ring_buffer = SharedMemoryFramesRingBuffer(frame_shape=(4, 6, 3), slots=2)
+
+    try:
+        # when
+        first_image, first_reference = ring_buffer.acquire()
+        second_image, second_reference = ring_buffer.acquire()
+        exhausted_result = ring_buffer.acquire(timeout=0.01)
+        release_frame_slot(reference=first_reference)
+        release_frame_slot(reference=first_reference)
+        third_image, third_reference = ring_buffer.acquire()
+
+        # then
+        assert first_image.shape == (4, 6, 3)
+        assert first_image.dtype == np.uint8
+        assert first_reference.slot != second_reference.slot
+        assert exhausted_result is None, "No slot can be leased when all are in use"
+        assert third_reference.slot == first_reference.slot
+        assert third_reference.generation > first_reference.generation
+        assert ring_buffer.free_slots() == 0, "Repeated release must be ignored"
+    finally:
+        ring_buffer.close()
+
+
+def test_frames_ring_buffer_releases_slot_once_image_is_garbage_collected() -> None:
+    # given
+    ring_buffer = SharedMemoryFramesRingBuffer(frame_shape=(4, 6, 3), slots=1)
+
+    try:
+        image, _ = ring_buffer.acquire()
+        view = image[1:3]
+        del image
+        gc.collect()
+        slots_held_by_view = ring_buffer.free_slots()
+
+        # when
+        del view
+        gc.collect()
+
+        # then
+        assert slots_held_by_view == 0, "Slot must be held as long as views exist"
+        assert ring_buffer.free_slots() == 1
+    finally:
+        ring_buffer.close()
+
+
+def test_attach_frame_slot() -> None:
+    # given
+    ring_buffer = SharedMemoryFramesRingBuffer(frame_shape=(4, 6, 3), slots=2)
+    _ = ring_buffer.acquire()
+    image, reference = ring_buffer.acquire()
+    image[...] = 7
+
+    try:
+        # when
+        attached_image = attach_frame_slot(reference=reference)
+        attached_content = attached_image.copy()
+        is_writeable = attached_image.flags.writeable
+        del attached_image
+        ring_buffer.release(reference=reference)
+
+        # then
+        assert np.all(attached_content == 7), "Frame must be visible without copy"
+        assert attached_content.shape == (4, 6, 3)
+        assert is_writeable is False
+        with pytest.raises(StaleFrameSlotError):
+            _ = attach_frame_slot(reference=reference)
+    finally:
+        del image
+        ring_buffer.close()
+        detach_frames_ring_buffers()
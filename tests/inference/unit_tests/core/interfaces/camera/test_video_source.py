@@ -5,11 +5,14 @@ from threading import Thread
 from unittest import mock
 from unittest.mock import MagicMock, call, patch
 
+import av
 import cv2
 import numpy as np
 import pytest
 import supervision as sv
 
+from inference.core.env import VIDEO_SOURCE_SHARED_MEMORY_SLOTS
+from inference.core.exceptions import InvalidEnvironmentVariableError
 from inference.core.interfaces.camera import video_source
 from inference.core.interfaces.camera.entities import (
     StatusUpdate,
@@ -20,10 +23,15 @@ from inference.core.interfaces.camera.exceptions import (
     SourceConnectionError,
     StreamOperationNotAllowedError,
 )
+from inference.core.interfaces.camera.frames_ring_buffer import (
+    SharedMemoryFramesRingBuffer,
+)
 from inference.core.interfaces.camera.video_source import (
     BufferConsumptionStrategy,
     BufferFillingStrategy,
     CV2VideoFrameProducer,
+    DecodingMode,
+    KeyFramesVideoFrameProducer,
     SourceMetadata,
     SourceProperties,
     StreamState,
@@ -31,6 +39,7 @@ from inference.core.interfaces.camera.video_source import (
     VideoSource,
     decode_video_frame_to_buffer,
     drop_single_frame_from_buffer,
+    get_default_decoding_mode,
     get_fps_if_tick_happens_now,
     get_from_queue,
 )
@@ -1316,3 +1325,244 @@ def test_source_properties_initialized_on_video_source_using_string_values(
         ],
         any_order=True,
     )
+
+
+def test_decode_video_frame_to_buffer_when_frames_ring_buffer_given() -> None:
+    # given
+    video = MagicMock()
+
+    def retrieve_into(image: np.ndarray) -> tuple:
+        image[...] = 3
+        return True, image
+
+    video.retrieve_into.side_effect = retrieve_into
+    video.retrieve.return_value = (True, np.ones((4, 6, 3), dtype=np.uint8))
+    ring_buffer = SharedMemoryFramesRingBuffer(frame_shape=(4, 6, 3), slots=1)
+    buffer = Queue()
+
+    try:
+        # when
+        first_result = decode_video_frame_to_buffer(
+            frame_timestamp=datetime.now(),
+            frame_id=1,
+            video=video,
+            buffer=buffer,
+            decoding_pace_monitor=sv.FPSMonitor(),
+            source_id=3,
+            frames_ring_buffer=ring_buffer,
+        )
+        second_result = decode_video_frame_to_buffer(
+            frame_timestamp=datetime.now(),
+            frame_id=2,
+            video=video,
+            buffer=buffer,
+            decoding_pace_monitor=sv.FPSMonitor(),
+            source_id=3,
+            frames_ring_buffer=ring_buffer,
+        )
+        first_frame, second_frame = buffer.get_nowait(), buffer.get_nowait()
+
+        # then
+        assert first_result is True and second_result is True
+        assert first_frame.slot_reference is not None
+        assert first_frame.slot_reference.buffer_name == ring_buffer.name
+        assert np.all(first_frame.image == 3), "Frame must be decoded into the slot"
+        assert (
+            second_frame.slot_reference is None
+        ), "Frame must be allocated regularly when no slot is free"
+        assert np.all(second_frame.image == 1)
+        first_frame.release()
+        assert ring_buffer.free_slots() == 1
+    finally:
+        ring_buffer.close()
+
+
+def test_video_source_when_shared_memory_buffer_enabled(
+    local_video_path: str,
+) -> None:
+    # given
+    source = VideoSource.init(
+        video_reference=local_video_path, buffer_size=2, shared_memory_buffer=True
+    )
+
+    try:
+        # when
+        source.start()
+        frames = [source.read_frame() for _ in range(8)]
+
+        # then
+        assert all(f.slot_reference is not None for f in frames)
+        assert all(f.image.shape == (240, 426, 3) for f in frames)
+        assert [f.frame_id for f in frames] == list(range(1, 9))
+        assert (
+            source._frames_ring_buffer.slots == VIDEO_SOURCE_SHARED_MEMORY_SLOTS
+        ), "Expected number of slots not to depend on buffer size"
+        for frame in frames:
+            frame.release()
+    finally:
+        tear_down_source(source=source)
+
+
+@mock.patch.object(video_source, "get_shared_memory_free_space")
+def test_video_source_when_shared_memory_buffer_does_not_fit_in_shared_memory(
+    get_shared_memory_free_space_mock: MagicMock,
+    local_video_path: str,
+) -> None:
+    # given
+    get_shared_memory_free_space_mock.return_value = 1024
+    source = VideoSource.init(
+        video_reference=local_video_path, buffer_size=2, shared_memory_buffer=True
+    )
+
+    try:
+        # when
+        source.start()
+        frames = [source.read_frame() for _ in range(4)]
+
+        # then
+        assert all(f.slot_reference is None for f in frames)
+        assert all(f.image.shape == (240, 426, 3) for f in frames)
+        assert [f.frame_id for f in frames] == list(range(1, 5))
+    finally:
+        tear_down_source(source=source)
+
+
+def test_stream_consumption_in_skip_decode_mode_seeks_over_file_frames() -> None:
+    # given
+    consumer = VideoConsumer.init(
+        buffer_filling_strategy=None,
+        adaptive_mode_stream_pace_tolerance=0.1,
+        adaptive_mode_reader_pace_tolerance=5.0,
+        minimum_adaptive_mode_samples=10,
+        maximum_adaptive_frames_dropped_in_row=16,
+        status_update_handlers=[],
+        desired_fps=1,
+        decoding_mode=DecodingMode.SKIP_DECODE,
+    )
+    video = MagicMock()
+    video.grab.return_value = True
+    video.retrieve.return_value = (True, np.zeros((128, 128, 3), dtype=np.uint8))
+    video.get_position.return_value = None
+    video.seek.return_value = True
+    source_properties = assembly_dummy_source_properties(is_file=True, fps=30.0)
+    video.discover_source_properties.return_value = source_properties
+    buffer = Queue()
+
+    # when
+    consumer.reset(source_properties=source_properties)
+    results = [
+        consumer.consume_frame(
+            video=video,
+            declared_source_fps=source_properties.fps,
+            is_source_video_file=source_properties.is_file,
+            buffer=buffer,
+            frames_buffering_allowed=True,
+        )
+        for _ in range(2)
+    ]
+
+    # then
+    assert results == [True, True]
+    video.seek.assert_called_once_with(position=30)
+    assert video.grab.call_count == 2, "Skipped frames must not be grabbed"
+    assert [buffer.get_nowait().frame_id for _ in range(2)] == [1, 31]
+
+
+@pytest.mark.timeout(90)
+@pytest.mark.slow
+def test_consumption_of_video_file_in_key_frames_only_mode(
+    local_video_path: str,
+) -> None:
+    # given
+    source = VideoSource.init(
+        video_reference=local_video_path,
+        decoding_mode=DecodingMode.KEY_FRAMES_ONLY,
+    )
+
+    try:
+        # when
+        source.start()
+        frames = list(source)
+
+        # then
+        assert [f.frame_id for f in frames] == [1, 92, 183, 274, 365]
+        assert all(f.image.shape == (240, 426, 3) for f in frames)
+    finally:
+        tear_down_source(source=source)
+
+
+@pytest.mark.timeout(90)
+@pytest.mark.slow
+def test_consumption_of_video_file_with_desired_fps_in_skip_decode_mode(
+    local_video_path: str,
+) -> None:
+    # given
+    source = VideoSource.init(
+        video_reference=local_video_path,
+        desired_fps=1,
+        decoding_mode=DecodingMode.SKIP_DECODE,
+    )
+
+    try:
+        # when
+        source.start()
+        frames_ids = [f.frame_id for f in source]
+
+        # then
+        assert frames_ids == list(range(1, 432, 30))
+    finally:
+        tear_down_source(source=source)
+
+
+@pytest.mark.parametrize(
+    "decoding_mode, expected_result",
+    [
+        ("FULL", DecodingMode.FULL),
+        ("skip_decode", DecodingMode.SKIP_DECODE),
+        (" Key_Frames_Only ", DecodingMode.KEY_FRAMES_ONLY),
+    ],
+)
+def test_get_default_decoding_mode(
+    decoding_mode: str, expected_result: DecodingMode
+) -> None:
+    # when
+    result = get_default_decoding_mode(decoding_mode=decoding_mode)
+
+    # then
+    assert result is expected_result
+
+
+def test_get_default_decoding_mode_when_mode_is_not_known() -> None:
+    # when
+    with pytest.raises(InvalidEnvironmentVariableError):
+        _ = get_default_decoding_mode(decoding_mode="key-frames")
+
+
+def test_key_frames_producer_discovers_properties_of_container_without_frames_count(
+    tmp_path,
+) -> None:
+    # given
+    video_path = str(tmp_path / "video.mkv")
+    container = av.open(video_path, "w")
+    stream = container.add_stream("mpeg4", rate=10)
+    stream.width, stream.height, stream.pix_fmt = 64, 48, "yuv420p"
+    for i in range(20):
+        frame = np.full((48, 64, 3), i * 10, dtype=np.uint8)
+        for packet in stream.encode(av.VideoFrame.from_ndarray(frame, format="bgr24")):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+    producer = KeyFramesVideoFrameProducer(video=video_path)
+
+    try:
+        # when
+        result = producer.discover_source_properties()
+    finally:
+        producer.release()
+
+    # then
+    assert result.is_file is True
+    assert result.total_frames == 20
+    assert result.fps == 10.0
+    assert (result.width, result.height) == (64, 48)
@@ -0,0 +1,198 @@
+from unittest.mock import MagicMock
+
+from inference.core.interfaces.http.handlers.execution_engines_cache import (
+    ExecutionEnginesCache,
+    RequestScopedBackgroundTasks,
+    bind_background_tasks,
+)
+from inference.core.workflows.execution_engine.v1.executor.utils import (
+    run_steps_in_parallel,
+)
+
+DEFINITION = {"version": "1.0", "inputs": [], "steps": [], "outputs": []}
+
+
+def _stateless_engine() -> MagicMock:
+    engine = MagicMock()
+    engine.has_stateful_steps.return_value = False
+    return engine
+
+
+def test_get_or_init_reuses_engine_for_the_same_definition() -> None:
+    # given
+    cache = ExecutionEnginesCache(cache_size=4)
+    init_engine = MagicMock(side_effect=_stateless_engine)
+
+    # when
+    first = cache.get_or_init(
+        workflow_definition=DEFINITION,
+        api_key="key",
+        workflow_id="a",
+        init_engine=init_engine,
+    )
+    second = cache.get_or_init(
+        workflow_definition=dict(reversed(list(DEFINITION.items()))),
+        api_key="key",
+        workflow_id="a",
+        init_engine=init_engine,
+    )
+    other_api_key = cache.get_or_init(
+        workflow_definition=DEFINITION,
+        api_key="other",
+        workflow_id="a",
+        init_engine=init_engine,
+    )
+
+    # then
+    assert first is second
+    assert other_api_key is not first
+    assert init_engine.call_count == 2
+
+
+def test_get_or_init_evicts_least_recently_used_engine() -> None:
+    # given
+    cache = ExecutionEnginesCache(cache_size=2)
+    for workflow_id in ["a", "b"]:
+        cache.get_or_init(
+            workflow_definition=DEFINITION,
+            api_key="key",
+            workflow_id=workflow_id,
+            init_engine=_stateless_engine,
+        )
+    cache.get_or_init(
+        workflow_definition=DEFINITION,
+        api_key="key",
+        workflow_id="a",
+        init_engine=_stateless_engine,
+    )
+
+    # when
+    cache.get_or_init(
+        workflow_definition=DEFINITION,
+        api_key="key",
+        workflow_id="c",
+        init_engine=_stateless_engine,
+    )
+    init_engine = MagicMock()
+    cache.get_or_init(
+        workflow_definition=DEFINITION,
+        api_key="key",
+        workflow_id="a",
+        init_engine=init_engine,
+    )
+
+    # then
+    assert len(cache) == 2
+    init_engine.assert_not_called()
+
+
+def test_get_or_init_drops_engine_when_definition_of_workflow_changes() -> None:
+    # given
+    cache = ExecutionEnginesCache(cache_size=4)
+    identity = ("workspace", "a", "key")
+    cache.get_or_init(
+        workflow_definition=DEFINITION,
+        api_key="key",
+        workflow_id="a",
+        init_engine=_stateless_engine,
+        identity=identity,
+    )
+
+    # when
+    cache.get_or_init(
+        workflow_definition={**DEFINITION, "steps": [{"name": "x"}]},
+        api_key="key",
+        workflow_id="a",
+        init_engine=_stateless_engine,
+        identity=identity,
+    )
+
+    # then
+    assert len(cache) == 1
+
+
+def test_invalidate_drops_engine_of_workflow() -> None:
+    # given
+    cache = ExecutionEnginesCache(cache_size=4)
+    identity = ("workspace", "a", "key")
+    cache.get_or_init(
+        workflow_definition=DEFINITION,
+        api_key="key",
+        workflow_id="a",
+        init_engine=_stateless_engine,
+        identity=identity,
+    )
+
+    # when
+    cache.invalidate(identity=identity)
+
+    # then
+    assert len(cache) == 0
+
+
+def test_get_or_init_when_cache_disabled() -> None:
+    # given
+    cache = ExecutionEnginesCache(cache_size=0)
+    init_engine = MagicMock(side_effect=_stateless_engine)
+
+    # when
+    for _ in range(2):
+        cache.get_or_init(
+            workflow_definition=DEFINITION,
+            api_key="key",
+            workflow_id="a",
+            init_engine=init_engine,
+        )
+
+    # then
+    assert init_engine.call_count == 2
+    assert len(cache) == 0
+
+
+def test_get_or_init_does_not_cache_engines_with_stateful_steps() -> None:
+    # given
+    cache = ExecutionEnginesCache(cache_size=4)
+    init_engine = MagicMock(side_effect=lambda: MagicMock())
+
+    # when
+    first = cache.get_or_init(
+        workflow_definition=DEFINITION,
+        api_key="key",
+        workflow_id="a",
+        init_engine=init_engine,
+    )
+    second = cache.get_or_init(
+        workflow_definition=DEFINITION,
+        api_key="key",
+        workflow_id="a",
+        init_engine=init_engine,
+    )
+
+    # then
+    assert first is not second
+    assert init_engine.call_count == 2
+    assert len(cache) == 0
+
+
+def test_request_scoped_background_tasks_delegates_to_bound_tasks_in_step_threads() -> (
+    None
+):
+    # given
+    background_tasks = MagicMock()
+    proxy = RequestScopedBackgroundTasks()
+
+    def step() -> bool:
+        if proxy:
+            proxy.add_task(print, "a")
+            return True
+        return False
+
+    # when
+    with bind_background_tasks(background_tasks=background_tasks):
+        results = run_steps_in_parallel(steps=[step, step], max_workers=2)
+    result_without_tasks = step()
+
+    # then
+    assert results == [True, True]
+    assert result_without_tasks is False
+    assert background_tasks.add_task.call_count == 2
@@ -0,0 +1,197 @@
+import json
+
+import cv2
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from inference.core.entities.requests.inference import ObjectDetectionInferenceRequest
+from inference.core.entities.requests.workflows import (
+    WorkflowSpecificationInferenceRequest,
+)
+from inference.core.interfaces.http.binary_uploads import (
+    BinaryUploadsRoute,
+    accepts_list,
+)
+from inference.core.utils.image_utils import load_image
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.router.route_class = BinaryUploadsRoute
+
+    @app.post("/infer/object_detection")
+    async def infer(inference_request: ObjectDetectionInferenceRequest):
+        images = inference_request.image
+        if not isinstance(images, list):
+            images = [images]
+        return {
+            "model_id": inference_request.model_id,
+            "confidence": inference_request.confidence,
+            "class_filter": inference_request.class_filter,
+            "images_types": [i.type for i in images],
+            "images_shapes": [list(load_image(i)[0].shape) for i in images],
+        }
+
+    @app.post("/workflows/run")
+    async def run(workflow_request: WorkflowSpecificationInferenceRequest):
+        return {
+            "api_key": workflow_request.api_key,
+            "specification": workflow_request.specification,
+            "inputs": {
+                name: _describe_workflow_input(value=value)
+                for name, value in workflow_request.inputs.items()
+            },
+        }
+
+    return TestClient(app)
+
+
+def _describe_workflow_input(value):
+    if isinstance(value, list):
+        return [v["type"] for v in value]
+    if isinstance(value, dict):
+        return value["type"]
+    return value
+
+
+def _encode_image(height: int = 32, width: int = 48) -> bytes:
+    return cv2.imencode(".jpg", np.zeros((height, width, 3), dtype=np.uint8))[
+        1
+    ].tobytes()
+
+
+def test_json_request_is_handled_as_before(client: TestClient) -> None:
+    # when
+    response = client.post(
+        "/infer/object_detection",
+        json={"model_id": "some/1", "class_filter": ["car"]},
+    )
+
+    # then
+    assert response.status_code == 422, "Missing image must be reported as before"
+
+
+def test_multipart_request_with_single_image(client: TestClient) -> None:
+    # when
+    response = client.post(
+        "/infer/object_detection",
+        data={"model_id": "some/1", "confidence": "0.25", "class_filter": "car"},
+        files={"image": ("image.jpg", _encode_image(), "image/jpeg")},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.json() == {
+        "model_id": "some/1",
+        "confidence": 0.25,
+        "class_filter": ["car"],
+        "images_types": ["bytes"],
+        "images_shapes": [[32, 48, 3]],
+    }
+
+
+def test_multipart_request_with_batch_of_images_and_request_field(
+    client: TestClient,
+) -> None:
+    # when
+    response = client.post(
+        "/infer/object_detection",
+        data={"request": json.dumps({"model_id": "some/1", "confidence": 0.5})},
+        files=[
+            ("image", ("a.jpg", _encode_image(), "image/jpeg")),
+            ("image", ("b.jpg", _encode_image(height=64), "image/jpeg")),
+        ],
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.json()["confidence"] == 0.5
+    assert response.json()["images_types"] == ["bytes", "bytes"]
+    assert response.json()["images_shapes"] == [[32, 48, 3], [64, 48, 3]]
+
+
+def test_multipart_request_with_malformed_request_field(client: TestClient) -> None:
+    # when
+    response = client.post(
+        "/infer/object_detection",
+        data={"request": "{not-a-json"},
+        files={"image": ("image.jpg", _encode_image(), "image/jpeg")},
+    )
+
+    # then
+    assert response.status_code == 422
+
+
+def test_octet_stream_request(client: TestClient) -> None:
+    # when
+    response = client.post(
+        "/infer/object_detection?model_id=some/1&class_filter=car&class_filter=dog",
+        content=_encode_image(),
+        headers={"Content-Type": "application/octet-stream"},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.json()["model_id"] == "some/1"
+    assert response.json()["class_filter"] == ["car", "dog"]
+    assert response.json()["images_shapes"] == [[32, 48, 3]]
+
+
+def test_multipart_workflow_request(client: TestClient) -> None:
+    # when
+    response = client.post(
+        "/workflows/run",
+        data={
+            "request": json.dumps(
+                {
+                    "api_key": "my-key",
+                    "specification": {"version": "1.0"},
+                    "inputs": {"confidence": 0.3},
+                }
+            )
+        },
+        files=[
+            ("image", ("a.jpg", _encode_image(), "image/jpeg")),
+            ("other", ("b.jpg", _encode_image(), "image/jpeg")),
+            ("other", ("c.jpg", _encode_image(), "image/jpeg")),
+        ],
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.json() == {
+        "api_key": "my-key",
+        "specification": {"version": "1.0"},
+        "inputs": {"confidence": 0.3, "image": "bytes", "other": ["bytes", "bytes"]},
+    }
+
+
+def test_octet_stream_workflow_request_is_not_supported(client: TestClient) -> None:
+    # when
+    response = client.post(
+        "/workflows/run",
+        content=_encode_image(),
+        headers={"Content-Type": "application/octet-stream"},
+    )
+
+    # then
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "annotation, expected_result",
+    [
+        (ObjectDetectionInferenceRequest.model_fields["class_filter"].annotation, True),
+        (ObjectDetectionInferenceRequest.model_fields["confidence"].annotation, False),
+        (ObjectDetectionInferenceRequest.model_fields["model_id"].annotation, False),
+    ],
+)
+def test_accepts_list(annotation, expected_result: bool) -> None:
+    # when
+    result = accepts_list(annotation=annotation)
+
+    # then
+    assert result is expected_result
@@ -0,0 +1,65 @@
+import msgpack
+import numpy as np
+import pytest
+
+from inference.core.entities.responses.inference import (
+    ColumnarDetectionsInferenceResponse,
+    InferenceResponseImage,
+)
+from inference.core.interfaces.http.msgpack_utils import (
+    MSGPACK_MEDIA_TYPE,
+    accepts_msgpack,
+    msgpack_response,
+)
+from inference.core.models.utils.columnar import build_columnar_predictions
+
+
+@pytest.mark.parametrize(
+    "accept, expected_result",
+    [
+        (None, False),
+        ("", False),
+        ("application/json", False),
+        ("application/msgpack", True),
+        ("application/json;q=0.5, application/x-msgpack", True),
+        ("Application/MsgPack; q=1.0", True),
+    ],
+)
+def test_accepts_msgpack(accept: str, expected_result: bool) -> None:
+    # when
+    result = accepts_msgpack(accept=accept)
+
+    # then
+    assert result is expected_result
+
+
+def test_msgpack_response_encodes_columns_as_raw_buffers() -> None:
+    # given
+    response = ColumnarDetectionsInferenceResponse(
+        predictions=build_columnar_predictions(
+            predictions=np.array(
+                [[1.0, 2.0, 3.0, 4.0, 0.5, 0.5, 1.0]], dtype=np.float32
+            ),
+            class_names=["a", "b"],
+            polygons=[[(1.0, 2.0), (3.0, 2.0), (3.0, 4.0)]],
+        ),
+        image=InferenceResponseImage(width=640, height=480),
+        time=0.5,
+        visualization=b"image",
+    )
+
+    # when
+    result = msgpack_response(response=response)
+
+    # then
+    assert result.media_type == MSGPACK_MEDIA_TYPE
+    decoded = msgpack.unpackb(result.body, raw=False)
+    assert decoded["image"] == {"width": 640, "height": 480}
+    assert decoded["time"] == 0.5
+    assert decoded["visualization"] == b"image"
+    xyxy = decoded["predictions"]["xyxy"]
+    assert xyxy["dtype"] == "<f4"
+    assert xyxy["shape"] == [1, 4]
+    assert np.frombuffer(xyxy["data"], dtype="<f4").tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert decoded["predictions"]["class_name"] == ["b"]
+    assert decoded["predictions"]["points"]["shape"] == [3, 2]
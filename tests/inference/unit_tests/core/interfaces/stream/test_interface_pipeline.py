@@ -28,7 +28,7 @@ from inference.core.interfaces.camera.video_source import (
     VideoSource,
     lock_state_transition,
 )
-from inference.core.interfaces.stream.entities import ModelConfig
+from inference.core.interfaces.stream.entities import InferenceStages, ModelConfig
 from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
 from inference.core.interfaces.stream.model_handlers.roboflow_models import (
     default_process_frame,
@@ -658,3 +658,149 @@ def test_inference_pipeline_works_correctly_against_multiple_video_files_with_ac
     assert frames_by_sources[1] == list(
         range(1, 431 * 2 + 1)
     ), "Order of prediction frames violated for source 1"
+
+
+class StagedModelStub(ModelStub):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self.calls_lock = Lock()
+
+    def preprocess(self, video_frames: List[VideoFrame]) -> List[int]:
+        with self.calls_lock:
+            self.calls.append("preprocess")
+        return [f.frame_id for f in video_frames]
+
+    def predict(self, frames_ids: List[int]) -> List[int]:
+        with self.calls_lock:
+            self.calls.append("predict")
+        return frames_ids
+
+    def postprocess(
+        self, frames_ids: List[int], video_frames: List[VideoFrame]
+    ) -> List[dict]:
+        with self.calls_lock:
+            self.calls.append("postprocess")
+        assert frames_ids == [f.frame_id for f in video_frames]
+        return [{"frame_id": frame_id} for frame_id in frames_ids]
+
+
+@pytest.mark.parametrize("use_main_thread", [True, False])
+def test_inference_pipeline_works_correctly_in_pipelined_mode(
+    use_main_thread: bool,
+) -> None:
+    # given
+    model = StagedModelStub()
+    video_source_1 = VideoSourceStub(
+        frames_number=100, is_file=False, rounds=1, source_id=0
+    )
+    video_source_2 = VideoSourceStub(
+        frames_number=130, is_file=False, rounds=1, source_id=1
+    )
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source_1, video_source_2])
+    accumulator = []
+
+    def on_prediction(predictions: List[dict], video_frames: List[VideoFrame]) -> None:
+        for frame_prediction, video_frame in zip(predictions, video_frames):
+            if frame_prediction is None:
+                continue
+            accumulator.append((video_frame, frame_prediction))
+
+    inference_pipeline = InferencePipeline(
+        on_video_frame=MagicMock(),
+        video_sources=[video_source_1, video_source_2],
+        on_prediction=on_prediction,
+        max_fps=None,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[watchdog.on_status_update],
+        inference_stages=InferenceStages(
+            preprocess=model.preprocess,
+            predict=model.predict,
+            postprocess=model.postprocess,
+        ),
+        stages_queue_size=1,
+    )
+    stop_counter = []
+    stop_counter_lock = Lock()
+
+    def stop() -> None:
+        with stop_counter_lock:
+            stop_counter.append(1)
+            if len(stop_counter) == 2:
+                inference_pipeline._stop = True
+
+    video_source_1.on_end = stop
+    video_source_2.on_end = stop
+
+    # when
+    inference_pipeline.start(use_main_thread=use_main_thread)
+    inference_pipeline.join()
+
+    # then
+    assert 0 < len(accumulator) <= 100 + 130
+    frames_by_sources = defaultdict(list)
+    for video_frame, prediction in accumulator:
+        assert prediction == {"frame_id": video_frame.frame_id}
+        frames_by_sources[video_frame.source_id].append(video_frame.frame_id)
+    assert frames_by_sources[0] == sorted(
+        frames_by_sources[0]
+    ), "Order of prediction frames violated for source 0"
+    assert frames_by_sources[1] == sorted(
+        frames_by_sources[1]
+    ), "Order of prediction frames violated for source 1"
+    inference_pipeline._on_video_frame.assert_not_called()
+    latency_reports = watchdog.get_report().latency_reports
+    assert set(latency_reports[0].stages_latency.keys()) == {
+        "preprocessing",
+        "inference",
+        "postprocessing",
+    }
+    assert latency_reports[0].inference_latency is not None
+
+
+def test_inference_pipeline_in_pipelined_mode_when_stage_fails() -> None:
+    # given
+    video_source = VideoSourceStub(frames_number=100, is_file=False, rounds=1)
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source])
+    predictions = []
+    status_updates = []
+
+    def on_prediction(prediction: dict, video_frame: VideoFrame) -> None:
+        predictions.append((video_frame, prediction))
+
+    def predict(frames_ids: List[int]) -> List[int]:
+        if frames_ids[0] == 10:
+            raise RuntimeError()
+        return frames_ids
+
+    model = StagedModelStub()
+    inference_pipeline = InferencePipeline(
+        on_video_frame=MagicMock(),
+        video_sources=[video_source],
+        on_prediction=on_prediction,
+        max_fps=None,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[status_updates.append],
+        inference_stages=InferenceStages(
+            preprocess=model.preprocess,
+            predict=predict,
+            postprocess=model.postprocess,
+        ),
+        stages_queue_size=1,
+    )
+    video_source.on_end = lambda: None
+
+    # when
+    inference_pipeline.start(use_main_thread=True)
+    inference_pipeline.join()
+
+    # then
+    assert [p[0].frame_id for p in predictions] == list(range(1, 10))
+    assert [
+        u.event_type for u in status_updates if u.event_type == "INFERENCE_ERROR"
+    ] == ["INFERENCE_ERROR"]
+    assert status_updates[-1].event_type == "INFERENCE_THREAD_FINISHED"
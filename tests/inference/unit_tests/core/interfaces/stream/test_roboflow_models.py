@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Any, Tuple
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+)
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream.entities import ModelConfig
+from inference.core.interfaces.stream.model_handlers.roboflow_models import (
+    build_default_inference_stages,
+    resolve_inference_kwargs,
+    supports_inference_stages,
+)
+from inference.core.models.object_detection_base import (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+)
+from inference.models.yolact.yolact_instance_segmentation import YOLACT
+
+
+class DetectorStub(ObjectDetectionBaseOnnxRoboflowInferenceModel):
+    def __init__(self):
+        self.api_key = "my-key"
+        self.batching_enabled = True
+        self.batch_size = 1
+        self.preprocess_calls = []
+        self.postprocess_calls = []
+
+    def preprocess(self, image: Any, **kwargs) -> Tuple[np.ndarray, dict]:
+        self.preprocess_calls.append((len(image), kwargs))
+        return np.zeros((len(image), 3, 8, 8)), {"img_dims": [(8, 8)] * len(image)}
+
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
+        return (img_in.sum(axis=(1, 2, 3)),)
+
+    def postprocess(self, predictions, preproc_return_metadata, **kwargs):
+        self.postprocess_calls.append(kwargs)
+        return [
+            ObjectDetectionInferenceResponse(
+                predictions=[], image=InferenceResponseImage(width=8, height=8)
+            )
+            for _ in predictions[0]
+        ]
+
+
+def test_supports_inference_stages() -> None:
+    # given
+    detector = DetectorStub()
+    yolact = YOLACT.__new__(YOLACT)
+
+    # when
+    detector_result = supports_inference_stages(model=detector)
+    yolact_result = supports_inference_stages(model=yolact)
+    other_result = supports_inference_stages(model=MagicMock())
+
+    # then
+    assert detector_result is True
+    assert yolact_result is False, "YOLACT overrides infer(...) with custom logic"
+    assert other_result is False
+
+
+def test_resolve_inference_kwargs() -> None:
+    # when
+    result = resolve_inference_kwargs(
+        model=DetectorStub(), kwargs={"confidence": 0.3, "mask_decode_mode": "fast"}
+    )
+
+    # then
+    assert result["confidence"] == 0.3
+    assert result["mask_decode_mode"] == "fast"
+    assert result["disable_preproc_static_crop"] is False
+    assert result["fix_batch_size"] is False
+    assert "image" not in result
+    assert "kwargs" not in result
+
+
+def test_default_inference_stages() -> None:
+    # given
+    model = DetectorStub()
+    frames = [
+        VideoFrame(
+            image=np.zeros((8, 8, 3), dtype=np.uint8),
+            frame_id=i,
+            frame_timestamp=datetime.now(),
+            source_id=i,
+        )
+        for i in range(3)
+    ]
+    stages = build_default_inference_stages(
+        model=model, inference_config=ModelConfig.init(confidence=0.3)
+    )
+
+    # when
+    preprocessed = stages.preprocess(frames)
+    predicted = stages.predict(preprocessed)
+    result = stages.postprocess(predicted, frames)
+
+    # then
+    assert len(result) == 3
+    assert result[0]["image"] == {"width": 8, "height": 8}
+    assert model.preprocess_calls[0][0] == 3
+    assert model.postprocess_calls[0]["confidence"] == 0.3
@@ -11,6 +11,7 @@ from inference.core.interfaces.stream.entities import (
 )
 from inference.core.interfaces.stream.watchdog import (
     BasePipelineWatchDog,
+    LatencyMonitor,
     are_events_compatible,
     average_property_values,
     compute_events_latency,
@@ -293,3 +294,23 @@ def test_base_watchdog_gives_correct_report_when_all_events_are_in_series_relate
     assert (
         result.sources_metadata[0] == "METADATA"
     ), "Metadata must match mocked video source response"
+
+
+def test_latency_monitor_when_multiple_frames_are_in_flight() -> None:
+    # given
+    monitor = LatencyMonitor(source_id=0)
+    frame_timestamp = datetime.now()
+
+    # when
+    monitor.register_inference_start(frame_timestamp=frame_timestamp, frame_id=1)
+    monitor.register_inference_start(frame_timestamp=frame_timestamp, frame_id=2)
+    monitor.register_stage_latency(stage="inference", latency=0.1)
+    monitor.register_stage_latency(stage="inference", latency=0.3)
+    monitor.register_prediction_ready(frame_timestamp=frame_timestamp, frame_id=1)
+    monitor.register_prediction_ready(frame_timestamp=frame_timestamp, frame_id=2)
+    result = monitor.summarise_reports()
+
+    # then
+    assert result.inference_latency is not None
+    assert all(r.inference_latency is not None for r in monitor._reports)
+    assert abs(result.stages_latency["inference"] - 0.2) < 1e-5
@@ -567,3 +567,43 @@ def assembly_valid_init_payload() -> dict:
     ).dict()
     valid_init_payload["type"] = CommandType.INIT
     return valid_init_payload
+
+
+@pytest.mark.timeout(30)
+@mock.patch.object(inference_pipeline_manager.InferencePipeline, "init_with_workflow")
+def test_inference_pipeline_manager_when_results_subscription_is_requested(
+    pipeline_init_mock: MagicMock,
+) -> None:
+    # given
+    pipeline_init_mock.return_value = MagicMock()
+    command_queue, responses_queue = Queue(), Queue()
+    manager = InferencePipelineManager(
+        pipeline_id="my_pipeline",
+        command_queue=command_queue,
+        responses_queue=responses_queue,
+    )
+    init_payload = assembly_valid_init_payload()
+
+    # when
+    command_queue.put(("1", {"type": CommandType.SUBSCRIBE_RESULTS}))
+    command_queue.put(("2", init_payload))
+    command_queue.put(("3", {"type": CommandType.SUBSCRIBE_RESULTS}))
+    command_queue.put(("4", {"type": CommandType.TERMINATE}))
+
+    manager.run()
+
+    status_1 = responses_queue.get()
+    _ = responses_queue.get()
+    status_3 = responses_queue.get()
+    status_4 = responses_queue.get()
+
+    # then
+    assert (
+        status_1[1]["error_type"] == ErrorType.OPERATION_ERROR
+    ), "Subscription to not initialised pipeline must fail"
+    assert status_3[1]["status"] == OperationStatus.SUCCESS
+    assert isinstance(status_3[1]["port"], int), "Port of results stream expected"
+    assert status_4 == (
+        "4",
+        {"status": OperationStatus.SUCCESS},
+    ), "Termination of pipeline must happen"
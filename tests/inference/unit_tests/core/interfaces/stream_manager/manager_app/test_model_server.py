@@ -0,0 +1,297 @@
+import os
+import shutil
+import tempfile
+import time
+from threading import Thread
+from typing import Generator, List
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.stream_manager.manager_app import model_server
+from inference.core.interfaces.stream_manager.manager_app.model_server import (
+    ModelServer,
+    ModelServerClient,
+    ModelServerError,
+    ModelServersSupervisor,
+    SharedArraysReader,
+    SharedArraysWriter,
+    SharedModelServersRegistry,
+    request_model_server,
+)
+from inference.core.models.object_detection_base import (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.registries.base import ModelRegistry
+
+
+class ModelStub:
+    def __init__(self, batching_enabled: bool = True, batch_major: bool = True):
+        self.batching_enabled = batching_enabled
+        self.batch_size = 1
+        self.batch_major = batch_major
+        self.batches_sizes: List[int] = []
+
+    def run_onnx_session(self, img_in: np.ndarray) -> List[np.ndarray]:
+        self.batches_sizes.append(len(img_in))
+        if len(self.batches_sizes) == 1:
+            # lets other clients queue up their requests
+            time.sleep(0.2)
+        if np.any(img_in < 0):
+            raise ValueError("Negative input")
+        sums = img_in.reshape(len(img_in), -1).sum(axis=1)
+        if not self.batch_major:
+            return [sums.reshape(1, -1)]
+        return [sums, img_in * 2]
+
+
+@pytest.fixture
+def sockets_directory() -> Generator[str, None, None]:
+    # unix sockets paths are limited to ~100 characters
+    directory = tempfile.mkdtemp(prefix="ms-")
+    yield directory
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def start_server(model: ModelStub, sockets_directory: str, **kwargs) -> ModelServer:
+    server = ModelServer(
+        model=model,
+        address=os.path.join(sockets_directory, "model.sock"),
+        batch_collection_timeout=0.05,
+        **kwargs,
+    )
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_clients(address: str, inputs: List[np.ndarray]) -> List[List[np.ndarray]]:
+    results = [None] * len(inputs)
+
+    def run_client(index: int) -> None:
+        client = ModelServerClient(address=address)
+        try:
+            results[index] = client.run(inputs[index])
+        finally:
+            client.close()
+
+    threads = [Thread(target=run_client, args=(i,)) for i in range(len(inputs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_shared_arrays_roundtrip_when_segment_must_grow() -> None:
+    # given
+    writer, reader = SharedArraysWriter(), SharedArraysReader()
+    small = [np.arange(6, dtype=np.float32).reshape(2, 3), np.array([1, 2])]
+    large = [np.ones((64, 64, 3), dtype=np.uint8)]
+
+    try:
+        # when
+        small_result = reader.read(writer.write(small))
+        large_descriptor = writer.write(large)
+        large_result = reader.read(large_descriptor)
+        reused_descriptor = writer.write(small)
+
+        # then
+        assert len(small_result) == 2
+        assert np.array_equal(small_result[0], small[0])
+        assert small_result[0].dtype == np.float32
+        assert np.array_equal(small_result[1], small[1])
+        assert np.array_equal(large_result[0], large[0])
+        assert reused_descriptor.name == large_descriptor.name
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_model_server_batches_requests_of_different_clients(
+    sockets_directory: str,
+) -> None:
+    # given
+    model = ModelStub()
+    server = start_server(model=model, sockets_directory=sockets_directory)
+    inputs = [np.full((1, 3, 4, 4), i, dtype=np.float32) for i in range(6)]
+
+    try:
+        # when
+        results = run_clients(address=server.address, inputs=inputs)
+    finally:
+        server.shutdown()
+
+    # then
+    for i, result in enumerate(results):
+        assert result[0].tolist() == [48 * i]
+        assert np.array_equal(result[1], inputs[i] * 2)
+    assert sum(model.batches_sizes) == 6
+    assert max(model.batches_sizes) > 1, "Requests of clients expected to be batched"
+
+
+def test_model_server_when_model_does_not_support_dynamic_batch(
+    sockets_directory: str,
+) -> None:
+    # given
+    model = ModelStub(batching_enabled=False)
+    server = start_server(model=model, sockets_directory=sockets_directory)
+    inputs = [np.full((1, 2), i, dtype=np.float32) for i in range(3)]
+
+    try:
+        # when
+        results = run_clients(address=server.address, inputs=inputs)
+    finally:
+        server.shutdown()
+
+    # then
+    assert [r[0].tolist() for r in results] == [[0], [2], [4]]
+    assert model.batches_sizes == [1, 1, 1]
+
+
+def test_model_server_when_outputs_are_not_batch_major(
+    sockets_directory: str,
+) -> None:
+    # given
+    model = ModelStub(batch_major=False)
+    server = start_server(model=model, sockets_directory=sockets_directory)
+    inputs = [np.full((1, 2), i, dtype=np.float32) for i in range(4)]
+
+    try:
+        # when
+        results = run_clients(address=server.address, inputs=inputs)
+    finally:
+        server.shutdown()
+
+    # then
+    assert [r[0].tolist() for r in results] == [[[0]], [[2]], [[4]], [[6]]]
+
+
+def test_model_server_when_model_fails(sockets_directory: str) -> None:
+    # given
+    server = start_server(model=ModelStub(), sockets_directory=sockets_directory)
+    client = ModelServerClient(address=server.address)
+
+    try:
+        # when
+        with pytest.raises(ModelServerError):
+            _ = client.run(np.full((1, 2), -1, dtype=np.float32))
+        result = client.run(np.ones((1, 2), dtype=np.float32))
+    finally:
+        client.close()
+        server.shutdown()
+
+    # then
+    assert result[0].tolist() == [2], "Server must keep serving after model error"
+
+
+def test_model_server_shuts_down_when_idle(sockets_directory: str) -> None:
+    # given
+    server = ModelServer(
+        model=ModelStub(),
+        address=os.path.join(sockets_directory, "model.sock"),
+        idle_timeout=0.1,
+    )
+    thread = Thread(target=server.serve_forever, daemon=True)
+
+    # when
+    thread.start()
+    thread.join(timeout=5)
+
+    # then
+    assert not thread.is_alive()
+    assert not os.path.exists(server.address)
+
+
+class DetectorStub(ObjectDetectionBaseOnnxRoboflowInferenceModel):
+    def __init__(self, model_id: str, api_key: str, load_weights: bool = True):
+        self.model_id = model_id
+        self.load_weights = load_weights
+
+
+@mock.patch.object(model_server, "ModelServerClient")
+@mock.patch.object(model_server, "request_model_server")
+def test_shared_model_servers_registry(
+    request_model_server_mock: mock.MagicMock,
+    model_server_client_mock: mock.MagicMock,
+) -> None:
+    # given
+    request_model_server_mock.return_value = "/tmp/model.sock"
+    other_model_class = mock.MagicMock()
+    registry = SharedModelServersRegistry(
+        registry=ModelRegistry(
+            registry_dict={"object-detection": DetectorStub, "other": other_model_class}
+        ),
+        supervisor_address="/tmp/supervisor.sock",
+    )
+
+    # when
+    model = registry.get_model("object-detection", "my-key")(
+        model_id="some/1", api_key="my-key"
+    )
+    other_model_loader = registry.get_model("other", "my-key")
+
+    # then
+    assert isinstance(model, DetectorStub)
+    assert model.load_weights is False
+    assert model.run_onnx_session is model_server_client_mock.return_value.run
+    request_model_server_mock.assert_called_once_with(
+        supervisor_address="/tmp/supervisor.sock", model_id="some/1", api_key="my-key"
+    )
+    model_server_client_mock.assert_called_once_with(address="/tmp/model.sock")
+    assert other_model_loader is other_model_class
+
+
+@mock.patch.object(model_server, "ModelServerClient")
+@mock.patch.object(model_server, "request_model_server")
+def test_shared_model_servers_registry_closes_client_when_model_is_unloaded(
+    request_model_server_mock: mock.MagicMock,
+    model_server_client_mock: mock.MagicMock,
+) -> None:
+    # given
+    request_model_server_mock.return_value = "/tmp/model.sock"
+    registry = SharedModelServersRegistry(
+        registry=ModelRegistry(registry_dict={"object-detection": DetectorStub}),
+        supervisor_address="/tmp/supervisor.sock",
+    )
+    model = registry.get_model("object-detection", "my-key")(
+        model_id="some/1", api_key="my-key"
+    )
+    model_server_client_mock.return_value.close.assert_not_called()
+
+    # when
+    model.unload()
+
+    # then
+    model_server_client_mock.return_value.close.assert_called_once_with()
+
+
+def test_request_model_server_from_supervisor(sockets_directory: str) -> None:
+    # given
+    supervisor = ModelServersSupervisor(sockets_directory=sockets_directory)
+    supervisor.start()
+
+    try:
+        with mock.patch.object(
+            supervisor, "ensure_model_server", return_value="/tmp/model.sock"
+        ) as ensure_model_server_mock:
+            # when
+            result = request_model_server(
+                supervisor_address=supervisor.address,
+                model_id="some/1",
+                api_key="my-key",
+            )
+            ensure_model_server_mock.side_effect = ModelServerError("Not found")
+            with pytest.raises(ModelServerError):
+                _ = request_model_server(
+                    supervisor_address=supervisor.address,
+                    model_id="some/1",
+                    api_key="my-key",
+                )
+    finally:
+        supervisor.terminate()
+
+    # then
+    assert result == "/tmp/model.sock"
+    ensure_model_server_mock.assert_called_with(model_id="some/1", api_key="my-key")
+    assert not os.path.exists(supervisor.address)
@@ -0,0 +1,151 @@
+import asyncio
+import json
+import socket
+import time
+from datetime import datetime
+from threading import Thread
+from typing import List
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream_manager.api import stream_manager_client
+from inference.core.interfaces.stream_manager.api.stream_manager_client import (
+    StreamManagerClient,
+)
+from inference.core.interfaces.stream_manager.manager_app.entities import (
+    DropPolicy,
+    SubscribeResultsPayload,
+)
+from inference.core.interfaces.stream_manager.manager_app.results_streaming import (
+    ResultsBroadcaster,
+    ResultsSubscriber,
+    serialise_pipeline_result,
+)
+
+
+def build_frame(frame_id: int) -> VideoFrame:
+    return VideoFrame(
+        image=np.zeros((4, 4, 3), dtype=np.uint8),
+        frame_id=frame_id,
+        frame_timestamp=datetime(2024, 1, 1),
+        source_id=0,
+    )
+
+
+def receive_messages(connection: socket.socket) -> List[dict]:
+    data = b""
+    while True:
+        chunk = connection.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    messages = []
+    while data:
+        size = int.from_bytes(data[:4], byteorder="big")
+        messages.append(json.loads(data[4 : 4 + size]))
+        data = data[4 + size :]
+    return messages
+
+
+def test_serialise_pipeline_result() -> None:
+    # when
+    result = serialise_pipeline_result(
+        predictions=[{"a": 1, "b": 2}, None],
+        frames=[build_frame(frame_id=3), None],
+        excluded_fields=["b"],
+    )
+
+    # then
+    assert result == {
+        "outputs": [{"a": 1}, None],
+        "frames_metadata": [
+            {
+                "frame_timestamp": "2024-01-01T00:00:00",
+                "frame_id": 3,
+                "source_id": 0,
+            },
+            None,
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "drop_policy, expected_frames_ids",
+    [
+        (DropPolicy.DROP_OLDEST, [[2, 3], [4]]),
+        (DropPolicy.DROP_NEWEST, [[0, 1], [2]]),
+    ],
+)
+def test_results_subscriber_when_subscriber_does_not_keep_up(
+    drop_policy: DropPolicy, expected_frames_ids: List[List[int]]
+) -> None:
+    # given
+    server_side, client_side = socket.socketpair()
+    subscriber = ResultsSubscriber(
+        connection=server_side,
+        subscription=SubscribeResultsPayload(
+            max_batch_size=2, buffer_size=3, drop_policy=drop_policy
+        ),
+    )
+    for frame_id in range(5):
+        subscriber.push(result=([{"frame": frame_id}], [build_frame(frame_id)]))
+    subscriber.close()
+
+    # when
+    subscriber.serve()
+    messages = receive_messages(connection=client_side)
+
+    # then
+    assert [
+        [r["frames_metadata"][0]["frame_id"] for r in m["results"]] for m in messages
+    ] == expected_frames_ids
+    assert [m["dropped_results"] for m in messages] == [2, 0]
+
+
+def test_results_broadcaster_streams_results_to_client() -> None:
+    # given
+    broadcaster = ResultsBroadcaster(host="127.0.0.1")
+    port = broadcaster.start()
+    client = StreamManagerClient.init(host="127.0.0.1", port=7070)
+    broadcaster.on_prediction(predictions={"frame": -1}, video_frame=build_frame(-1))
+
+    def produce_results() -> None:
+        deadline = time.monotonic() + 5
+        while not broadcaster.has_subscribers() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for frame_id in range(3):
+            broadcaster.on_prediction(
+                predictions={"frame": frame_id, "other": 1},
+                video_frame=build_frame(frame_id),
+            )
+        broadcaster.close()
+
+    async def consume_results() -> List[dict]:
+        messages = await client.subscribe_pipeline_results(
+            pipeline_id="my-pipeline",
+            subscription=SubscribeResultsPayload(excluded_fields=["other"]),
+        )
+        return [json.loads(message) async for message in messages]
+
+    # when
+    with mock.patch.object(
+        stream_manager_client,
+        "send_command",
+        return_value={"response": {"status": "success", "port": port}},
+    ) as send_command_mock:
+        producer = Thread(target=produce_results)
+        producer.start()
+        messages = asyncio.run(consume_results())
+        producer.join()
+
+    # then
+    assert send_command_mock.call_args[1]["command"] == {
+        "type": "subscribe_results",
+        "pipeline_id": "my-pipeline",
+    }
+    outputs = [r["outputs"][0] for m in messages for r in m["results"]]
+    assert outputs == [{"frame": 0}, {"frame": 1}, {"frame": 2}]
+    assert broadcaster.has_subscribers() is False
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.exceptions import ModelLoadingInProgressError
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.background_loading import (
+    WithBackgroundModelLoading,
+)
+
+
+def _build_model_manager(release: threading.Event) -> ModelManager:
+    model_registry = MagicMock()
+
+    def load_model(model_id: str, api_key: str) -> MagicMock:
+        release.wait(timeout=5)
+        return MagicMock()
+
+    model_registry.get_model.return_value = load_model
+    return ModelManager(model_registry=model_registry)
+
+
+@pytest.mark.asyncio
+async def test_add_model_async_loads_model_once_for_concurrent_requests() -> None:
+    # given
+    release = threading.Event()
+    model_manager = _build_model_manager(release=release)
+    decorated_manager = WithBackgroundModelLoading(model_manager, max_workers=2)
+
+    # when
+    tasks = [
+        asyncio.create_task(decorated_manager.add_model_async("some/1", "key"))
+        for _ in range(4)
+    ]
+    await asyncio.sleep(0.05)
+    is_loading = decorated_manager.is_loading("some/1")
+    release.set()
+    await asyncio.gather(*tasks)
+
+    # then
+    assert is_loading is True
+    assert model_manager.model_registry.get_model.call_count == 1
+    assert "some/1" in decorated_manager
+    assert decorated_manager.is_loading("some/1") is False
+
+
+@pytest.mark.asyncio
+async def test_add_model_async_raises_when_model_not_loaded_within_timeout() -> None:
+    # given
+    release = threading.Event()
+    model_manager = _build_model_manager(release=release)
+    decorated_manager = WithBackgroundModelLoading(
+        model_manager, max_workers=1, wait_timeout=0.01
+    )
+
+    # when
+    with pytest.raises(ModelLoadingInProgressError):
+        await decorated_manager.add_model_async("some/1", "key")
+    release.set()
+    await asyncio.sleep(0.05)
+    await decorated_manager.add_model_async("some/1", "key")
+
+    # then
+    assert model_manager.model_registry.get_model.call_count == 1
+    assert "some/1" in decorated_manager
+
+
+def test_add_model_propagates_loading_error_and_allows_retry() -> None:
+    # given
+    model_registry = MagicMock()
+    model_registry.get_model.side_effect = [RuntimeError("broken"), MagicMock()]
+    decorated_manager = WithBackgroundModelLoading(
+        ModelManager(model_registry=model_registry), max_workers=1
+    )
+
+    # when
+    with pytest.raises(RuntimeError):
+        decorated_manager.add_model("some/1", "key")
+    decorated_manager.add_model("some/1", "key")
+
+    # then
+    assert "some/1" in decorated_manager
+
+
+def test_add_model_passes_already_loaded_model_to_underlying_manager() -> None:
+    # given
+    model_manager = MagicMock()
+    model_manager.__contains__.return_value = True
+    decorated_manager = WithBackgroundModelLoading(model_manager, max_workers=1)
+
+    # when
+    decorated_manager.add_model("some/1", "key", model_id_alias="alias/1")
+
+    # then
+    model_manager.add_model.assert_called_once_with(
+        "some/1", "key", model_id_alias="alias/1"
+    )
@@ -358,10 +358,12 @@ def test_model_manager_describe_models() -> None:
     model_1.batch_size = 12
     model_1.img_size_w = 640
     model_1.img_size_h = 480
+    model_1.onnx_session_settings = {"intra_op_num_threads": 2}
     model_2.task_type = "instance-segmentation"
     model_2.batch_size = 1
     model_2.img_size_w = 480
     model_2.img_size_h = 480
+    model_2.onnx_session_settings = None
     model_manager._models = {"some/1": model_1, "some/2": model_2}
 
     # when
@@ -375,6 +377,7 @@ def test_model_manager_describe_models() -> None:
             batch_size=12,
             input_width=640,
             input_height=480,
+            session_settings={"intra_op_num_threads": 2},
         ),
         ModelDescription(
             model_id="some/2",
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+)
+from inference.core.exceptions import (
+    InferenceExecutorQueueFullError,
+    ModelInferenceQueueFullError,
+)
+from inference.core.managers.decorators.executor import WithInferenceExecutor
+
+
+def _build_response() -> ObjectDetectionInferenceResponse:
+    return ObjectDetectionInferenceResponse(
+        predictions=[],
+        image=InferenceResponseImage(width=100, height=100),
+        time=0.1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_runs_inference_outside_of_event_loop_thread() -> None:
+    # given
+    model_manager = MagicMock()
+    threads = []
+
+    def infer_from_request_sync(model_id, request, **kwargs):
+        threads.append(threading.current_thread())
+        return _build_response()
+
+    model_manager.infer_from_request_sync.side_effect = infer_from_request_sync
+    decorated_manager = WithInferenceExecutor(model_manager, max_workers=1)
+
+    # when
+    result = await decorated_manager.infer_from_request(
+        "some/1", MagicMock(), active_learning_eligible=True
+    )
+
+    # then
+    assert threads[0] is not threading.current_thread()
+    assert result.time == 0.1
+    assert result.queue_time is not None and result.queue_time >= 0
+    assert (
+        model_manager.infer_from_request_sync.call_args[1]["active_learning_eligible"]
+        is True
+    )
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_rejects_requests_when_model_queue_is_full() -> None:
+    # given
+    model_manager = MagicMock()
+    release = threading.Event()
+
+    def infer_from_request_sync(model_id, request, **kwargs):
+        release.wait(timeout=5)
+        return _build_response()
+
+    model_manager.infer_from_request_sync.side_effect = infer_from_request_sync
+    decorated_manager = WithInferenceExecutor(
+        model_manager,
+        max_workers=2,
+        max_concurrency_per_model=1,
+        max_queue_size_per_model=1,
+    )
+
+    # when
+    first = asyncio.create_task(
+        decorated_manager.infer_from_request("some/1", MagicMock())
+    )
+    second = asyncio.create_task(
+        decorated_manager.infer_from_request("some/1", MagicMock())
+    )
+    await asyncio.sleep(0.05)
+    with pytest.raises(ModelInferenceQueueFullError):
+        await decorated_manager.infer_from_request("some/1", MagicMock())
+    other_model_task = asyncio.create_task(
+        decorated_manager.infer_from_request("other/1", MagicMock())
+    )
+    release.set()
+    results = await asyncio.gather(first, second, other_model_task)
+
+    # then
+    assert len(results) == 3
+    assert results[1].queue_time >= results[0].queue_time
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_rejects_requests_when_executor_is_overloaded() -> (
+    None
+):
+    # given
+    model_manager = MagicMock()
+    release = threading.Event()
+
+    def infer_from_request_sync(model_id, request, **kwargs):
+        release.wait(timeout=5)
+        return _build_response()
+
+    model_manager.infer_from_request_sync.side_effect = infer_from_request_sync
+    decorated_manager = WithInferenceExecutor(
+        model_manager,
+        max_workers=1,
+        max_queue_size=0,
+    )
+
+    # when
+    first = asyncio.create_task(
+        decorated_manager.infer_from_request("some/1", MagicMock())
+    )
+    await asyncio.sleep(0.05)
+    with pytest.raises(InferenceExecutorQueueFullError):
+        await decorated_manager.infer_from_request("other/1", MagicMock())
+    release.set()
+    _ = await first
+
+
+@pytest.mark.asyncio
+async def test_infer_from_request_propagates_inference_errors() -> None:
+    # given
+    model_manager = MagicMock()
+    model_manager.infer_from_request_sync.side_effect = ValueError("broken")
+    decorated_manager = WithInferenceExecutor(model_manager, max_workers=1)
+
+    # when
+    with pytest.raises(ValueError):
+        await decorated_manager.infer_from_request("some/1", MagicMock())
+
+    # then
+    assert decorated_manager._in_flight == 0
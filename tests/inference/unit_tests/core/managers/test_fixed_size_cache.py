@@ -0,0 +1,165 @@
+import threading
+from typing import Dict
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+
+MB = 1024 * 1024
+
+
+class DummyModel:
+    def __init__(self, memory_usage: int):
+        self.memory_usage = memory_usage
+        self.unloaded = False
+
+    def get_memory_usage(self) -> int:
+        return self.memory_usage
+
+    def clear_cache(self) -> None:
+        pass
+
+    def unload(self) -> None:
+        self.unloaded = True
+
+
+def _build_model_manager(memory_usages: Dict[str, int]) -> ModelManager:
+    model_registry = MagicMock()
+    model_registry.get_model.side_effect = lambda model_id, api_key: (
+        lambda model_id, api_key: DummyModel(memory_usage=memory_usages[model_id])
+    )
+    return ModelManager(model_registry=model_registry)
+
+
+def test_add_model_evicts_least_recently_used_model_when_max_size_reached() -> None:
+    # given
+    model_manager = _build_model_manager({"a/1": MB, "b/1": MB, "c/1": MB})
+    cache = WithFixedSizeCache(model_manager, max_size=2)
+    cache.add_model("a/1", api_key="key")
+    cache.add_model("b/1", api_key="key")
+    cache.add_model("a/1", api_key="key")
+
+    # when
+    cache.add_model("c/1", api_key="key")
+
+    # then
+    assert set(cache.keys()) == {"a/1", "c/1"}
+    assert list(cache._key_queue.keys()) == ["a/1", "c/1"]
+
+
+def test_add_model_evicts_models_to_stay_within_memory_budget() -> None:
+    # given
+    model_manager = _build_model_manager(
+        {"a/1": 40 * MB, "b/1": 40 * MB, "c/1": 50 * MB}
+    )
+    cache = WithFixedSizeCache(model_manager, max_size=8, memory_budget_mb=100)
+    cache.add_model("a/1", api_key="key")
+    cache.add_model("b/1", api_key="key")
+
+    # when
+    cache.add_model("c/1", api_key="key")
+
+    # then
+    assert set(cache.keys()) == {"b/1", "c/1"}
+
+
+def test_add_model_keeps_model_exceeding_memory_budget_on_its_own() -> None:
+    # given
+    model_manager = _build_model_manager({"a/1": 10 * MB, "b/1": 200 * MB})
+    cache = WithFixedSizeCache(model_manager, max_size=8, memory_budget_mb=100)
+    cache.add_model("a/1", api_key="key")
+
+    # when
+    cache.add_model("b/1", api_key="key")
+
+    # then
+    assert set(cache.keys()) == {"b/1"}
+
+
+def test_gdsf_policy_keeps_models_expensive_to_reload() -> None:
+    # given
+    model_manager = _build_model_manager({"a/1": MB, "b/1": MB, "c/1": MB})
+    cache = WithFixedSizeCache(model_manager, max_size=2, eviction_policy="gdsf")
+    cache.add_model("a/1", api_key="key")
+    cache._key_queue["a/1"].load_time = 10.0
+    cache._mark_as_used("a/1")
+    cache.add_model("b/1", api_key="key")
+    cache._key_queue["b/1"].load_time = 0.1
+    cache._mark_as_used("b/1")
+
+    # when
+    cache.add_model("c/1", api_key="key")
+
+    # then
+    assert set(cache.keys()) == {"a/1", "c/1"}
+    assert cache._clock > 0
+
+
+def test_add_model_removes_model_from_queue_when_loading_fails() -> None:
+    # given
+    model_registry = MagicMock()
+    model_registry.get_model.side_effect = RuntimeError("cannot load")
+    cache = WithFixedSizeCache(ModelManager(model_registry=model_registry))
+
+    # when
+    with pytest.raises(RuntimeError):
+        cache.add_model("a/1", api_key="key")
+
+    # then
+    assert len(cache._key_queue) == 0
+
+
+def test_remove_unloads_model() -> None:
+    # given
+    model_manager = _build_model_manager({"a/1": MB})
+    cache = WithFixedSizeCache(model_manager, max_size=2)
+    cache.add_model("a/1", api_key="key")
+    model = cache["a/1"]
+
+    # when
+    cache.remove("a/1")
+
+    # then
+    assert model.unloaded is True
+    assert "a/1" not in cache._key_queue
+
+
+def test_add_model_does_not_evict_models_being_loaded_by_other_threads() -> None:
+    # given
+    loading_started, release = threading.Event(), threading.Event()
+    model_registry = MagicMock()
+
+    def get_model(model_id: str, api_key: str):
+        def load_model(model_id: str, api_key: str) -> DummyModel:
+            if model_id == "a/1":
+                loading_started.set()
+                release.wait(timeout=5)
+            return DummyModel(memory_usage=MB)
+
+        return load_model
+
+    model_registry.get_model.side_effect = get_model
+    cache = WithFixedSizeCache(ModelManager(model_registry=model_registry), max_size=2)
+    slow_load = threading.Thread(target=cache.add_model, args=("a/1", "key"))
+    slow_load.start()
+    loading_started.wait(timeout=5)
+
+    # when
+    cache.add_model("b/1", api_key="key")
+    cache.add_model("c/1", api_key="key")
+    for _ in range(100):
+        cache._mark_as_used("b/1")
+    release.set()
+    slow_load.join()
+
+    # then
+    assert set(cache.keys()) == {"a/1", "c/1"}
+    assert set(cache._key_queue.keys()) == {"a/1", "c/1"}
+
+
+def test_unknown_eviction_policy_is_rejected() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = WithFixedSizeCache(MagicMock(), eviction_policy="fifo")
@@ -0,0 +1,108 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+from inference.core.cache.memory import MemoryCache
+from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
+from inference.core.entities.requests.inference import (
+    InferenceRequestImage,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+)
+from inference.core.managers import metrics as metrics_module
+from inference.core.managers.metrics_recorder import InferenceMetricsRecorder
+
+
+def _build_request() -> ObjectDetectionInferenceRequest:
+    return ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        api_key="my-key",
+        image=InferenceRequestImage(type="url", value="https://some.com/image.jpg"),
+    )
+
+
+def _build_response() -> ObjectDetectionInferenceResponse:
+    return ObjectDetectionInferenceResponse(
+        predictions=[],
+        image=InferenceResponseImage(width=100, height=100),
+        time=0.25,
+    )
+
+
+def test_recorder_writes_inference_and_error_events_in_batches() -> None:
+    # given
+    cache = MemoryCache()
+    recorder = InferenceMetricsRecorder(cache=cache, batch_size=16)
+
+    # when
+    for i in range(3):
+        recorder.record_inference(
+            model_id="some/1",
+            request=_build_request(),
+            response=_build_response(),
+            finish_time=100.0 + i,
+        )
+    recorder.record_error(
+        model_id="some/1",
+        request=_build_request(),
+        error=ValueError("broken"),
+        finish_time=104.0,
+    )
+    recorder.flush()
+
+    # then
+    with mock.patch.object(metrics_module, "cache", cache):
+        metrics = metrics_module.get_model_metrics(GLOBAL_INFERENCE_SERVER_ID, "some/1")
+    assert metrics["num_inferences"] == 3
+    assert metrics["num_errors"] == 1
+    assert (
+        cache.zrangebyscore("models")
+        == [f"{GLOBAL_INFERENCE_SERVER_ID}:my-key:some/1"] * 4
+    )
+    assert recorder.dropped_events == 0
+
+
+def test_recorder_drops_events_when_queue_is_full() -> None:
+    # given
+    cache = MagicMock()
+    recorder = InferenceMetricsRecorder(
+        cache=cache, max_queue_size=2, sampling_threshold=1.0
+    )
+    recorder._ensure_thread_started = MagicMock()
+
+    # when
+    for i in range(5):
+        recorder.record_inference(
+            model_id="some/1",
+            request=_build_request(),
+            response=_build_response(),
+            finish_time=100.0 + i,
+        )
+
+    # then
+    assert recorder.dropped_events == 3
+    assert recorder._queue.qsize() == 2
+
+
+def test_recorder_samples_events_when_queue_fills_up() -> None:
+    # given
+    cache = MagicMock()
+    recorder = InferenceMetricsRecorder(
+        cache=cache, max_queue_size=100, sampling_threshold=0.0
+    )
+    recorder._ensure_thread_started = MagicMock()
+
+    # when
+    for i in range(100):
+        recorder.record_inference(
+            model_id="some/1",
+            request=_build_request(),
+            response=_build_response(),
+            finish_time=100.0 + i,
+        )
+
+    # then
+    assert recorder.dropped_events > 0
+    assert recorder._queue.qsize() + recorder.dropped_events == 100
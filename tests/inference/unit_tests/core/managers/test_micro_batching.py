@@ -0,0 +1,229 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Tuple
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from inference.core.entities.requests.inference import (
+    InferenceRequestImage,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+)
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.micro_batching import (
+    MicroBatcher,
+    WithMicroBatching,
+)
+from inference.core.models.base import Model
+
+
+class DummyBatchingModel(Model):
+    task_type = "object-detection"
+    batching_enabled = True
+
+    def __init__(self):
+        self.batch_sizes: List[int] = []
+
+    def preprocess(self, image: Any, **kwargs) -> Tuple[np.ndarray, dict]:
+        value = float(image["value"])
+        return np.full((1, 3, 4, 4), value), {"value": value}
+
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
+        self.batch_sizes.append(img_in.shape[0])
+        return (img_in[:, 0, 0, 0] * 10,)
+
+    def postprocess(
+        self, predictions: Tuple[np.ndarray, ...], metadata: dict, **kwargs
+    ) -> List[ObjectDetectionInferenceResponse]:
+        assert predictions[0].shape == (1,)
+        assert predictions[0][0] == metadata["value"] * 10
+        return [
+            ObjectDetectionInferenceResponse(
+                predictions=[],
+                image=InferenceResponseImage(
+                    width=int(predictions[0][0]), height=kwargs["confidence"] * 100
+                ),
+            )
+        ]
+
+
+class DummyModelWithSharedOutput(DummyBatchingModel):
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        self.batch_sizes.append(img_in.shape[0])
+        # second output (like prototypes of Yolact) has no batch axis
+        return img_in[:, 0, 0, 0] * 10, np.ones((32, 8))
+
+    def postprocess(
+        self, predictions: Tuple[np.ndarray, ...], metadata: dict, **kwargs
+    ) -> List[ObjectDetectionInferenceResponse]:
+        assert predictions[1].shape == (32, 8)
+        return super().postprocess(predictions, metadata, **kwargs)
+
+
+def _build_request(
+    value: int, confidence: float = 0.5
+) -> ObjectDetectionInferenceRequest:
+    return ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image=InferenceRequestImage(type="numpy", value=value),
+        confidence=confidence,
+    )
+
+
+def test_micro_batcher_merges_concurrent_requests_into_single_batch() -> None:
+    # given
+    model = DummyBatchingModel()
+    micro_batcher = MicroBatcher(max_batch_size=4, max_wait_time=5.0)
+    requests = [_build_request(value=i, confidence=i / 10) for i in range(1, 5)]
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda r: micro_batcher.infer(
+                    model_id="some/1", model=model, request=r
+                ),
+                requests,
+            )
+        )
+    micro_batcher.stop_all()
+
+    # then
+    assert model.batch_sizes == [4]
+    assert [r.image.width for r in results] == [10, 20, 30, 40]
+    assert [r.image.height for r in results] == [10, 20, 30, 40]
+    assert [r.inference_id for r in results] == [r.id for r in requests]
+
+
+def test_micro_batcher_runs_requests_one_by_one_when_outputs_are_not_batch_major() -> (
+    None
+):
+    # given
+    model = DummyModelWithSharedOutput()
+    micro_batcher = MicroBatcher(max_batch_size=4, max_wait_time=5.0)
+    requests = [_build_request(value=i, confidence=i / 10) for i in range(1, 5)]
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda r: micro_batcher.infer(
+                    model_id="some/1", model=model, request=r
+                ),
+                requests,
+            )
+        )
+    second_result = micro_batcher.infer(
+        model_id="some/1", model=model, request=_build_request(value=5)
+    )
+    micro_batcher.stop_all()
+
+    # then
+    assert model.batch_sizes == [
+        4,
+        1,
+        1,
+        1,
+        1,
+        1,
+    ], "Expected batch to be re-run per request and further requests not to be batched"
+    assert [r.image.width for r in results] == [10, 20, 30, 40]
+    assert second_result.image.width == 50
+
+
+def test_micro_batcher_flushes_batch_after_max_wait_time() -> None:
+    # given
+    model = DummyBatchingModel()
+    micro_batcher = MicroBatcher(max_batch_size=8, max_wait_time=0.001)
+
+    # when
+    result = micro_batcher.infer(
+        model_id="some/1", model=model, request=_build_request(value=3)
+    )
+    micro_batcher.stop_all()
+
+    # then
+    assert model.batch_sizes == [1]
+    assert result.image.width == 30
+
+
+def test_micro_batcher_propagates_errors_to_all_requests_in_batch() -> None:
+    # given
+    model = DummyBatchingModel()
+    model.predict = MagicMock(side_effect=RuntimeError("forward pass failed"))
+    micro_batcher = MicroBatcher(max_batch_size=2, max_wait_time=5.0)
+    futures = [
+        micro_batcher._get_batcher(model_id="some/1", model=model).submit(
+            _build_request(value=i)
+        )
+        for i in range(2)
+    ]
+
+    # when
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
+    micro_batcher.stop_all()
+
+
+def test_micro_batcher_bypasses_batching_for_multi_image_requests() -> None:
+    # given
+    model = MagicMock()
+    model.batching_enabled = True
+    micro_batcher = MicroBatcher(max_batch_size=8, max_wait_time=0.001)
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image=[
+            InferenceRequestImage(type="numpy", value=1),
+            InferenceRequestImage(type="numpy", value=2),
+        ],
+    )
+
+    # when
+    result = micro_batcher.infer(model_id="some/1", model=model, request=request)
+
+    # then
+    assert result is model.infer_from_request.return_value
+    model.infer_from_request.assert_called_once_with(request)
+
+
+def test_micro_batcher_bypasses_batching_for_models_without_dynamic_batch() -> None:
+    # given
+    model = DummyBatchingModel()
+    model.batching_enabled = False
+    model.infer_from_request = MagicMock()
+    micro_batcher = MicroBatcher(max_batch_size=8, max_wait_time=0.001)
+    request = _build_request(value=1)
+
+    # when
+    result = micro_batcher.infer(model_id="some/1", model=model, request=request)
+
+    # then
+    assert result is model.infer_from_request.return_value
+    assert model.batch_sizes == []
+
+
+@pytest.mark.asyncio
+async def test_with_micro_batching_routes_requests_through_micro_batcher() -> None:
+    # given
+    model = DummyBatchingModel()
+    model_manager = ModelManager(model_registry=MagicMock())
+    model_manager._models = {"some/1": model}
+    decorated_manager = WithMicroBatching(
+        model_manager, max_batch_size=4, max_wait_time=0.001
+    )
+
+    # when
+    result = await decorated_manager.infer_from_request(
+        "some/1", _build_request(value=2)
+    )
+    decorated_manager.remove("some/1")
+
+    # then
+    assert model.batch_sizes == [1]
+    assert result.image.width == 20
+    assert "some/1" not in decorated_manager
@@ -1,19 +1,37 @@
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
+import numpy as np
+import onnxruntime
 import pytest
+from onnxruntime.datasets import get_example
 
-from inference.core.exceptions import ModelArtefactError
+from inference.core.entities.requests.inference import InferenceRequestImage
+from inference.core.exceptions import (
+    ModelArtefactError,
+    RoboflowAPINotAuthorizedError,
+)
 from inference.core.models import roboflow
 from inference.core.models.roboflow import (
+    OnnxRoboflowInferenceModel,
     class_mapping_not_available_in_environment,
     color_mapping_available_in_environment,
     get_class_names_from_environment_file,
     get_color_mapping_from_environment,
     is_model_artefacts_bucket_available,
 )
+from inference.core.models.utils.image_loader_pool import SharedImageLoaderPool
+from inference.core.models.utils.onnx_io_binding import (
+    OnnxBuffersPool,
+    OnnxSessionIOBindingRunner,
+    onnx_buffers_scope,
+)
 
 
 @mock.patch.object(roboflow, "AWS_ACCESS_KEY_ID", None)
@@ -194,3 +212,330 @@ def test_get_class_names_from_environment_file() -> None:
         "class_k",
         "class_l",
     ]
+
+
+def _build_onnx_model_for_preprocessing(preproc: dict) -> OnnxRoboflowInferenceModel:
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.preproc = preproc
+    model.resize_method = "Fit (black edges) in"
+    model.img_size_h = 320
+    model.img_size_w = 320
+    model.onnx_buffers_pool = OnnxBuffersPool(max_buffers_per_shape=1, max_shapes=1)
+    return model
+
+
+def _encode_gradient_jpeg(height: int, width: int) -> bytes:
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image[:, :, 0] = np.linspace(0, 255, width, dtype=np.uint8)[None, :]
+    image[:, :, 2] = np.linspace(0, 255, height, dtype=np.uint8)[:, None]
+    return cv2.imencode(".jpg", image)[1].tobytes()
+
+
+def test_preproc_image_when_jpeg_is_decoded_at_reduced_resolution() -> None:
+    # given
+    model = _build_onnx_model_for_preprocessing(preproc={})
+    image = InferenceRequestImage(
+        type="bytes", value=_encode_gradient_jpeg(height=1500, width=2000)
+    )
+
+    # when
+    with mock.patch.object(roboflow, "ENABLE_REDUCED_RESOLUTION_JPEG_DECODING", True):
+        result, img_dims = model.preproc_image(image)
+    with mock.patch.object(roboflow, "ENABLE_REDUCED_RESOLUTION_JPEG_DECODING", False):
+        expected_result, expected_img_dims = model.preproc_image(image)
+
+    # then
+    assert img_dims == expected_img_dims == (1500, 2000)
+    assert result.shape == expected_result.shape == (1, 3, 320, 320)
+    assert np.abs(result - expected_result).mean() < 1.0
+    assert np.all(result[:, :, :40, :] == 0), "Letterbox padding must not change"
+    assert np.all(result[:, :, 280:, :] == 0), "Letterbox padding must not change"
+
+
+def test_preproc_image_when_static_crop_is_to_be_applied() -> None:
+    # given
+    model = _build_onnx_model_for_preprocessing(
+        preproc={
+            "static-crop": {
+                "enabled": True,
+                "x_min": 0,
+                "y_min": 0,
+                "x_max": 50,
+                "y_max": 50,
+            }
+        }
+    )
+    image = InferenceRequestImage(
+        type="bytes", value=_encode_gradient_jpeg(height=1500, width=2000)
+    )
+
+    # when
+    with mock.patch.object(roboflow, "ENABLE_REDUCED_RESOLUTION_JPEG_DECODING", True):
+        result, img_dims = model.preproc_image(image)
+    with mock.patch.object(roboflow, "ENABLE_REDUCED_RESOLUTION_JPEG_DECODING", False):
+        expected_result, expected_img_dims = model.preproc_image(image)
+
+    # then
+    assert img_dims == expected_img_dims == (1500, 2000)
+    assert np.array_equal(
+        result, expected_result
+    ), "Static crop must be taken from full resolution image"
+
+
+def test_load_image_when_batch_is_given() -> None:
+    # given
+    model = _build_onnx_model_for_preprocessing(preproc={})
+    model.batching_enabled = True
+    model.image_loader_threadpool = ThreadPoolExecutor(max_workers=2)
+    images = [
+        InferenceRequestImage(
+            type="bytes", value=_encode_gradient_jpeg(height=1500, width=2000)
+        ),
+        InferenceRequestImage(
+            type="bytes", value=_encode_gradient_jpeg(height=200, width=100)
+        ),
+    ]
+
+    # when
+    result, img_dims = model.load_image(images)
+
+    # then
+    assert result.shape == (2, 3, 320, 320)
+    assert result.dtype == np.float32
+    assert list(img_dims) == [(1500, 2000), (200, 100)]
+    assert np.array_equal(result[1:2], model.preproc_image(images[1])[0])
+
+
+def test_load_image_when_model_was_already_unloaded() -> None:
+    # given
+    model = _build_onnx_model_for_preprocessing(preproc={})
+    model.batching_enabled = True
+    pool = SharedImageLoaderPool(max_workers=2)
+    model.image_loader_threadpool = pool.acquire()
+    model._image_loader_pool_acquired = True
+    images = [
+        InferenceRequestImage(
+            type="bytes", value=_encode_gradient_jpeg(height=200, width=100)
+        )
+    ] * 2
+
+    # when
+    model.unload()
+    model.unload()
+    result, _ = model.load_image(images)
+
+    # then
+    assert result.shape == (2, 3, 320, 320)
+    assert pool.get_metrics()["users"] == 0, "Pool must be released exactly once"
+
+
+def test_run_onnx_session_binds_outputs_only_within_buffers_scope() -> None:
+    # given
+    model = _build_onnx_model_for_preprocessing(preproc={})
+    model.onnx_session = onnxruntime.InferenceSession(
+        get_example("sigmoid.onnx"), providers=["CPUExecutionProvider"]
+    )
+    model.input_name = "x"
+    model.onnx_io_binding_runner = OnnxSessionIOBindingRunner(
+        session=model.onnx_session, buffers_pool=model.onnx_buffers_pool
+    )
+    x = np.zeros((3, 4, 5), dtype=np.float32)
+
+    # when
+    outside_of_scope_result = model.run_onnx_session(x)
+    with onnx_buffers_scope():
+        _ = model.run_onnx_session(x)
+    with onnx_buffers_scope():
+        within_scope_result = model.run_onnx_session(x)
+        bound_output_is_pooled = model.onnx_buffers_pool.get_metrics()["shapes"] == 0
+
+    # then
+    assert np.allclose(outside_of_scope_result[0], 0.5)
+    assert np.allclose(within_scope_result[0], 0.5)
+    assert bound_output_is_pooled, "Pooled output buffer should be leased"
+    assert model.onnx_buffers_pool.get_metrics()["free_buffers"] == 1
+
+
+class ModelWithValidatedClasses(OnnxRoboflowInferenceModel):
+    def validate_model_classes(self) -> None:
+        assert self.get_model_output_shape() == (1, 84, 8400)
+
+
+def _build_model_for_validation(cache_dir: str) -> ModelWithValidatedClasses:
+    model = ModelWithValidatedClasses.__new__(ModelWithValidatedClasses)
+    model.endpoint = "some/1"
+    model.load_weights = True
+    model.onnx_session = MagicMock()
+    model.model_output_shape = None
+    model.cache_file = lambda f: os.path.join(cache_dir, f)
+    model.run_test_inference = MagicMock()
+    model.probe_model_output_shape = MagicMock(return_value=(1, 84, 8400))
+    return model
+
+
+@mock.patch.object(roboflow, "MODEL_WARMUP_MODE", "sync")
+@mock.patch.object(roboflow, "MODEL_VALIDATION_CACHE_ENABLED", True)
+def test_validate_model_when_weights_were_validated_before(tmp_path) -> None:
+    # given
+    (tmp_path / "weights.onnx").write_bytes(b"weights")
+    first_model = _build_model_for_validation(cache_dir=str(tmp_path))
+    second_model = _build_model_for_validation(cache_dir=str(tmp_path))
+
+    # when
+    first_model.validate_model()
+    second_model.validate_model()
+
+    # then
+    first_model.run_test_inference.assert_called_once()
+    first_model.probe_model_output_shape.assert_called_once()
+    assert second_model.run_test_inference.call_count == 1, "Only warmup expected"
+    second_model.probe_model_output_shape.assert_not_called()
+    assert second_model.model_output_shape == (1, 84, 8400)
+
+
+@mock.patch.object(roboflow, "MODEL_WARMUP_MODE", "disabled")
+@mock.patch.object(roboflow, "MODEL_VALIDATION_CACHE_ENABLED", True)
+def test_validate_model_when_weights_changed_since_validation(tmp_path) -> None:
+    # given
+    (tmp_path / "weights.onnx").write_bytes(b"weights")
+    first_model = _build_model_for_validation(cache_dir=str(tmp_path))
+    second_model = _build_model_for_validation(cache_dir=str(tmp_path))
+
+    # when
+    first_model.validate_model()
+    (tmp_path / "weights.onnx").write_bytes(b"other-weights")
+    second_model.validate_model()
+
+    # then
+    second_model.run_test_inference.assert_called_once()
+    second_model.probe_model_output_shape.assert_called_once()
+
+
+@mock.patch.object(roboflow, "MODEL_VALIDATION_CACHE_ENABLED", True)
+def test_validate_model_does_not_save_result_when_validation_fails(tmp_path) -> None:
+    # given
+    (tmp_path / "weights.onnx").write_bytes(b"weights")
+    model = _build_model_for_validation(cache_dir=str(tmp_path))
+    model.probe_model_output_shape.return_value = (1, 85, 8400)
+
+    # when
+    with pytest.raises(ModelArtefactError):
+        model.validate_model()
+
+    # then
+    assert not os.path.exists(tmp_path / "model_validation.json")
+
+
+@mock.patch.object(roboflow, "MODEL_WARMUP_MODE", "async")
+def test_warm_up_in_background() -> None:
+    # given
+    model = _build_model_for_validation(cache_dir="/some")
+    warmup_finished = threading.Event()
+    model.run_test_inference.side_effect = lambda: warmup_finished.set()
+
+    # when
+    model.warm_up()
+
+    # then
+    assert warmup_finished.wait(timeout=5)
+
+
+@mock.patch.object(roboflow, "is_model_artefacts_bucket_available", return_value=False)
+@mock.patch.object(roboflow, "are_all_files_cached")
+@mock.patch.object(roboflow, "get_cache_file_path")
+def test_cache_model_artefacts_when_other_process_downloaded_artefacts(
+    get_cache_file_path_mock: MagicMock,
+    are_all_files_cached_mock: MagicMock,
+    _is_model_artefacts_bucket_available_mock: MagicMock,
+    tmp_path,
+) -> None:
+    # given
+    get_cache_file_path_mock.return_value = os.path.join(tmp_path, "some.lock")
+    are_all_files_cached_mock.side_effect = [False, True]
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.endpoint = "some/1"
+    model.get_all_required_infer_bucket_file = MagicMock(return_value=["a.onnx"])
+    model.download_model_artifacts_from_roboflow_api = MagicMock()
+
+    # when
+    model.cache_model_artefacts()
+
+    # then
+    model.download_model_artifacts_from_roboflow_api.assert_not_called()
+    assert os.path.isfile(os.path.join(tmp_path, "some.lock"))
+
+
+def _build_model_for_artefacts_download() -> OnnxRoboflowInferenceModel:
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.api_key = "my-api-key"
+    model.endpoint = "some/1"
+    model.device_id = "some-device"
+    return model
+
+
+@mock.patch.object(roboflow, "save_json_in_cache")
+@mock.patch.object(roboflow, "download_from_url")
+@mock.patch.object(roboflow, "get_from_url")
+@mock.patch.object(roboflow, "get_roboflow_model_data")
+def test_download_model_artifacts_from_roboflow_api_fetches_environment_while_downloading_weights(
+    get_roboflow_model_data_mock: MagicMock,
+    get_from_url_mock: MagicMock,
+    download_from_url_mock: MagicMock,
+    save_json_in_cache_mock: MagicMock,
+) -> None:
+    # given
+    get_roboflow_model_data_mock.return_value = {
+        "ort": {"model": "https://model.url", "environment": "https://env.url"}
+    }
+    weights_download_started = threading.Event()
+    environment_fetched = threading.Event()
+
+    def download_weights(**kwargs) -> None:
+        weights_download_started.set()
+        assert environment_fetched.wait(timeout=5), "Expected concurrent fetch"
+
+    def fetch_environment(url: str) -> dict:
+        assert weights_download_started.wait(timeout=5), "Expected concurrent fetch"
+        environment_fetched.set()
+        return {"PREPROCESSING": "{}"}
+
+    download_from_url_mock.side_effect = download_weights
+    get_from_url_mock.side_effect = fetch_environment
+    model = _build_model_for_artefacts_download()
+
+    # when
+    model.download_model_artifacts_from_roboflow_api()
+
+    # then
+    assert download_from_url_mock.call_args.kwargs["url"] == "https://model.url"
+    save_json_in_cache_mock.assert_called_once_with(
+        content={"PREPROCESSING": "{}"},
+        file="environment.json",
+        model_id="some/1",
+    )
+
+
+@mock.patch.object(roboflow, "save_json_in_cache")
+@mock.patch.object(roboflow, "download_from_url")
+@mock.patch.object(roboflow, "get_from_url")
+@mock.patch.object(roboflow, "get_roboflow_model_data")
+def test_download_model_artifacts_from_roboflow_api_when_weights_download_fails(
+    get_roboflow_model_data_mock: MagicMock,
+    get_from_url_mock: MagicMock,
+    download_from_url_mock: MagicMock,
+    save_json_in_cache_mock: MagicMock,
+) -> None:
+    # given
+    get_roboflow_model_data_mock.return_value = {
+        "ort": {"model": "https://model.url", "environment": "https://env.url"}
+    }
+    get_from_url_mock.return_value = {"PREPROCESSING": "{}"}
+    download_from_url_mock.side_effect = RoboflowAPINotAuthorizedError("forbidden")
+    model = _build_model_for_artefacts_download()
+
+    # when
+    with pytest.raises(RoboflowAPINotAuthorizedError):
+        model.download_model_artifacts_from_roboflow_api()
+
+    # then
+    save_json_in_cache_mock.assert_not_called()
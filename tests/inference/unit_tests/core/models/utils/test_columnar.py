@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from inference.core.models.instance_segmentation_base import (
+    InstanceSegmentationBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.object_detection_base import (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.utils.columnar import build_columnar_predictions
+
+CLASS_NAMES = ["cat", "dog", "bird"]
+
+
+def _assert_responses_match(columnar_response: dict, regular_response: dict) -> None:
+    columnar_predictions = columnar_response.pop("predictions")
+    regular_predictions = regular_response.pop("predictions")
+    assert columnar_response == regular_response
+    assert len(columnar_predictions) == len(regular_predictions)
+    for columnar_prediction, regular_prediction in zip(
+        columnar_predictions, regular_predictions
+    ):
+        del columnar_prediction["detection_id"]
+        del regular_prediction["detection_id"]
+        assert columnar_prediction == pytest.approx(regular_prediction)
+
+
+def test_build_columnar_predictions_for_empty_predictions() -> None:
+    # when
+    result = build_columnar_predictions(
+        predictions=np.empty((0,)), class_names=CLASS_NAMES, polygons=[]
+    )
+
+    # then
+    assert len(result) == 0
+    assert result.xyxy.shape == (0, 4)
+    assert result.points.shape == (0, 2)
+    assert result.points_offsets.tolist() == [0]
+
+
+def test_build_columnar_predictions_concatenates_polygons() -> None:
+    # given
+    predictions = np.array(
+        [
+            [1.0, 2.0, 3.0, 4.0, 0.5, 0.5, 2.0],
+            [5.0, 6.0, 7.0, 8.0, 0.7, 0.7, 0.0],
+        ]
+    )
+    polygons = [[(1.0, 2.0), (3.0, 2.0), (3.0, 4.0)], [(5.0, 6.0), (7.0, 8.0)]]
+
+    # when
+    result = build_columnar_predictions(
+        predictions=predictions, class_names=CLASS_NAMES, polygons=polygons
+    )
+
+    # then
+    assert result.xyxy.tolist() == [[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0]]
+    assert result.confidence.tolist() == [0.5, 0.7]
+    assert result.class_id.tolist() == [2, 0]
+    assert result.class_name == ["bird", "cat"]
+    assert len(set(result.detection_id)) == 2
+    assert result.points_offsets.tolist() == [0, 3, 5]
+    assert result.points[3:5].tolist() == [[5.0, 6.0], [7.0, 8.0]]
+
+
+def test_columnar_object_detection_response_matches_regular_one() -> None:
+    # given
+    model = ObjectDetectionBaseOnnxRoboflowInferenceModel.__new__(
+        ObjectDetectionBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = CLASS_NAMES
+    rng = np.random.default_rng(42)
+    predictions = [
+        np.concatenate(
+            [
+                rng.uniform(0, 100, size=(20, 4)),
+                rng.uniform(0, 1, size=(20, 2)),
+                rng.integers(0, 3, size=(20, 1)),
+            ],
+            axis=1,
+        ).astype(np.float32),
+        np.empty((0, 7), dtype=np.float32),
+    ]
+    img_dims = [(480, 640), (100, 200)]
+
+    # when
+    regular = model.make_response(predictions, img_dims, class_filter=["cat", "dog"])
+    columnar = model.make_response(
+        predictions, img_dims, class_filter=["cat", "dog"], columnar_predictions=True
+    )
+
+    # then
+    assert len(regular) == len(columnar) == 2
+    for regular_response, columnar_response in zip(regular, columnar):
+        _assert_responses_match(
+            columnar_response=columnar_response.to_detections_response().model_dump(
+                by_alias=True
+            ),
+            regular_response=regular_response.model_dump(by_alias=True),
+        )
+
+
+def test_columnar_instance_segmentation_response_matches_regular_one() -> None:
+    # given
+    model = InstanceSegmentationBaseOnnxRoboflowInferenceModel.__new__(
+        InstanceSegmentationBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = CLASS_NAMES
+    predictions = [
+        np.array(
+            [
+                [10.0, 20.0, 30.0, 40.0, 0.9, 0.9, 1.0],
+                [50.0, 60.0, 70.0, 80.0, 0.6, 0.6, 2.0],
+            ]
+        )
+    ]
+    masks = [
+        [
+            [(10.0, 20.0), (30.0, 20.0), (30.0, 40.0)],
+            [(50.0, 60.0), (70.0, 60.0), (70.0, 80.0), (50.0, 80.0)],
+        ]
+    ]
+
+    # when
+    regular = model.make_response(predictions, masks, [(100, 100)])
+    columnar = model.make_response(
+        predictions, masks, [(100, 100)], columnar_predictions=True
+    )
+
+    # then
+    _assert_responses_match(
+        columnar_response=columnar[0]
+        .to_detections_response()
+        .model_dump(by_alias=True),
+        regular_response=regular[0].model_dump(by_alias=True),
+    )
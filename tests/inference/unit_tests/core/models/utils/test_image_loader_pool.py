@@ -0,0 +1,81 @@
+import threading
+
+from inference.core.models.utils.image_loader_pool import SharedImageLoaderPool
+
+
+def test_map_preserves_order_of_results() -> None:
+    # given
+    pool = SharedImageLoaderPool(max_workers=2).acquire()
+
+    # when
+    result = pool.map(lambda x: x * 2, [1, 2, 3, 4])
+
+    # then
+    assert result == [2, 4, 6, 8]
+    assert pool.get_metrics()["completed_tasks"] == 4
+    assert pool.get_metrics()["pending_tasks"] == 0
+
+
+def test_map_does_not_exceed_max_workers() -> None:
+    # given
+    pool = SharedImageLoaderPool(max_workers=2).acquire()
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def task(x: int) -> int:
+        with lock:
+            running.append(x)
+            max_running.append(len(running))
+        threading.Event().wait(0.01)
+        with lock:
+            running.remove(x)
+        return x
+
+    # when
+    _ = pool.map(task, list(range(8)))
+
+    # then
+    assert max(max_running) <= 2
+    assert pool.get_metrics()["peak_pending_tasks"] == 8
+
+
+def test_pool_is_shut_down_when_last_user_releases_it() -> None:
+    # given
+    pool = SharedImageLoaderPool(max_workers=2)
+    pool.acquire()
+    pool.acquire()
+
+    # when
+    pool.release()
+    executor_after_first_release = pool._executor
+    pool.release()
+
+    # then
+    assert executor_after_first_release is not None
+    assert pool._executor is None
+    assert pool.get_metrics()["users"] == 0
+
+
+def test_pool_can_be_used_again_after_being_released() -> None:
+    # given
+    pool = SharedImageLoaderPool(max_workers=1)
+    pool.acquire()
+    pool.release()
+
+    # when
+    result = pool.map(lambda x: x + 1, [1])
+
+    # then
+    assert result == [2]
+
+
+def test_release_of_not_acquired_pool_is_noop() -> None:
+    # given
+    pool = SharedImageLoaderPool(max_workers=1)
+
+    # when
+    pool.release()
+
+    # then
+    assert pool.get_metrics()["users"] == 0
@@ -0,0 +1,53 @@
+import numpy as np
+
+from inference.core.models.utils.memory import estimate_model_memory_usage
+
+
+class DummyModel:
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.embedding_cache = {
+            "a": np.zeros((10, 10), dtype=np.float32),
+            "b": (np.zeros((5,), dtype=np.uint8), "not-an-array"),
+        }
+
+
+def test_estimate_model_memory_usage_sums_artefacts_and_cached_arrays(
+    tmp_path,
+) -> None:
+    # given
+    (tmp_path / "weights.onnx").write_bytes(b"0" * 1000)
+    model = DummyModel(cache_dir=str(tmp_path))
+
+    # when
+    result = estimate_model_memory_usage(model)
+
+    # then
+    assert result == 1000 + 400 + 5
+
+
+def test_estimate_model_memory_usage_prefers_value_reported_by_model() -> None:
+    # given
+    model = DummyModel(cache_dir="/non/existing")
+    model.get_memory_usage = lambda: 42
+
+    # when
+    result = estimate_model_memory_usage(model)
+
+    # then
+    assert result == 42
+
+
+def test_estimate_model_memory_usage_ignores_persisted_optimized_models(
+    tmp_path,
+) -> None:
+    # given
+    (tmp_path / "weights.onnx").write_bytes(b"0" * 1000)
+    (tmp_path / "weights.optimized.0123456789ab.onnx").write_bytes(b"0" * 900)
+    model = DummyModel(cache_dir=str(tmp_path))
+
+    # when
+    result = estimate_model_memory_usage(model)
+
+    # then
+    assert result == 1000 + 400 + 5
@@ -0,0 +1,127 @@
+import numpy as np
+import onnxruntime
+import pytest
+from onnxruntime.datasets import get_example
+
+from inference.core.models.utils.onnx_io_binding import (
+    OnnxBuffersPool,
+    OnnxSessionIOBindingRunner,
+    onnx_buffers_scope,
+    onnx_buffers_scope_active,
+)
+
+
+@pytest.fixture(scope="module")
+def sigmoid_session() -> onnxruntime.InferenceSession:
+    return onnxruntime.InferenceSession(
+        get_example("sigmoid.onnx"), providers=["CPUExecutionProvider"]
+    )
+
+
+def test_lease_outside_of_scope_does_not_pool_buffers() -> None:
+    # given
+    pool = OnnxBuffersPool(max_buffers_per_shape=2, max_shapes=2)
+
+    # when
+    first = pool.lease(shape=(2, 3), dtype=np.float32)
+    second = pool.lease(shape=(2, 3), dtype=np.float32)
+
+    # then
+    assert onnx_buffers_scope_active() is False
+    assert first is not second
+    assert pool.get_metrics()["free_buffers"] == 0
+
+
+def test_buffers_are_reused_once_scope_is_closed() -> None:
+    # given
+    pool = OnnxBuffersPool(max_buffers_per_shape=2, max_shapes=2)
+
+    # when
+    with onnx_buffers_scope():
+        first = pool.lease(shape=(2, 3), dtype=np.float32)
+        concurrent = pool.lease(shape=(2, 3), dtype=np.float32)
+        assert onnx_buffers_scope_active() is True
+    with onnx_buffers_scope():
+        reused = pool.lease(shape=(2, 3), dtype=np.float32)
+        other_dtype = pool.lease(shape=(2, 3), dtype=np.uint8)
+
+    # then
+    assert first is not concurrent
+    assert reused is concurrent or reused is first
+    assert other_dtype.dtype == np.uint8
+    assert pool.get_metrics()["free_buffers"] == 3
+
+
+def test_nested_scope_releases_only_own_buffers() -> None:
+    # given
+    pool = OnnxBuffersPool(max_buffers_per_shape=2, max_shapes=2)
+
+    # when
+    with onnx_buffers_scope():
+        _ = pool.lease(shape=(2, 3), dtype=np.float32)
+        with onnx_buffers_scope():
+            _ = pool.lease(shape=(4, 3), dtype=np.float32)
+        free_buffers_after_nested_scope = pool.get_metrics()["free_buffers"]
+
+    # then
+    assert free_buffers_after_nested_scope == 1
+    assert pool.get_metrics()["free_buffers"] == 2
+
+
+def test_pool_keeps_limited_number_of_buffers_and_shapes() -> None:
+    # given
+    pool = OnnxBuffersPool(max_buffers_per_shape=1, max_shapes=2)
+
+    # when
+    with onnx_buffers_scope():
+        for batch_size in (1, 1, 2, 3):
+            _ = pool.lease(shape=(batch_size, 3), dtype=np.float32)
+
+    # then
+    assert pool.get_metrics() == {"shapes": 2, "free_buffers": 2, "free_bytes": 60}
+
+
+def test_runner_writes_outputs_into_pooled_buffers(
+    sigmoid_session: onnxruntime.InferenceSession,
+) -> None:
+    # given
+    pool = OnnxBuffersPool(max_buffers_per_shape=2, max_shapes=2)
+    runner = OnnxSessionIOBindingRunner(session=sigmoid_session, buffers_pool=pool)
+    x = np.random.default_rng(42).normal(size=(3, 4, 5)).astype(np.float32)
+    expected_result = sigmoid_session.run(None, {"x": x})
+
+    # when
+    with onnx_buffers_scope():
+        first_result = runner.run(input_name="x", img_in=x)
+    with onnx_buffers_scope():
+        second_result = runner.run(input_name="x", img_in=x)
+        second_result = [np.copy(output) for output in second_result]
+    with onnx_buffers_scope():
+        third_result = runner.run(input_name="x", img_in=x)
+
+    # then
+    assert np.allclose(first_result[0], expected_result[0])
+    assert np.allclose(second_result[0], expected_result[0])
+    assert np.allclose(third_result[0], expected_result[0])
+    assert pool.get_metrics()["free_buffers"] == 1, "Output buffer should be reused"
+
+
+def test_runner_falls_back_to_allocated_outputs_when_outputs_shapes_do_not_match(
+    sigmoid_session: onnxruntime.InferenceSession,
+) -> None:
+    # given
+    pool = OnnxBuffersPool(max_buffers_per_shape=2, max_shapes=2)
+    runner = OnnxSessionIOBindingRunner(session=sigmoid_session, buffers_pool=pool)
+    runner._outputs_specs[(3, 4, 5)] = [((2, 2), np.dtype(np.float32))]
+    x = np.zeros((3, 4, 5), dtype=np.float32)
+
+    # when
+    with onnx_buffers_scope():
+        first_result = runner.run(input_name="x", img_in=x)
+    with onnx_buffers_scope():
+        second_result = runner.run(input_name="x", img_in=x)
+
+    # then
+    assert np.allclose(first_result[0], 0.5)
+    assert np.allclose(second_result[0], 0.5)
+    assert runner._outputs_specs[(3, 4, 5)] is None
@@ -0,0 +1,247 @@
+import os
+import shutil
+from unittest import mock
+
+import numpy as np
+import onnxruntime
+import pytest
+from onnxruntime.datasets import get_example
+
+from inference.core.exceptions import InvalidEnvironmentVariableError
+from inference.core.models.utils import onnx_session
+from inference.core.models.utils.onnx_session import (
+    OnnxSessionProfile,
+    build_session_options,
+    create_inference_session,
+    get_onnx_session_profile,
+    get_optimized_model_path,
+    is_optimized_model_file,
+)
+
+
+@pytest.fixture
+def weights_path(tmp_path) -> str:
+    path = os.path.join(tmp_path, "weights.onnx")
+    shutil.copy(get_example("sigmoid.onnx"), path)
+    return path
+
+
+def test_get_onnx_session_profile_when_no_overrides_given() -> None:
+    # when
+    result = get_onnx_session_profile(model_id="some/1", session_profiles=None)
+
+    # then
+    assert result == onnx_session.get_default_onnx_session_profile()
+
+
+def test_get_onnx_session_profile_when_dataset_and_model_overrides_given() -> None:
+    # given
+    session_profiles = (
+        '{"some": {"intra_op_num_threads": 4, "allow_spinning": false},'
+        ' "some/2": {"intra_op_num_threads": 2}}'
+    )
+
+    # when
+    result = get_onnx_session_profile(
+        model_id="some/2", session_profiles=session_profiles
+    )
+    other_version_result = get_onnx_session_profile(
+        model_id="some/1", session_profiles=session_profiles
+    )
+
+    # then
+    assert result.intra_op_num_threads == 2
+    assert result.allow_spinning is False
+    assert other_version_result.intra_op_num_threads == 4
+
+
+@mock.patch.object(onnx_session, "ONNXRUNTIME_INTRA_OP_NUM_THREADS", None)
+@mock.patch.object(onnx_session, "ONNXRUNTIME_THREADS_BUDGET", 20)
+@mock.patch.object(onnx_session, "MAX_ACTIVE_MODELS", 8)
+def test_get_onnx_session_profile_when_threads_budget_given() -> None:
+    # when
+    result = get_onnx_session_profile(
+        model_id="some/1", session_profiles='{"other/1": {"intra_op_num_threads": 6}}'
+    )
+    explicitly_set_result = get_onnx_session_profile(
+        model_id="other/1", session_profiles='{"other/1": {"intra_op_num_threads": 6}}'
+    )
+
+    # then
+    assert result.intra_op_num_threads == 2
+    assert explicitly_set_result.intra_op_num_threads == 6
+
+
+@pytest.mark.parametrize(
+    "session_profiles",
+    [
+        "{not-a-json",
+        '["some/1"]',
+        '{"some/1": 4}',
+        '{"some/1": {"threads": 4}}',
+        '{"some/1": {"execution_mode": "concurrent"}}',
+    ],
+)
+def test_get_onnx_session_profile_when_profiles_are_malformed(
+    session_profiles: str,
+) -> None:
+    # when
+    with pytest.raises(InvalidEnvironmentVariableError):
+        _ = get_onnx_session_profile(
+            model_id="some/1", session_profiles=session_profiles
+        )
+
+
+def test_build_session_options() -> None:
+    # given
+    profile = OnnxSessionProfile(
+        intra_op_num_threads=2,
+        inter_op_num_threads=3,
+        execution_mode="parallel",
+        allow_spinning=False,
+        enable_cpu_mem_arena=False,
+    )
+
+    # when
+    result = build_session_options(profile=profile, providers=["CPUExecutionProvider"])
+
+    # then
+    assert result.intra_op_num_threads == 2
+    assert result.inter_op_num_threads == 3
+    assert result.execution_mode == onnxruntime.ExecutionMode.ORT_PARALLEL
+    assert result.enable_cpu_mem_arena is False
+    assert result.get_session_config_entry("session.intra_op.allow_spinning") == "0"
+    assert (
+        result.graph_optimization_level
+        == onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+
+
+def test_build_session_options_when_tensorrt_is_used() -> None:
+    # when
+    result = build_session_options(
+        profile=OnnxSessionProfile(),
+        providers=[("TensorrtExecutionProvider", {}), "CPUExecutionProvider"],
+    )
+
+    # then
+    assert (
+        result.graph_optimization_level
+        == onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+    )
+
+
+def test_create_inference_session_persists_and_loads_optimized_model(
+    weights_path: str,
+) -> None:
+    # given
+    profile = OnnxSessionProfile(intra_op_num_threads=1)
+    x = np.zeros((3, 4, 5), dtype=np.float32)
+
+    # when
+    first_session, first_settings = create_inference_session(
+        weights_path=weights_path,
+        profile=profile,
+        providers=["CPUExecutionProvider"],
+    )
+    second_session, second_settings = create_inference_session(
+        weights_path=weights_path,
+        profile=profile,
+        providers=["CPUExecutionProvider"],
+    )
+
+    # then
+    optimized_model_path = get_optimized_model_path(
+        weights_path=weights_path, providers=["CPUExecutionProvider"]
+    )
+    assert os.path.isfile(optimized_model_path)
+    assert is_optimized_model_file(optimized_model_path) is True
+    assert sorted(os.listdir(os.path.dirname(weights_path))) == sorted(
+        ["weights.onnx", os.path.basename(optimized_model_path)]
+    ), "No temporary files should be left"
+    assert first_settings["optimized_model_loaded"] is False
+    assert second_settings["optimized_model_loaded"] is True
+    assert second_settings["optimized_model_path"] == optimized_model_path
+    assert second_settings["intra_op_num_threads"] == 1
+    assert second_settings["providers"] == ["CPUExecutionProvider"]
+    assert np.allclose(second_session.run(None, {"x": x})[0], 0.5)
+
+
+def test_get_optimized_model_path_when_weights_are_replaced(
+    weights_path: str,
+) -> None:
+    # given
+    path_for_original_weights = get_optimized_model_path(
+        weights_path=weights_path, providers=["CPUExecutionProvider"]
+    )
+    shutil.copy(get_example("mul_1.onnx"), weights_path)
+
+    # when
+    result = get_optimized_model_path(
+        weights_path=weights_path, providers=["CPUExecutionProvider"]
+    )
+
+    # then
+    assert result != path_for_original_weights
+    assert is_optimized_model_file(result) is True
+
+
+def test_create_inference_session_when_optimized_model_is_corrupted(
+    weights_path: str,
+) -> None:
+    # given
+    optimized_model_path = get_optimized_model_path(
+        weights_path=weights_path, providers=["CPUExecutionProvider"]
+    )
+    with open(optimized_model_path, "wb") as f:
+        f.write(b"corrupted")
+
+    # when
+    session, settings = create_inference_session(
+        weights_path=weights_path,
+        profile=OnnxSessionProfile(),
+        providers=["CPUExecutionProvider"],
+    )
+
+    # then
+    assert settings["optimized_model_loaded"] is False
+    assert os.path.getsize(optimized_model_path) > len(b"corrupted")
+    assert np.allclose(
+        session.run(None, {"x": np.zeros((3, 4, 5), dtype=np.float32)})[0], 0.5
+    )
+
+
+def test_create_inference_session_when_persistence_is_disabled(
+    weights_path: str,
+) -> None:
+    # when
+    _, settings = create_inference_session(
+        weights_path=weights_path,
+        profile=OnnxSessionProfile(persist_optimized_model=False),
+        providers=["CPUExecutionProvider"],
+    )
+
+    # then
+    assert settings["optimized_model_path"] is None
+    assert os.listdir(os.path.dirname(weights_path)) == ["weights.onnx"]
+
+
+@mock.patch.object(
+    onnx_session.onnxruntime,
+    "get_available_providers",
+    return_value=["OpenVINOExecutionProvider", "CPUExecutionProvider"],
+)
+def test_create_inference_session_when_provider_compiles_nodes(
+    _get_available_providers_mock: mock.MagicMock,
+    weights_path: str,
+) -> None:
+    # when
+    _, settings = create_inference_session(
+        weights_path=weights_path,
+        profile=OnnxSessionProfile(),
+        providers=["OpenVINOExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    assert settings["optimized_model_path"] is None
+    assert os.listdir(os.path.dirname(weights_path)) == ["weights.onnx"]
@@ -1,5 +1,11 @@
+import hashlib
+import os
+
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
+    get_weights_hash,
+    load_model_validation_result,
+    save_model_validation_result,
 )
 
 
@@ -46,3 +52,97 @@ def test_get_num_classes_from_model_prediction_shape_with_keypoints_more_classes
     )
     # then
     assert num_classes == 5
+
+
+def test_load_model_validation_result_when_result_not_saved(tmp_path) -> None:
+    # when
+    result = load_model_validation_result(
+        cache_path=str(tmp_path / "model_validation.json")
+    )
+
+    # then
+    assert result is None
+
+
+def test_load_model_validation_result_when_result_is_malformed(tmp_path) -> None:
+    # given
+    cache_path = tmp_path / "model_validation.json"
+    cache_path.write_text('{"version": 1, "weights_hash"')
+
+    # when
+    result = load_model_validation_result(cache_path=str(cache_path))
+
+    # then
+    assert result is None
+
+
+def test_save_and_load_model_validation_result(tmp_path) -> None:
+    # given
+    weights_path = tmp_path / "weights.onnx"
+    weights_path.write_bytes(b"weights")
+    cache_path = str(tmp_path / "model_validation.json")
+
+    # when
+    save_model_validation_result(
+        cache_path=cache_path,
+        weights_path=str(weights_path),
+        weights_hash="some-hash",
+        output_shape=(1, 84, 8400),
+    )
+    result = load_model_validation_result(cache_path=cache_path)
+
+    # then
+    assert result["weights_hash"] == "some-hash"
+    assert result["output_shape"] == [1, 84, 8400]
+    assert result["weights_size"] == len(b"weights")
+
+
+def test_get_weights_hash_when_no_validation_result_given(tmp_path) -> None:
+    # given
+    weights_path = tmp_path / "weights.onnx"
+    weights_path.write_bytes(b"weights")
+
+    # when
+    result = get_weights_hash(weights_path=str(weights_path))
+
+    # then
+    assert result == hashlib.sha256(b"weights").hexdigest()
+
+
+def test_get_weights_hash_reuses_hash_when_weights_not_modified(tmp_path) -> None:
+    # given
+    weights_path = tmp_path / "weights.onnx"
+    weights_path.write_bytes(b"weights")
+    weights_stat = os.stat(weights_path)
+    validation_result = {
+        "weights_hash": "saved-hash",
+        "weights_size": weights_stat.st_size,
+        "weights_mtime_ns": weights_stat.st_mtime_ns,
+    }
+
+    # when
+    result = get_weights_hash(
+        weights_path=str(weights_path), validation_result=validation_result
+    )
+
+    # then
+    assert result == "saved-hash"
+
+
+def test_get_weights_hash_when_weights_modified(tmp_path) -> None:
+    # given
+    weights_path = tmp_path / "weights.onnx"
+    weights_path.write_bytes(b"weights")
+    validation_result = {
+        "weights_hash": "saved-hash",
+        "weights_size": 1,
+        "weights_mtime_ns": os.stat(weights_path).st_mtime_ns,
+    }
+
+    # when
+    result = get_weights_hash(
+        weights_path=str(weights_path), validation_result=validation_result
+    )
+
+    # then
+    assert result == hashlib.sha256(b"weights").hexdigest()
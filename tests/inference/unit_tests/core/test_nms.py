@@ -0,0 +1,195 @@
+import numpy as np
+import pytest
+
+from inference.core.nms import batched_non_max_suppression, w_np_non_max_suppression
+
+
+def _generate_predictions(
+    batch_size: int,
+    candidates: int,
+    num_classes: int,
+    num_masks: int = 0,
+    seed: int = 42,
+) -> np.ndarray:
+    generator = np.random.default_rng(seed)
+    centers = generator.uniform(0, 640, size=(batch_size, candidates, 2))
+    sizes = generator.uniform(10, 120, size=(batch_size, candidates, 2))
+    class_confidences = generator.uniform(
+        0, 1, size=(batch_size, candidates, num_classes)
+    )
+    max_confidence = class_confidences.max(axis=2, keepdims=True)
+    masks = generator.uniform(-1, 1, size=(batch_size, candidates, num_masks))
+    return np.concatenate(
+        [centers, sizes, max_confidence, class_confidences, masks], axis=2
+    ).astype(np.float32)
+
+
+def _legacy_as_arrays(result: list) -> list:
+    return [
+        np.array(image_result).reshape(len(image_result), -1) for image_result in result
+    ]
+
+
+@pytest.mark.parametrize("class_agnostic", [True, False])
+@pytest.mark.parametrize("num_masks", [0, 32])
+def test_batched_non_max_suppression_matches_legacy_implementation(
+    class_agnostic: bool,
+    num_masks: int,
+) -> None:
+    # given
+    predictions = _generate_predictions(
+        batch_size=3, candidates=500, num_classes=5, num_masks=num_masks
+    )
+
+    # when
+    result = batched_non_max_suppression(
+        predictions.copy(),
+        conf_thresh=0.5,
+        iou_thresh=0.45,
+        class_agnostic=class_agnostic,
+        max_detections=300,
+        num_masks=num_masks,
+    )
+    expected = w_np_non_max_suppression(
+        predictions.copy(),
+        conf_thresh=0.5,
+        iou_thresh=0.45,
+        class_agnostic=class_agnostic,
+        max_detections=300,
+        num_masks=num_masks,
+    )
+
+    # then
+    assert len(result) == 3
+    for result_for_image, expected_for_image in zip(
+        result, _legacy_as_arrays(expected)
+    ):
+        assert result_for_image.shape == expected_for_image.shape
+        assert np.allclose(result_for_image, expected_for_image, atol=1e-4)
+
+
+def test_batched_non_max_suppression_matches_legacy_implementation_for_xyxy() -> None:
+    # given
+    predictions = _generate_predictions(batch_size=1, candidates=300, num_classes=3)
+    predictions[:, :, 2:4] += predictions[:, :, 0:2]
+
+    # when
+    result = batched_non_max_suppression(
+        predictions.copy(), conf_thresh=0.3, box_format="xyxy"
+    )
+    expected = w_np_non_max_suppression(
+        predictions.copy(), conf_thresh=0.3, box_format="xyxy"
+    )
+
+    # then
+    assert np.allclose(result[0], _legacy_as_arrays(expected)[0], atol=1e-4)
+
+
+def test_batched_non_max_suppression_does_not_modify_input() -> None:
+    # given
+    predictions = _generate_predictions(batch_size=1, candidates=100, num_classes=3)
+    predictions_copy = predictions.copy()
+
+    # when
+    _ = batched_non_max_suppression(predictions, conf_thresh=0.3)
+
+    # then
+    assert np.array_equal(predictions, predictions_copy)
+
+
+def test_batched_non_max_suppression_keeps_overlapping_boxes_of_other_classes() -> None:
+    # given
+    predictions = np.array(
+        [
+            [
+                [100, 100, 50, 50, 0.9, 0.9, 0.1],
+                [100, 100, 50, 50, 0.8, 0.1, 0.8],
+                [101, 101, 50, 50, 0.7, 0.7, 0.1],
+            ]
+        ]
+    )
+
+    # when
+    result = batched_non_max_suppression(predictions, conf_thresh=0.5)
+
+    # then
+    assert result[0].shape == (2, 7)
+    assert np.allclose(result[0][:, 4], [0.9, 0.8])
+    assert np.allclose(result[0][:, 6], [0, 1])
+
+
+def test_batched_non_max_suppression_when_class_agnostic_mode_enabled() -> None:
+    # given
+    predictions = np.array(
+        [
+            [
+                [100, 100, 50, 50, 0.9, 0.9, 0.1],
+                [100, 100, 50, 50, 0.8, 0.1, 0.8],
+            ]
+        ]
+    )
+
+    # when
+    result = batched_non_max_suppression(
+        predictions, conf_thresh=0.5, class_agnostic=True
+    )
+
+    # then
+    assert result[0].shape == (1, 7)
+    assert np.allclose(result[0][0], [75, 75, 125, 125, 0.9, 0.9, 0])
+
+
+def test_batched_non_max_suppression_enforces_max_candidate_detections() -> None:
+    # given
+    predictions = np.array(
+        [
+            [
+                [100, 100, 50, 50, 0.7, 0.7],
+                [300, 300, 50, 50, 0.9, 0.9],
+                [500, 500, 50, 50, 0.8, 0.8],
+            ]
+        ]
+    )
+
+    # when
+    result = batched_non_max_suppression(
+        predictions, conf_thresh=0.5, max_candidate_detections=2
+    )
+
+    # then
+    assert np.allclose(result[0][:, 4], [0.9, 0.8])
+
+
+def test_batched_non_max_suppression_enforces_max_detections() -> None:
+    # given
+    predictions = _generate_predictions(batch_size=1, candidates=1000, num_classes=5)
+
+    # when
+    result = batched_non_max_suppression(
+        predictions, conf_thresh=0.1, max_detections=10
+    )
+
+    # then
+    assert result[0].shape == (10, 7)
+    assert np.all(np.diff(result[0][:, 4]) <= 0)
+
+
+def test_batched_non_max_suppression_when_nothing_passes_confidence_threshold() -> None:
+    # given
+    predictions = _generate_predictions(batch_size=2, candidates=10, num_classes=3)
+
+    # when
+    result = batched_non_max_suppression(predictions, conf_thresh=1.1)
+
+    # then
+    assert len(result) == 2
+    assert all(r.shape == (0, 7) for r in result)
+
+
+def test_batched_non_max_suppression_when_invalid_box_format_provided() -> None:
+    # given
+    predictions = _generate_predictions(batch_size=1, candidates=10, num_classes=3)
+
+    # when
+    with pytest.raises(ValueError):
+        _ = batched_non_max_suppression(predictions, box_format="invalid")
@@ -8,7 +8,7 @@ import requests.exceptions
 from requests_mock import Mocker
 
 from inference.core import roboflow_api
-from inference.core.cache import MemoryCache
+from inference.core.cache import MemoryCache, downloads
 from inference.core.env import API_BASE_URL
 from inference.core.exceptions import (
     MalformedRoboflowAPIResponseError,
@@ -28,6 +28,7 @@ from inference.core.roboflow_api import (
     annotate_image_at_roboflow,
     build_roboflow_api_headers,
     delete_cached_workflow_response_if_exists,
+    download_from_url,
     get_roboflow_active_learning_configuration,
     get_roboflow_dataset_type,
     get_roboflow_labeling_batches,
@@ -191,6 +192,44 @@ def test_get_roboflow_workspace_when_connection_error_occurs(
         _ = get_roboflow_workspace(api_key="my_api_key")
 
 
+@pytest.mark.parametrize(
+    "status_code, expected_error",
+    [
+        (401, RoboflowAPINotAuthorizedError),
+        (404, RoboflowAPINotNotFoundError),
+        (500, RoboflowAPIUnsuccessfulRequestError),
+    ],
+)
+def test_download_from_url_when_http_error_occurs(
+    requests_mock: Mocker,
+    tmp_path,
+    status_code: int,
+    expected_error: Type[Exception],
+) -> None:
+    # given
+    requests_mock.get(url="https://some.com/weights.onnx", status_code=status_code)
+    target_path = str(tmp_path / "weights.onnx")
+
+    # when
+    with pytest.raises(expected_error):
+        download_from_url(url="https://some.com/weights.onnx", target_path=target_path)
+
+
+@mock.patch.object(downloads, "MAX_RETRY_BACKOFF", 0)
+@mock.patch.object(downloads.requests, "get")
+def test_download_from_url_when_connection_error_occurs(
+    get_mock: MagicMock,
+    tmp_path,
+) -> None:
+    # given
+    get_mock.side_effect = requests.exceptions.ConnectionError()
+    target_path = str(tmp_path / "weights.onnx")
+
+    # when
+    with pytest.raises(RoboflowAPIConnectionError):
+        download_from_url(url="https://some.com/weights.onnx", target_path=target_path)
+
+
 def test_get_roboflow_workspace_when_response_parsing_error_occurs(
     requests_mock: Mocker,
 ) -> None:
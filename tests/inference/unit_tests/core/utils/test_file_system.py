@@ -5,6 +5,7 @@ import pytest
 from humanfriendly.testing import touch
 
 from inference.core.utils.file_system import (
+    atomic_path,
     dump_bytes,
     dump_json,
     dump_text_lines,
@@ -382,3 +383,21 @@ def assert_text_file_content_correct(file_path: str, content: str) -> None:
 def assert_bytes_file_content_correct(file_path: str, content: bytes) -> None:
     with open(file_path, "rb") as f:
         assert f.read() == content
+
+
+def test_atomic_path_when_writing_fails(empty_local_dir: str) -> None:
+    # given
+    file_path = os.path.join(empty_local_dir, "some.txt")
+    with open(file_path, "w") as f:
+        f.write("previous")
+
+    # when
+    with pytest.raises(RuntimeError):
+        with atomic_path(path=file_path) as temporary_path:
+            with open(temporary_path, "w") as f:
+                f.write("partial")
+            raise RuntimeError()
+
+    # then
+    assert read_text_file(path=file_path) == "previous"
+    assert os.listdir(empty_local_dir) == ["some.txt"]
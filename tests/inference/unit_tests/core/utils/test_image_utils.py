@@ -24,7 +24,10 @@ from inference.core.utils.image_utils import (
     attempt_loading_image_from_string,
     choose_image_decoding_flags,
     convert_gray_image_to_bgr,
+    extract_encoded_image_payload,
     extract_image_payload_and_type,
+    get_jpeg_dimensions,
+    is_jpeg,
     load_image,
     load_image_base64,
     load_image_from_buffer,
@@ -517,6 +520,38 @@ def test_load_image_from_encoded_bytes_when_decoding_should_fail() -> None:
         _ = load_image_from_encoded_bytes(value=b"FOR SURE NOT AN IMAGE :)")
 
 
+def test_load_image_from_encoded_bytes_when_empty_payload_given() -> None:
+    # when
+    with pytest.raises(InputImageLoadError):
+        _ = load_image_from_encoded_bytes(value=b"")
+
+
+def test_load_image_from_encoded_bytes_when_string_given() -> None:
+    # when
+    with pytest.raises(InputImageLoadError):
+        _ = load_image_from_encoded_bytes(value="some")
+
+
+def test_load_image_when_bytes_type_declared_for_string_value() -> None:
+    # given
+    value = {"type": "bytes", "value": "some"}
+
+    # when
+    with pytest.raises(InputImageLoadError):
+        _ = load_image(value=value)
+
+
+def test_load_image_from_encoded_bytes_when_memoryview_given(
+    image_as_png_bytes: bytes,
+    image_as_numpy: np.ndarray,
+) -> None:
+    # when
+    result = load_image_from_encoded_bytes(value=memoryview(image_as_png_bytes))
+
+    # then
+    assert np.allclose(image_as_numpy, result)
+
+
 @mock.patch.object(image_utils, "ALLOW_NUMPY_INPUT", True)
 @pytest.mark.parametrize(
     "fixture_name",
@@ -694,6 +729,7 @@ def test_extract_image_payload_and_type_when_value_is_request_and_type_is_not_re
         ("image_as_jpeg_base64_string", ImageType.BASE64, True),
         ("image_as_local_path", ImageType.FILE, True),
         ("image_as_buffer", ImageType.MULTIPART, True),
+        ("image_as_png_bytes", ImageType.BYTES, True),
         ("image_as_pickled_bytes", ImageType.NUMPY, True),
         ("image_as_base64_encoded_pickled_bytes", ImageType.NUMPY, True),
         ("image_as_pillow", ImageType.PILLOW, False),
@@ -955,3 +991,77 @@ def test_load_image_rgb_on_rgb_image(load_image_mock: MagicMock) -> None:
     assert result.shape == (128, 128, 3)
     assert np.all(result[:, :, 0] == 1)
     assert np.all(result[:, :, -1] == 255)
+
+
+def _encode_jpeg(image: np.ndarray, orientation: int = 1) -> bytes:
+    exif = Image.Exif()
+    exif[0x0112] = orientation
+    buffer = io.BytesIO()
+    Image.fromarray(image).save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def test_is_jpeg() -> None:
+    # given
+    image = np.zeros((32, 48, 3), dtype=np.uint8)
+
+    # when
+    jpeg_result = is_jpeg(_encode_jpeg(image=image))
+    png_result = is_jpeg(cv2.imencode(".png", image)[1].tobytes())
+
+    # then
+    assert jpeg_result is True
+    assert png_result is False
+
+
+@pytest.mark.parametrize(
+    "orientation, respect_orientation, expected_result",
+    [
+        (1, True, (32, 48)),
+        (6, True, (48, 32)),
+        (6, False, (32, 48)),
+        (3, True, (32, 48)),
+    ],
+)
+def test_get_jpeg_dimensions(
+    orientation: int,
+    respect_orientation: bool,
+    expected_result: tuple,
+) -> None:
+    # given
+    payload = _encode_jpeg(
+        image=np.zeros((32, 48, 3), dtype=np.uint8), orientation=orientation
+    )
+
+    # when
+    result = get_jpeg_dimensions(
+        payload=payload, respect_orientation=respect_orientation
+    )
+
+    # then
+    assert result == expected_result
+
+
+def test_get_jpeg_dimensions_when_payload_is_malformed() -> None:
+    # when
+    with pytest.raises(InputImageLoadError):
+        _ = get_jpeg_dimensions(payload=b"\xff\xd8\xffnot-really-jpeg")
+
+
+@pytest.mark.parametrize(
+    "value, expected_result",
+    [
+        (InferenceRequestImage(type="bytes", value=b"some"), b"some"),
+        ({"type": "base64", "value": "c29tZQ=="}, b"some"),
+        ({"type": "multipart", "value": io.BytesIO(b"some")}, b"some"),
+        ({"type": "numpy", "value": "some"}, None),
+        ({"type": "url", "value": "https://some.com/image.jpg"}, None),
+        (np.zeros((32, 32, 3), dtype=np.uint8), None),
+    ],
+)
+def test_extract_encoded_image_payload(value: Any, expected_result: Any) -> None:
+    # when
+    result = extract_encoded_image_payload(value=value)
+
+    # then
+    assert result == expected_result
@@ -1,6 +1,7 @@
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
 import numpy as np
 import pytest
 
@@ -9,9 +10,13 @@ from inference.core.utils import preprocess
 from inference.core.utils.preprocess import (
     ContrastAdjustmentType,
     apply_contrast_adjustment,
+    choose_jpeg_reduction_factor,
     contrast_adjustments_should_be_applied,
+    get_resize_geometry,
     grayscale_conversion_should_be_applied,
+    letterbox_image,
     prepare,
+    resize_image_into_tensor,
     static_crop_should_be_applied,
     take_static_crop,
 )
@@ -296,3 +301,104 @@ def test_prepare_when_misconfiguration_error_is_encountered(
             image=np.zeros((128, 128, 3), dtype=np.uint8),
             preproc={"static-crop": {"enabled": True}},
         )
+
+
+@pytest.mark.parametrize(
+    "resize_method, color",
+    [
+        ("Fit (black edges) in", (0, 0, 0)),
+        ("Fit (white edges) in", (255, 255, 255)),
+        ("Fit (grey edges) in", (114, 114, 114)),
+    ],
+)
+def test_resize_image_into_tensor_when_image_is_letterboxed(
+    resize_method: str,
+    color: tuple,
+) -> None:
+    # given
+    image = np.random.randint(0, 256, size=(300, 500, 3), dtype=np.uint8)
+    tensor = np.empty((3, 320, 320), dtype=np.float32)
+    expected_result = letterbox_image(image, (320, 320), color=color)
+    expected_result = cv2.cvtColor(expected_result, cv2.COLOR_BGR2RGB)
+    expected_result = np.transpose(expected_result, (2, 0, 1)).astype(np.float32)
+
+    # when
+    resize_image_into_tensor(image=image, tensor=tensor, resize_method=resize_method)
+
+    # then
+    assert np.array_equal(tensor, expected_result)
+
+
+def test_resize_image_into_tensor_when_image_is_stretched_and_given_in_rgb() -> None:
+    # given
+    image = np.random.randint(0, 256, size=(300, 500, 3), dtype=np.uint8)
+    tensor = np.empty((3, 320, 256), dtype=np.float32)
+    expected_result = np.transpose(cv2.resize(image, (256, 320)), (2, 0, 1))
+
+    # when
+    resize_image_into_tensor(
+        image=image, tensor=tensor, resize_method="Stretch to", is_bgr=False
+    )
+
+    # then
+    assert np.array_equal(tensor, expected_result.astype(np.float32))
+
+
+def test_resize_image_into_tensor_when_reference_shape_given() -> None:
+    # given
+    image = np.full((250, 376, 3), 255, dtype=np.uint8)
+    tensor = np.empty((3, 640, 640), dtype=np.float32)
+
+    # when
+    resize_image_into_tensor(
+        image=image,
+        tensor=tensor,
+        resize_method="Fit (black edges) in",
+        reference_shape=(1001, 1503),
+    )
+
+    # then
+    expected_height = int(640 / (1503 / 1001))
+    top = (640 - expected_height) // 2
+    assert np.all(tensor[:, top : top + expected_height, :] == 255)
+    assert np.all(tensor[:, :top, :] == 0)
+    assert np.all(tensor[:, top + expected_height :, :] == 0)
+
+
+def test_get_resize_geometry_when_resize_method_is_unknown() -> None:
+    # when
+    with pytest.raises(PreProcessingError):
+        _ = get_resize_geometry(
+            image_shape=(100, 100),
+            desired_size=(640, 640),
+            resize_method="unknown",
+        )
+
+
+@pytest.mark.parametrize(
+    "image_shape, resize_method, expected_result",
+    [
+        ((3000, 4000), "Fit (black edges) in", 4),
+        ((3000, 4000), "Stretch to", 4),
+        ((6000, 8000), "Fit (black edges) in", 8),
+        ((1280, 1280), "Fit (black edges) in", 2),
+        ((1279, 1279), "Fit (black edges) in", 1),
+        ((640, 640), "Fit (black edges) in", 1),
+        ((300, 400), "Stretch to", 1),
+        ((3000, 640), "Stretch to", 1),
+    ],
+)
+def test_choose_jpeg_reduction_factor(
+    image_shape: tuple,
+    resize_method: str,
+    expected_result: int,
+) -> None:
+    # when
+    result = choose_jpeg_reduction_factor(
+        image_shape=image_shape,
+        desired_size=(640, 640),
+        resize_method=resize_method,
+    )
+
+    # then
+    assert result == expected_result
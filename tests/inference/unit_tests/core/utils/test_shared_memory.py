@@ -0,0 +1,100 @@
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from unittest import mock
+
+import pytest
+
+from inference.core.utils import shared_memory
+from inference.core.utils.shared_memory import (
+    attach_shared_memory,
+    close_detached_shared_memories,
+    create_shared_memory,
+    get_shared_memory_free_space,
+    shared_memory_array,
+    unlink_shared_memory,
+)
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 13), reason="Attachments are not tracked in Python 3.13+"
+)
+@mock.patch.object(shared_memory.resource_tracker, "unregister")
+def test_attach_shared_memory_when_segment_is_owned_by_other_process(
+    unregister_mock: mock.MagicMock,
+) -> None:
+    # given
+    owned_memory = SharedMemory(create=True, size=16)
+
+    # when
+    attached_memory = attach_shared_memory(name=owned_memory.name)
+    attached_memory.close()
+    unregister_calls = list(unregister_mock.call_args_list)
+    owned_memory.close()
+    owned_memory.unlink()
+
+    # then
+    assert unregister_calls == [mock.call(owned_memory._name, "shared_memory")]
+
+
+@mock.patch.object(shared_memory.resource_tracker, "unregister")
+def test_attach_shared_memory_when_segment_is_owned_by_current_process(
+    unregister_mock: mock.MagicMock,
+) -> None:
+    # given
+    owned_memory = create_shared_memory(size=16)
+    owned_memory.buf[:4] = b"some"
+
+    # when
+    attached_memory = attach_shared_memory(name=owned_memory.name)
+    content = bytes(attached_memory.buf[:4])
+    attached_memory.close()
+    owned_memory.close()
+    unregister_mock.assert_not_called()
+    unlink_shared_memory(memory=owned_memory)
+
+    # then
+    assert content == b"some"
+
+
+def test_close_detached_shared_memories_when_segment_is_still_in_use() -> None:
+    # given
+    memories = [create_shared_memory(size=16), create_shared_memory(size=16)]
+    array = shared_memory_array(memory=memories[0], shape=(4, 4), dtype="|u1")
+
+    # when
+    first_result = close_detached_shared_memories(memories=memories)
+    del array
+    second_result = close_detached_shared_memories(memories=first_result)
+
+    # then
+    assert first_result == [memories[0]]
+    assert second_result == []
+    for memory in memories:
+        unlink_shared_memory(memory=memory)
+
+
+@mock.patch.object(shared_memory.os, "statvfs", create=True)
+def test_get_shared_memory_free_space(statvfs_mock: mock.MagicMock) -> None:
+    # given
+    statvfs_mock.return_value = mock.MagicMock(f_bavail=10, f_frsize=4096)
+
+    # when
+    result = get_shared_memory_free_space()
+
+    # then
+    assert result == 40960
+    statvfs_mock.assert_called_once_with("/dev/shm")
+
+
+@mock.patch.object(shared_memory.os, "statvfs", create=True)
+def test_get_shared_memory_free_space_when_mount_point_is_not_available(
+    statvfs_mock: mock.MagicMock,
+) -> None:
+    # given
+    statvfs_mock.side_effect = FileNotFoundError()
+
+    # when
+    result = get_shared_memory_free_space()
+
+    # then
+    assert result is None
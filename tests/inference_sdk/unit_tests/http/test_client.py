@@ -6,7 +6,10 @@ from io import BytesIO
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock
 
+import msgpack
+import numpy as np
 import pytest
+import supervision as sv
 from aiohttp import ClientConnectionError, ClientResponseError, RequestInfo
 from aioresponses import aioresponses
 from requests import HTTPError, Request, Response
@@ -1947,6 +1950,174 @@ async def test_infer_from_api_v1_async_when_request_succeed_for_object_detection
         ]
 
 
+def _columnar_object_detection_msgpack_response() -> bytes:
+    xyxy = np.array([[0.0, 50.0, 200.0, 350.0]], dtype=np.float32)
+    return msgpack.packb(
+        {
+            "image": {"height": 480, "width": 640},
+            "predictions": {
+                "xyxy": {
+                    "__ndarray__": True,
+                    "dtype": xyxy.dtype.str,
+                    "shape": list(xyxy.shape),
+                    "data": xyxy.tobytes(),
+                },
+                "confidence": [0.9],
+                "class_id": [3],
+                "class_name": ["A"],
+                "detection_id": ["some"],
+            },
+        },
+        use_bin_type=True,
+    )
+
+
+@mock.patch.object(client, "load_static_inference_input")
+def test_infer_from_api_v1_when_columnar_predictions_requested(
+    load_static_inference_input_mock: MagicMock,
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.get_model_description = MagicMock()
+    http_client.get_model_description.return_value = ModelDescription(
+        model_id="coco/3",
+        task_type="object-detection",
+        input_height=480,
+        input_width=640,
+    )
+    load_static_inference_input_mock.return_value = [("base64_image", 0.5)]
+    configuration = InferenceConfiguration(columnar_predictions=True)
+    http_client.configure(inference_configuration=configuration)
+    requests_mock.post(
+        f"{api_url}/infer/object_detection",
+        content=_columnar_object_detection_msgpack_response(),
+        headers={"Content-Type": "application/msgpack"},
+    )
+
+    # when
+    result = http_client.infer_from_api_v1(
+        inference_input="https://some/image.jpg",
+        model_id="coco/3",
+    )
+
+    # then
+    assert requests_mock.last_request.headers["Accept"] == "application/msgpack"
+    assert result["image"] == {"height": 960, "width": 1280}
+    assert isinstance(result["predictions"], sv.Detections)
+    assert result["predictions"].xyxy.tolist() == [[0.0, 100.0, 400.0, 700.0]]
+    assert result["predictions"].class_id.tolist() == [3]
+    assert result["predictions"]["class_name"].tolist() == ["A"]
+
+
+@pytest.mark.asyncio
+@mock.patch.object(client, "load_static_inference_input_async")
+async def test_infer_from_api_v1_async_when_columnar_predictions_requested(
+    load_static_inference_input_async_mock: MagicMock,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.get_model_description_async = AsyncMock()
+    http_client.get_model_description_async.return_value = ModelDescription(
+        model_id="coco/3",
+        task_type="object-detection",
+        input_height=480,
+        input_width=640,
+    )
+    load_static_inference_input_async_mock.return_value = [("base64_image", None)]
+    configuration = InferenceConfiguration(columnar_predictions=True)
+    http_client.configure(inference_configuration=configuration)
+
+    with aioresponses() as m:
+        m.post(
+            f"{api_url}/infer/object_detection",
+            body=_columnar_object_detection_msgpack_response(),
+            content_type="application/msgpack",
+        )
+
+        # when
+        result = await http_client.infer_from_api_v1_async(
+            inference_input="https://some/image.jpg",
+            model_id="coco/3",
+        )
+
+    # then
+    assert result["image"] == {"height": 480, "width": 640}
+    assert isinstance(result["predictions"], sv.Detections)
+    assert result["predictions"].xyxy.tolist() == [[0.0, 50.0, 200.0, 350.0]]
+    assert result["predictions"]["detection_id"].tolist() == ["some"]
+
+
+@mock.patch.object(client, "load_static_inference_input")
+def test_infer_from_api_v1_when_columnar_predictions_requested_but_json_returned(
+    load_static_inference_input_mock: MagicMock,
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.get_model_description = MagicMock()
+    http_client.get_model_description.return_value = ModelDescription(
+        model_id="coco/3",
+        task_type="object-detection",
+        input_height=480,
+        input_width=640,
+    )
+    load_static_inference_input_mock.return_value = [("base64_image", None)]
+    configuration = InferenceConfiguration(columnar_predictions=True)
+    http_client.configure(inference_configuration=configuration)
+    requests_mock.post(
+        f"{api_url}/infer/object_detection",
+        json={"image": {"height": 480, "width": 640}, "predictions": []},
+    )
+
+    # when
+    result = http_client.infer_from_api_v1(
+        inference_input="https://some/image.jpg",
+        model_id="coco/3",
+    )
+
+    # then
+    assert result == {"image": {"height": 480, "width": 640}, "predictions": []}
+
+
+@pytest.mark.asyncio
+@mock.patch.object(client, "load_static_inference_input_async")
+async def test_infer_from_api_v1_async_when_columnar_predictions_requested_but_json_returned(
+    load_static_inference_input_async_mock: MagicMock,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.get_model_description_async = AsyncMock()
+    http_client.get_model_description_async.return_value = ModelDescription(
+        model_id="coco/3",
+        task_type="object-detection",
+        input_height=480,
+        input_width=640,
+    )
+    load_static_inference_input_async_mock.return_value = [("base64_image", None)]
+    configuration = InferenceConfiguration(columnar_predictions=True)
+    http_client.configure(inference_configuration=configuration)
+
+    with aioresponses() as m:
+        m.post(
+            f"{api_url}/infer/object_detection",
+            payload={"image": {"height": 480, "width": 640}, "predictions": []},
+        )
+
+        # when
+        result = await http_client.infer_from_api_v1_async(
+            inference_input="https://some/image.jpg",
+            model_id="coco/3",
+        )
+
+    # then
+    assert result == {"image": {"height": 480, "width": 640}, "predictions": []}
+
+
 @mock.patch.object(client, "load_static_inference_input")
 def test_infer_from_api_v1_when_request_succeed_for_object_detection_with_visualisation(
     load_static_inference_input_mock: AsyncMock,
@@ -2803,6 +2974,40 @@ def test_get_clip_image_embeddings_when_single_image_given_in_v1_mode(
     }, "Request must contain API key and image encoded in standard format"
 
 
+@mock.patch.object(client, "load_static_inference_input")
+def test_get_clip_image_embeddings_when_multipart_image_uploads_requested(
+    load_static_inference_input_mock: MagicMock,
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(
+        inference_configuration=InferenceConfiguration(multipart_image_uploads=True)
+    )
+    load_static_inference_input_mock.return_value = [
+        (base64.b64encode(b"image_bytes").decode(), 0.5)
+    ]
+    expected_prediction = {"frame_id": None, "time": 0.05, "embeddings": [[0.1, 0.2]]}
+    requests_mock.post(
+        f"{api_url}/clip/embed_image",
+        json=expected_prediction,
+    )
+
+    # when
+    result = http_client.get_clip_image_embeddings(inference_input="/some/image.jpg")
+
+    # then
+    assert (
+        result == expected_prediction
+    ), "Result must match the value returned by HTTP endpoint"
+    request = requests_mock.request_history[0]
+    assert request.headers["Content-Type"].startswith("multipart/form-data")
+    assert b'name="request"' in request.body
+    assert b'{"api_key": "my-api-key"}' in request.body
+    assert b"\r\n\r\nimage_bytes\r\n" in request.body, "Image must be sent as raw bytes"
+
+
 @pytest.mark.asyncio
 @mock.patch.object(client, "load_static_inference_input_async")
 async def test_get_clip_image_embeddings_async_when_single_image_given_in_v1_mode(
@@ -0,0 +1,166 @@
+from typing import Optional
+
+import msgpack
+import numpy as np
+import pytest
+import supervision as sv
+
+from inference_sdk.http.utils.columnar import (
+    adjust_columnar_prediction_to_client_scaling_factor,
+    columnar_predictions_to_detections,
+    decode_msgpack_payload,
+    is_columnar_prediction,
+    is_msgpack_response,
+)
+
+
+def _encode_array(array: np.ndarray) -> dict:
+    return {
+        "__ndarray__": True,
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "data": array.tobytes(),
+    }
+
+
+def _columnar_instance_segmentation_response() -> dict:
+    return {
+        "image": {"width": 100, "height": 80},
+        "predictions": {
+            "xyxy": np.array([[10, 10, 40, 40], [50, 20, 60, 30]], dtype=np.float32),
+            "confidence": np.array([0.9, 0.5], dtype=np.float32),
+            "class_id": np.array([1, 0]),
+            "class_name": ["dog", "cat"],
+            "detection_id": ["first", "second"],
+            "points": np.array(
+                [[10, 10], [40, 10], [40, 40], [10, 40], [50, 20], [60, 30]],
+                dtype=np.float64,
+            ),
+            "points_offsets": np.array([0, 4, 6]),
+        },
+    }
+
+
+def test_decode_msgpack_payload_restores_arrays() -> None:
+    # given
+    xyxy = np.array([[1.5, 2.5, 3.5, 4.5]], dtype=np.float32)
+    payload = msgpack.packb(
+        [{"predictions": {"xyxy": _encode_array(xyxy), "class_name": ["a"]}}],
+        use_bin_type=True,
+    )
+
+    # when
+    result = decode_msgpack_payload(payload=payload)
+
+    # then
+    assert len(result) == 1
+    assert result[0]["predictions"]["class_name"] == ["a"]
+    assert result[0]["predictions"]["xyxy"].dtype == np.float32
+    assert np.array_equal(result[0]["predictions"]["xyxy"], xyxy)
+    assert is_columnar_prediction(prediction=result[0]) is True
+
+
+def test_is_columnar_prediction_for_regular_prediction() -> None:
+    # when
+    result = is_columnar_prediction(prediction={"predictions": [{"x": 1}]})
+
+    # then
+    assert result is False
+
+
+@pytest.mark.parametrize(
+    "content_type, expected_result",
+    [
+        ("application/msgpack", True),
+        ("Application/MsgPack; charset=binary", True),
+        ("application/json", False),
+        ("text/html; charset=utf-8", False),
+        (None, False),
+    ],
+)
+def test_is_msgpack_response(
+    content_type: Optional[str], expected_result: bool
+) -> None:
+    # when
+    result = is_msgpack_response(content_type=content_type)
+
+    # then
+    assert result is expected_result
+
+
+def test_columnar_predictions_to_detections_matches_detections_from_inference() -> None:
+    # given
+    response = _columnar_instance_segmentation_response()
+    regular_response = {
+        "image": {"width": 100, "height": 80},
+        "predictions": [
+            {
+                "x": 25.0,
+                "y": 25.0,
+                "width": 30.0,
+                "height": 30.0,
+                "confidence": 0.9,
+                "class_id": 1,
+                "class": "dog",
+                "points": [
+                    {"x": 10, "y": 10},
+                    {"x": 40, "y": 10},
+                    {"x": 40, "y": 40},
+                    {"x": 10, "y": 40},
+                ],
+            },
+            {
+                "x": 55.0,
+                "y": 25.0,
+                "width": 10.0,
+                "height": 10.0,
+                "confidence": 0.5,
+                "class_id": 0,
+                "class": "cat",
+                "points": [{"x": 50, "y": 20}, {"x": 60, "y": 30}],
+            },
+        ],
+    }
+
+    # when
+    result = columnar_predictions_to_detections(prediction=response)
+
+    # then
+    expected = sv.Detections.from_inference(regular_response)
+    assert np.allclose(result.xyxy, expected.xyxy)
+    assert np.allclose(result.confidence, expected.confidence)
+    assert np.array_equal(result.class_id, expected.class_id)
+    assert np.array_equal(result.mask, expected.mask)
+    assert result["class_name"].tolist() == ["dog"]
+    assert result["detection_id"].tolist() == ["first"]
+
+
+def test_columnar_predictions_to_detections_for_object_detection() -> None:
+    # given
+    response = _columnar_instance_segmentation_response()
+    del response["predictions"]["points"]
+    del response["predictions"]["points_offsets"]
+
+    # when
+    result = columnar_predictions_to_detections(prediction=response)
+
+    # then
+    assert len(result) == 2
+    assert result.mask is None
+    assert result.xyxy.tolist() == [[10, 10, 40, 40], [50, 20, 60, 30]]
+    assert result["class_name"].tolist() == ["dog", "cat"]
+
+
+def test_adjust_columnar_prediction_to_client_scaling_factor() -> None:
+    # given
+    response = _columnar_instance_segmentation_response()
+
+    # when
+    result = adjust_columnar_prediction_to_client_scaling_factor(
+        prediction=response, scaling_factor=0.5
+    )
+
+    # then
+    assert result["image"] == {"width": 200, "height": 160}
+    assert result["predictions"]["xyxy"][0].tolist() == [20, 20, 80, 80]
+    assert result["predictions"]["points"][-1].tolist() == [120, 60]
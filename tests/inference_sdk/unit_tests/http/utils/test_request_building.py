@@ -1,3 +1,6 @@
+import base64
+import json
+
 import pytest
 
 from inference_sdk.http.utils.request_building import (
@@ -104,6 +107,40 @@ def test_assembly_request_data_when_image_placement_is_in_json_and_multiple_imag
     )
 
 
+def test_assembly_request_data_when_image_placement_is_multipart() -> None:
+    # given
+    images = [
+        base64.b64encode(b"image_1").decode(),
+        base64.b64encode(b"image_2").decode(),
+    ]
+
+    # when
+    result = assembly_request_data(
+        url="https://some.com",
+        batch_inference_inputs=[(images[0], 1.0), (images[1], 0.5)],
+        headers={"Content-Type": "application/json"},
+        parameters=None,
+        payload={"api_key": "secret"},
+        image_placement=ImagePlacement.MULTIPART,
+    )
+
+    # then
+    content_type = result.headers["Content-Type"]
+    assert content_type.startswith("multipart/form-data; boundary=")
+    boundary = content_type.split("boundary=")[1].encode()
+    parts = result.data.split(b"--" + boundary)[1:-1]
+    assert len(parts) == 3
+    assert b'name="request"' in parts[0]
+    assert json.loads(parts[0].split(b"\r\n\r\n", 1)[1].rstrip()) == {
+        "api_key": "secret"
+    }
+    assert b'name="image"' in parts[1] and parts[1].endswith(b"\r\n\r\nimage_1\r\n")
+    assert b'name="image"' in parts[2] and parts[2].endswith(b"\r\n\r\nimage_2\r\n")
+    assert result.payload is None
+    assert result.request_elements == 2
+    assert result.image_scaling_factors == [1.0, 0.5]
+
+
 def test_prepare_requests_data() -> None:
     # when
     result = prepare_requests_data(
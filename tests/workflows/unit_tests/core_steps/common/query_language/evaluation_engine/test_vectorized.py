@@ -0,0 +1,174 @@
+from typing import Any
+
+import numpy as np
+import pytest
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    StatementGroup,
+)
+from inference.core.workflows.core_steps.common.query_language.errors import (
+    EvaluationEngineError,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
+    build_eval_function,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.detection.vectorized import (
+    build_detections_mask_function,
+)
+from inference.core.workflows.core_steps.common.query_language.operations.detections.base import (
+    filter_detections,
+)
+
+
+def _detection_property(property_name: str) -> dict:
+    return {
+        "type": "DynamicOperand",
+        "operations": [
+            {"type": "ExtractDetectionProperty", "property_name": property_name}
+        ],
+    }
+
+
+def _statement(left: dict, comparator: str, right: dict, negate: bool = False) -> dict:
+    return {
+        "type": "BinaryStatement",
+        "left_operand": left,
+        "comparator": {"type": comparator},
+        "right_operand": right,
+        "negate": negate,
+    }
+
+
+def _static(value: Any) -> dict:
+    return {"type": "StaticOperand", "value": value}
+
+
+def _group(operator: str, *statements: dict) -> StatementGroup:
+    return StatementGroup.model_validate(
+        {"type": "StatementGroup", "operator": operator, "statements": statements}
+    )
+
+
+def _build_detections() -> sv.Detections:
+    return sv.Detections(
+        xyxy=np.array(
+            [[0, 0, 10, 10], [0, 0, 20, 20], [5, 5, 6, 6], [0, 0, 100, 50]],
+            dtype=np.float32,
+        ),
+        confidence=np.array([0.3, 0.5, 0.9, 0.7], dtype=np.float32),
+        class_id=np.array([0, 1, 0, 2]),
+        data={"class_name": np.array(["car", "dog", "car", "truck"])},
+    )
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        _group(
+            "and",
+            _statement(
+                _detection_property("class_name"),
+                "in (Sequence)",
+                {"type": "DynamicOperand", "operand_name": "classes"},
+            ),
+            _statement(_detection_property("confidence"), "(Number) >", _static(0.3)),
+        ),
+        _group(
+            "or",
+            _statement(_detection_property("size"), "(Number) >=", _static(400)),
+            _statement(_static(1), "==", _detection_property("class_id")),
+        ),
+        _group(
+            "and",
+            _statement(
+                _detection_property("class_name"),
+                "(String) startsWith",
+                _static("c"),
+                negate=True,
+            ),
+            _statement(_detection_property("x_max"), "(Number) <", _static(50)),
+        ),
+        _group(
+            "and",
+            _statement(_detection_property("class_name"), "==", _static(None)),
+        ),
+    ],
+)
+def test_mask_function_matches_row_by_row_evaluation(
+    definition: StatementGroup,
+) -> None:
+    # given
+    detections = _build_detections()
+    global_parameters = {"classes": ["car", "truck"]}
+    mask_fun = build_detections_mask_function(definition=definition)
+    filtering_fun = build_eval_function(definition=definition)
+
+    # when
+    vectorized_result = filter_detections(
+        detections=detections,
+        filtering_fun=filtering_fun,
+        global_parameters=global_parameters,
+        mask_fun=mask_fun,
+    )
+    row_by_row_result = filter_detections(
+        detections=detections,
+        filtering_fun=filtering_fun,
+        global_parameters=global_parameters,
+    )
+
+    # then
+    assert mask_fun is not None
+    assert vectorized_result == row_by_row_result
+
+
+def test_build_detections_mask_function_when_predicate_cannot_be_vectorized() -> None:
+    # given
+    definition = _group(
+        "and",
+        _statement(_detection_property("confidence"), "(Number) >", _static(0.3)),
+        _statement(
+            _detection_property("confidence"),
+            "(Number) >",
+            {
+                "type": "StaticOperand",
+                "value": None,
+                "operations": [{"type": "RandomNumber"}],
+            },
+        ),
+    )
+
+    # when
+    result = build_detections_mask_function(definition=definition)
+
+    # then
+    assert result is None
+
+
+def test_mask_function_when_property_is_missing_in_detections() -> None:
+    # given
+    definition = _group(
+        "and", _statement(_detection_property("class_name"), "==", _static("car"))
+    )
+    detections = _build_detections()
+    detections.data = {}
+    mask_fun = build_detections_mask_function(definition=definition)
+
+    # when
+    result = mask_fun(detections, {})
+
+    # then
+    assert result is None
+
+
+def test_mask_function_when_operands_cannot_be_compared() -> None:
+    # given
+    definition = _group(
+        "and",
+        _statement(_detection_property("confidence"), "(Number) >", _static("a")),
+    )
+    mask_fun = build_detections_mask_function(definition=definition)
+
+    # when
+    with pytest.raises(EvaluationEngineError):
+        _ = mask_fun(_build_detections(), {})
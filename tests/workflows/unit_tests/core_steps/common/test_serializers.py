@@ -5,9 +5,14 @@ import numpy as np
 import supervision as sv
 
 from inference.core.workflows.core_steps.common.serializers import (
+    COMPACT_DETECTIONS_SERIALIZATION_FORMAT,
+    masks_to_first_polygons,
     serialise_image,
     serialise_sv_detections,
+    serialise_sv_detections_compact,
+    serialise_sv_detections_in_requested_format,
     serialize_wildcard_kind,
+    use_detections_serialization_format,
 )
 from inference.core.workflows.execution_engine.entities.base import (
     ImageParentMetadata,
@@ -190,6 +195,100 @@ def test_serialise_sv_detections() -> None:
     }
 
 
+def test_masks_to_first_polygons_matches_polygons_traced_over_whole_mask() -> None:
+    # given
+    masks = np.zeros((4, 60, 80), dtype=np.uint8)
+    cv2.circle(masks[0], (40, 30), 10, 1, -1)
+    cv2.circle(masks[1], (0, 0), 15, 1, -1)
+    cv2.circle(masks[2], (79, 59), 20, 1, -1)
+    cv2.rectangle(masks[3], (5, 5), (20, 50), 1, -1)
+    cv2.circle(masks[3], (60, 30), 8, 1, -1)
+    masks = masks.astype(bool)
+
+    # when
+    result = masks_to_first_polygons(masks=masks)
+
+    # then
+    assert len(result) == 4
+    for polygon, mask in zip(result, masks):
+        assert np.array_equal(polygon, sv.mask_to_polygons(mask=mask)[0])
+
+
+def test_serialise_sv_detections_compact() -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array([[1, 1, 2, 2], [3, 3, 4, 4]], dtype=np.float64),
+        class_id=np.array([1, 2]),
+        confidence=np.array([0.1, 0.9], dtype=np.float64),
+        mask=np.array(
+            [
+                sv.polygon_to_mask(
+                    np.array([[1, 1], [1, 10], [10, 10], [10, 1]]),
+                    resolution_wh=(15, 15),
+                ),
+                sv.polygon_to_mask(
+                    np.array([[2, 2], [2, 10], [10, 10], [10, 2]]),
+                    resolution_wh=(15, 15),
+                ),
+            ],
+            dtype=bool,
+        ),
+        data={
+            "class_name": np.array(["cat", "dog"]),
+            "detection_id": np.array(["first", "second"]),
+            "image_dimensions": np.array([[192, 168], [192, 168]]),
+        },
+    )
+
+    # when
+    result = serialise_sv_detections_compact(detections=detections)
+
+    # then
+    assert result == {
+        "image": {"width": 168, "height": 192},
+        "predictions": {
+            "width": [1.0, 1.0],
+            "height": [1.0, 1.0],
+            "x": [1.5, 3.5],
+            "y": [1.5, 3.5],
+            "confidence": [0.1, 0.9],
+            "class_id": [1, 2],
+            "points": [
+                [[1.0, 1.0], [1.0, 10.0], [10.0, 10.0], [10.0, 1.0]],
+                [[2.0, 2.0], [2.0, 10.0], [10.0, 10.0], [10.0, 2.0]],
+            ],
+            "class": ["cat", "dog"],
+            "detection_id": ["first", "second"],
+        },
+    }
+
+
+def test_serialise_sv_detections_in_requested_format() -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array([[1, 1, 2, 2]], dtype=np.float64),
+        class_id=np.array([1]),
+        confidence=np.array([0.5], dtype=np.float64),
+        data={
+            "class_name": np.array(["cat"]),
+            "detection_id": np.array(["first"]),
+        },
+    )
+
+    # when
+    default_result = serialise_sv_detections_in_requested_format(detections=detections)
+    with use_detections_serialization_format(
+        serialization_format=COMPACT_DETECTIONS_SERIALIZATION_FORMAT
+    ):
+        compact_result = serialise_sv_detections_in_requested_format(
+            detections=detections
+        )
+
+    # then
+    assert default_result == serialise_sv_detections(detections=detections)
+    assert compact_result == serialise_sv_detections_compact(detections=detections)
+
+
 def test_serialise_image() -> None:
     # given
     np_image = np.zeros((192, 168, 3), dtype=np.uint8)
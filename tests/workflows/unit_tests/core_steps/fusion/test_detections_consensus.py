@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -18,6 +18,7 @@ from inference.core.workflows.core_steps.fusion.detections_consensus.v1 import (
     does_not_detect_objects_in_any_source,
     enumerate_detections,
     filter_predictions,
+    find_consensus_detections,
     get_average_bounding_box,
     get_class_of_least_confident_detection,
     get_class_of_most_confident_detection,
@@ -2102,3 +2103,100 @@ def test_agree_on_consensus_for_all_detections_sources_when_predictions_from_mul
     )
 
     assert result == ("some_parent", True, {"b": 0.95}, expected_consensus)
+
+
+def _generate_detections_from_sources(
+    sources: int, detections: int, seed: int
+) -> List[sv.Detections]:
+    rng = np.random.default_rng(seed)
+    top_left = rng.uniform(0, 500, size=(detections, 2))
+    wh = rng.uniform(10, 60, size=(detections, 2))
+    base_xyxy = np.concatenate([top_left, top_left + wh], axis=1)
+    base_class_id = rng.integers(0, 3, size=detections)
+    results = []
+    for source_id in range(sources):
+        xyxy = base_xyxy + rng.normal(0, 5, size=base_xyxy.shape)
+        class_id = np.where(
+            rng.uniform(size=detections) < 0.2,
+            rng.integers(0, 3, size=detections),
+            base_class_id,
+        )
+        results.append(
+            sv.Detections(
+                xyxy=xyxy,
+                confidence=rng.uniform(0.3, 1.0, size=detections),
+                class_id=class_id,
+                data={
+                    "detection_id": np.array(
+                        [f"{source_id}_{i}" for i in range(detections)]
+                    ),
+                    "class_name": np.array([f"class_{c}" for c in class_id]),
+                    "parent_id": np.array(["p"] * detections),
+                    "parent_coordinates": np.array([[0, 0]] * detections),
+                    "parent_dimensions": np.array([[600, 600]] * detections),
+                    "root_parent_id": np.array(["p"] * detections),
+                    "root_parent_coordinates": np.array([[0, 0]] * detections),
+                    "root_parent_dimensions": np.array([[600, 600]] * detections),
+                    "image_dimensions": np.array([[600, 600]] * detections),
+                },
+            )
+        )
+    return results
+
+
+@pytest.mark.parametrize("class_aware", [True, False])
+@pytest.mark.parametrize("required_votes", [1, 2, 3])
+@pytest.mark.parametrize("iou_threshold", [0.3, 0.6])
+@pytest.mark.parametrize("mixed_boxes_types", [True, False])
+@mock.patch.object(v1, "uuid4")
+def test_find_consensus_detections_matches_detection_by_detection_matching(
+    uuid4_mock: MagicMock,
+    class_aware: bool,
+    required_votes: int,
+    iou_threshold: float,
+    mixed_boxes_types: bool,
+) -> None:
+    # given
+    uuid4_mock.return_value = "xxx"
+    detections_from_sources = _generate_detections_from_sources(
+        sources=3, detections=30, seed=required_votes
+    )
+    if mixed_boxes_types:
+        detections_from_sources[1].xyxy = detections_from_sources[1].xyxy.astype(
+            np.float32
+        )
+    detections_already_considered = set()
+    expected_result = []
+    for source_id, detection in enumerate_detections(
+        detections_from_sources=detections_from_sources
+    ):
+        consensus_update, detections_already_considered = (
+            get_consensus_for_single_detection(
+                detection=detection,
+                source_id=source_id,
+                detections_from_sources=detections_from_sources,
+                iou_threshold=iou_threshold,
+                class_aware=class_aware,
+                required_votes=required_votes,
+                confidence=0.5,
+                detections_merge_confidence_aggregation=AggregationMode.AVERAGE,
+                detections_merge_coordinates_aggregation=AggregationMode.AVERAGE,
+                detections_already_considered=detections_already_considered,
+            )
+        )
+        expected_result += consensus_update
+
+    # when
+    result = find_consensus_detections(
+        detections_from_sources=detections_from_sources,
+        iou_threshold=iou_threshold,
+        class_aware=class_aware,
+        required_votes=required_votes,
+        confidence=0.5,
+        detections_merge_confidence_aggregation=AggregationMode.AVERAGE,
+        detections_merge_coordinates_aggregation=AggregationMode.AVERAGE,
+    )
+
+    # then
+    assert len(expected_result) > 0
+    assert sv.Detections.merge(result) == sv.Detections.merge(expected_result)
@@ -1,18 +1,41 @@
+from typing import Callable
+from unittest.mock import MagicMock
+
 import pytest
 
+from inference.core.workflows.core_steps.classical_cv.image_blur.v1 import (
+    ImageBlurBlockV1,
+)
+from inference.core.workflows.core_steps.flow_control.rate_limiter.v1 import (
+    RateLimiterBlockV1,
+)
+from inference.core.workflows.core_steps.sinks.email_notification.v1 import (
+    EmailNotificationBlockV1,
+)
+from inference.core.workflows.core_steps.sinks.local_file.v1 import LocalFileSinkBlockV1
+from inference.core.workflows.core_steps.sinks.roboflow.model_monitoring_inference_aggregator.v1 import (
+    ModelMonitoringInferenceAggregatorBlockV1,
+)
+from inference.core.workflows.core_steps.sinks.webhook.v1 import WebhookSinkBlockV1
+from inference.core.workflows.core_steps.transformations.byte_tracker.v1 import (
+    ByteTrackerBlockV1,
+)
 from inference.core.workflows.errors import (
     BlockInitParameterNotProvidedError,
     BlockInterfaceError,
 )
 from inference.core.workflows.execution_engine.v1.compiler.entities import (
     BlockSpecification,
+    InitialisedStep,
 )
 from inference.core.workflows.execution_engine.v1.compiler.steps_initialiser import (
     call_if_callable,
     initialise_step,
+    is_step_stateful,
     retrieve_init_parameter_values,
     retrieve_init_parameters_values,
 )
+from inference.core.workflows.prototypes.block import WorkflowBlock
 from tests.workflows.unit_tests.execution_engine.compiler.plugin_with_test_blocks.blocks import (
     ExampleBlockWithFaultyInit,
     ExampleBlockWithFaultyInitManifest,
@@ -220,3 +243,70 @@ def test_initialise_step_when_initialisation_failed() -> None:
             },
             initializers={},
         )
+
+
+def test_is_step_stateful_when_block_does_not_declare_being_stateless() -> None:
+    # given
+    step = InitialisedStep(
+        block_specification=MagicMock(),
+        manifest=MagicMock(),
+        step=ExampleBlockWithInit(a=9, b=30),
+    )
+
+    # when
+    result = is_step_stateful(step=step)
+
+    # then
+    assert result is True
+
+
+def test_is_step_stateful_when_block_declares_being_stateless() -> None:
+    # given
+    step = InitialisedStep(
+        block_specification=MagicMock(),
+        manifest=MagicMock(),
+        step=ImageBlurBlockV1(),
+    )
+
+    # when
+    result = is_step_stateful(step=step)
+
+    # then
+    assert result is False
+
+
+@pytest.mark.parametrize(
+    "block_factory",
+    [
+        lambda: ByteTrackerBlockV1(),
+        lambda: RateLimiterBlockV1(),
+        lambda: WebhookSinkBlockV1(background_tasks=None, thread_pool_executor=None),
+        lambda: EmailNotificationBlockV1(
+            background_tasks=None, thread_pool_executor=None
+        ),
+        lambda: LocalFileSinkBlockV1(
+            allow_access_to_file_system=True, allowed_write_directory=None
+        ),
+        lambda: ModelMonitoringInferenceAggregatorBlockV1(
+            cache=MagicMock(),
+            api_key="my-api-key",
+            background_tasks=None,
+            thread_pool_executor=None,
+        ),
+    ],
+)
+def test_is_step_stateful_when_block_keeps_state_between_runs(
+    block_factory: Callable[[], WorkflowBlock],
+) -> None:
+    # given
+    step = InitialisedStep(
+        block_specification=MagicMock(),
+        manifest=MagicMock(),
+        step=block_factory(),
+    )
+
+    # when
+    result = is_step_stateful(step=step)
+
+    # then
+    assert result is True
@@ -10,6 +10,7 @@ from inference.core.workflows.execution_engine.v1.compiler.entities import (
 )
 from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
     ParallelStepExecutionCoordinator,
+    get_steps_dependencies,
 )
 
 
@@ -153,6 +154,34 @@ def test_parallel_flow_coordinator_when_there_are_two_parallel_execution_paths()
     assert result is None, "Execution path should end up to this point"
 
 
+def test_get_steps_dependencies_when_there_are_two_parallel_execution_paths() -> None:
+    # given
+    graph = nx.DiGraph()
+    graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
+    for step in ["step_1", "step_2", "step_3", "step_4"]:
+        graph.add_node(step, node_compilation_output=assembly_dummy_step(step))
+    graph.add_node(
+        "output_1", node_compilation_output=assembly_dummy_output("output_1")
+    )
+    graph.add_edge("input_1", "step_1")
+    graph.add_edge("step_1", "step_2")
+    graph.add_edge("input_1", "step_3")
+    graph.add_edge("step_3", "step_4")
+    graph.add_edge("step_2", "step_4")
+    graph.add_edge("step_4", "output_1")
+
+    # when
+    result = get_steps_dependencies(execution_graph=graph)
+
+    # then
+    assert result == {
+        "step_1": set(),
+        "step_2": {"step_1"},
+        "step_3": set(),
+        "step_4": {"step_2", "step_3"},
+    }
+
+
 def assembly_dummy_input(name: str) -> InputNode:
     return InputNode(
         node_category=NodeCategory.INPUT_NODE,
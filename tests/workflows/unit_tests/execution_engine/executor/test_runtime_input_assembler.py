@@ -4,6 +4,7 @@ from typing import Any
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
 import numpy as np
 import pytest
 
@@ -156,6 +157,31 @@ def test_assemble_runtime_parameters_when_image_is_provided_as_single_element_np
     )
 
 
+def test_assemble_runtime_parameters_when_image_is_provided_as_raw_bytes() -> None:
+    # given
+    image_bytes = cv2.imencode(".png", np.zeros((192, 168, 3), dtype=np.uint8))[
+        1
+    ].tobytes()
+    runtime_parameters = {"image1": {"type": "bytes", "value": image_bytes}}
+    defined_inputs = [WorkflowImage(type="WorkflowImage", name="image1")]
+
+    # when
+    result = assemble_runtime_parameters(
+        runtime_parameters=runtime_parameters,
+        defined_inputs=defined_inputs,
+        kinds_deserializers=KINDS_DESERIALIZERS,
+    )
+
+    # then
+    assert (
+        len(result["image1"]) == 1
+    ), "Image is to be transformed into single element list"
+    assert result["image1"][0].parent_metadata.parent_id == "image1"
+    assert np.allclose(
+        result["image1"][0].numpy_image, np.zeros((192, 168, 3), dtype=np.uint8)
+    ), "Expected uploaded bytes to be decoded into image"
+
+
 def test_assemble_runtime_parameters_when_image_is_provided_as_unknown_element() -> (
     None
 ):
@@ -0,0 +1,159 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from inference.core.workflows.execution_engine.v1.executor.utils import (
+    STEPS_EXECUTOR_THREAD_NAME_PREFIX,
+    get_steps_executor,
+    mark_steps_executor_thread,
+    run_steps_following_dependencies,
+    run_steps_in_parallel,
+)
+
+
+def test_get_steps_executor_returns_the_same_executor() -> None:
+    # when
+    first = get_steps_executor()
+    second = get_steps_executor()
+
+    # then
+    assert first is second
+
+
+def test_run_steps_in_parallel_returns_results_in_order_of_steps() -> None:
+    # given
+    executor = ThreadPoolExecutor(max_workers=4)
+    steps = [lambda i=i: (time.sleep(0.01 * (4 - i)), i)[1] for i in range(4)]
+
+    # when
+    result = run_steps_in_parallel(steps=steps, max_workers=4, executor=executor)
+
+    # then
+    assert result == [0, 1, 2, 3]
+
+
+def test_run_steps_in_parallel_does_not_exceed_max_workers() -> None:
+    # given
+    executor = ThreadPoolExecutor(max_workers=8)
+    lock = threading.Lock()
+    running, max_running = [0], [0]
+
+    def step() -> None:
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+
+    # when
+    _ = run_steps_in_parallel(steps=[step] * 8, max_workers=2, executor=executor)
+
+    # then
+    assert max_running[0] == 2
+
+
+def test_run_steps_following_dependencies_starts_step_once_its_dependencies_finish() -> (
+    None
+):
+    # given
+    executor = ThreadPoolExecutor(max_workers=4)
+    finished: List[str] = []
+    durations = {"slow_1": 0.2, "fast_1": 0.0, "fast_2": 0.0, "slow_2": 0.0}
+
+    def run_step(step: str) -> None:
+        time.sleep(durations[step])
+        finished.append(step)
+
+    # when
+    run_steps_following_dependencies(
+        steps_dependencies={
+            "slow_1": set(),
+            "fast_1": set(),
+            "fast_2": {"fast_1"},
+            "slow_2": {"slow_1", "fast_2"},
+        },
+        run_step=run_step,
+        max_workers=4,
+        executor=executor,
+    )
+
+    # then
+    assert finished == ["fast_1", "fast_2", "slow_1", "slow_2"]
+
+
+def test_run_steps_following_dependencies_stops_dispatching_after_error() -> None:
+    # given
+    executor = ThreadPoolExecutor(max_workers=4)
+    executed: List[str] = []
+
+    def run_step(step: str) -> None:
+        executed.append(step)
+        if step == "a":
+            raise ValueError("broken")
+
+    # when
+    with pytest.raises(ValueError):
+        run_steps_following_dependencies(
+            steps_dependencies={"a": set(), "b": {"a"}},
+            run_step=run_step,
+            max_workers=4,
+            executor=executor,
+        )
+
+    # then
+    assert executed == ["a"]
+
+
+def test_run_steps_in_parallel_runs_nested_steps_in_thread_of_steps_executor() -> None:
+    # given
+    executor = ThreadPoolExecutor(
+        max_workers=1,
+        thread_name_prefix=STEPS_EXECUTOR_THREAD_NAME_PREFIX,
+        initializer=mark_steps_executor_thread,
+    )
+
+    def outer_step() -> List[str]:
+        return run_steps_in_parallel(
+            steps=[lambda: threading.current_thread().name] * 2,
+            max_workers=2,
+            executor=executor,
+        )
+
+    # when
+    result = run_steps_in_parallel(
+        steps=[outer_step, lambda: []], max_workers=2, executor=executor
+    )
+
+    # then
+    assert len(result[0]) == 2
+    assert all(name.startswith(STEPS_EXECUTOR_THREAD_NAME_PREFIX) for name in result[0])
+
+
+def test_run_steps_in_parallel_dispatches_steps_from_threads_not_marked_as_steps_executor() -> (
+    None
+):
+    # given
+    executor = ThreadPoolExecutor(max_workers=2)
+    outer_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix=STEPS_EXECUTOR_THREAD_NAME_PREFIX
+    )
+
+    def outer_step() -> List[str]:
+        return run_steps_in_parallel(
+            steps=[lambda: threading.current_thread().name] * 2,
+            max_workers=2,
+            executor=executor,
+        )
+
+    # when
+    result = outer_executor.submit(outer_step).result()
+
+    # then
+    assert len(result) == 2
+    assert not any(
+        name.startswith(STEPS_EXECUTOR_THREAD_NAME_PREFIX) for name in result
+    )